@@ -56,13 +56,13 @@ from backend.protocol_rpc.message_handler.types import (
 from backend.protocol_rpc.fees import (
     FEE_ACCOUNTING_KEY,
     FeeValidationError,
-    StudioFeePolicy,
     consume_message_fees,
     create_child_fee_accounting,
     derive_external_message_call_key,
     fill_message_fee_payload_from_allocation,
     record_external_message_execution_fees,
     record_reveal_message_fees,
+    studio_fee_policy,
     unwind_reveal_message_fees,
 )
 from backend.rollup.consensus_service import ConsensusService
@@ -89,6 +89,8 @@ from backend.consensus.decisions import (
     has_appeal_capacity,
 )
 from backend.consensus.effect_executor import EffectExecutor
+from backend.consensus.execution_scheduler import execution_scheduler
+from backend.consensus.timing import ConsensusTimingRecorder
 from backend.node.genvm import get_code_slot
 from backend.node.genvm.error_codes import GenVMInternalError, GenVMErrorCode
 from backend.node.base import Manager as GenVMManager
@@ -358,6 +360,14 @@ def contract_snapshot_factory(
     return ContractSnapshot(contract_address, session)
 
 
+def _fork_snapshot(snapshot: ContractSnapshot | None) -> ContractSnapshot | None:
+    """
+    Per-node view of the transaction's contract snapshot. Nodes share the
+    snapshot's state and keep their writes in a copy-on-write overlay.
+    """
+    return snapshot.fork() if snapshot is not None else None
+
+
 def contract_processor_factory(session: Session):
     """
     Factory function to create a ContractProcessor instance.
@@ -425,6 +435,7 @@ class TransactionContext:
         validator_nodes (list): List of validator nodes.
         validation_results (list): List of validation results.
         consensus_service (ConsensusService): Consensus service to interact with the rollup.
+        timing (ConsensusTimingRecorder): Buffer for the transaction's timing markers.
     """
 
     def __init__(
@@ -478,6 +489,8 @@ class TransactionContext:
         # Shared for the lifetime of this transaction context (leader + validators).
         self.shared_decoded_value_cache: dict[str, bytes] = {}
         self.shared_contract_snapshot_cache: dict[str, ContractSnapshot] = {}
+        # Buffered current_monitoring markers, flushed at phase boundaries.
+        self.timing = ConsensusTimingRecorder(transactions_processor, transaction.hash)
 
         if self.transaction.type != TransactionType.SEND:
             saved = self.transaction.contract_snapshot
@@ -518,6 +531,14 @@ class TransactionContext:
         self.validators_snapshot = validators_snapshot
 
 
+async def _handle_state(state: "TransactionState", context: TransactionContext):
+    """Run one consensus state and flush its buffered timing markers on exit."""
+    try:
+        return await state.handle(context)
+    finally:
+        context.timing.close()
+
+
 class ConsensusAlgorithm:
     """
     Class representing the consensus algorithm.
@@ -617,7 +638,7 @@ class ConsensusAlgorithm:
             # Begin state transitions starting from PendingState
             state = PendingState()
             while True:
-                next_state = await state.handle(context)
+                next_state = await _handle_state(state, context)
                 if next_state is None:
                     break
                 elif next_state == ConsensusRound.ACCEPTED:
@@ -870,7 +891,7 @@ class ConsensusAlgorithm:
 
         # Transition to the FinalizingState
         state = FinalizingState()
-        await state.handle(context)
+        await _handle_state(state, context)
 
     async def process_leader_appeal(
         self,
@@ -961,7 +982,7 @@ class ConsensusAlgorithm:
             # Begin state transitions starting from PendingState
             state = PendingState()
             while True:
-                next_state = await state.handle(context)
+                next_state = await _handle_state(state, context)
                 if next_state is None:
                     break
                 elif next_state == ConsensusRound.LEADER_APPEAL_SUCCESSFUL:
@@ -1067,7 +1088,7 @@ class ConsensusAlgorithm:
             # Begin state transitions starting from PendingState
             state = PendingState()
             while True:
-                next_state = await state.handle(context)
+                next_state = await _handle_state(state, context)
                 if next_state is None:
                     break
                 elif next_state == ConsensusRound.LEADER_TIMEOUT_APPEAL_SUCCESSFUL:
@@ -1188,7 +1209,7 @@ class ConsensusAlgorithm:
             # Begin state transitions starting from CommittingState
             state = CommittingState()
             while True:
-                next_state = await state.handle(context)
+                next_state = await _handle_state(state, context)
                 if next_state is None:
                     break
                 elif next_state == ConsensusRound.VALIDATOR_APPEAL_SUCCESSFUL:
@@ -2095,22 +2116,17 @@ class ProposingState(TransactionState):
         executor = EffectExecutor(context)
         await executor.execute(pre_effects)
 
-        context.transactions_processor.add_state_timestamp(
-            context.transaction.hash, "PROPOSING.VALIDATORS_SELECTED"
-        )
+        context.timing.record("PROPOSING.VALIDATORS_SELECTED")
 
         assert context.validators_snapshot is not None
 
         # Create timing callback for leader execution
         def leader_timing_callback(step_name: str):
-            context.transactions_processor.add_state_timestamp(
-                context.transaction.hash, f"PROPOSING.LEADER.{step_name}"
-            )
+            context.timing.record(f"PROPOSING.LEADER.{step_name}")
 
         # Execute leader with one wall-clock slot budget. Fatal internal
         # failures can still use replacements while budget remains.
         leader_budget_seconds = _slot_budget_seconds(context.transaction, "leader")
-        leader_deadline = asyncio.get_running_loop().time() + leader_budget_seconds
 
         def _build_leader_timeout_receipt(leader_dict: dict) -> Receipt:
             timeout_ms = int(leader_budget_seconds * 1000)
@@ -2135,81 +2151,96 @@ class ProposingState(TransactionState):
                 processing_time=timeout_ms,
             )
 
-        for attempt in range(MAX_IDLE_REPLACEMENTS + 1):
-            remaining = leader_deadline - asyncio.get_running_loop().time()
-            if remaining <= 0:
-                context.consensus_data.leader_receipt = [
-                    _build_leader_timeout_receipt(context.leader)
-                ]
-                break
-
-            leader_node = context.node_factory(
-                context.leader,
-                ExecutionMode.LEADER,
-                deepcopy(context.contract_snapshot),
-                None,
-                context.msg_handler,
-                context.contract_snapshot_factory,
-                context.validators_snapshot,
-                leader_timing_callback,
-                context.genvm_manager,
-                context.shared_decoded_value_cache,
-                context.shared_contract_snapshot_cache,
-            )
-
-            context.transactions_processor.add_state_timestamp(
-                context.transaction.hash,
-                f"PROPOSING.LEADER_NODE_CREATED.attempt_{attempt}",
-            )
-            exec_task = asyncio.create_task(
-                leader_node.exec_transaction(context.transaction)
-            )
-            try:
-                done, _ = await asyncio.wait(
-                    {exec_task},
-                    timeout=remaining,
-                    return_when=asyncio.FIRST_COMPLETED,
-                )
-                if exec_task not in done:
-                    exec_task.cancel()
-                    try:
-                        await asyncio.wait_for(exec_task, timeout=0.1)
-                    except (asyncio.CancelledError, asyncio.TimeoutError, Exception):
-                        pass
+        # The budget starts once the worker-wide scheduler admits the leader,
+        # so queueing behind other transactions never eats into it.
+        async with execution_scheduler.slot(
+            context.transaction.hash, leader_budget_seconds
+        ) as slot:
+            leader_deadline = asyncio.get_running_loop().time() + leader_budget_seconds
+            for attempt in range(MAX_IDLE_REPLACEMENTS + 1):
+                remaining = leader_deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
                     context.consensus_data.leader_receipt = [
                         _build_leader_timeout_receipt(context.leader)
                     ]
                     break
 
-                context.consensus_data.leader_receipt = [await exec_task]
-                break  # success
-            except GenVMInternalError as e:
-                if not e.is_fatal:
-                    raise  # non-fatal → propagate immediately
-                if not context.remaining_validators:
-                    raise  # pool empty → propagate
-                # Replace leader with next validator
-                from loguru import logger
-
-                logger.error(
-                    f"Leader GenVM internal error for {context.transaction.hash}, "
-                    f"replacing leader (attempt {attempt + 1}/{MAX_IDLE_REPLACEMENTS}): "
-                    f"code={e.error_code}, causes={e.causes}, ctx={e.ctx}"
+                leader_node = context.node_factory(
+                    context.leader,
+                    ExecutionMode.LEADER,
+                    _fork_snapshot(context.contract_snapshot),
+                    None,
+                    context.msg_handler,
+                    context.contract_snapshot_factory,
+                    context.validators_snapshot,
+                    leader_timing_callback,
+                    context.genvm_manager,
+                    context.shared_decoded_value_cache,
+                    context.shared_contract_snapshot_cache,
                 )
-                context.leader = context.remaining_validators.pop(0)
-        else:
-            # All replacement attempts exhausted
-            raise GenVMInternalError(
-                message="Leader idle: all replacements exhausted",
-                error_code=GenVMErrorCode.LLM_NO_PROVIDER,
-                causes=["ALL_LEADERS_IDLE"],
-                is_fatal=True,
-                is_leader=True,
-            )
 
-        context.transactions_processor.add_state_timestamp(
-            context.transaction.hash, "PROPOSING.TRANSACTION_EXECUTED"
-        )
+                context.timing.record(
+                    f"PROPOSING.LEADER_NODE_CREATED.attempt_{attempt}",
+                )
+                exec_task = asyncio.create_task(
+                    leader_node.exec_transaction(context.transaction)
+                )
+                try:
+                    done, _ = await asyncio.wait(
+                        {exec_task},
+                        timeout=remaining,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    if exec_task not in done:
+                        exec_task.cancel()
+                        try:
+                            await asyncio.wait_for(exec_task, timeout=0.1)
+                        except (
+                            asyncio.CancelledError,
+                            asyncio.TimeoutError,
+                            Exception,
+                        ):
+                            pass
+                        context.consensus_data.leader_receipt = [
+                            _build_leader_timeout_receipt(context.leader)
+                        ]
+                        slot.overloaded()
+                        break
+
+                    leader_receipt = await exec_task
+                    if (
+                        leader_receipt.result
+                        == bytes([ResultCode.VM_ERROR]) + b"timeout"
+                    ):
+                        slot.overloaded()
+                    context.consensus_data.leader_receipt = [leader_receipt]
+                    break  # success
+                except GenVMInternalError as e:
+                    slot.overloaded()
+                    if not e.is_fatal:
+                        raise  # non-fatal → propagate immediately
+                    if not context.remaining_validators:
+                        raise  # pool empty → propagate
+                    # Replace leader with next validator
+                    from loguru import logger
+
+                    logger.error(
+                        f"Leader GenVM internal error for {context.transaction.hash}, "
+                        f"replacing leader (attempt {attempt + 1}/{MAX_IDLE_REPLACEMENTS}): "
+                        f"code={e.error_code}, causes={e.causes}, ctx={e.ctx}"
+                    )
+                    context.leader = context.remaining_validators.pop(0)
+            else:
+                # All replacement attempts exhausted
+                raise GenVMInternalError(
+                    message="Leader idle: all replacements exhausted",
+                    error_code=GenVMErrorCode.LLM_NO_PROVIDER,
+                    causes=["ALL_LEADERS_IDLE"],
+                    is_fatal=True,
+                    is_leader=True,
+                )
+
+        context.timing.record("PROPOSING.TRANSACTION_EXECUTED")
 
         # Update the consensus data with the leader's vote and receipt
         context.consensus_data.votes = {}
@@ -2281,15 +2312,14 @@ class CommittingState(TransactionState):
 
             # Create timing callback for this validator
             def validator_timing_callback(step_name: str):
-                context.transactions_processor.add_state_timestamp(
-                    context.transaction.hash,
+                context.timing.record(
                     f"COMMITTING.VALIDATOR_{validator_index}.{step_name}",
                 )
 
             return context.node_factory(
                 validator,
                 ExecutionMode.VALIDATOR,
-                deepcopy(context.contract_snapshot),
+                _fork_snapshot(context.contract_snapshot),
                 (
                     context.consensus_data.leader_receipt[0]
                     if context.consensus_data.leader_receipt
@@ -2308,9 +2338,6 @@ class CommittingState(TransactionState):
             context.transaction, "validator"
         )
 
-        # Execute the transaction with a semaphore to limit the number of concurrent validators
-        sem = asyncio.Semaphore(8)
-
         # Build replacement pool: all validators minus those already assigned
         assigned_addresses: set[str] = set()
         if context.leader.get("address"):
@@ -2407,7 +2434,11 @@ class CommittingState(TransactionState):
             )
 
         async def run_single_validator(validator_dict: dict, index: int) -> Receipt:
-            async with sem:
+            # The slot budget starts once the worker-wide scheduler admits
+            # this execution, so queueing never eats into it.
+            async with execution_scheduler.slot(
+                context.transaction.hash, validator_slot_budget_seconds
+            ) as slot:
                 current = validator_dict
                 slot_deadline = (
                     asyncio.get_running_loop().time() + validator_slot_budget_seconds
@@ -2419,8 +2450,7 @@ class CommittingState(TransactionState):
                         break
 
                     node = create_validator_node(context, current, index)
-                    context.transactions_processor.add_state_timestamp(
-                        context.transaction.hash,
+                    context.timing.record(
                         f"COMMITTING.VALIDATOR_{index}_START" f".attempt_{attempt}",
                     )
                     exec_task = asyncio.create_task(
@@ -2452,14 +2482,12 @@ class CommittingState(TransactionState):
                             Exception,
                         ):
                             pass
-                        context.transactions_processor.add_state_timestamp(
-                            context.transaction.hash,
+                        context.timing.record(
                             f"COMMITTING.VALIDATOR_{index}_TIMEOUT"
                             f".attempt_{attempt}",
                         )
                         result = _build_timeout_receipt(current)
-                    context.transactions_processor.add_state_timestamp(
-                        context.transaction.hash,
+                    context.timing.record(
                         f"COMMITTING.VALIDATOR_{index}_END" f".attempt_{attempt}",
                     )
 
@@ -2470,6 +2498,8 @@ class CommittingState(TransactionState):
                             continue
                     break
 
+                if result.vote == Vote.TIMEOUT:
+                    slot.overloaded()
                 if _is_fatal_error(result):
                     result.vote = Vote.IDLE
                 return result
@@ -2486,14 +2516,10 @@ class CommittingState(TransactionState):
         else:
             validators_to_run = list(context.remaining_validators)
 
-        context.transactions_processor.add_state_timestamp(
-            context.transaction.hash, "COMMITTING.VALIDATORS_PREPARED"
-        )
+        context.timing.record("COMMITTING.VALIDATORS_PREPARED")
 
         # Execute the transaction on each validator and gather the results
-        context.transactions_processor.add_state_timestamp(
-            context.transaction.hash, "COMMITTING.VALIDATORS_EXECUTION_START"
-        )
+        context.timing.record("COMMITTING.VALIDATORS_EXECUTION_START")
 
         def _is_quorum_reached(votes_so_far: list[str], total_votes: int) -> bool:
             pending = total_votes - len(votes_so_far)
@@ -2614,12 +2640,8 @@ class CommittingState(TransactionState):
                 is_leader=True,
             )
 
-        context.transactions_processor.add_state_timestamp(
-            context.transaction.hash, "COMMITTING.VALIDATORS_EXECUTION_END"
-        )
-        context.transactions_processor.add_state_timestamp(
-            context.transaction.hash, "COMMITTING.VALIDATION_RESULTS_GATHERED"
-        )
+        context.timing.record("COMMITTING.VALIDATORS_EXECUTION_END")
+        context.timing.record("COMMITTING.VALIDATION_RESULTS_GATHERED")
 
         # Post-execution effects (vote committed events + timestamp)
         validators_to_emit = slot_validators
@@ -3010,6 +3032,7 @@ class FinalizingState(TransactionState):
             context.contract_processor.update_contract_state(
                 context.transaction.to_address,
                 finalized_state=accepted_state,
+                based_on=snapshot,
             )
 
             internal_messages_data, insert_transactions_data = _get_messages_data(
@@ -3226,7 +3249,7 @@ def _attach_child_fee_accounting(
             message_allocations=message_payload.get("allocationSubtree") or [],
             sender=context.transaction.origin_address
             or context.transaction.from_address,
-            policy=StudioFeePolicy.from_env(),
+            policy=studio_fee_policy.current(),
         )
     except FeeValidationError as exc:
         raise RuntimeError(str(exc)) from exc
@@ -43,11 +43,16 @@ class EffectExecutor:
         Args:
             context: A TransactionContext (or any object exposing
                      transactions_processor, msg_handler, consensus_service,
-                     contract_processor).
+                     contract_processor, and optionally a `timing` recorder).
         """
         self.ctx = context
 
     async def execute(self, effects: list[Effect]) -> None:
+        # Buffered timing markers belong before this batch's writes (e.g. a
+        # consensus history update that moves current_monitoring into a round).
+        timing = getattr(self.ctx, "timing", None)
+        if timing is not None and effects:
+            timing.flush()
         for effect in effects:
             await self._execute_one(effect)
 
@@ -118,6 +123,11 @@ class EffectExecutor:
                 kwargs["accepted_state"] = effect.accepted_state
             if effect.finalized_state is not None:
                 kwargs["finalized_state"] = effect.finalized_state
+            # The new state was derived from the transaction's snapshot, so
+            # slot storage only needs the slots that differ from it.
+            snapshot = getattr(self.ctx, "contract_snapshot", None)
+            if snapshot is not None:
+                kwargs["based_on"] = snapshot
             cp.update_contract_state(effect.address, **kwargs)
 
         elif isinstance(effect, InsertTriggeredTransactionEffect):
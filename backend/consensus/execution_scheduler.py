@@ -0,0 +1,238 @@
+# backend/consensus/execution_scheduler.py
+
+"""
+Worker-wide scheduler for GenVM executions (leader and validators).
+
+Every consensus execution in a worker takes a slot from one shared
+scheduler instead of a fixed per-transaction semaphore, so concurrent
+transactions together never exceed what the GenVM manager can handle.
+
+The number of slots adapts AIMD-style:
+
+- an execution that finishes well within its slot budget (below
+  CONSENSUS_EXEC_LATENCY_THRESHOLD of it) raises the limit by 1/limit,
+  i.e. by about one slot per limit's worth of fast executions;
+- an execution that times out or hits a GenVM internal error (manager
+  overloaded or unreachable) multiplies the limit by
+  CONSENSUS_EXEC_DECREASE_FACTOR, at most once per round of executions
+  granted at the current limit, so one overload burst only backs off once;
+- slow successes and cancelled executions leave the limit unchanged.
+
+The configured maximum is further capped by the slot count the GenVM
+manager reports (see set_capacity), so the limit never probes past it.
+
+Waiting executions are granted round-robin across transactions, so one
+transaction's validator fan-out cannot starve another transaction's leader.
+"""
+
+import asyncio
+import os
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Hashable
+
+from loguru import logger
+
+DEFAULT_INITIAL_LIMIT = 8
+DEFAULT_MIN_LIMIT = 1
+DEFAULT_MAX_LIMIT = 32
+DEFAULT_LATENCY_THRESHOLD = 0.5
+DEFAULT_DECREASE_FACTOR = 0.7
+
+
+class ExecutionSlot:
+    """A granted execution slot; call `overloaded()` to report congestion."""
+
+    def __init__(self, key: Hashable, epoch: int, budget_seconds: float | None):
+        self.key = key
+        self.epoch = epoch
+        self.budget_seconds = budget_seconds
+        self.started_at = time.monotonic()
+        self.is_overloaded = False
+
+    def overloaded(self) -> None:
+        self.is_overloaded = True
+
+
+class ExecutionScheduler:
+    """Shared AIMD concurrency limit with round-robin fairness across keys."""
+
+    def __init__(
+        self,
+        initial_limit: int = DEFAULT_INITIAL_LIMIT,
+        min_limit: int = DEFAULT_MIN_LIMIT,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+        latency_threshold: float = DEFAULT_LATENCY_THRESHOLD,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+    ):
+        self.min_limit = max(1, min_limit)
+        self.configured_max_limit = max(self.min_limit, max_limit)
+        self.max_limit = self.configured_max_limit
+        self.latency_threshold = latency_threshold
+        self.decrease_factor = decrease_factor
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self._in_flight = 0
+        self._epoch = 0
+        self._waiters: OrderedDict[Hashable, deque[asyncio.Future]] = OrderedDict()
+        self.granted = 0
+        self.increases = 0
+        self.decreases = 0
+
+    @classmethod
+    def from_environment(cls) -> "ExecutionScheduler":
+        def env_int(name: str, default: int) -> int:
+            try:
+                return int(os.environ.get(name, str(default)))
+            except ValueError:
+                return default
+
+        def env_float(name: str, default: float) -> float:
+            try:
+                return float(os.environ.get(name, str(default)))
+            except ValueError:
+                return default
+
+        return cls(
+            initial_limit=env_int(
+                "CONSENSUS_EXEC_CONCURRENCY_INITIAL", DEFAULT_INITIAL_LIMIT
+            ),
+            min_limit=env_int("CONSENSUS_EXEC_CONCURRENCY_MIN", DEFAULT_MIN_LIMIT),
+            max_limit=env_int("CONSENSUS_EXEC_CONCURRENCY_MAX", DEFAULT_MAX_LIMIT),
+            latency_threshold=env_float(
+                "CONSENSUS_EXEC_LATENCY_THRESHOLD", DEFAULT_LATENCY_THRESHOLD
+            ),
+            decrease_factor=env_float(
+                "CONSENSUS_EXEC_DECREASE_FACTOR", DEFAULT_DECREASE_FACTOR
+            ),
+        )
+
+    @property
+    def limit(self) -> int:
+        return min(int(self._limit), self.max_limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(queue) for queue in self._waiters.values())
+
+    async def acquire(
+        self, key: Hashable, budget_seconds: float | None = None
+    ) -> ExecutionSlot:
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._waiters.setdefault(key, deque()).append(future)
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # Granted just before the cancellation landed.
+                    self._in_flight -= 1
+                    self._grant_waiters()
+                else:
+                    self._discard_waiter(key, future)
+                raise
+        self.granted += 1
+        return ExecutionSlot(key, self._epoch, budget_seconds)
+
+    def release(self, slot: ExecutionSlot, completed: bool = True) -> None:
+        """
+        Return `slot`. `completed=False` (cancelled or failed for reasons
+        unrelated to capacity) releases without adjusting the limit.
+        """
+        self._in_flight -= 1
+        if slot.is_overloaded:
+            self._decrease(slot)
+        elif completed:
+            elapsed = time.monotonic() - slot.started_at
+            if (
+                slot.budget_seconds is None
+                or elapsed < slot.budget_seconds * self.latency_threshold
+            ):
+                self._increase()
+        self._grant_waiters()
+
+    @asynccontextmanager
+    async def slot(
+        self, key: Hashable, budget_seconds: float | None = None
+    ) -> AsyncIterator[ExecutionSlot]:
+        slot = await self.acquire(key, budget_seconds)
+        completed = False
+        try:
+            yield slot
+            completed = True
+        finally:
+            self.release(slot, completed)
+
+    def set_capacity(self, slots: int | None) -> None:
+        """
+        Cap the limit at `slots` executions, as reported by the GenVM
+        manager; None restores the configured maximum. Only max_limit is
+        written, so this is safe to call from the health-check thread.
+        """
+        if slots is None:
+            self.max_limit = self.configured_max_limit
+        else:
+            self.max_limit = max(self.min_limit, min(self.configured_max_limit, slots))
+
+    def get_metrics(self) -> dict:
+        return {
+            "limit": self.limit,
+            "max_limit": self.max_limit,
+            "in_flight": self._in_flight,
+            "waiting": self.waiting,
+            "granted": self.granted,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
+
+    def _increase(self) -> None:
+        if self._limit >= self.max_limit:
+            return
+        before = self.limit
+        self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+        if self.limit > before:
+            self.increases += 1
+
+    def _decrease(self, slot: ExecutionSlot) -> None:
+        if slot.epoch != self._epoch:
+            # Started before the last back-off; that overload is accounted for.
+            return
+        self._epoch += 1
+        current = min(self._limit, float(self.max_limit))
+        self._limit = max(float(self.min_limit), current * self.decrease_factor)
+        self.decreases += 1
+        logger.warning(
+            f"GenVM executions overloaded, lowering worker concurrency to {self.limit}"
+        )
+
+    def _grant_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            key, queue = self._waiters.popitem(last=False)
+            future = queue.popleft()
+            if queue:
+                # Round-robin: this key goes to the back of the line.
+                self._waiters[key] = queue
+            if future.done():
+                continue
+            self._in_flight += 1
+            future.set_result(None)
+
+    def _discard_waiter(self, key: Hashable, future: asyncio.Future) -> None:
+        queue = self._waiters.get(key)
+        if queue is None:
+            return
+        try:
+            queue.remove(future)
+        except ValueError:
+            pass
+        if not queue:
+            del self._waiters[key]
+
+
+execution_scheduler = ExecutionScheduler.from_environment()
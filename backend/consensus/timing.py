@@ -0,0 +1,90 @@
+"""
+Buffered consensus timing markers.
+
+Consensus states record many fine-grained timestamps (leader steps,
+VALIDATOR_i_START/END per attempt, ...) into
+`consensus_history.current_monitoring`. Writing each of them as its own
+UPDATE + commit puts dozens of tiny transactions on the hot `transactions`
+row per round, so the recorder keeps them in memory and writes them in one
+statement when the context's next effect batch runs (phase boundaries), when
+markers have been pending for longer than the flush interval (so the
+no-progress detectors still see a heartbeat), and when the state loop exits.
+"""
+
+import os
+import time
+
+from loguru import logger
+
+from backend.database_handler.transactions_processor import TransactionsProcessor
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 10.0
+
+
+def _flush_interval_from_env() -> float:
+    try:
+        return float(
+            os.environ.get(
+                "CONSENSUS_TIMING_FLUSH_INTERVAL_SECONDS",
+                DEFAULT_FLUSH_INTERVAL_SECONDS,
+            )
+        )
+    except ValueError:
+        return DEFAULT_FLUSH_INTERVAL_SECONDS
+
+
+class ConsensusTimingRecorder:
+    """
+    Accumulates `current_monitoring` markers of one transaction and writes
+    them in batches.
+    """
+
+    def __init__(
+        self,
+        transactions_processor: TransactionsProcessor,
+        transaction_hash: str,
+        flush_interval: float | None = None,
+    ):
+        """
+        Initialize the recorder.
+
+        Args:
+            transactions_processor: Processor used to write the markers
+            transaction_hash: Hash of the transaction the markers belong to
+            flush_interval: Max seconds a marker may stay buffered; 0 writes
+                every marker immediately. Defaults to
+                CONSENSUS_TIMING_FLUSH_INTERVAL_SECONDS (10s).
+        """
+        self.transactions_processor = transactions_processor
+        self.transaction_hash = transaction_hash
+        self.flush_interval = (
+            flush_interval if flush_interval is not None else _flush_interval_from_env()
+        )
+        self.pending: dict[str, float] = {}
+        self._oldest_pending: float | None = None
+
+    def record(self, state_name: str):
+        """Record that `state_name` was reached now."""
+        now = time.time()
+        self.pending[state_name] = now
+        if self._oldest_pending is None:
+            self._oldest_pending = now
+        if now - self._oldest_pending >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Write all pending markers in one statement."""
+        if not self.pending:
+            return
+        markers, self.pending = self.pending, {}
+        self._oldest_pending = None
+        self.transactions_processor.add_state_timestamps(self.transaction_hash, markers)
+
+    def close(self):
+        """Flush on the way out of a state loop, without masking its exception."""
+        try:
+            self.flush()
+        except Exception as e:
+            logger.warning(
+                f"Failed to flush timing markers for {self.transaction_hash}: {e}"
+            )
@@ -0,0 +1,171 @@
+# backend/consensus/work_notifier.py
+
+"""
+Postgres LISTEN/NOTIFY listener that wakes consensus workers when new work
+becomes claimable.
+
+TransactionsProcessor emits a NOTIFY on CONSENSUS_WORK_CHANNEL whenever a
+transaction is inserted, moves into a claimable status or gets appealed. The
+listener keeps one dedicated autocommit connection per worker, registers its
+socket with the event loop and sets an asyncio.Event on every notification,
+so the worker loop can block on the event instead of polling the claim
+queries every few seconds. Polling is kept by the worker as a slow safety net
+for missed notifications (e.g. while reconnecting).
+"""
+
+import asyncio
+import json
+from typing import Callable, Optional
+
+import psycopg2
+import psycopg2.extensions
+from loguru import logger
+
+from backend.database_handler.transactions_processor import CONSENSUS_WORK_CHANNEL
+
+
+class WorkNotificationListener:
+    """
+    Listens on the consensus work channel and exposes an event workers wait on.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str = CONSENSUS_WORK_CHANNEL,
+        reconnect_delay: float = 5.0,
+    ):
+        """
+        Initialize the listener.
+
+        Args:
+            dsn: libpq connection string or URI of the database to listen on
+            channel: NOTIFY channel name
+            reconnect_delay: Seconds to wait before reconnecting after a failure
+        """
+        self.dsn = dsn
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+
+        self.work_available = asyncio.Event()
+        self.is_running = False
+
+        self._conn: Optional[psycopg2.extensions.connection] = None
+        self._fd: Optional[int] = None
+        self._connection_lost: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._callbacks: list[Callable[[dict], None]] = []
+
+    @property
+    def is_listening(self) -> bool:
+        """True while the LISTEN connection is established."""
+        return self._conn is not None and not self._conn.closed
+
+    def add_callback(self, callback: Callable[[dict], None]):
+        """Register a callback invoked with the decoded payload of each notification."""
+        self._callbacks.append(callback)
+
+    def wake(self):
+        """Wake waiting workers without a notification (e.g. from a timer)."""
+        self.work_available.set()
+
+    async def start(self):
+        """Start listening in a background task that reconnects on failure."""
+        if self.is_running:
+            return
+
+        self.is_running = True
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop listening and close the connection."""
+        self.is_running = False
+
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        self._close()
+
+    async def _run(self):
+        while self.is_running:
+            try:
+                await asyncio.to_thread(self._connect)
+            except Exception as e:
+                logger.warning(
+                    f"Work notification listener failed to connect: {e}, "
+                    f"retrying in {self.reconnect_delay}s"
+                )
+                await asyncio.sleep(self.reconnect_delay)
+                continue
+
+            self._connection_lost = asyncio.Event()
+            self._fd = self._conn.fileno()
+            self._loop.add_reader(self._fd, self._on_readable)
+            logger.info(f"Work notification listener listening on '{self.channel}'")
+
+            # Anything committed while we were not listening was missed
+            self.wake()
+
+            await self._connection_lost.wait()
+            self._close()
+            if self.is_running:
+                await asyncio.sleep(self.reconnect_delay)
+
+    def _connect(self):
+        conn = psycopg2.connect(
+            self.dsn,
+            keepalives=1,
+            keepalives_idle=30,
+            keepalives_interval=10,
+            keepalives_count=3,
+        )
+        conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        with conn.cursor() as cursor:
+            cursor.execute(f'LISTEN "{self.channel}"')
+        self._conn = conn
+
+    def _close(self):
+        conn, self._conn = self._conn, None
+        fd, self._fd = self._fd, None
+        if fd is not None:
+            self._loop.remove_reader(fd)
+        if conn is None:
+            return
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _on_readable(self):
+        if self._conn is None or self._connection_lost.is_set():
+            return
+        try:
+            self._conn.poll()
+        except Exception as e:
+            logger.warning(f"Work notification listener lost connection: {e}")
+            self._connection_lost.set()
+            return
+
+        notified = False
+        while self._conn.notifies:
+            notification = self._conn.notifies.pop(0)
+            notified = True
+            try:
+                payload = json.loads(notification.payload)
+            except (TypeError, ValueError):
+                payload = {}
+            for callback in self._callbacks:
+                try:
+                    callback(payload)
+                except Exception as e:
+                    logger.exception(f"Work notification callback failed: {e}")
+
+        if notified:
+            self.work_available.set()
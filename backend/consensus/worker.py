@@ -13,9 +13,11 @@ from backend.database_handler.models import Transactions, TransactionStatus
 from backend.database_handler.transactions_processor import TransactionsProcessor
 from backend.database_handler.accounts_manager import AccountsManager
 from backend.database_handler.errors import ContractNotFoundError
+from backend.database_handler.db_offload import run_sync
 from backend.domain.types import Transaction
 from backend.node.genvm.error_codes import GenVMInternalError
 from backend.consensus.base import ConsensusAlgorithm, NoValidatorsAvailableError
+from backend.consensus.work_notifier import WorkNotificationListener
 
 # Alias for use in context manager (avoids circular import issues)
 _NoValidatorsError = NoValidatorsAvailableError
@@ -37,6 +39,7 @@ class ConsensusWorker:
     MAX_GENERIC_ERROR_RETRIES = 3
     MAX_LEADER_CRASH_RETRIES = 3
     MAX_RECOVERY_CYCLES = 3
+    STUCK_RECOVERY_INTERVAL_SECONDS = 60
 
     def __init__(
         self,
@@ -49,6 +52,8 @@ class ConsensusWorker:
         poll_interval: int = 5,
         transaction_timeout_minutes: int = 20,
         should_shutdown: Optional[Callable[[], bool]] = None,
+        work_notifier: Optional[WorkNotificationListener] = None,
+        safety_poll_interval: int = 30,
     ):
         """
         Initialize the consensus worker.
@@ -62,6 +67,10 @@ class ConsensusWorker:
             poll_interval: Seconds to wait between polls when no work available
             transaction_timeout_minutes: Minutes before a stuck transaction is recovered
             should_shutdown: Callback that returns True if worker should stop claiming new work
+            work_notifier: Optional LISTEN/NOTIFY listener; when it is connected the
+                worker sleeps until notified instead of polling every poll_interval
+            safety_poll_interval: Seconds between polls while work_notifier is
+                connected, to pick up anything a missed notification would hide
         """
         self.worker_id = worker_id or f"worker-{uuid.uuid4().hex[:8]}"
         self.get_session = get_session
@@ -69,11 +78,15 @@ class ConsensusWorker:
         self.consensus_service = consensus_service
         self.validators_manager = validators_manager
         self.poll_interval = poll_interval
+        self.safety_poll_interval = max(safety_poll_interval, poll_interval)
         self.transaction_timeout_minutes = transaction_timeout_minutes
         self.running = True
 
         # Parallel transaction processing configuration
         self.max_parallel_txs: int = self._parse_max_parallel_txs()
+        # How many free slots a single claim query may fill at once
+        # (one transaction per contract). 1 restores one-row-per-query claiming.
+        self.claim_batch_size: int = self._parse_claim_batch_size()
         self.current_transactions: dict[str, dict] = (
             {}
         )  # Track currently processing transactions by hash
@@ -82,6 +95,14 @@ class ConsensusWorker:
         # Callback for graceful shutdown during K8s scale-down
         self.should_shutdown = should_shutdown
 
+        # NOTIFY-driven wakeup. Finalization eligibility is time-based (the
+        # finality window elapses without any DB write), so an "accepted"
+        # notification also schedules a wakeup for when the window closes.
+        self.work_notifier = work_notifier
+        self._finalization_wakeups: dict[int, asyncio.TimerHandle] = {}
+        if work_notifier is not None:
+            work_notifier.add_callback(self._on_work_notification)
+
         now_monotonic = time.monotonic()
         self._query_log_interval = 60.0  # seconds
         self._query_log_state = {
@@ -187,6 +208,43 @@ class ConsensusWorker:
 
         return parsed
 
+    def _parse_claim_batch_size(self) -> int:
+        """
+        Parse WORKER_CLAIM_BATCH_SIZE from environment with validation.
+
+        Returns:
+            Parsed value clamped to [1, max_parallel_txs]; defaults to max_parallel_txs.
+        """
+        env_value = os.environ.get("WORKER_CLAIM_BATCH_SIZE")
+
+        if env_value is None:
+            return self.max_parallel_txs
+
+        try:
+            parsed = int(env_value)
+        except (ValueError, TypeError):
+            logger.warning(
+                f"[Worker {self.worker_id}] Invalid WORKER_CLAIM_BATCH_SIZE value "
+                f"'{env_value}', using default {self.max_parallel_txs}"
+            )
+            return self.max_parallel_txs
+
+        return max(1, min(parsed, self.max_parallel_txs))
+
+    @staticmethod
+    def _execute_returning(
+        session: Session, query, params: dict, commit: bool = True
+    ) -> list:
+        """
+        Execute `query` and fetch its rows, committing when it returned any.
+        Called through run_sync so claim and recovery queries do not block
+        the event loop that drives in-flight consensus tasks.
+        """
+        rows = session.execute(query, params).all()
+        if rows and commit:
+            session.commit()
+        return rows
+
     async def claim_next_finalization(self, session: Session) -> Optional[dict]:
         """
         Claim the next transaction that needs finalization (appeal window expired).
@@ -194,6 +252,19 @@ class ConsensusWorker:
         Returns:
             Transaction data dict if claimed, None otherwise
         """
+        claimed = await self.claim_next_finalizations(session, limit=1)
+        return claimed[0] if claimed else None
+
+    async def claim_next_finalizations(
+        self, session: Session, limit: int
+    ) -> list[dict]:
+        """
+        Claim up to `limit` transactions that need finalization, at most one
+        per contract, in a single statement.
+
+        Returns:
+            List of claimed transaction data dicts (possibly empty)
+        """
         # Ordering invariant: a tx can only be claimed for finalization
         # once every OLDER tx on the same contract has reached a terminal
         # state ({FINALIZED, CANCELED}). Otherwise a younger tx could
@@ -266,12 +337,12 @@ class ConsensusWorker:
                 FROM locked_finalizations
             ),
             single_finalization AS (
-                -- FIXED: Limit update to exactly ONE transaction
+                -- At most ONE transaction per contract, up to :batch_limit contracts
                 SELECT *
                 FROM ready_for_finalization
                 WHERE rn = 1
                 ORDER BY created_at ASC
-                LIMIT 1
+                LIMIT :batch_limit
             )
             UPDATE transactions
             SET blocked_at = NOW(),
@@ -288,7 +359,9 @@ class ConsensusWorker:
         """
         )
 
-        result = session.execute(
+        rows = await run_sync(
+            self._execute_returning,
+            session,
             query,
             {
                 "worker_id": self.worker_id,
@@ -296,43 +369,47 @@ class ConsensusWorker:
                 "finality_window_seconds": self.consensus_algorithm.finality_window_time,
                 "appeal_failed_reduction": self.consensus_algorithm.finality_window_appeal_failed_reduction,
                 "stranded_threshold_seconds": STRANDED_TX_AFTER_SECONDS,
+                "batch_limit": limit,
             },
-        ).first()
+        )
         duration = time.perf_counter() - start_time
-        self._log_query_result("finalization", result, duration)
+        self._log_query_result("finalization", rows, duration)
 
-        if result:
-            logger.debug(
-                f"[Worker {self.worker_id}] Claimed next finalization result {result.hash}"
-            )
-            session.commit()
-            # Convert result to dict
-            return {
-                "hash": result.hash,
-                "from_address": result.from_address,
-                "to_address": result.to_address,
-                "data": result.data,
-                "value": result.value,
-                "type": result.type,
-                "nonce": result.nonce,
-                "gaslimit": result.gaslimit,
-                "r": result.r,
-                "s": result.s,
-                "v": result.v,
-                "leader_only": result.leader_only,
-                "execution_mode": result.execution_mode,
-                "sim_config": result.sim_config,
-                "status": result.status,
-                "consensus_data": result.consensus_data,
-                "input_data": result.input_data,
-                "created_at": result.created_at,
-                "timestamp_awaiting_finalization": result.timestamp_awaiting_finalization,
-                "appeal_failed": result.appeal_failed,
-                "blocked_at": result.blocked_at,
-                "triggered_by": result.triggered_by_hash,
-            }
+        if not rows:
+            return []
 
-        return None
+        logger.debug(
+            f"[Worker {self.worker_id}] Claimed finalizations "
+            f"{[row.hash for row in rows]}"
+        )
+        # Convert results to dicts
+        return [
+            {
+                "hash": row.hash,
+                "from_address": row.from_address,
+                "to_address": row.to_address,
+                "data": row.data,
+                "value": row.value,
+                "type": row.type,
+                "nonce": row.nonce,
+                "gaslimit": row.gaslimit,
+                "r": row.r,
+                "s": row.s,
+                "v": row.v,
+                "leader_only": row.leader_only,
+                "execution_mode": row.execution_mode,
+                "sim_config": row.sim_config,
+                "status": row.status,
+                "consensus_data": row.consensus_data,
+                "input_data": row.input_data,
+                "created_at": row.created_at,
+                "timestamp_awaiting_finalization": row.timestamp_awaiting_finalization,
+                "appeal_failed": row.appeal_failed,
+                "blocked_at": row.blocked_at,
+                "triggered_by": row.triggered_by_hash,
+            }
+            for row in rows
+        ]
 
     async def claim_next_appeal(self, session: Session) -> Optional[dict]:
         """
@@ -342,6 +419,17 @@ class ConsensusWorker:
         Returns:
             Transaction data dict if claimed, None otherwise
         """
+        claimed = await self.claim_next_appeals(session, limit=1)
+        return claimed[0] if claimed else None
+
+    async def claim_next_appeals(self, session: Session, limit: int) -> list[dict]:
+        """
+        Claim up to `limit` appealed transactions, at most one per contract,
+        in a single statement.
+
+        Returns:
+            List of claimed transaction data dicts (possibly empty)
+        """
         # Query to atomically claim an appealed transaction
         start_time = time.perf_counter()
         query = text(
@@ -374,12 +462,12 @@ class ConsensusWorker:
                 FROM locked_appeals
             ),
             single_appeal AS (
-                -- FIXED: Limit update to exactly ONE transaction
+                -- At most ONE transaction per contract, up to :batch_limit contracts
                 SELECT *
                 FROM available_appeals
                 WHERE rn = 1
                 ORDER BY created_at ASC
-                LIMIT 1
+                LIMIT :batch_limit
             )
             UPDATE transactions
             SET blocked_at = NOW(),
@@ -399,49 +487,54 @@ class ConsensusWorker:
         """
         )
 
-        result = session.execute(
+        rows = await run_sync(
+            self._execute_returning,
+            session,
             query,
             {
                 "worker_id": self.worker_id,
                 "timeout": f"{self.transaction_timeout_minutes} minutes",
+                "batch_limit": limit,
             },
-        ).first()
+        )
         duration = time.perf_counter() - start_time
-        self._log_query_result("appeal", result, duration)
+        self._log_query_result("appeal", rows, duration)
 
-        if result:
-            session.commit()
-            # Convert result to dict
-            return {
-                "hash": result.hash,
-                "from_address": result.from_address,
-                "to_address": result.to_address,
-                "data": result.data,
-                "value": result.value,
-                "type": result.type,
-                "nonce": result.nonce,
-                "gaslimit": result.gaslimit,
-                "r": result.r,
-                "s": result.s,
-                "v": result.v,
-                "leader_only": result.leader_only,
-                "execution_mode": result.execution_mode,
-                "sim_config": result.sim_config,
-                "status": result.status,
-                "consensus_data": result.consensus_data,
-                "input_data": result.input_data,
-                "created_at": result.created_at,
-                "appealed": result.appealed,
-                "appeal_failed": result.appeal_failed,
-                "timestamp_appeal": result.timestamp_appeal,
-                "appeal_undetermined": result.appeal_undetermined,
-                "appeal_leader_timeout": result.appeal_leader_timeout,
-                "appeal_validators_timeout": result.appeal_validators_timeout,
-                "blocked_at": result.blocked_at,
-                "triggered_by": result.triggered_by_hash,
-            }
+        if not rows:
+            return []
 
-        return None
+        # Convert results to dicts
+        return [
+            {
+                "hash": row.hash,
+                "from_address": row.from_address,
+                "to_address": row.to_address,
+                "data": row.data,
+                "value": row.value,
+                "type": row.type,
+                "nonce": row.nonce,
+                "gaslimit": row.gaslimit,
+                "r": row.r,
+                "s": row.s,
+                "v": row.v,
+                "leader_only": row.leader_only,
+                "execution_mode": row.execution_mode,
+                "sim_config": row.sim_config,
+                "status": row.status,
+                "consensus_data": row.consensus_data,
+                "input_data": row.input_data,
+                "created_at": row.created_at,
+                "appealed": row.appealed,
+                "appeal_failed": row.appeal_failed,
+                "timestamp_appeal": row.timestamp_appeal,
+                "appeal_undetermined": row.appeal_undetermined,
+                "appeal_leader_timeout": row.appeal_leader_timeout,
+                "appeal_validators_timeout": row.appeal_validators_timeout,
+                "blocked_at": row.blocked_at,
+                "triggered_by": row.triggered_by_hash,
+            }
+            for row in rows
+        ]
 
     async def claim_next_transaction(self, session: Session) -> Optional[dict]:
         """
@@ -451,6 +544,17 @@ class ConsensusWorker:
         Returns:
             Transaction data dict if claimed, None otherwise
         """
+        claimed = await self.claim_next_transactions(session, limit=1)
+        return claimed[0] if claimed else None
+
+    async def claim_next_transactions(self, session: Session, limit: int) -> list[dict]:
+        """
+        Claim up to `limit` transactions for `limit` distinct contracts in a
+        single statement, so free processing slots are filled in one round-trip.
+
+        Returns:
+            List of claimed transaction data dicts (possibly empty)
+        """
         # Query to atomically claim a transaction
         # Ensures only one transaction per contract is processed at a time
         start_time = time.perf_counter()
@@ -516,7 +620,8 @@ class ConsensusWorker:
                 FROM candidate_transactions
             ),
             single_transaction AS (
-                -- Select only ONE transaction (oldest across all contracts)
+                -- Select ONE transaction per contract (oldest across all
+                -- contracts first), up to :batch_limit contracts
                 -- Prefer transactions that have not already needed recovery, so
                 -- one repeatedly reset poison tx does not monopolize all workers.
                 -- Upgrade transactions (type=3) are prioritized ahead of regular
@@ -528,7 +633,7 @@ class ConsensusWorker:
                          CASE WHEN type = 3 THEN 0 ELSE 1 END,
                          created_at ASC,
                          hash ASC
-                LIMIT 1
+                LIMIT :batch_limit
             )
             UPDATE transactions
             SET blocked_at = NOW(),
@@ -545,46 +650,54 @@ class ConsensusWorker:
         """
         )
 
-        result = session.execute(
+        rows = await run_sync(
+            self._execute_returning,
+            session,
             query,
             {
                 "worker_id": self.worker_id,
                 "timeout": f"{self.transaction_timeout_minutes} minutes",
                 "finality_window_seconds": self.consensus_algorithm.finality_window_time,
                 "appeal_failed_reduction": self.consensus_algorithm.finality_window_appeal_failed_reduction,
+                "batch_limit": limit,
             },
-        ).first()
+        )
         duration = time.perf_counter() - start_time
-        self._log_query_result("transaction", result, duration)
+        self._log_query_result("transaction", rows, duration)
 
-        if result:
-            logger.debug(f"[Worker {self.worker_id}] Claimed transaction {result.hash}")
-            session.commit()
-            # Convert result to dict
-            return {
-                "hash": result.hash,
-                "from_address": result.from_address,
-                "to_address": result.to_address,
-                "data": result.data,
-                "value": result.value,
-                "type": result.type,
-                "nonce": result.nonce,
-                "gaslimit": result.gaslimit,
-                "r": result.r,
-                "s": result.s,
-                "v": result.v,
-                "leader_only": result.leader_only,
-                "execution_mode": result.execution_mode,
-                "sim_config": result.sim_config,
-                "status": result.status,
-                "consensus_data": result.consensus_data,
-                "input_data": result.input_data,
-                "created_at": result.created_at,
-                "blocked_at": result.blocked_at,
-                "triggered_by": result.triggered_by_hash,
-            }
+        if not rows:
+            return []
 
-        return None
+        logger.debug(
+            f"[Worker {self.worker_id}] Claimed transactions "
+            f"{[row.hash for row in rows]}"
+        )
+        # Convert results to dicts
+        return [
+            {
+                "hash": row.hash,
+                "from_address": row.from_address,
+                "to_address": row.to_address,
+                "data": row.data,
+                "value": row.value,
+                "type": row.type,
+                "nonce": row.nonce,
+                "gaslimit": row.gaslimit,
+                "r": row.r,
+                "s": row.s,
+                "v": row.v,
+                "leader_only": row.leader_only,
+                "execution_mode": row.execution_mode,
+                "sim_config": row.sim_config,
+                "status": row.status,
+                "consensus_data": row.consensus_data,
+                "input_data": row.input_data,
+                "created_at": row.created_at,
+                "blocked_at": row.blocked_at,
+                "triggered_by": row.triggered_by_hash,
+            }
+            for row in rows
+        ]
 
     def release_transaction(self, session: Session, transaction_hash: str):
         """
@@ -924,7 +1037,9 @@ class ConsensusWorker:
             RETURNING hash, recovery_count;
             """
         ).bindparams(bindparam("consensus_statuses", expanding=True))
-        escalated = session.execute(
+        escalated = await run_sync(
+            self._execute_returning,
+            session,
             escalate_query,
             {
                 "max_cycles": self._max_recovery_cycles,
@@ -932,9 +1047,8 @@ class ConsensusWorker:
                 "orphan_timeout": "5 minutes",
                 "consensus_statuses": list(self._CONSENSUS_RECOVERABLE_STATUSES),
             },
-        ).fetchall()
+        )
         if escalated:
-            session.commit()
             for row in escalated:
                 logger.error(
                     f"[Worker {self.worker_id}] Transaction {row.hash} canceled "
@@ -959,15 +1073,16 @@ class ConsensusWorker:
             RETURNING hash, status;
             """
         ).bindparams(bindparam("finalization_statuses", expanding=True))
-        released = session.execute(
+        released = await run_sync(
+            self._execute_returning,
+            session,
             release_finalization_query,
             {
                 "timeout": f"{self.transaction_timeout_minutes} minutes",
                 "finalization_statuses": list(self._FINALIZATION_ELIGIBLE_STATUSES),
             },
-        ).fetchall()
+        )
         if released:
-            session.commit()
             for row in released:
                 logger.info(
                     f"[Worker {self.worker_id}] Released orphaned finalization "
@@ -1021,7 +1136,9 @@ class ConsensusWorker:
             """
         ).bindparams(bindparam("consensus_statuses", expanding=True))
 
-        result = session.execute(
+        recovered = await run_sync(
+            self._execute_returning,
+            session,
             recovery_query,
             {
                 "max_cycles": self._max_recovery_cycles,
@@ -1030,9 +1147,7 @@ class ConsensusWorker:
                 "consensus_statuses": list(self._CONSENSUS_RECOVERABLE_STATUSES),
             },
         )
-        recovered = result.fetchall()
         if recovered:
-            session.commit()
             for row in recovered:
                 logger.info(
                     f"[Worker {self.worker_id}] Recovered stuck transaction {row.hash} "
@@ -1066,13 +1181,16 @@ class ConsensusWorker:
             LIMIT 50
             """
         ).bindparams(bindparam("finalization_statuses", expanding=True))
-        stuck = session.execute(
+        stuck = await run_sync(
+            self._execute_returning,
+            session,
             stuck_finalization_query,
             {
                 "finalization_statuses": list(self._FINALIZATION_ELIGIBLE_STATUSES),
                 "threshold_seconds": stuck_threshold_seconds,
             },
-        ).fetchall()
+            commit=False,
+        )
         if stuck:
             for row in stuck:
                 logger.warning(
@@ -1510,6 +1628,11 @@ class ConsensusWorker:
         import base64
         from backend.node.genvm import get_code_slot
         from backend.database_handler.models import CurrentState
+        from backend.database_handler.contract_storage import (
+            ContractStorage,
+            is_slot_backed,
+            slot_backed_data,
+        )
 
         tx_hash = transaction_data["hash"]
 
@@ -1560,18 +1683,30 @@ class ConsensusWorker:
             # Update contract data - update BOTH accepted and finalized state
             # Since upgrade transactions bypass consensus and go directly to FINALIZED,
             # both state trees must be updated for reads to see the new code
-            contract.data = {
-                "state": {
-                    "accepted": {
-                        **contract.data["state"]["accepted"],
-                        code_slot_key: code_slot_value,
-                    },
-                    "finalized": {
-                        **contract.data["state"]["finalized"],
-                        code_slot_key: code_slot_value,
+            if is_slot_backed(contract.data):
+                version = contract.data["version"] + 1
+                storage = ContractStorage(session)
+                for state_name in ("accepted", "finalized"):
+                    storage.apply_write_set(
+                        contract_address,
+                        state_name,
+                        {code_slot_key: code_slot_value},
+                        version,
+                    )
+                contract.data = slot_backed_data(version)
+            else:
+                contract.data = {
+                    "state": {
+                        "accepted": {
+                            **contract.data["state"]["accepted"],
+                            code_slot_key: code_slot_value,
+                        },
+                        "finalized": {
+                            **contract.data["state"]["finalized"],
+                            code_slot_key: code_slot_value,
+                        },
                     },
-                },
-            }
+                }
 
             # Store success in consensus_data for receipt
             tx = session.query(Transactions).filter_by(hash=tx_hash).one()
@@ -1863,7 +1998,12 @@ class ConsensusWorker:
         if now_monotonic - state["last_log"] < self._query_log_interval:
             return
 
-        result_text = "returned a row" if result is not None else "returned no rows"
+        if isinstance(result, list):
+            result_text = (
+                f"returned {len(result)} rows" if result else "returned no rows"
+            )
+        else:
+            result_text = "returned a row" if result is not None else "returned no rows"
         logger.debug(
             f"[Worker {self.worker_id}] {state['label']} query {result_text}: {result!r} "
             f"in {duration_seconds:.3f}s (polls since last log: {state['polls']})"
@@ -1930,27 +2070,40 @@ class ConsensusWorker:
 
     async def _try_claim_work(self, session: Session) -> bool:
         """
-        Try to claim and spawn task for next work item.
+        Try to claim work for the free processing slots and spawn a task per item.
+
+        Each claim query fills up to `claim_batch_size` free slots in one
+        statement (one item per contract), so a burst across many contracts
+        is picked up in a single pass instead of one round-trip per slot.
 
         Args:
             session: Database session for claiming work
 
         Returns:
-            True if work was claimed and task spawned, False otherwise
+            True if work was claimed and at least one task spawned, False otherwise
         """
         # Priority: appeals > finalizations > transactions
+        free_slots = min(
+            self.max_parallel_txs - len(self._active_tasks), self.claim_batch_size
+        )
+        if free_slots <= 0:
+            return False
+
+        spawned = 0
 
-        appeal_data = await self.claim_next_appeal(session)
-        if appeal_data:
+        for appeal_data in await self.claim_next_appeals(session, free_slots):
             logger.debug(
                 f"[Worker {self.worker_id}] Claimed appeal for transaction {appeal_data['hash']}"
             )
             task = asyncio.create_task(self._process_appeal_task(appeal_data))
             self._active_tasks.add(task)
+            spawned += 1
+        if spawned >= free_slots:
             return True
 
-        finalization_data = await self.claim_next_finalization(session)
-        if finalization_data:
+        for finalization_data in await self.claim_next_finalizations(
+            session, free_slots - spawned
+        ):
             logger.debug(
                 f"[Worker {self.worker_id}] Claimed finalization for transaction {finalization_data['hash']}"
             )
@@ -1958,10 +2111,13 @@ class ConsensusWorker:
                 self._process_finalization_task(finalization_data)
             )
             self._active_tasks.add(task)
+            spawned += 1
+        if spawned >= free_slots:
             return True
 
-        transaction_data = await self.claim_next_transaction(session)
-        if transaction_data:
+        for transaction_data in await self.claim_next_transactions(
+            session, free_slots - spawned
+        ):
             tx_hash = transaction_data["hash"]
             # Check backoff for no-validators retry
             if not self._is_in_backoff(transaction_data):
@@ -1970,12 +2126,75 @@ class ConsensusWorker:
                     self._process_transaction_task(transaction_data)
                 )
                 self._active_tasks.add(task)
-                return True
+                spawned += 1
             else:
                 # Release transaction if in backoff
                 self.release_transaction(session, tx_hash)
 
-        return False
+        return spawned > 0
+
+    def _on_work_notification(self, payload: dict):
+        """
+        Schedule a wakeup for when a newly accepted transaction becomes
+        finalization-eligible. Wakeups are coalesced per second so a burst of
+        acceptances only arms a handful of timers.
+        """
+        if payload.get("reason") not in (
+            TransactionStatus.ACCEPTED.value,
+            TransactionStatus.UNDETERMINED.value,
+            TransactionStatus.LEADER_TIMEOUT.value,
+            TransactionStatus.VALIDATORS_TIMEOUT.value,
+        ):
+            return
+
+        delay = self.consensus_algorithm.finality_window_time
+        if not delay or delay <= 0:
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = int(loop.time() + delay) + 1
+        if deadline in self._finalization_wakeups:
+            return
+
+        def _wake():
+            self._finalization_wakeups.pop(deadline, None)
+            self.work_notifier.wake()
+
+        self._finalization_wakeups[deadline] = loop.call_at(deadline, _wake)
+
+    async def _wait_for_work(self):
+        """
+        Sleep until a processing slot frees up, new work is notified, or the
+        poll interval elapses.
+
+        While the work notifier is connected the poll interval is only a
+        safety net (safety_poll_interval); otherwise fall back to poll_interval.
+        """
+        listening = self.work_notifier is not None and self.work_notifier.is_listening
+        timeout = self.safety_poll_interval if listening else self.poll_interval
+
+        waiters = set(self._active_tasks)
+        notified_waiter = None
+        if self.work_notifier is not None:
+            notified_waiter = asyncio.create_task(
+                self.work_notifier.work_available.wait()
+            )
+            waiters.add(notified_waiter)
+
+        if not waiters:
+            await asyncio.sleep(timeout)
+            return
+
+        try:
+            await asyncio.wait(
+                waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            if notified_waiter is not None:
+                notified_waiter.cancel()
+                # Clear before the next claim pass: a notification arriving
+                # during that pass sets the event again and is not lost.
+                self.work_notifier.work_available.clear()
 
     async def run(self):
         """
@@ -1984,10 +2203,11 @@ class ConsensusWorker:
         """
         logger.info(
             f"[Worker {self.worker_id}] Starting consensus worker "
-            f"(max_parallel_txs={self.max_parallel_txs})"
+            f"(max_parallel_txs={self.max_parallel_txs}, "
+            f"notify={'on' if self.work_notifier is not None else 'off'})"
         )
 
-        recovery_counter = 0
+        last_recovery = time.monotonic()
 
         while self.running:
             try:
@@ -2016,10 +2236,14 @@ class ConsensusWorker:
                     break
 
                 with self.get_session() as session:
-                    # Periodically recover stuck transactions (every 12 iterations = ~60 seconds)
-                    recovery_counter += 1
-                    if recovery_counter >= 12:
-                        recovery_counter = 0
+                    # Periodically recover stuck transactions. Time-based rather
+                    # than per-iteration: with notifications the loop wakes at
+                    # an irregular rate.
+                    if (
+                        time.monotonic() - last_recovery
+                        >= self.STUCK_RECOVERY_INTERVAL_SECONDS
+                    ):
+                        last_recovery = time.monotonic()
                         recovered = await self.recover_stuck_transactions(session)
                         if recovered > 0:
                             logger.info(
@@ -2033,16 +2257,8 @@ class ConsensusWorker:
                             # Try to claim more immediately if we have capacity
                             continue
 
-                # Wait for a task to complete or poll interval
-                if self._active_tasks:
-                    done, _ = await asyncio.wait(
-                        self._active_tasks,
-                        timeout=self.poll_interval,
-                        return_when=asyncio.FIRST_COMPLETED,
-                    )
-                else:
-                    # No active tasks, wait before polling again
-                    await asyncio.sleep(self.poll_interval)
+                # Wait for a task to complete, a work notification or the poll interval
+                await self._wait_for_work()
 
             except Exception as e:
                 logger.exception(f"[Worker {self.worker_id}] Error in main loop: {e}")
@@ -2055,3 +2271,9 @@ class ConsensusWorker:
             f"({len(self._active_tasks)} active tasks)"
         )
         self.running = False
+        for handle in self._finalization_wakeups.values():
+            handle.cancel()
+        self._finalization_wakeups.clear()
+        if self.work_notifier is not None:
+            # Unblock run() if it is waiting for work
+            self.work_notifier.wake()
@@ -2,6 +2,7 @@
 
 import os
 import sys
+import json
 import asyncio
 import signal
 import time
@@ -14,6 +15,7 @@ from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
 
 from backend.consensus.worker import ConsensusWorker
+from backend.consensus.work_notifier import WorkNotificationListener
 from backend.protocol_rpc.message_handler.redis_worker_handler import (
     RedisWorkerMessageHandler,
 )
@@ -23,6 +25,8 @@ import backend.validators as validators
 from loguru import logger
 
 from backend.protocol_rpc.app_lifespan import create_genvm_manager
+from backend.database_handler.db_offload import db_offload, event_loop_lag
+from backend.consensus.execution_scheduler import execution_scheduler
 
 
 # Configure loguru to route logs correctly for GCP Cloud Logging
@@ -102,6 +106,23 @@ def get_genvm_failure_count() -> int:
     return _genvm_consecutive_failures
 
 
+def genvm_manager_slots(status_body: bytes) -> int | None:
+    """
+    Execution slot count from a GenVM manager /status body: the "permits"
+    total, given either as a number or as {"max": n}. None when absent.
+    """
+    try:
+        status = json.loads(status_body)
+    except (TypeError, ValueError):
+        return None
+    permits = status.get("permits") if isinstance(status, dict) else None
+    if isinstance(permits, dict):
+        permits = permits.get("max")
+    if isinstance(permits, int) and not isinstance(permits, bool) and permits > 0:
+        return permits
+    return None
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage the worker lifecycle."""
@@ -151,6 +172,7 @@ async def lifespan(app: FastAPI):
     # Get worker configuration from environment
     worker_id = os.environ.get("WORKER_ID", None)  # Auto-generate if not set
     poll_interval = int(os.environ.get("WORKER_POLL_INTERVAL", "5"))
+    safety_poll_interval = int(os.environ.get("WORKER_SAFETY_POLL_INTERVAL", "30"))
     transaction_timeout = int(os.environ.get("TRANSACTION_TIMEOUT_MINUTES", "30"))
     redis_url = os.environ.get("REDIS_URL")
 
@@ -214,6 +236,17 @@ async def lifespan(app: FastAPI):
         """Returns True if graceful shutdown has been requested."""
         return shutting_down
 
+    # LISTEN/NOTIFY wakeup: claim new work as soon as it is committed instead
+    # of waiting for the next poll. Disable to fall back to plain polling.
+    work_notifier = None
+    if os.environ.get("WORKER_LISTEN_NOTIFY", "true").lower() == "true":
+        work_notifier = WorkNotificationListener(
+            engine.url.set(drivername="postgresql").render_as_string(
+                hide_password=False
+            )
+        )
+        await work_notifier.start()
+
     # Create and start the worker
     worker = ConsensusWorker(
         get_session=get_session,
@@ -225,6 +258,8 @@ async def lifespan(app: FastAPI):
         poll_interval=poll_interval,
         transaction_timeout_minutes=transaction_timeout,
         should_shutdown=should_shutdown_callback,
+        work_notifier=work_notifier,
+        safety_poll_interval=safety_poll_interval,
     )
 
     # Get restart configuration from environment
@@ -302,6 +337,7 @@ async def lifespan(app: FastAPI):
                 logger.info(f"Restarting worker {worker.worker_id}...")
 
     worker_task = asyncio.create_task(run_worker_with_auto_restart())
+    event_loop_lag.start()
 
     print(f"Consensus Worker {worker.worker_id} started successfully")
 
@@ -371,6 +407,11 @@ async def lifespan(app: FastAPI):
             except asyncio.CancelledError:
                 pass
 
+        await event_loop_lag.stop()
+
+        if work_notifier:
+            await work_notifier.stop()
+
         # Terminate validators manager to shut down background tasks
         if validators_manager:
             try:
@@ -395,6 +436,7 @@ async def lifespan(app: FastAPI):
         print("Consensus Worker Service stopped")
 
         await genvm_manager.close()
+        db_offload.shutdown()
 
 
 SENTRY_DSN = os.getenv("SENTRY_DSN", None)
@@ -496,6 +538,10 @@ def health_check():
         }
     except:
         pass
+    metrics["event_loop"] = event_loop_lag.get_metrics()
+    metrics["db_offload"] = db_offload.get_metrics()
+    metrics["execution_scheduler"] = execution_scheduler.get_metrics()
+    metrics["event_publisher"] = worker.msg_handler.get_publish_metrics()
 
     # Probe local GenVM manager responsiveness.
     # Uses urllib (sync) instead of aiohttp since this runs in a threadpool.
@@ -520,6 +566,7 @@ def health_check():
                 else:
                     _genvm_health_last_ok = True
                     _genvm_health_last_error = None
+                    execution_scheduler.set_capacity(genvm_manager_slots(resp.read()))
                 resp.close()
             except (URLError, OSError, TimeoutError) as exc:
                 _genvm_health_last_ok = False
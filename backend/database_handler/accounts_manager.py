@@ -4,6 +4,7 @@ from eth_account import Account
 from eth_utils import is_address, to_checksum_address
 
 from .models import CurrentState, Transactions
+from .contract_storage import load_contract_data
 from backend.database_handler.errors import AccountNotFoundError
 from backend.protocol_rpc.fees import (
     FEE_ACCOUNTING_KEY,
@@ -23,7 +24,7 @@ class AccountsManager:
     def _parse_account_data(self, account_data: CurrentState) -> dict:
         return {
             "id": account_data.id,
-            "data": account_data.data,
+            "data": load_contract_data(self.session, account_data),
             "balance": account_data.balance,
             "updated_at": account_data.updated_at.isoformat(),
         }
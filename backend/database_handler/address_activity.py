@@ -0,0 +1,66 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+
+# Counters as they would be if recomputed from transactions right now.
+_ACTUAL_COUNTS = """
+    SELECT address, SUM(sent) AS sent_count, SUM(pending) AS pending_count
+    FROM (
+        SELECT from_address AS address, 1 AS sent, 0 AS pending
+        FROM transactions
+        WHERE from_address IS NOT NULL
+        UNION ALL
+        SELECT to_address, 0, CASE WHEN status = 'PENDING' THEN 1 ELSE 0 END
+        FROM transactions
+        WHERE to_address IS NOT NULL
+    ) AS t
+    GROUP BY address
+"""
+
+_DRIFT = f"""
+    SELECT
+        COALESCE(actual.address, stored.address) AS address,
+        COALESCE(stored.sent_count, 0) AS stored_sent_count,
+        COALESCE(actual.sent_count, 0) AS actual_sent_count,
+        COALESCE(stored.pending_count, 0) AS stored_pending_count,
+        COALESCE(actual.pending_count, 0) AS actual_pending_count
+    FROM ({_ACTUAL_COUNTS}) AS actual
+    FULL OUTER JOIN address_activity AS stored ON stored.address = actual.address
+    WHERE COALESCE(stored.sent_count, 0) <> COALESCE(actual.sent_count, 0)
+       OR COALESCE(stored.pending_count, 0) <> COALESCE(actual.pending_count, 0)
+    ORDER BY 1
+"""
+
+
+def find_address_activity_drift(session: Session, limit: int = 100) -> list[dict]:
+    """
+    Compare address_activity against a full recount of transactions.
+
+    Returns up to `limit` addresses whose stored counters differ from the
+    recount. An empty list means the triggers have kept the table exact.
+    """
+    rows = session.execute(text(f"{_DRIFT} LIMIT :limit"), {"limit": limit})
+    return [dict(row._mapping) for row in rows]
+
+
+def repair_address_activity(session: Session) -> int:
+    """
+    Overwrite drifted counters with the recounted values.
+
+    Blocks writes to transactions for the duration so the recount cannot race
+    the triggers. Returns the number of addresses repaired; the caller commits.
+    """
+    session.execute(text("LOCK TABLE transactions IN SHARE MODE"))
+    result = session.execute(
+        text(
+            f"""
+            INSERT INTO address_activity AS a
+                (address, sent_count, pending_count)
+            SELECT address, actual_sent_count, actual_pending_count
+            FROM ({_DRIFT}) AS drift
+            ON CONFLICT (address) DO UPDATE SET
+                sent_count = EXCLUDED.sent_count,
+                pending_count = EXCLUDED.pending_count
+            """
+        )
+    )
+    return result.rowcount
@@ -1,5 +1,14 @@
 # database_handler/contract_processor.py
 from .models import CurrentState
+from .contract_snapshot import ContractSnapshot
+from .contract_storage import (
+    STATE_NAMES,
+    ContractStorage,
+    is_slot_backed,
+    slot_backed_data,
+    slot_storage_enabled,
+    state_write_set,
+)
 from sqlalchemy.orm import Session
 
 
@@ -18,7 +27,16 @@ class ContractProcessor:
         current_contract = (
             self.session.query(CurrentState).filter_by(id=contract["id"]).one()
         )
-        current_contract.data = contract["data"]
+        if slot_storage_enabled():
+            storage = ContractStorage(self.session)
+            storage.clear(contract["id"])
+            for name in STATE_NAMES:
+                storage.replace_state(
+                    contract["id"], name, contract["data"]["state"][name] or {}, 1
+                )
+            current_contract.data = slot_backed_data(1)
+        else:
+            current_contract.data = contract["data"]
         self.session.commit()
 
     def update_contract_state(
@@ -26,9 +44,14 @@ class ContractProcessor:
         contract_address: str,
         accepted_state: dict[str, str] | None = None,
         finalized_state: dict[str, str] | None = None,
+        based_on: ContractSnapshot | None = None,
     ):
         """
         Update the accepted and/or finalized state of the contract in the database.
+
+        `based_on` is the snapshot the new states were derived from. When it
+        holds the slot storage as currently stored, only the slots that
+        differ from it are written.
         """
         contract = (
             self.session.query(CurrentState)
@@ -38,25 +61,75 @@ class ContractProcessor:
             .one_or_none()
         )
 
-        if contract:
-            new_state = {
-                "accepted": (
-                    accepted_state
-                    if accepted_state is not None
-                    else contract.data["state"]["accepted"]
-                ),
-                "finalized": (
-                    finalized_state
-                    if finalized_state is not None
-                    else contract.data["state"]["finalized"]
-                ),
-            }
-            new_contract_data = {
-                "state": new_state,
+        if not contract:
+            return
+
+        new_states = {"accepted": accepted_state, "finalized": finalized_state}
+
+        if slot_storage_enabled():
+            self._update_slot_state(contract, new_states, based_on)
+        else:
+            if is_slot_backed(contract.data):
+                # Move the contract back to the blob layout
+                storage = ContractStorage(self.session)
+                stored_states = storage.read_state(contract_address)
+                storage.clear(contract_address)
+            else:
+                stored_states = contract.data["state"]
+
+            contract.data = {
+                "state": {
+                    name: (
+                        new_states[name]
+                        if new_states[name] is not None
+                        else stored_states[name]
+                    )
+                    for name in STATE_NAMES
+                },
             }
+        self.session.commit()
 
-            contract.data = new_contract_data
-            self.session.commit()
+    def _update_slot_state(
+        self,
+        contract: CurrentState,
+        new_states: dict[str, dict[str, str] | None],
+        based_on: ContractSnapshot | None,
+    ):
+        storage = ContractStorage(self.session)
+        base_states = None
+
+        if is_slot_backed(contract.data):
+            version = contract.data["version"] + 1
+            if (
+                based_on is not None
+                and based_on.contract_address == contract.id
+                and based_on.storage_version == contract.data["version"]
+            ):
+                base_states = based_on.states
+        else:
+            # First write since slot storage was enabled: move the blob over
+            version = 1
+            storage.clear(contract.id)
+            for name in STATE_NAMES:
+                if new_states[name] is None:
+                    storage.replace_state(
+                        contract.id, name, contract.data["state"][name], version
+                    )
+
+        for name in STATE_NAMES:
+            if new_states[name] is None:
+                continue
+            if base_states is not None:
+                storage.apply_write_set(
+                    contract.id,
+                    name,
+                    state_write_set(base_states.get(name, {}), new_states[name]),
+                    version,
+                )
+            else:
+                storage.replace_state(contract.id, name, new_states[name], version)
+
+        contract.data = slot_backed_data(version)
 
     def reset_contract(self, contract_address: str) -> bool:
         """
@@ -75,6 +148,7 @@ class ContractProcessor:
         )
 
         if current_contract:
+            ContractStorage(self.session).clear(contract_address)
             current_contract.data = {}
             current_contract.balance = 0
             self.session.commit()
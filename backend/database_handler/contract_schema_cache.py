@@ -0,0 +1,80 @@
+"""
+Content-addressed cache of contract schemas.
+
+A schema is produced by running the contract code's GET_SCHEMA method in
+GenVM and depends only on that code, so it is stored in `contract_schemas`
+under the code's sha256 (plus the GenVM release, GENVM_TAG, since a new
+release may extract schemas differently) and shared by all RPC pods. A small
+per-process memo in front avoids the DB round trip for hot schemas.
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from .models import ContractSchema
+
+MEMO_MAX_ENTRIES = 256
+
+_memo: OrderedDict[tuple[str, str], dict] = OrderedDict()
+
+
+def code_hash(code: bytes) -> str:
+    return hashlib.sha256(code).hexdigest()
+
+
+def genvm_version() -> str:
+    return os.environ.get("GENVM_TAG", "")
+
+
+def schema_cache_enabled() -> bool:
+    return os.environ.get("CONTRACT_SCHEMA_CACHE", "true").lower() == "true"
+
+
+def _remember(key: tuple[str, str], schema: dict):
+    _memo[key] = schema
+    _memo.move_to_end(key)
+    while len(_memo) > MEMO_MAX_ENTRIES:
+        _memo.popitem(last=False)
+
+
+class ContractSchemaCache:
+    """Reads and writes cached schemas keyed by code hash."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get(self, code: bytes) -> dict | None:
+        key = (code_hash(code), genvm_version())
+        schema = _memo.get(key)
+        if schema is not None:
+            _memo.move_to_end(key)
+            return schema
+
+        schema = self.session.execute(
+            select(ContractSchema.schema).where(
+                ContractSchema.code_hash == key[0],
+                ContractSchema.genvm_version == key[1],
+            )
+        ).scalar_one_or_none()
+        if schema is not None:
+            _remember(key, schema)
+        return schema
+
+    def put(self, code: bytes, schema: dict):
+        key = (code_hash(code), genvm_version())
+        self.session.execute(
+            insert(ContractSchema)
+            .values(code_hash=key[0], genvm_version=key[1], schema=schema)
+            .on_conflict_do_nothing(constraint="contract_schemas_pkey")
+        )
+        self.session.commit()
+        _remember(key, schema)
+
+
+def clear_memo():
+    _memo.clear()
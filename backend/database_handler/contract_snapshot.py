@@ -1,24 +1,51 @@
 # database_handler/contract_snapshot.py
 from .models import CurrentState
 from .errors import ContractNotFoundError
+from .contract_storage import ContractStorage, is_slot_backed
 from sqlalchemy.orm import Session
-from typing import Optional, Dict
+from collections import ChainMap
+from typing import Callable, Iterable, Mapping, MutableMapping, Optional, Dict
 import base64
 import json
 
 
+def code_slot_b64() -> str:
+    """Base64 key of the slot holding a contract's deployed code."""
+    # Import here to avoid circular dependencies at module import time
+    from backend.node.genvm import get_code_slot
+
+    return base64.b64encode(get_code_slot()).decode("ascii")
+
+
 class ContractSnapshot:
     """
     Warning: if you initialize this class with a contract_address:
     - The contract_address must exist in the database.
     - `self.contract_data` and `self.states` will be loaded from the database **only once** at initialization.
+    - If `slots` is given, only those slots are loaded for slot-backed contracts
+      (see contract_storage.py); use it for point reads such as the code slot.
+
+    Use `fork()` to hand the same state to several executions: forks share
+    this snapshot's state and keep their own writes in an overlay, so this
+    snapshot must not be modified while its forks are in use.
+
+    `storage_version` is the slot-storage version the full state was read at
+    (None for blob contracts, point reads and deserialized snapshots); a
+    write based on this snapshot can then send only the slots that changed.
     """
 
     contract_address: str
     balance: int
-    states: Dict[str, Dict[str, str]]
-
-    def __init__(self, contract_address: str | None, session: Session):
+    states: Dict[str, MutableMapping[str, str]]
+    parent: Optional["ContractSnapshot"] = None
+    storage_version: Optional[int] = None
+
+    def __init__(
+        self,
+        contract_address: str | None,
+        session: Session,
+        slots: Iterable[str] | None = None,
+    ):
         if contract_address is not None:
             self.contract_address = contract_address
 
@@ -26,6 +53,18 @@ class ContractSnapshot:
             self.contract_data = contract_account.data
             self.balance = contract_account.balance
 
+            if is_slot_backed(self.contract_data):
+                if slots is None:
+                    self.storage_version = self.contract_data["version"]
+                storage = ContractStorage(session)
+                self.contract_data = {
+                    "state": (
+                        storage.read_state(contract_address)
+                        if slots is None
+                        else storage.read_slots(contract_address, slots)
+                    )
+                }
+
             if ("accepted" in self.contract_data["state"]) and (
                 isinstance(self.contract_data["state"]["accepted"], dict)
             ):
@@ -39,7 +78,15 @@ class ContractSnapshot:
             "contract_address": (
                 self.contract_address if self.contract_address else None
             ),
-            "states": self.states if self.states else {"accepted": {}, "finalized": {}},
+            "states": (
+                (
+                    self.states
+                    if self.parent is None
+                    else {status: dict(state) for status, state in self.states.items()}
+                )
+                if self.states
+                else {"accepted": {}, "finalized": {}}
+            ),
             "balance": (
                 int(b) if (b := getattr(self, "balance", None)) is not None else None
             ),
@@ -57,6 +104,33 @@ class ContractSnapshot:
         else:
             return None
 
+    def fork(self) -> "ContractSnapshot":
+        """Copy-on-write copy: reads fall through to this snapshot, writes stay in the fork."""
+        instance = ContractSnapshot.__new__(ContractSnapshot)
+        instance.contract_address = self.contract_address
+        instance.balance = getattr(self, "balance", None)
+        instance.states = {
+            status: ChainMap({}, state) for status, state in self.states.items()
+        }
+        instance.parent = self
+        return instance
+
+    def decoded_state(
+        self,
+        status: str,
+        decode: Callable[[Mapping[str, str]], dict[bytes, bytes]],
+    ) -> dict[bytes, bytes]:
+        """
+        `decode(states[status])`, computed once and shared by every fork of
+        this snapshot. Callers must not modify the returned dict.
+        """
+        cache = self.__dict__.setdefault("_decoded_states", {})
+        decoded = cache.get(status)
+        if decoded is None:
+            decoded = decode(self.states.get(status, {}))
+            cache[status] = decoded
+        return decoded
+
     def _load_contract_account(self, session: Session) -> CurrentState:
         """Load and return the current state of the contract from the database."""
         result = (
@@ -87,14 +161,10 @@ class ContractSnapshot:
         slices out the code payload, and returns it base64-encoded. Returns None
         if missing/invalid.
         """
-        # Import here to avoid circular dependencies at module import time
-        from backend.node.genvm import get_code_slot
-
         accepted = self.states.get("accepted") or {}
 
         try:
-            code_slot_b64 = base64.b64encode(get_code_slot()).decode("ascii")
-            stored = accepted.get(code_slot_b64)
+            stored = accepted.get(code_slot_b64())
             if not stored:
                 return None
 
@@ -0,0 +1,206 @@
+# database_handler/contract_storage.py
+"""
+Slot-backed contract storage.
+
+By default a contract's state lives in `current_state.data` as
+`{"state": {"accepted": {slot: value}, "finalized": {slot: value}}}` (base64
+slot id -> base64 value) and every accepted/finalized transaction rewrites
+the whole blob. With CONTRACT_STORAGE_BACKEND=slots each slot is a row in
+`contract_storage_slots` instead: writes upsert/delete only the slots whose
+value changed, and point reads fetch only the slots they ask for.
+
+A slot-backed contract keeps a small marker in `current_state.data` so the
+existing "is this contract deployed" checks on `data` keep working; use
+`load_contract_data` to get the blob layout for either kind of row.
+Contracts move to the slot layout on their first write in slots mode and back
+to the blob on their first write in jsonb mode, so the setting can be flipped
+without a backfill.
+"""
+
+import json
+import os
+from typing import Iterable, Mapping
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from .models import CurrentState
+
+STATE_NAMES = ("accepted", "finalized")
+SLOTS_STORAGE = "slots"
+
+
+def slot_storage_enabled() -> bool:
+    """Whether contract state writes should go to the slot table."""
+    backend = os.environ.get("CONTRACT_STORAGE_BACKEND", "jsonb")
+    return backend.strip().lower() == SLOTS_STORAGE
+
+
+def is_slot_backed(data) -> bool:
+    """Whether a `current_state.data` value is a slot-storage marker."""
+    return isinstance(data, dict) and data.get("storage") == SLOTS_STORAGE
+
+
+def slot_backed_data(version: int) -> dict:
+    """Marker stored in `current_state.data` for slot-backed contracts."""
+    return {
+        "storage": SLOTS_STORAGE,
+        "version": version,
+        "state": {name: {} for name in STATE_NAMES},
+    }
+
+
+def load_contract_data(session: Session, contract: CurrentState) -> dict:
+    """Return `contract.data` in the blob layout, reading slots if needed."""
+    if is_slot_backed(contract.data):
+        return {"state": ContractStorage(session).read_state(contract.id)}
+    return contract.data
+
+
+def state_write_set(
+    old: Mapping[str, str], new: Mapping[str, str]
+) -> dict[str, str | None]:
+    """Slots that differ between two states; None marks a deleted slot."""
+    write_set: dict[str, str | None] = {
+        slot: value for slot, value in new.items() if old.get(slot) != value
+    }
+    write_set.update({slot: None for slot in old if slot not in new})
+    return write_set
+
+
+class ContractStorage:
+    """
+    Reads and writes the `contract_storage_slots` rows of contracts.
+
+    Callers are expected to hold the contract's `current_state` row lock
+    (SELECT ... FOR UPDATE) around writes, as ContractProcessor does.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def read_state(self, contract_address: str) -> dict[str, dict[str, str]]:
+        """Load every slot of both states of a contract."""
+        rows = self.session.execute(
+            text(
+                """
+                SELECT state, slot, value FROM contract_storage_slots
+                WHERE contract_address = :address
+                """
+            ),
+            {"address": contract_address},
+        )
+        states = {name: {} for name in STATE_NAMES}
+        for state, slot, value in rows:
+            states[state][slot] = value
+        return states
+
+    def read_slots(
+        self, contract_address: str, slots: Iterable[str]
+    ) -> dict[str, dict[str, str]]:
+        """Load only the given slots (in both states) of a contract."""
+        states = {name: {} for name in STATE_NAMES}
+        slots = list(slots)
+        if not slots:
+            return states
+        rows = self.session.execute(
+            text(
+                """
+                SELECT state, slot, value FROM contract_storage_slots
+                WHERE contract_address = :address AND slot = ANY(:slots)
+                """
+            ),
+            {"address": contract_address, "slots": slots},
+        )
+        for state, slot, value in rows:
+            states[state][slot] = value
+        return states
+
+    def replace_state(
+        self,
+        contract_address: str,
+        state: str,
+        values: dict[str, str],
+        version: int,
+    ):
+        """
+        Make the stored `state` of a contract equal to `values`.
+
+        The diff against the stored rows is done by Postgres, so only slots
+        whose value changed are rewritten and only vanished slots deleted.
+        """
+        self._upsert(contract_address, state, values, version)
+        self.session.execute(
+            text(
+                """
+                DELETE FROM contract_storage_slots
+                WHERE contract_address = :address AND state = :state
+                    AND slot <> ALL(:slots)
+                """
+            ),
+            {"address": contract_address, "state": state, "slots": list(values)},
+        )
+
+    def apply_write_set(
+        self,
+        contract_address: str,
+        state: str,
+        write_set: dict[str, str | None],
+        version: int,
+    ):
+        """Upsert the given slots of a contract; a None value deletes the slot."""
+        upserts = {
+            slot: value for slot, value in write_set.items() if value is not None
+        }
+        deletes = [slot for slot, value in write_set.items() if value is None]
+        if upserts:
+            self._upsert(contract_address, state, upserts, version)
+        if deletes:
+            self.session.execute(
+                text(
+                    """
+                    DELETE FROM contract_storage_slots
+                    WHERE contract_address = :address AND state = :state
+                        AND slot = ANY(:slots)
+                    """
+                ),
+                {"address": contract_address, "state": state, "slots": deletes},
+            )
+
+    def clear(self, contract_address: str):
+        """Delete every slot of a contract."""
+        self.session.execute(
+            text(
+                "DELETE FROM contract_storage_slots WHERE contract_address = :address"
+            ),
+            {"address": contract_address},
+        )
+
+    def _upsert(
+        self,
+        contract_address: str,
+        state: str,
+        values: dict[str, str],
+        version: int,
+    ):
+        if not values:
+            return
+        self.session.execute(
+            text(
+                """
+                INSERT INTO contract_storage_slots
+                    (contract_address, state, slot, value, version)
+                SELECT :address, :state, incoming.key, incoming.value, :version
+                FROM jsonb_each_text(CAST(:values AS jsonb)) AS incoming
+                ON CONFLICT (contract_address, state, slot) DO UPDATE
+                SET value = EXCLUDED.value, version = EXCLUDED.version
+                WHERE contract_storage_slots.value IS DISTINCT FROM EXCLUDED.value
+                """
+            ),
+            {
+                "address": contract_address,
+                "state": state,
+                "values": json.dumps(values),
+                "version": version,
+            },
+        )
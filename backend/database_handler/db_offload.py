@@ -0,0 +1,206 @@
+"""
+Run blocking database work off the asyncio event loop.
+
+SQLAlchemy sessions in this codebase are synchronous. Called from a
+coroutine, a slow query stalls every request, WebSocket and health probe
+served by the same loop. `run_sync` runs such work on a bounded thread
+pool instead (DB_OFFLOAD_MAX_WORKERS threads; keep it at or below the
+connection pool size so queued calls wait here rather than in the pool
+checkout), so unrelated requests no longer wait for the slowest query.
+
+Work is run with a copy of the caller's context variables, and
+`calling_event_loop()` gives code running in a pool thread the loop to
+hand asynchronous follow-ups back to.
+
+`EventLoopLagMonitor` measures how late the loop wakes up from a short
+sleep; sustained lag means something still blocks it.
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_LAG_INTERVAL = 0.5
+DEFAULT_LAG_WINDOW = 120
+
+T = TypeVar("T")
+
+_calling_loop: contextvars.ContextVar[asyncio.AbstractEventLoop | None] = (
+    contextvars.ContextVar("db_offload_calling_loop", default=None)
+)
+
+
+def calling_event_loop() -> asyncio.AbstractEventLoop | None:
+    """The event loop whose `run_sync` call is running in this thread, if any."""
+    return _calling_loop.get()
+
+
+def _env_number(name: str, default, cast):
+    try:
+        return cast(os.environ.get(name, str(default)))
+    except ValueError:
+        return default
+
+
+class DBOffloadExecutor:
+    """Bounded thread pool for synchronous database work, with queue metrics."""
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.max_workers = max(1, max_workers)
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._running = 0
+        self.completed = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    @classmethod
+    def from_environment(cls) -> "DBOffloadExecutor":
+        return cls(
+            max_workers=_env_number("DB_OFFLOAD_MAX_WORKERS", DEFAULT_MAX_WORKERS, int)
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="db-offload"
+                )
+            return self._executor
+
+    async def run(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        context.run(_calling_loop.set, loop)
+        call = functools.partial(
+            context.run,
+            self._timed,
+            time.perf_counter(),
+            functools.partial(fn, *args, **kwargs),
+        )
+
+        self._in_flight += 1
+        future = loop.run_in_executor(self._get_executor(), call)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # The thread cannot be interrupted and may still be using the
+            # caller's session: let it finish before the caller unwinds.
+            while not future.done():
+                try:
+                    await asyncio.wait({future})
+                except asyncio.CancelledError:
+                    pass
+            if not future.cancelled():
+                future.exception()
+            raise
+        finally:
+            self._in_flight -= 1
+
+    def _timed(self, submitted_at: float, call: Callable[[], T]) -> T:
+        waited = time.perf_counter() - submitted_at
+        with self._lock:
+            self._running += 1
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        try:
+            return call()
+        finally:
+            with self._lock:
+                self._running -= 1
+                self.completed += 1
+
+    def get_metrics(self) -> dict:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "in_flight": self._in_flight,
+                "running": self._running,
+                "queued": max(0, self._in_flight - self._running),
+                "completed_total": self.completed,
+                "wait_seconds_total": round(self.total_wait_seconds, 6),
+                "max_wait_seconds": round(self.max_wait_seconds, 6),
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+class EventLoopLagMonitor:
+    """Samples how late the running loop wakes up from an `interval` sleep."""
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_LAG_INTERVAL,
+        window: int = DEFAULT_LAG_WINDOW,
+    ):
+        self.interval = interval
+        self._samples: deque[float] = deque(maxlen=max(1, window))
+        self._task: asyncio.Task | None = None
+        self.samples_total = 0
+
+    @classmethod
+    def from_environment(cls) -> "EventLoopLagMonitor":
+        return cls(
+            interval=_env_number(
+                "EVENT_LOOP_LAG_INTERVAL_SECONDS", DEFAULT_LAG_INTERVAL, float
+            )
+        )
+
+    def start(self) -> None:
+        if self.interval <= 0 or (self._task is not None and not self._task.done()):
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.record(loop.time() - started - self.interval)
+
+    def record(self, lag_seconds: float) -> None:
+        self._samples.append(max(0.0, lag_seconds))
+        self.samples_total += 1
+
+    def get_metrics(self) -> dict:
+        """Latest, p99 and max lag over the last `window` samples."""
+        recent = list(self._samples)
+        if not recent:
+            return {"lag_seconds": 0.0, "lag_p99_seconds": 0.0, "lag_max_seconds": 0.0}
+        samples = sorted(recent)
+        p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+        return {
+            "lag_seconds": round(recent[-1], 6),
+            "lag_p99_seconds": round(p99, 6),
+            "lag_max_seconds": round(samples[-1], 6),
+        }
+
+
+db_offload = DBOffloadExecutor.from_environment()
+event_loop_lag = EventLoopLagMonitor.from_environment()
+
+
+async def run_sync(fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run `fn(*args, **kwargs)` on the shared database offload pool."""
+    return await db_offload.run(fn, *args, **kwargs)
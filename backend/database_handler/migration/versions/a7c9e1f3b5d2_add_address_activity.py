@@ -0,0 +1,142 @@
+"""maintain per-address transaction counters in address_activity
+
+Revision ID: a7c9e1f3b5d2
+Revises: e5a7c9b1d3f4
+Create Date: 2026-07-02 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c9e1f3b5d2"
+down_revision: Union[str, None] = "e5a7c9b1d3f4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Applies the counter deltas of one inserted, updated or deleted transaction.
+# Rows are upserted in address order so two transactions touching the same
+# pair of addresses cannot deadlock.
+_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION address_activity_apply() RETURNS trigger AS $$
+DECLARE
+    old_from text;
+    old_to text;
+    old_pending bigint := 0;
+    new_from text;
+    new_to text;
+    new_pending bigint := 0;
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        old_from := OLD.from_address;
+        old_to := OLD.to_address;
+        IF OLD.status = 'PENDING' THEN
+            old_pending := 1;
+        END IF;
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        new_from := NEW.from_address;
+        new_to := NEW.to_address;
+        IF NEW.status = 'PENDING' THEN
+            new_pending := 1;
+        END IF;
+    END IF;
+
+    INSERT INTO address_activity AS a
+        (address, sent_count, pending_count, last_activity_at)
+    SELECT
+        d.address,
+        SUM(d.sent),
+        SUM(d.pending),
+        CASE WHEN bool_or(d.touched) THEN now() END
+    FROM (
+        VALUES
+            (old_from, -1::bigint, 0::bigint, false),
+            (new_from, 1::bigint, 0::bigint, true),
+            (old_to, 0::bigint, -old_pending, false),
+            (new_to, 0::bigint, new_pending, true)
+    ) AS d(address, sent, pending, touched)
+    WHERE d.address IS NOT NULL
+    GROUP BY d.address
+    HAVING SUM(d.sent) <> 0 OR SUM(d.pending) <> 0 OR bool_or(d.touched)
+    ORDER BY d.address
+    ON CONFLICT (address) DO UPDATE SET
+        sent_count = a.sent_count + EXCLUDED.sent_count,
+        pending_count = a.pending_count + EXCLUDED.pending_count,
+        last_activity_at = COALESCE(EXCLUDED.last_activity_at, a.last_activity_at);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "address_activity",
+        sa.Column("address", sa.String(length=255), nullable=False),
+        sa.Column("sent_count", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("pending_count", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("last_activity_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("address", name="address_activity_pkey"),
+    )
+
+    op.execute(_TRIGGER_FUNCTION)
+    # Block concurrent writes to transactions until this migration commits,
+    # so no row lands between the triggers going live and the backfill.
+    op.execute("LOCK TABLE transactions IN SHARE ROW EXCLUSIVE MODE")
+    op.execute(
+        """
+        CREATE TRIGGER address_activity_insert_delete
+        AFTER INSERT OR DELETE ON transactions
+        FOR EACH ROW EXECUTE FUNCTION address_activity_apply()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER address_activity_update
+        AFTER UPDATE OF status, from_address, to_address ON transactions
+        FOR EACH ROW
+        WHEN (
+            OLD.status IS DISTINCT FROM NEW.status
+            OR OLD.from_address IS DISTINCT FROM NEW.from_address
+            OR OLD.to_address IS DISTINCT FROM NEW.to_address
+        )
+        EXECUTE FUNCTION address_activity_apply()
+        """
+    )
+
+    op.execute(
+        """
+        INSERT INTO address_activity
+            (address, sent_count, pending_count, last_activity_at)
+        SELECT address, SUM(sent), SUM(pending), MAX(created_at)
+        FROM (
+            SELECT from_address AS address, 1 AS sent, 0 AS pending, created_at
+            FROM transactions
+            WHERE from_address IS NOT NULL
+            UNION ALL
+            SELECT to_address, 0,
+                   CASE WHEN status = 'PENDING' THEN 1 ELSE 0 END,
+                   created_at
+            FROM transactions
+            WHERE to_address IS NOT NULL
+        ) AS t
+        GROUP BY address
+        ON CONFLICT (address) DO UPDATE SET
+            sent_count = EXCLUDED.sent_count,
+            pending_count = EXCLUDED.pending_count,
+            last_activity_at = EXCLUDED.last_activity_at
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS address_activity_update ON transactions")
+    op.execute("DROP TRIGGER IF EXISTS address_activity_insert_delete ON transactions")
+    op.execute("DROP FUNCTION IF EXISTS address_activity_apply()")
+    op.drop_table("address_activity")
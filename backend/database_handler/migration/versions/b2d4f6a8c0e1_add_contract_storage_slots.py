@@ -0,0 +1,56 @@
+"""add contract_storage_slots table for slot-backed contract state
+
+Revision ID: b2d4f6a8c0e1
+Revises: a7b8c9d0e1f2
+Create Date: 2026-06-02 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b2d4f6a8c0e1"
+down_revision: Union[str, None] = "a7b8c9d0e1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # One row per (contract, accepted|finalized, slot) so a write only
+    # touches the slots that changed instead of rewriting (and re-TOASTing)
+    # the whole current_state.data blob. No backfill: contracts move to the
+    # slot layout lazily on their first write with
+    # CONTRACT_STORAGE_BACKEND=slots (see contract_storage.py), and stay on
+    # the JSONB blob otherwise.
+    op.create_table(
+        "contract_storage_slots",
+        sa.Column("contract_address", sa.String(length=255), nullable=False),
+        sa.Column("state", sa.String(length=16), nullable=False),
+        sa.Column("slot", sa.String(), nullable=False),
+        sa.Column("value", sa.String(), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.CheckConstraint(
+            "state IN ('accepted', 'finalized')",
+            name="contract_storage_slots_state_check",
+        ),
+        sa.ForeignKeyConstraint(
+            ["contract_address"],
+            ["current_state.id"],
+            name="contract_storage_slots_contract_address_fkey",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "contract_address", "state", "slot", name="contract_storage_slots_pkey"
+        ),
+    )
+
+
+def downgrade() -> None:
+    # Slot-backed contracts keep only a marker in current_state.data; move
+    # them back to the blob (run with CONTRACT_STORAGE_BACKEND=jsonb until
+    # each has been written once) before downgrading past this revision.
+    op.drop_table("contract_storage_slots")
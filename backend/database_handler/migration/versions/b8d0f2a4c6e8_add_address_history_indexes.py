@@ -0,0 +1,47 @@
+"""add per-address keyset indexes for transaction history
+
+Revision ID: b8d0f2a4c6e8
+Revises: a7c9e1f3b5d2
+Create Date: 2026-07-06 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8d0f2a4c6e8"
+down_revision: Union[str, None] = "a7c9e1f3b5d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ADDRESS_HISTORY_INDEXES = {
+    "idx_transactions_from_address_created_at": "from_address",
+    "idx_transactions_to_address_created_at": "to_address",
+}
+
+
+def upgrade() -> None:
+    # sim_getTransactionsForAddress pages each side of an address's history
+    # with a (created_at, hash) cursor (see get_transactions_for_address_page).
+    # With the address leading, one index range scan returns a page in order,
+    # at any depth, instead of sorting every transaction the address has.
+    #
+    # CONCURRENTLY so the builds don't lock writes on prod; it can't run
+    # inside Alembic's implicit transaction.
+    for index_name, column in ADDRESS_HISTORY_INDEXES.items():
+        with op.get_context().autocommit_block():
+            op.execute(
+                f"""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name}
+                ON transactions ({column}, created_at DESC, hash DESC)
+                """
+            )
+
+
+def downgrade() -> None:
+    for index_name in ADDRESS_HISTORY_INDEXES:
+        with op.get_context().autocommit_block():
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
@@ -0,0 +1,81 @@
+"""add explorer keyset pagination and trigram search indexes
+
+Revision ID: c3e5a7b9d1f2
+Revises: b2d4f6a8c0e1
+Create Date: 2026-06-09 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3e5a7b9d1f2"
+down_revision: Union[str, None] = "b2d4f6a8c0e1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_INDEXES = {
+    "idx_transactions_hash_trgm": "hash",
+    "idx_transactions_from_address_trgm": "from_address",
+    "idx_transactions_to_address_trgm": "to_address",
+}
+
+
+def upgrade() -> None:
+    # The explorer transaction list pages with a (created_at, hash) cursor
+    # (see get_all_transactions_paginated). The composite btree serves both
+    # the ORDER BY and the row-comparison seek, so a deep page costs the same
+    # as the first one instead of scanning OFFSET rows.
+    #
+    # Its `search` filter is ILIKE '%term%' over hash/from/to, which a btree
+    # cannot serve. pg_trgm GIN indexes can. The server may not ship
+    # pg_trgm at all, or managed Postgres may refuse CREATE EXTENSION to the
+    # migration role; in either case search keeps working unindexed rather
+    # than failing the deploy.
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        EXCEPTION WHEN OTHERS THEN
+            RAISE NOTICE 'pg_trgm unavailable, skipping explorer search indexes';
+        END
+        $$
+        """
+    )
+    has_trgm = (
+        op.get_bind()
+        .execute(sa.text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'"))
+        .scalar()
+    )
+
+    # CONCURRENTLY so the builds don't lock writes on prod; it can't run
+    # inside Alembic's implicit transaction.
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_transactions_created_at_hash
+            ON transactions (created_at DESC, hash DESC)
+            """
+        )
+    if has_trgm:
+        for index_name, column in TRIGRAM_INDEXES.items():
+            with op.get_context().autocommit_block():
+                op.execute(
+                    f"""
+                    CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name}
+                    ON transactions USING gin ({column} gin_trgm_ops)
+                    """
+                )
+
+
+def downgrade() -> None:
+    for index_name in TRIGRAM_INDEXES:
+        with op.get_context().autocommit_block():
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_transactions_created_at_hash")
@@ -0,0 +1,207 @@
+"""maintain value conservation totals in value_ledger
+
+Revision ID: c9e1a3b5d7f0
+Revises: b8d0f2a4c6e8
+Create Date: 2026-07-08 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c9e1a3b5d7f0"
+down_revision: Union[str, None] = "b8d0f2a4c6e8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LEDGER_SLOTS = 16
+
+# The totals are spread over LEDGER_SLOTS rows, picked per backend, so
+# concurrent transactions moving value do not queue on a single counter row.
+# Readers sum the slots. Each function applies the change of one row, inside
+# the transaction that made it.
+_APPLY_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION value_ledger_apply(
+    d_balances numeric, d_in_transit numeric, d_minted numeric
+) RETURNS void AS $$
+BEGIN
+    IF d_balances = 0 AND d_in_transit = 0 AND d_minted = 0 THEN
+        RETURN;
+    END IF;
+    INSERT INTO value_ledger AS l
+        (slot, total_balances, in_transit_value, total_minted, updated_at)
+    VALUES (
+        pg_backend_pid() % {LEDGER_SLOTS}, d_balances, d_in_transit, d_minted, now()
+    )
+    ON CONFLICT (slot) DO UPDATE SET
+        total_balances = l.total_balances + EXCLUDED.total_balances,
+        in_transit_value = l.in_transit_value + EXCLUDED.in_transit_value,
+        total_minted = l.total_minted + EXCLUDED.total_minted,
+        updated_at = EXCLUDED.updated_at;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+_BALANCE_FUNCTION = """
+CREATE OR REPLACE FUNCTION value_ledger_on_balance() RETURNS trigger AS $$
+DECLARE
+    delta numeric := 0;
+BEGIN
+    IF TG_OP <> 'DELETE' THEN
+        delta := delta + COALESCE(NEW.balance, 0);
+    END IF;
+    IF TG_OP <> 'INSERT' THEN
+        delta := delta - COALESCE(OLD.balance, 0);
+    END IF;
+    PERFORM value_ledger_apply(delta, 0, 0);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# Same predicates as get_in_transit_value / get_total_minted.
+_TRANSACTION_FUNCTION = """
+CREATE OR REPLACE FUNCTION value_ledger_on_transaction() RETURNS trigger AS $$
+DECLARE
+    d_in_transit numeric := 0;
+    d_minted numeric := 0;
+BEGIN
+    IF TG_OP <> 'DELETE' THEN
+        IF NEW.value > 0 AND NEW.value_credited = false
+           AND NEW.status IN ('PENDING', 'ACTIVATED') THEN
+            d_in_transit := d_in_transit + NEW.value;
+        END IF;
+        IF NEW.from_address IS NULL AND NEW.type = 0 THEN
+            d_minted := d_minted + COALESCE(NEW.value, 0);
+        END IF;
+    END IF;
+    IF TG_OP <> 'INSERT' THEN
+        IF OLD.value > 0 AND OLD.value_credited = false
+           AND OLD.status IN ('PENDING', 'ACTIVATED') THEN
+            d_in_transit := d_in_transit - OLD.value;
+        END IF;
+        IF OLD.from_address IS NULL AND OLD.type = 0 THEN
+            d_minted := d_minted - COALESCE(OLD.value, 0);
+        END IF;
+    END IF;
+    PERFORM value_ledger_apply(0, d_in_transit, d_minted);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "value_ledger",
+        sa.Column("slot", sa.SmallInteger(), nullable=False),
+        sa.Column(
+            "total_balances",
+            sa.Numeric(precision=78, scale=0),
+            server_default="0",
+            nullable=False,
+        ),
+        sa.Column(
+            "in_transit_value",
+            sa.Numeric(precision=78, scale=0),
+            server_default="0",
+            nullable=False,
+        ),
+        sa.Column(
+            "total_minted",
+            sa.Numeric(precision=78, scale=0),
+            server_default="0",
+            nullable=False,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("slot", name="value_ledger_pkey"),
+    )
+
+    op.execute(_APPLY_FUNCTION)
+    op.execute(_BALANCE_FUNCTION)
+    op.execute(_TRANSACTION_FUNCTION)
+    # Block concurrent writes to both tables until this migration commits,
+    # so no change lands between the triggers going live and the backfill.
+    op.execute("LOCK TABLE current_state, transactions IN SHARE ROW EXCLUSIVE MODE")
+    op.execute(
+        """
+        CREATE TRIGGER value_ledger_balance_insert_delete
+        AFTER INSERT OR DELETE ON current_state
+        FOR EACH ROW EXECUTE FUNCTION value_ledger_on_balance()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER value_ledger_balance_update
+        AFTER UPDATE OF balance ON current_state
+        FOR EACH ROW
+        WHEN (OLD.balance IS DISTINCT FROM NEW.balance)
+        EXECUTE FUNCTION value_ledger_on_balance()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER value_ledger_transaction_insert_delete
+        AFTER INSERT OR DELETE ON transactions
+        FOR EACH ROW EXECUTE FUNCTION value_ledger_on_transaction()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER value_ledger_transaction_update
+        AFTER UPDATE OF value, value_credited, status, from_address, type
+        ON transactions
+        FOR EACH ROW
+        WHEN (
+            OLD.value IS DISTINCT FROM NEW.value
+            OR OLD.value_credited IS DISTINCT FROM NEW.value_credited
+            OR OLD.status IS DISTINCT FROM NEW.status
+            OR OLD.from_address IS DISTINCT FROM NEW.from_address
+            OR OLD.type IS DISTINCT FROM NEW.type
+        )
+        EXECUTE FUNCTION value_ledger_on_transaction()
+        """
+    )
+
+    # The backfill is the whole total; drop any delta a trigger has already
+    # recorded so it is not counted twice.
+    op.execute("DELETE FROM value_ledger")
+    op.execute(
+        """
+        INSERT INTO value_ledger
+            (slot, total_balances, in_transit_value, total_minted, updated_at)
+        SELECT
+            0,
+            (SELECT COALESCE(SUM(balance), 0) FROM current_state),
+            (
+                SELECT COALESCE(SUM(value), 0) FROM transactions
+                WHERE value > 0
+                AND value_credited = false
+                AND status IN ('PENDING', 'ACTIVATED')
+            ),
+            (
+                SELECT COALESCE(SUM(value), 0) FROM transactions
+                WHERE from_address IS NULL AND type = 0
+            ),
+            now()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS value_ledger_transaction_update ON transactions")
+    op.execute(
+        "DROP TRIGGER IF EXISTS value_ledger_transaction_insert_delete ON transactions"
+    )
+    op.execute("DROP TRIGGER IF EXISTS value_ledger_balance_update ON current_state")
+    op.execute(
+        "DROP TRIGGER IF EXISTS value_ledger_balance_insert_delete ON current_state"
+    )
+    op.execute("DROP FUNCTION IF EXISTS value_ledger_on_transaction()")
+    op.execute("DROP FUNCTION IF EXISTS value_ledger_on_balance()")
+    op.execute("DROP FUNCTION IF EXISTS value_ledger_apply(numeric, numeric, numeric)")
+    op.drop_table("value_ledger")
@@ -0,0 +1,45 @@
+"""add contract_schemas table for the content-addressed schema cache
+
+Revision ID: d4f6a8c0e2b3
+Revises: c3e5a7b9d1f2
+Create Date: 2026-06-16 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d4f6a8c0e2b3"
+down_revision: Union[str, None] = "c3e5a7b9d1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A schema depends only on the contract code (and the GenVM release that
+    # extracted it), so it is stored once per code hash and shared by every
+    # RPC pod. Rows are a pure cache: dropping them only costs a GenVM run.
+    op.create_table(
+        "contract_schemas",
+        sa.Column("code_hash", sa.String(length=64), nullable=False),
+        sa.Column("genvm_version", sa.String(length=255), nullable=False),
+        sa.Column("schema", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint(
+            "code_hash", "genvm_version", name="contract_schemas_pkey"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("contract_schemas")
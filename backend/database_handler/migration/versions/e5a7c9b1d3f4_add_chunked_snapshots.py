@@ -0,0 +1,103 @@
+"""store chain snapshots as streamed chunks with a per-row manifest
+
+Revision ID: e5a7c9b1d3f4
+Revises: d4f6a8c0e2b3
+Create Date: 2026-06-23 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a7c9b1d3f4"
+down_revision: Union[str, None] = "d4f6a8c0e2b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Snapshots taken before this revision keep their single compressed
+    # blobs and are still restorable; new snapshots leave them NULL.
+    op.alter_column("snapshots", "state_data", nullable=True)
+    op.alter_column("snapshots", "transaction_data", nullable=True)
+    op.add_column(
+        "snapshots", sa.Column("base_snapshot_id", sa.Integer(), nullable=True)
+    )
+    op.add_column(
+        "snapshots",
+        sa.Column("state_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "snapshots",
+        sa.Column(
+            "transaction_count", sa.Integer(), server_default="0", nullable=False
+        ),
+    )
+
+    # Row payloads, a few hundred rows per compressed chunk.
+    op.create_table(
+        "snapshot_chunks",
+        sa.Column("snapshot_id", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(length=16), nullable=False),
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("row_count", sa.Integer(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["snapshot_id"],
+            ["snapshots.snapshot_id"],
+            name="snapshot_chunks_snapshot_id_fkey",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "snapshot_id", "kind", "seq", name="snapshot_chunks_pkey"
+        ),
+    )
+
+    # Every row present when the snapshot was taken, with the snapshot whose
+    # chunks hold its payload. An incremental snapshot only writes chunks for
+    # rows whose hash changed since its base and points the rest at the
+    # snapshot that already has them.
+    op.create_table(
+        "snapshot_rows",
+        sa.Column("snapshot_id", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(length=16), nullable=False),
+        sa.Column("key", sa.String(length=255), nullable=False),
+        sa.Column("row_hash", sa.String(length=32), nullable=False),
+        sa.Column("source_snapshot_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["snapshot_id"],
+            ["snapshots.snapshot_id"],
+            name="snapshot_rows_snapshot_id_fkey",
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["source_snapshot_id"],
+            ["snapshots.snapshot_id"],
+            name="snapshot_rows_source_snapshot_id_fkey",
+        ),
+        sa.PrimaryKeyConstraint(
+            "snapshot_id", "kind", "key", name="snapshot_rows_pkey"
+        ),
+    )
+    op.create_index(
+        "idx_snapshot_rows_source",
+        "snapshot_rows",
+        ["source_snapshot_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_snapshot_rows_source", table_name="snapshot_rows")
+    op.drop_table("snapshot_rows")
+    op.drop_table("snapshot_chunks")
+    op.drop_column("snapshots", "transaction_count")
+    op.drop_column("snapshots", "state_count")
+    op.drop_column("snapshots", "base_snapshot_id")
+    # Chunked snapshots cannot be represented in the old layout.
+    op.execute("DELETE FROM snapshots WHERE state_data IS NULL")
+    op.alter_column("snapshots", "transaction_data", nullable=False)
+    op.alter_column("snapshots", "state_data", nullable=False)
@@ -8,6 +8,7 @@ from sqlalchemy import (
     Enum,
     Integer,
     PrimaryKeyConstraint,
+    SmallInteger,
     String,
     TypeDecorator,
     UniqueConstraint,
@@ -84,6 +85,52 @@ class CurrentState(Base):
     )
 
 
+class ContractStorageSlot(Base):
+    """One storage slot of a slot-backed contract (see contract_storage.py)."""
+
+    __tablename__ = "contract_storage_slots"
+    __table_args__ = (
+        PrimaryKeyConstraint(
+            "contract_address", "state", "slot", name="contract_storage_slots_pkey"
+        ),
+        CheckConstraint(
+            "state IN ('accepted', 'finalized')",
+            name="contract_storage_slots_state_check",
+        ),
+    )
+
+    contract_address: Mapped[str] = mapped_column(
+        String(255),
+        ForeignKey(
+            "current_state.id",
+            name="contract_storage_slots_contract_address_fkey",
+            ondelete="CASCADE",
+        ),
+    )
+    state: Mapped[str] = mapped_column(String(16))
+    slot: Mapped[str] = mapped_column(String)  # base64 slot id
+    value: Mapped[str] = mapped_column(String)  # base64 slot value
+    version: Mapped[int] = mapped_column(BigInteger)
+
+
+class ContractSchema(Base):
+    """GenVM schema of a contract code blob (see contract_schema_cache.py)."""
+
+    __tablename__ = "contract_schemas"
+    __table_args__ = (
+        PrimaryKeyConstraint(
+            "code_hash", "genvm_version", name="contract_schemas_pkey"
+        ),
+    )
+
+    code_hash: Mapped[str] = mapped_column(String(64))  # sha256 hex
+    genvm_version: Mapped[str] = mapped_column(String(255))
+    schema: Mapped[dict] = mapped_column(JSONB)
+    created_at: Mapped[Optional[datetime.datetime]] = mapped_column(
+        DateTime(True), init=False, server_default=func.current_timestamp()
+    )
+
+
 class Transactions(Base):
     __tablename__ = "transactions"
     __table_args__ = (
@@ -181,6 +228,52 @@ class Transactions(Base):
     )
 
 
+class AddressActivity(Base):
+    """
+    Per-address transaction counters, maintained by triggers on `transactions`
+    (see migration a7c9e1f3b5d2 and address_activity.py).
+    """
+
+    __tablename__ = "address_activity"
+    __table_args__ = (PrimaryKeyConstraint("address", name="address_activity_pkey"),)
+
+    address: Mapped[str] = mapped_column(String(255))
+    # Transactions with this from_address (the account nonce)
+    sent_count: Mapped[int] = mapped_column(BigInteger, server_default="0", default=0)
+    # PENDING transactions with this to_address
+    pending_count: Mapped[int] = mapped_column(
+        BigInteger, server_default="0", default=0
+    )
+    last_activity_at: Mapped[Optional[datetime.datetime]] = mapped_column(
+        DateTime(True), default=None
+    )
+
+
+class ValueLedger(Base):
+    """
+    Running value conservation totals, maintained by triggers on
+    `current_state` and `transactions` (see migration c9e1a3b5d7f0 and
+    invariants.py). Spread over slots; the totals are the sums of all rows.
+    """
+
+    __tablename__ = "value_ledger"
+    __table_args__ = (PrimaryKeyConstraint("slot", name="value_ledger_pkey"),)
+
+    slot: Mapped[int] = mapped_column(SmallInteger)
+    total_balances: Mapped[int] = mapped_column(
+        IntNumeric(), server_default="0", default=0
+    )
+    in_transit_value: Mapped[int] = mapped_column(
+        IntNumeric(), server_default="0", default=0
+    )
+    total_minted: Mapped[int] = mapped_column(
+        IntNumeric(), server_default="0", default=0
+    )
+    updated_at: Mapped[Optional[datetime.datetime]] = mapped_column(
+        DateTime(True), default=None
+    )
+
+
 class Validators(Base):
     __tablename__ = "validators"
     __table_args__ = (
@@ -244,15 +337,74 @@ class Snapshot(Base):
         nullable=False,
         init=False,
     )  # Incremental identifier
-    state_data: Mapped[bytes] = mapped_column(
-        LargeBinary
-    )  # Stores compressed state data as bytes
-    transaction_data: Mapped[bytes] = mapped_column(
-        LargeBinary
-    )  # Stores compressed transaction data as bytes
     created_at: Mapped[datetime.datetime] = mapped_column(
         DateTime(True), server_default=func.current_timestamp(), init=False
     )
+    # Single compressed blobs; only set on snapshots taken before chunking.
+    state_data: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary, nullable=True, default=None
+    )
+    transaction_data: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary, nullable=True, default=None
+    )
+    base_snapshot_id: Mapped[Optional[int]] = mapped_column(
+        Integer, nullable=True, default=None
+    )  # Snapshot an incremental snapshot was diffed against
+    state_count: Mapped[int] = mapped_column(
+        Integer, server_default="0", nullable=False, default=0
+    )
+    transaction_count: Mapped[int] = mapped_column(
+        Integer, server_default="0", nullable=False, default=0
+    )
+
+
+class SnapshotChunk(Base):
+    """A compressed batch of row payloads of a snapshot (see snapshot_manager.py)."""
+
+    __tablename__ = "snapshot_chunks"
+    __table_args__ = (
+        PrimaryKeyConstraint("snapshot_id", "kind", "seq", name="snapshot_chunks_pkey"),
+    )
+
+    snapshot_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey(
+            "snapshots.snapshot_id",
+            name="snapshot_chunks_snapshot_id_fkey",
+            ondelete="CASCADE",
+        ),
+    )
+    kind: Mapped[str] = mapped_column(String(16))  # "state" or "transaction"
+    seq: Mapped[int] = mapped_column(Integer)
+    row_count: Mapped[int] = mapped_column(Integer)
+    data: Mapped[bytes] = mapped_column(LargeBinary)
+
+
+class SnapshotRow(Base):
+    """Manifest entry: a row present in a snapshot and where its payload lives."""
+
+    __tablename__ = "snapshot_rows"
+    __table_args__ = (
+        PrimaryKeyConstraint("snapshot_id", "kind", "key", name="snapshot_rows_pkey"),
+    )
+
+    snapshot_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey(
+            "snapshots.snapshot_id",
+            name="snapshot_rows_snapshot_id_fkey",
+            ondelete="CASCADE",
+        ),
+    )
+    kind: Mapped[str] = mapped_column(String(16))
+    key: Mapped[str] = mapped_column(String(255))
+    row_hash: Mapped[str] = mapped_column(String(32))  # md5 of the row's JSON
+    source_snapshot_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey(
+            "snapshots.snapshot_id", name="snapshot_rows_source_snapshot_id_fkey"
+        ),
+    )
 
 
 class ApiTier(Base):
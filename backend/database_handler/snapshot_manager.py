@@ -1,97 +1,244 @@
-from typing import Dict, Optional
-from sqlalchemy.orm import Session
-from datetime import datetime
+"""
+Chain snapshots (sim_createSnapshot / sim_restoreSnapshot).
+
+A snapshot is streamed in chunks instead of being built as one in-memory blob:
+
+- `snapshot_rows` is the manifest: every `current_state` / `transactions` row
+  present when the snapshot was taken, with an md5 of the row and the
+  snapshot whose `snapshot_chunks` hold its payload. It is filled with one
+  INSERT ... SELECT, so Postgres does the work.
+- `snapshot_chunks` hold the payloads, SNAPSHOT_CHUNK_ROWS rows per
+  zlib-compressed JSON chunk, read from a server-side cursor.
+
+An incremental snapshot diffs its manifest against the previous snapshot's and
+only writes chunks for rows whose hash changed; unchanged rows point at the
+snapshot that already holds them. Restoring replays the chunks of every
+snapshot the manifest points at (oldest first) with batched upserts, then
+drops rows that are not in the manifest.
+
+Snapshots taken before chunking keep their `state_data` / `transaction_data`
+blobs and are restored the old way.
+"""
+
+import enum
 import json
+import os
 import zlib
+from datetime import datetime
+from typing import Any, Callable, Iterator, Optional
+
+from sqlalchemy import DateTime, Enum, Table, and_, func, insert, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from .models import (
+    Snapshot,
+    SnapshotChunk,
+    SnapshotRow,
+    CurrentState,
+    Transactions,
+    TransactionStatus,
+)
+from .contract_storage import load_contract_data
+
+STATE_KIND = "state"
+TRANSACTION_KIND = "transaction"
+DEFAULT_CHUNK_ROWS = 500
+
+# kind -> (table, primary key column)
+_KINDS: dict[str, tuple[Table, str]] = {
+    STATE_KIND: (CurrentState.__table__, "id"),
+    TRANSACTION_KIND: (Transactions.__table__, "hash"),
+}
+
+# Worker claim bookkeeping; a restored transaction must be claimable again.
+_TRANSIENT_COLUMNS: dict[str, frozenset[str]] = {
+    STATE_KIND: frozenset(),
+    TRANSACTION_KIND: frozenset({"blocked_at", "worker_id"}),
+}
+
+# Called as progress(phase, rows_done, rows_total) after every chunk.
+ProgressCallback = Callable[[str, int, int], None]
 
-from .models import Snapshot, CurrentState, Transactions, TransactionStatus
+
+def _chunk_rows() -> int:
+    try:
+        return max(1, int(os.environ.get("SNAPSHOT_CHUNK_ROWS", DEFAULT_CHUNK_ROWS)))
+    except ValueError:
+        return DEFAULT_CHUNK_ROWS
 
 
 class SnapshotManager:
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, chunk_rows: int | None = None):
         self.session = session
+        self.chunk_rows = chunk_rows or _chunk_rows()
 
-    def _compress_data(self, data: Dict) -> bytes:
+    def _compress_data(self, data: Any) -> bytes:
         """Compress data using zlib and return as bytes."""
         json_data = json.dumps(data)
         return zlib.compress(json_data.encode())
 
-    def _decompress_data(self, compressed_data: bytes) -> Dict:
+    def _decompress_data(self, compressed_data: bytes) -> Any:
         """Decompress bytes data back to dictionary."""
         if not compressed_data:
             return {}
         json_data = zlib.decompress(compressed_data)
         return json.loads(json_data)
 
-    def create_snapshot(self) -> Snapshot:
-        """Create a snapshot of the current state and transactions."""
-        # Get all current states
-        states = self.session.query(CurrentState).all()
-
-        # Prepare state data for compression
-        state_data = {
-            state.id: {
-                "data": state.data,
-                "balance": state.balance,
-                "updated_at": (
-                    state.updated_at.isoformat() if state.updated_at else None
-                ),
-            }
-            for state in states
-        }
+    def create_snapshot(
+        self,
+        incremental: bool = False,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Snapshot:
+        """
+        Create a snapshot of the current state and transactions.
 
-        transactions = self.session.query(Transactions).all()
-
-        # Prepare transaction data for compression
-        transaction_data = {
-            tx.hash: {
-                "status": tx.status.value,
-                "from_address": tx.from_address,
-                "to_address": tx.to_address,
-                "input_data": tx.input_data,
-                "data": tx.data,
-                "consensus_data": tx.consensus_data,
-                "nonce": tx.nonce,
-                "value": tx.value,
-                "type": tx.type,
-                "gaslimit": tx.gaslimit,
-                "created_at": tx.created_at.isoformat() if tx.created_at else None,
-                "leader_only": tx.leader_only,
-                "r": tx.r,
-                "s": tx.s,
-                "v": tx.v,
-                "appeal_failed": tx.appeal_failed,
-                "consensus_history": tx.consensus_history,
-                "timestamp_appeal": tx.timestamp_appeal,
-                "appeal_processing_time": tx.appeal_processing_time,
-                "contract_snapshot": tx.contract_snapshot,
-                "config_rotation_rounds": tx.config_rotation_rounds,
-                "appealed": tx.appealed,
-                "appeal_undetermined": tx.appeal_undetermined,
-                "triggered_by_hash": tx.triggered_by_hash,
-                "appealed": tx.appealed,
-                "timestamp_awaiting_finalization": tx.timestamp_awaiting_finalization,
-                "num_of_initial_validators": tx.num_of_initial_validators,
-                "last_vote_timestamp": tx.last_vote_timestamp,
-                "rotation_count": tx.rotation_count,
-                "appeal_leader_timeout": tx.appeal_leader_timeout,
-                "leader_timeout_validators": tx.leader_timeout_validators,
-                "appeal_validators_timeout": tx.appeal_validators_timeout,
-                "value_credited": tx.value_credited,
-            }
-            for tx in transactions
-        }
+        With `incremental`, only rows changed since the latest snapshot are
+        written; the result still restores the full database on its own.
+        """
+        base_snapshot_id = self._latest_chunked_snapshot_id() if incremental else None
 
-        snapshot = Snapshot(
-            state_data=self._compress_data(state_data),
-            transaction_data=self._compress_data(transaction_data),
+        snapshot = Snapshot(base_snapshot_id=base_snapshot_id)
+        self.session.add(snapshot)
+        self.session.flush()
+
+        for kind in _KINDS:
+            self._write_manifest(snapshot.snapshot_id, base_snapshot_id, kind)
+            self._write_chunks(snapshot.snapshot_id, kind, progress)
+
+        counts = dict(
+            self.session.execute(
+                select(SnapshotRow.kind, func.count())
+                .where(SnapshotRow.snapshot_id == snapshot.snapshot_id)
+                .group_by(SnapshotRow.kind)
+            ).all()
         )
+        snapshot.state_count = counts.get(STATE_KIND, 0)
+        snapshot.transaction_count = counts.get(TRANSACTION_KIND, 0)
 
-        self.session.add(snapshot)
         self.session.commit()
         return snapshot
 
-    def restore_snapshot(self, snapshot_id: int) -> bool:
+    def _latest_chunked_snapshot_id(self) -> Optional[int]:
+        return self.session.execute(
+            select(func.max(Snapshot.snapshot_id)).where(Snapshot.state_data.is_(None))
+        ).scalar()
+
+    def _write_manifest(
+        self, snapshot_id: int, base_snapshot_id: Optional[int], kind: str
+    ):
+        """Record every live row; unchanged rows keep their base's payload."""
+        table, key = _KINDS[kind]
+        self.session.execute(
+            text(
+                f"""
+                INSERT INTO snapshot_rows
+                    (snapshot_id, kind, key, row_hash, source_snapshot_id)
+                SELECT :snapshot_id, :kind, t.{key}, h.row_hash,
+                       CASE WHEN prev.row_hash = h.row_hash
+                            THEN prev.source_snapshot_id
+                            ELSE :snapshot_id END
+                FROM {table.name} t
+                CROSS JOIN LATERAL (
+                    SELECT md5(row_to_json(t)::text) AS row_hash
+                ) h
+                LEFT JOIN snapshot_rows prev
+                  ON prev.snapshot_id = :base_snapshot_id
+                 AND prev.kind = :kind
+                 AND prev.key = t.{key}
+                """
+            ),
+            {
+                "snapshot_id": snapshot_id,
+                "base_snapshot_id": base_snapshot_id,
+                "kind": kind,
+            },
+        )
+
+    def _write_chunks(
+        self,
+        snapshot_id: int,
+        kind: str,
+        progress: Optional[ProgressCallback],
+    ):
+        """Stream the rows this snapshot holds into compressed chunks."""
+        table, key = _KINDS[kind]
+        rows = SnapshotRow.__table__
+        total = self.session.execute(
+            select(func.count()).where(
+                rows.c.snapshot_id == snapshot_id,
+                rows.c.kind == kind,
+                rows.c.source_snapshot_id == snapshot_id,
+            )
+        ).scalar_one()
+
+        stmt = (
+            select(table)
+            .join(
+                rows,
+                and_(
+                    rows.c.snapshot_id == snapshot_id,
+                    rows.c.kind == kind,
+                    rows.c.key == table.c[key],
+                    rows.c.source_snapshot_id == snapshot_id,
+                ),
+            )
+            .order_by(table.c[key])
+            .execution_options(yield_per=self.chunk_rows)
+        )
+        result = self.session.execute(stmt)
+        done = 0
+        for seq, partition in enumerate(result.partitions()):
+            payload = [self._encode_row(kind, row) for row in partition]
+            self.session.execute(
+                insert(SnapshotChunk.__table__),
+                {
+                    "snapshot_id": snapshot_id,
+                    "kind": kind,
+                    "seq": seq,
+                    "row_count": len(payload),
+                    "data": self._compress_data(payload),
+                },
+            )
+            done += len(payload)
+            if progress is not None:
+                progress(f"create.{kind}", done, total)
+
+    def _encode_row(self, kind: str, row) -> dict:
+        table, _ = _KINDS[kind]
+        skip = _TRANSIENT_COLUMNS[kind]
+        encoded = {}
+        for column in table.columns:
+            if column.name in skip:
+                continue
+            value = row._mapping[column]
+            if kind == STATE_KIND and column.name == "data":
+                value = load_contract_data(self.session, row)
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            elif isinstance(value, enum.Enum):
+                value = value.value
+            encoded[column.name] = value
+        return encoded
+
+    def _decode_row(self, kind: str, encoded: dict) -> dict:
+        table, _ = _KINDS[kind]
+        decoded = {}
+        for name, value in encoded.items():
+            column = table.c.get(name)
+            if column is None:
+                continue  # column dropped since the snapshot was taken
+            if value is not None:
+                if isinstance(column.type, DateTime):
+                    value = datetime.fromisoformat(value)
+                elif isinstance(column.type, Enum) and column.type.enum_class:
+                    value = column.type.enum_class(value)
+            decoded[name] = value
+        return decoded
+
+    def restore_snapshot(
+        self, snapshot_id: int, progress: Optional[ProgressCallback] = None
+    ) -> bool:
         """Restore the database state from a snapshot."""
         # Get the snapshot
         snapshot = (
@@ -99,8 +246,134 @@ class SnapshotManager:
         )
         if not snapshot:
             return False
+        if snapshot.state_data is not None or snapshot.transaction_data is not None:
+            return self._restore_legacy_snapshot(snapshot)
+
+        # triggered_by_hash links are applied once every transaction exists.
+        self.session.execute(
+            text(
+                """
+                CREATE TEMP TABLE snapshot_restore_links (
+                    hash VARCHAR(66) PRIMARY KEY,
+                    triggered_by_hash VARCHAR(66)
+                ) ON COMMIT DROP
+                """
+            )
+        )
+
+        # Clear existing states and transactions
+        self.session.query(CurrentState).delete()
+        self.session.query(Transactions).delete()
+
+        rows = SnapshotRow.__table__
+        source_ids = list(
+            self.session.execute(
+                select(rows.c.source_snapshot_id)
+                .where(rows.c.snapshot_id == snapshot_id)
+                .distinct()
+                .order_by(rows.c.source_snapshot_id)
+            ).scalars()
+        )
+        totals = {
+            STATE_KIND: snapshot.state_count,
+            TRANSACTION_KIND: snapshot.transaction_count,
+        }
+
+        for kind in _KINDS:
+            done = 0
+            for source_id in source_ids:
+                for encoded_rows in self._iter_chunks(source_id, kind):
+                    self._upsert_rows(kind, encoded_rows)
+                    done += len(encoded_rows)
+                    if progress is not None:
+                        progress(f"restore.{kind}", done, totals[kind])
+            if len(source_ids) > 1:
+                self._delete_rows_outside_manifest(snapshot_id, kind)
+
+        self.session.execute(
+            text(
+                """
+                UPDATE transactions t
+                SET triggered_by_hash = l.triggered_by_hash
+                FROM snapshot_restore_links l
+                WHERE t.hash = l.hash
+                  AND l.triggered_by_hash IS NOT NULL
+                  AND EXISTS (
+                      SELECT 1 FROM transactions p WHERE p.hash = l.triggered_by_hash
+                  )
+                """
+            )
+        )
+        self.session.commit()
+        return True
+
+    def _iter_chunks(self, snapshot_id: int, kind: str) -> Iterator[list[dict]]:
+        """Yield the decoded rows of each chunk, one chunk in memory at a time."""
+        seqs = self.session.execute(
+            select(SnapshotChunk.seq)
+            .where(SnapshotChunk.snapshot_id == snapshot_id, SnapshotChunk.kind == kind)
+            .order_by(SnapshotChunk.seq)
+        ).scalars()
+        for seq in list(seqs):
+            data = self.session.execute(
+                select(SnapshotChunk.data).where(
+                    SnapshotChunk.snapshot_id == snapshot_id,
+                    SnapshotChunk.kind == kind,
+                    SnapshotChunk.seq == seq,
+                )
+            ).scalar_one()
+            yield self._decompress_data(data)
+
+    def _upsert_rows(self, kind: str, encoded_rows: list[dict]):
+        if not encoded_rows:
+            return
+        table, key = _KINDS[kind]
+        values = [self._decode_row(kind, row) for row in encoded_rows]
+        if kind == TRANSACTION_KIND:
+            self.session.execute(
+                text(
+                    """
+                    INSERT INTO snapshot_restore_links (hash, triggered_by_hash)
+                    VALUES (:hash, :triggered_by_hash)
+                    ON CONFLICT (hash) DO UPDATE
+                    SET triggered_by_hash = EXCLUDED.triggered_by_hash
+                    """
+                ),
+                [
+                    {"hash": v["hash"], "triggered_by_hash": v.get("triggered_by_hash")}
+                    for v in values
+                ],
+            )
+            for v in values:
+                v["triggered_by_hash"] = None
+
+        stmt = pg_insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c[key]],
+            set_={name: stmt.excluded[name] for name in values[0] if name != key},
+        )
+        self.session.execute(stmt, values)
+
+    def _delete_rows_outside_manifest(self, snapshot_id: int, kind: str):
+        """Drop rows replayed from older chunks that were gone by `snapshot_id`."""
+        table, key = _KINDS[kind]
+        self.session.execute(
+            text(
+                f"""
+                DELETE FROM {table.name} t
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM snapshot_rows r
+                    WHERE r.snapshot_id = :snapshot_id
+                      AND r.kind = :kind
+                      AND r.key = t.{key}
+                )
+                """
+            ),
+            {"snapshot_id": snapshot_id, "kind": kind},
+        )
 
-        # Decompress the data
+    def _restore_legacy_snapshot(self, snapshot: Snapshot) -> bool:
+        """Restore a snapshot stored as two compressed blobs (pre-chunking)."""
         state_data = self._decompress_data(snapshot.state_data)
         transaction_data = self._decompress_data(snapshot.transaction_data)
 
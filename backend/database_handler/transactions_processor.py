@@ -4,11 +4,22 @@ from enum import Enum
 import rlp
 import re
 import random
-from sqlalchemy.orm import Session, selectinload
-from sqlalchemy import or_, desc, and_, JSON, type_coerce, text
+from sqlalchemy.orm import Session, defer, selectinload
+from sqlalchemy import (
+    desc,
+    and_,
+    select,
+    tuple_,
+    union,
+    JSON,
+    type_coerce,
+    text,
+    literal_column,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 
 from backend.node.types import Vote, Receipt, ExecutionResultStatus
-from .models import Transactions, TransactionStatus
+from .models import AddressActivity, Transactions, TransactionStatus
 from eth_utils import to_bytes, keccak, is_address, to_checksum_address
 import json
 import base64
@@ -45,6 +56,128 @@ TRANSACTION_STATUS_CODES = {
 }
 
 
+# Postgres LISTEN/NOTIFY channel consensus workers listen on to wake up as
+# soon as new work becomes claimable (see backend/consensus/work_notifier.py).
+# NOTIFY is transactional: the payload is only delivered once the emitting
+# transaction commits, so listeners never observe uncommitted rows.
+CONSENSUS_WORK_CHANNEL = "consensus_work"
+
+# Statuses that make a transaction claimable by a worker: PENDING for
+# (re-)processing, the ACCEPTED class for finalization.
+CONSENSUS_WORK_STATUSES = frozenset(
+    {
+        TransactionStatus.PENDING,
+        TransactionStatus.ACCEPTED,
+        TransactionStatus.UNDETERMINED,
+        TransactionStatus.LEADER_TIMEOUT,
+        TransactionStatus.VALIDATORS_TIMEOUT,
+    }
+)
+
+
+# Transaction columns that can reach megabytes per row: deploy code, receipts
+# carrying the contract state, per-round history and the pre-execution
+# contract snapshot. Lean reads defer them and load only the subpaths
+# _parse_transaction_data derives fields from.
+# Columns read by get_transaction_summary and summary address-history pages.
+TRANSACTION_SUMMARY_COLUMNS = (
+    Transactions.hash,
+    Transactions.from_address,
+    Transactions.to_address,
+    Transactions.status,
+    Transactions.type,
+    Transactions.value,
+    Transactions.nonce,
+    Transactions.created_at,
+)
+
+# Page sizes for sim_getTransactionsForAddress; history is always read in
+# bounded pages however many transactions an address has.
+ADDRESS_HISTORY_DEFAULT_LIMIT = 50
+ADDRESS_HISTORY_MAX_LIMIT = 500
+
+HEAVY_TRANSACTION_COLUMNS = (
+    "data",
+    "consensus_data",
+    "consensus_history",
+    "contract_snapshot",
+    "leader_timeout_validators",
+    "sim_config",
+)
+
+
+def consensus_data_without_contract_state():
+    """`transactions.consensus_data` with `contract_state` dropped from the
+    leader receipts in Postgres, so the state never leaves the database."""
+    return literal_column(
+        """
+        CASE jsonb_typeof(transactions.consensus_data -> 'leader_receipt')
+            WHEN 'array' THEN jsonb_set(
+                transactions.consensus_data,
+                '{leader_receipt}',
+                COALESCE(
+                    (
+                        SELECT jsonb_agg(
+                            CASE WHEN jsonb_typeof(r.value) = 'object'
+                                THEN r.value - 'contract_state'
+                                ELSE r.value
+                            END
+                            ORDER BY r.ordinality
+                        )
+                        FROM jsonb_array_elements(
+                            transactions.consensus_data -> 'leader_receipt'
+                        ) WITH ORDINALITY AS r(value, ordinality)
+                    ),
+                    '[]'::jsonb
+                )
+            )
+            WHEN 'object' THEN jsonb_set(
+                transactions.consensus_data,
+                '{leader_receipt}',
+                (transactions.consensus_data -> 'leader_receipt') - 'contract_state'
+            )
+            ELSE transactions.consensus_data
+        END
+        """,
+        type_=JSONB,
+    )
+
+
+def _leader_receipt_summary():
+    """The first leader receipt cut down to `execution_result` and `result`,
+    shaped like `consensus_data` for _parse_transaction_data (NULL without
+    consensus data)."""
+    return literal_column(
+        """
+        (
+            SELECT jsonb_build_object(
+                'leader_receipt',
+                CASE WHEN jsonb_typeof(receipt.value) = 'object' THEN jsonb_build_array(
+                    COALESCE(
+                        (
+                            SELECT jsonb_object_agg(field.key, field.value)
+                            FROM jsonb_each(receipt.value) AS field
+                            WHERE field.key IN ('execution_result', 'result')
+                        ),
+                        '{}'::jsonb
+                    )
+                )
+                ELSE '[]'::jsonb
+                END
+            )
+            FROM (
+                SELECT CASE jsonb_typeof(transactions.consensus_data -> 'leader_receipt')
+                    WHEN 'array' THEN transactions.consensus_data -> 'leader_receipt' -> 0
+                    WHEN 'object' THEN transactions.consensus_data -> 'leader_receipt'
+                END AS value
+            ) AS receipt
+            WHERE jsonb_typeof(transactions.consensus_data) = 'object'
+        )
+        """,
+        type_=JSONB,
+    )
+
+
 class TransactionAddressFilter(Enum):
     ALL = "all"
     TO = "to"
@@ -112,20 +245,56 @@ class TransactionsProcessor:
             }
         return value
 
-    @staticmethod
-    def _parse_transaction_data(transaction_data: Transactions) -> dict:
-        fee_accounting = (
-            transaction_data.data.get(FEE_ACCOUNTING_KEY)
-            if isinstance(transaction_data.data, dict)
-            else None
+    def _notify_consensus_work(self, transaction_hash: str, reason: str):
+        """
+        Queue a NOTIFY on the consensus work channel in the current DB transaction.
+
+        Delivered to listening workers when the caller commits; a rollback
+        discards it together with the change it announces.
+
+        Args:
+            transaction_hash (str): Hash of the transaction that became claimable.
+            reason (str): "inserted", "appealed" or the new status value.
+        """
+        self.session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {
+                "channel": CONSENSUS_WORK_CHANNEL,
+                "payload": json.dumps({"hash": transaction_hash, "reason": reason}),
+            },
         )
-        execution_result, execution_result_name = (
-            TransactionsProcessor._execution_result_fields(
-                transaction_data.consensus_data
+
+    @staticmethod
+    def _parse_transaction_data(
+        transaction_data: Transactions, lean: dict | None = None
+    ) -> dict:
+        """
+        `lean` replaces the HEAVY_TRANSACTION_COLUMNS of `transaction_data`,
+        which the caller deferred or loaded as trimmed JSONB; heavy columns it
+        leaves out are left out of the result and never loaded. It may also
+        carry `fee_accounting` and `receipt_summary` (see
+        _leader_receipt_summary) to derive fees and results from.
+        """
+        if lean is None:
+            heavy = {
+                name: getattr(transaction_data, name)
+                for name in HEAVY_TRANSACTION_COLUMNS
+            }
+        else:
+            heavy = lean
+        data = heavy.get("data")
+        consensus_data = heavy.get("consensus_data", heavy.get("receipt_summary"))
+        if "fee_accounting" in heavy:
+            fee_accounting = heavy["fee_accounting"]
+        else:
+            fee_accounting = (
+                data.get(FEE_ACCOUNTING_KEY) if isinstance(data, dict) else None
             )
+        execution_result, execution_result_name = (
+            TransactionsProcessor._execution_result_fields(consensus_data)
         )
-        if transaction_data.consensus_data:
-            leader_receipts = transaction_data.consensus_data.get("leader_receipt", [])
+        if consensus_data:
+            leader_receipts = consensus_data.get("leader_receipt", [])
             if isinstance(leader_receipts, dict):
                 result = leader_receipts.get("result", {})
             elif isinstance(leader_receipts, list) and len(leader_receipts) > 0:
@@ -133,14 +302,14 @@ class TransactionsProcessor:
             else:
                 result = {}
         else:
-            result = transaction_data.consensus_data
+            result = consensus_data
         if isinstance(result, dict):
             result = result.get("raw", {})
-        return {
+        parsed = {
             "hash": transaction_data.hash,
             "from_address": transaction_data.from_address,
             "to_address": transaction_data.to_address,
-            "data": TransactionsProcessor._json_safe_numbers(transaction_data.data),
+            "data": TransactionsProcessor._json_safe_numbers(data),
             # Numeric-columns contract (tests/db-sqlalchemy/test_numeric_types.py):
             # top-level "value" is a plain int. The blanket _json_safe_numbers
             # stringification (fee-accounting era) broke that contract for
@@ -154,7 +323,7 @@ class TransactionsProcessor:
             "fees": TransactionsProcessor._canonical_fees(fee_accounting),
             "result": TransactionsProcessor._decode_base64_data(result),
             "consensus_data": TransactionsProcessor._json_safe_numbers(
-                transaction_data.consensus_data
+                heavy.get("consensus_data")
             ),
             "gaslimit": transaction_data.nonce,
             "nonce": transaction_data.nonce,
@@ -175,23 +344,53 @@ class TransactionsProcessor:
             "timestamp_awaiting_finalization": transaction_data.timestamp_awaiting_finalization,
             "appeal_failed": transaction_data.appeal_failed,
             "appeal_undetermined": transaction_data.appeal_undetermined,
-            "consensus_history": transaction_data.consensus_history,
+            "consensus_history": heavy.get("consensus_history"),
             "timestamp_appeal": transaction_data.timestamp_appeal,
             "appeal_processing_time": transaction_data.appeal_processing_time,
-            "contract_snapshot": transaction_data.contract_snapshot,
+            "contract_snapshot": heavy.get("contract_snapshot"),
             "config_rotation_rounds": transaction_data.config_rotation_rounds,
             "num_of_initial_validators": transaction_data.num_of_initial_validators,
             "last_vote_timestamp": transaction_data.last_vote_timestamp,
             "rotation_count": transaction_data.rotation_count,
             "appeal_leader_timeout": transaction_data.appeal_leader_timeout,
-            "leader_timeout_validators": transaction_data.leader_timeout_validators,
+            "leader_timeout_validators": heavy.get("leader_timeout_validators"),
             "appeal_validators_timeout": transaction_data.appeal_validators_timeout,
-            "sim_config": transaction_data.sim_config,
+            "sim_config": heavy.get("sim_config"),
             # Required for execute_transfer's idempotency guard. Missing this
             # field caused the guard to always read None/false, double-crediting
             # SEND txs created by sim_fundAccount.
             "value_credited": transaction_data.value_credited,
         }
+        if lean is not None:
+            for name in HEAVY_TRANSACTION_COLUMNS:
+                if name not in lean:
+                    del parsed[name]
+        return parsed
+
+    def _lean_transactions_query(self):
+        """
+        Query (transaction, fee_accounting, receipt_summary) rows with every
+        heavy column deferred; see _parse_lean_row. Triggered transactions
+        are loaded with their hash only, which is all the result lists.
+        """
+        return self.session.query(
+            Transactions,
+            Transactions.data[FEE_ACCOUNTING_KEY].label("fee_accounting"),
+            _leader_receipt_summary().label("receipt_summary"),
+        ).options(
+            *(defer(getattr(Transactions, name)) for name in HEAVY_TRANSACTION_COLUMNS),
+            selectinload(Transactions.triggered_transactions).load_only(
+                Transactions.hash
+            ),
+        )
+
+    @staticmethod
+    def _parse_lean_row(row) -> dict:
+        transaction, fee_accounting, receipt_summary = row
+        return TransactionsProcessor._parse_transaction_data(
+            transaction,
+            {"fee_accounting": fee_accounting, "receipt_summary": receipt_summary},
+        )
 
     @staticmethod
     def _status_payload(status: str) -> dict:
@@ -464,6 +663,7 @@ class TransactionsProcessor:
         self.session.add(new_transaction)
 
         self.session.flush()  # So that `created_at` gets set
+        self._notify_consensus_work(transaction_hash, "inserted")
         self.session.commit()  # Persist the transaction to the database
 
         return transaction_hash
@@ -803,38 +1003,41 @@ class TransactionsProcessor:
     ) -> dict | None:
         # Expire cached ORM objects to ensure we read fresh data after raw SQL writes
         self.session.expire_all()
-        transaction = (
-            self.session.query(Transactions)
-            .filter_by(hash=transaction_hash)
-            .one_or_none()
-        )
-
-        if transaction is None:
-            return None
-
-        transaction_data = self._parse_transaction_data(transaction)
 
-        # Handle contract_state based on sim_config
+        # contract_state is dropped from the leader receipts in SQL by default
+        # (unless explicitly requested); it is by far the largest part of a
+        # receipt and most callers never read it.
         include_contract_state = sim_config and sim_config.get(
             "include_contract_state", False
         )
-
-        # Remove contract_state from consensus_data by default (unless explicitly requested)
-        if (
-            transaction_data.get("consensus_data")
-            and "leader_receipt" in transaction_data["consensus_data"]
-        ):
-            leader_receipt = transaction_data["consensus_data"]["leader_receipt"]
-
-            if isinstance(leader_receipt, dict):
-                if not include_contract_state and "contract_state" in leader_receipt:
-                    del leader_receipt["contract_state"]
-
-            elif isinstance(leader_receipt, list):
-                for receipt in leader_receipt:
-                    if isinstance(receipt, dict):
-                        if not include_contract_state and "contract_state" in receipt:
-                            del receipt["contract_state"]
+        if include_contract_state:
+            transaction = (
+                self.session.query(Transactions)
+                .filter_by(hash=transaction_hash)
+                .one_or_none()
+            )
+            if transaction is None:
+                return None
+            transaction_data = self._parse_transaction_data(transaction)
+        else:
+            row = (
+                self.session.query(
+                    Transactions, consensus_data_without_contract_state()
+                )
+                .options(defer(Transactions.consensus_data))
+                .filter(Transactions.hash == transaction_hash)
+                .one_or_none()
+            )
+            if row is None:
+                return None
+            transaction, consensus_data = row
+            heavy = {
+                name: getattr(transaction, name)
+                for name in HEAVY_TRANSACTION_COLUMNS
+                if name != "consensus_data"
+            }
+            heavy["consensus_data"] = consensus_data
+            transaction_data = self._parse_transaction_data(transaction, heavy)
 
         # Process for testnet
         transaction_data = self._prepare_basic_transaction_data(transaction_data)
@@ -849,16 +1052,25 @@ class TransactionsProcessor:
     def get_studio_transaction_by_hash(
         self, transaction_hash: str, full: bool
     ) -> dict | None:
-        transaction = (
-            self.session.query(Transactions)
-            .filter_by(hash=transaction_hash)
-            .one_or_none()
-        )
-
-        if transaction is None:
-            return None
-
-        transaction_data = self._parse_transaction_data(transaction)
+        if full:
+            transaction = (
+                self.session.query(Transactions)
+                .filter_by(hash=transaction_hash)
+                .one_or_none()
+            )
+            if transaction is None:
+                return None
+            transaction_data = self._parse_transaction_data(transaction)
+        else:
+            # Validators info and encoded data are left out, so never load them
+            row = (
+                self._lean_transactions_query()
+                .filter(Transactions.hash == transaction_hash)
+                .one_or_none()
+            )
+            if row is None:
+                return None
+            transaction_data = self._parse_lean_row(row)
 
         # Transform studio fields to testnet fields
         transaction_data["tx_id"] = transaction_data.pop("hash", None)
@@ -878,18 +1090,6 @@ class TransactionsProcessor:
             transaction_data.pop("last_vote_timestamp", 0)
         )
 
-        if not full:
-            # Remove validators info and encoded data
-            for key in [
-                "data",
-                "consensus_data",
-                "consensus_history",
-                "contract_snapshot",
-                "leader_timeout_validators",
-                "sim_config",
-            ]:
-                transaction_data.pop(key, None)
-
         return transaction_data
 
     def get_activated_transactions_older_than(self, seconds: int) -> list[dict]:
@@ -999,43 +1199,54 @@ class TransactionsProcessor:
             )
             return
 
+        if new_status in CONSENSUS_WORK_STATUSES:
+            self._notify_consensus_work(transaction_hash, new_status.value)
         self.session.commit()
 
     def add_state_timestamp(self, transaction_hash: str, state_name: str):
         """
         Add a timestamp for when a consensus state is entered.
 
+        Args:
+            transaction_hash (str): Hash of the transaction.
+            state_name (str): Name of the state (e.g., "PENDING", "PROPOSING").
+        """
+        self.add_state_timestamps(transaction_hash, {state_name: time.time()})
+
+    def add_state_timestamps(self, transaction_hash: str, markers: dict[str, float]):
+        """
+        Merge several state timestamps into `current_monitoring` in one write.
+
         Uses server-side JSONB update to avoid loading the full row
         (which includes the massive contract_snapshot column).
 
         Args:
             transaction_hash (str): Hash of the transaction.
-            state_name (str): Name of the state (e.g., "PENDING", "PROPOSING").
+            markers (dict[str, float]): State name -> epoch seconds.
         """
+        if not markers:
+            return
+
         result = self.session.execute(
             text(
                 """
                 UPDATE transactions
                 SET consensus_history = jsonb_set(
-                    jsonb_set(
-                        CASE WHEN jsonb_typeof(consensus_history) = 'object'
-                             THEN consensus_history
-                             ELSE '{}'::jsonb
-                        END,
-                        '{current_monitoring}',
-                        CASE WHEN jsonb_typeof(consensus_history) = 'object'
-                                  AND consensus_history->'current_monitoring' IS NOT NULL
-                             THEN consensus_history->'current_monitoring'
-                             ELSE '{}'::jsonb
-                        END
-                    ),
-                    ARRAY['current_monitoring', :state_name],
-                    to_jsonb(CAST(:ts AS double precision))
+                    CASE WHEN jsonb_typeof(consensus_history) = 'object'
+                         THEN consensus_history
+                         ELSE '{}'::jsonb
+                    END,
+                    '{current_monitoring}',
+                    CASE WHEN jsonb_typeof(consensus_history) = 'object'
+                              AND jsonb_typeof(consensus_history->'current_monitoring') = 'object'
+                         THEN consensus_history->'current_monitoring'
+                         ELSE '{}'::jsonb
+                    END || CAST(:markers AS jsonb)
                 )
                 WHERE hash = :hash
             """
             ),
-            {"hash": transaction_hash, "state_name": state_name, "ts": time.time()},
+            {"hash": transaction_hash, "markers": json.dumps(markers)},
         )
 
         if result.rowcount == 0:
@@ -1101,52 +1312,179 @@ class TransactionsProcessor:
         data["fee_accounting"] = fee_accounting
         self.update_transaction_data(transaction_hash, data)
 
-    def get_transaction_count(self, address: str) -> int:
+    def get_transaction_count(self, address: str | None) -> int:
+        if address is None:
+            # Mints (sim_fundAccount) have no sender and no address_activity row
+            return (
+                self.session.query(Transactions)
+                .filter(Transactions.from_address.is_(None))
+                .count()
+            )
+
         # Normalize address to checksum format
         try:
-            checksum_address = self.web3.to_checksum_address(address)
-        except:
+            checksum_address = to_checksum_address(address)
+        except Exception:
             checksum_address = address
 
         # Always use database count as source of truth
-        # Our transactions are stored in PostgreSQL, not on Hardhat blockchain
-        count = (
-            self.session.query(Transactions)
-            .filter(Transactions.from_address == checksum_address)
-            .count()
-        )
-        return count
+        # Our transactions are stored in PostgreSQL, not on Hardhat blockchain.
+        # address_activity is kept in step with transactions by triggers, so
+        # this is a primary-key lookup rather than a scan of the sender's rows.
+        count = self.session.execute(
+            select(AddressActivity.sent_count).where(
+                AddressActivity.address == checksum_address
+            )
+        ).scalar()
+        return count or 0
 
     def get_transactions_for_address(
         self,
         address: str,
         filter: TransactionAddressFilter,
+        full: bool = True,
     ) -> list[dict]:
+        """
+        The newest ADDRESS_HISTORY_MAX_LIMIT transactions sent from and/or to
+        `address`, newest first. Use get_transactions_for_address_page to
+        read further back.
+        """
+        return self.get_transactions_for_address_page(
+            address, filter, limit=ADDRESS_HISTORY_MAX_LIMIT, full=full
+        )["transactions"]
+
+    def get_transactions_for_address_page(
+        self,
+        address: str,
+        filter: TransactionAddressFilter,
+        limit: int = ADDRESS_HISTORY_DEFAULT_LIMIT,
+        cursor: str | None = None,
+        full: bool = True,
+        summary: bool = False,
+    ) -> dict:
+        """
+        One page of transactions sent from and/or to `address`, newest first.
+
+        Pages seek past the (created_at, hash) key returned as `nextCursor` on
+        the previous page, served by the per-address (created_at, hash)
+        indexes, so a deep page costs the same as the first. `limit` is capped
+        at ADDRESS_HISTORY_MAX_LIMIT. With `summary` only the columns of
+        get_transaction_summary are read; otherwise `full` behaves as in
+        get_transactions_for_address. Raises ValueError for a malformed cursor.
+        """
         try:
             address = to_checksum_address(address)
         except Exception:
             pass
-        query = self.session.query(Transactions).options(
-            selectinload(Transactions.triggered_transactions)
-        )
+        limit = max(1, min(limit, ADDRESS_HISTORY_MAX_LIMIT))
+        after = self._decode_address_cursor(cursor) if cursor else None
+
+        def page_keys(column):
+            query = select(Transactions.created_at, Transactions.hash).where(
+                column == address
+            )
+            if after is not None:
+                query = query.where(
+                    tuple_(Transactions.created_at, Transactions.hash) < tuple_(*after)
+                )
+            return query.order_by(
+                Transactions.created_at.desc(), Transactions.hash.desc()
+            ).limit(limit + 1)
 
         if filter == TransactionAddressFilter.TO:
-            query = query.filter(Transactions.to_address == address)
+            keys_query = page_keys(Transactions.to_address)
         elif filter == TransactionAddressFilter.FROM:
-            query = query.filter(Transactions.from_address == address)
+            keys_query = page_keys(Transactions.from_address)
         else:  # TransactionFilter.ALL
-            query = query.filter(
-                or_(
-                    Transactions.from_address == address,
-                    Transactions.to_address == address,
-                )
+            # One seek per index instead of an OR that would have to sort
+            # every matching row; UNION drops self-sent duplicates.
+            both = union(
+                page_keys(Transactions.from_address),
+                page_keys(Transactions.to_address),
+            ).subquery()
+            keys_query = (
+                select(both.c.created_at, both.c.hash)
+                .order_by(both.c.created_at.desc(), both.c.hash.desc())
+                .limit(limit + 1)
+            )
+        keys = self.session.execute(keys_query).all()
+        next_cursor = (
+            self._encode_address_cursor(*keys[limit - 1]) if len(keys) > limit else None
+        )
+        hashes = [key.hash for key in keys[:limit]]
+        if not hashes:
+            return {"transactions": [], "nextCursor": None}
+
+        if summary:
+            rows = (
+                self.session.query(*TRANSACTION_SUMMARY_COLUMNS)
+                .filter(Transactions.hash.in_(hashes))
+                .all()
+            )
+            by_hash = {row.hash: self._parse_summary_row(row) for row in rows}
+        elif full:
+            rows = (
+                self.session.query(Transactions)
+                .options(selectinload(Transactions.triggered_transactions))
+                .filter(Transactions.hash.in_(hashes))
+                .all()
+            )
+            by_hash = {row.hash: self._parse_transaction_data(row) for row in rows}
+        else:
+            rows = (
+                self._lean_transactions_query()
+                .filter(Transactions.hash.in_(hashes))
+                .all()
             )
+            by_hash = {row[0].hash: self._parse_lean_row(row) for row in rows}
 
-        transactions = query.order_by(Transactions.created_at.desc()).all()
+        return {
+            "transactions": [by_hash[h] for h in hashes if h in by_hash],
+            "nextCursor": next_cursor,
+        }
 
-        return [
-            self._parse_transaction_data(transaction) for transaction in transactions
-        ]
+    @staticmethod
+    def _encode_address_cursor(created_at: datetime, transaction_hash: str) -> str:
+        raw = f"{created_at.isoformat()}|{transaction_hash}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def _decode_address_cursor(cursor: str) -> tuple[datetime, str]:
+        try:
+            created_at, transaction_hash = (
+                base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+            )
+            return datetime.fromisoformat(created_at), transaction_hash
+        except Exception:
+            raise ValueError("Invalid cursor")
+
+    @staticmethod
+    def _parse_summary_row(row) -> dict:
+        return {
+            "hash": row.hash,
+            "from_address": row.from_address,
+            "to_address": row.to_address,
+            "status": row.status.value,
+            "type": row.type,
+            "value": row.value,
+            "nonce": row.nonce,
+            "created_at": row.created_at.isoformat(),
+        }
+
+    def get_transaction_summary(self, transaction_hash: str) -> dict | None:
+        """
+        Hash, addresses, status, type, value, nonce and creation time of a
+        transaction, read without touching any JSONB column. For receipts,
+        block lookups and existence checks.
+        """
+        row = (
+            self.session.query(*TRANSACTION_SUMMARY_COLUMNS)
+            .filter(Transactions.hash == transaction_hash)
+            .one_or_none()
+        )
+        if row is None:
+            return None
+        return self._parse_summary_row(row)
 
     def set_transaction_appeal(self, transaction_hash: str, appeal: bool):
         if not appeal:
@@ -1170,6 +1508,7 @@ class TransactionsProcessor:
                 {"hash": transaction_hash, "appeal": appeal, "ts": int(time.time())},
             )
             if result.rowcount > 0:
+                self._notify_consensus_work(transaction_hash, "appealed")
                 self.session.commit()
 
     def set_transaction_timestamp_awaiting_finalization(
@@ -1586,20 +1925,17 @@ class TransactionsProcessor:
         """
         try:
             # Normalize address to checksum format
-            checksum_address = self.web3.to_checksum_address(address)
-        except ValueError:
+            checksum_address = to_checksum_address(address)
+        except Exception:
             # If address normalization fails, use as-is
             checksum_address = address
 
-        count = (
-            self.session.query(Transactions)
-            .filter(
-                Transactions.to_address == checksum_address,
-                Transactions.status == TransactionStatus.PENDING,
+        count = self.session.execute(
+            select(AddressActivity.pending_count).where(
+                AddressActivity.address == checksum_address
             )
-            .count()
-        )
-        return count
+        ).scalar()
+        return count or 0
 
     def get_transaction_status(self, transaction_hash: str) -> dict | None:
         transaction = (
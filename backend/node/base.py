@@ -9,6 +9,7 @@ import sys
 import asyncio
 from typing import Callable, Optional
 import typing
+import collections
 import collections.abc
 import os
 import logging
@@ -243,13 +244,30 @@ class _SnapshotView(genvmbase.StateProxy):
     def _get_contract_slot_cache(self, snap: ContractSnapshot) -> dict[str, bytes]:
         return self._decoded_slots.setdefault(snap.contract_address, {})
 
-    def _get_primary_decoded(self) -> dict[bytes, bytes]:
+    def _get_primary_decoded(self) -> collections.abc.MutableMapping[bytes, bytes]:
         decoded = self._primary_decoded
         if decoded is not None:
             return decoded
 
-        decoded = {}
         state = self.snapshot.states.get(self.state_status, {})
+        parent = getattr(self.snapshot, "parent", None)
+        if parent is not None and isinstance(state, collections.ChainMap):
+            # Forked snapshot: the parent's state is decoded once and shared by
+            # all forks; this execution's writes go to the overlay.
+            decoded = collections.ChainMap(
+                self._decode_state(state.maps[0]),
+                parent.decoded_state(self.state_status, self._decode_state),
+            )
+        else:
+            decoded = self._decode_state(state)
+
+        self._primary_decoded = decoded
+        return decoded
+
+    def _decode_state(
+        self, state: collections.abc.Mapping[str, str]
+    ) -> dict[bytes, bytes]:
+        decoded = {}
         shared_cache = self._shared_decoded_value_cache
         for slot_key, raw in state.items():
             slot = base64.b64decode(slot_key)
@@ -273,8 +291,6 @@ class _SnapshotView(genvmbase.StateProxy):
                     if metrics is not None:
                         metrics["shared_decoded_cache_hits"] += 1
             decoded[slot] = value
-
-        self._primary_decoded = decoded
         return decoded
 
     def _read_primary_slot_value(self, slot: bytes) -> bytes:
@@ -317,6 +333,19 @@ class _SnapshotView(genvmbase.StateProxy):
         slot_cache[slot_key] = data
         return data
 
+    def fork(self) -> "_SnapshotView":
+        """Fresh view over the state this execution started from, for retries."""
+        origin = getattr(self.snapshot, "parent", None) or self.snapshot
+        return _SnapshotView(
+            origin.fork(),
+            self.snapshot_factory,
+            self.readonly,
+            self.state_status,
+            self._shared_decoded_value_cache,
+            self._shared_contract_snapshot_cache,
+            self._metrics is not None,
+        )
+
     def get_metrics(self) -> dict[str, int]:
         metrics = self._metrics
         if metrics is None:
@@ -410,14 +439,47 @@ _MODULE_MAP = {
 }
 
 
+def _manager_connector() -> aiohttp.BaseConnector:
+    """
+    Keep-alive connector for GenVM manager calls.
+
+    GENVM_MANAGER_SOCKET routes requests over a Unix socket (manager URL host
+    is then only used for the Host header); otherwise TCP to the manager URL.
+    GENVM_MANAGER_HTTP_POOL_SIZE bounds concurrent pooled connections.
+    """
+    pool_size = int(os.getenv("GENVM_MANAGER_HTTP_POOL_SIZE", "64"))
+    keepalive_timeout = float(os.getenv("GENVM_MANAGER_HTTP_KEEPALIVE_SECONDS", "30"))
+    socket_path = os.getenv("GENVM_MANAGER_SOCKET")
+    if socket_path:
+        return aiohttp.UnixConnector(
+            path=socket_path, limit=pool_size, keepalive_timeout=keepalive_timeout
+        )
+    return aiohttp.TCPConnector(limit=pool_size, keepalive_timeout=keepalive_timeout)
+
+
 class Manager:
     url: str
     llm_config_base: dict[str, typing.Any]
     web_config_base: dict[str, typing.Any]
     logger: Logger
     proc: asyncio.subprocess.Process | None
+    _http_session: aiohttp.ClientSession | None = None
+
+    def http_session(self) -> aiohttp.ClientSession:
+        """
+        Process-wide pooled session used for every manager call, so executions
+        and status polls reuse connections instead of opening one per request.
+        Created on first use (needs a running loop) and closed by close().
+        """
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(connector=_manager_connector())
+        return self._http_session
 
     async def close(self):
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+
         if self.proc is not None:
             import signal
 
@@ -472,8 +534,8 @@ class Manager:
     async def stop_module(self, module_type: typing.Literal["llm", "web"]):
 
         data = {"module_type": _MODULE_MAP[module_type]}
-        async with aiohttp.request(
-            "POST", f"{self.url}/module/stop", json=data
+        async with self.http_session().post(
+            f"{self.url}/module/stop", json=data
         ) as resp:
             body = await resp.json()
             if resp.status != 200:
@@ -490,8 +552,8 @@ class Manager:
         extra: dict = {},
     ):
         data = {"module_type": _MODULE_MAP[module_type], "config": config, **extra}
-        async with aiohttp.request(
-            "POST", f"{self.url}/module/start", json=data
+        async with self.http_session().post(
+            f"{self.url}/module/start", json=data
         ) as resp:
             body = await resp.json()
             if resp.status != 200:
@@ -521,7 +583,7 @@ class Manager:
             "configs": configs,
             "test_prompts": [prompt],
         }
-        async with aiohttp.request("POST", f"{self.url}/llm/check", json=data) as resp:
+        async with self.http_session().post(f"{self.url}/llm/check", json=data) as resp:
             body = await resp.json()
             if resp.status != 200:
                 self.logger.error(
@@ -716,7 +778,10 @@ class Node:
         if fallback_llm_id and self.validators_snapshot:
             fallback_validator = None
             for node in self.validators_snapshot.nodes:
-                if f"node-{node.validator.address}" == fallback_llm_id:
+                llm_id = (node.genvm_host_data or {}).get(
+                    "studio_llm_id", f"node-{node.validator.address}"
+                )
+                if llm_id == fallback_llm_id:
                     fallback_validator = node.validator
                     break
 
@@ -943,6 +1008,7 @@ class Node:
             logger=self.logger,
             timeout=30,
             manager_uri=self.manager.url,
+            http_session=self.manager.http_session(),
         )
         result.processing_time = int((time.time() - start_time) * 1000)
 
@@ -1072,6 +1138,7 @@ class Node:
                 extra_args=_genvm_extra_args(),
                 is_sync=is_sync,
                 manager_uri=self.manager.url,
+                http_session=self.manager.http_session(),
                 timeout=timeout,
                 code=code,
                 fee_context=genvmbase.GenVMFeeContext(
@@ -1156,9 +1223,9 @@ class Node:
             pending_transactions=result.pending_transactions,
             vote=None,
             execution_result=result_exec_code,
-            contract_state=typing.cast(_SnapshotView, result.state).snapshot.states[
-                "accepted"
-            ],
+            contract_state=dict(
+                typing.cast(_SnapshotView, result.state).snapshot.states["accepted"]
+            ),
             calldata=calldata,
             mode=self.validator_mode,
             node_config=self._create_enhanced_node_config(host_data),
@@ -25,6 +25,7 @@ import json
 import base64
 import asyncio
 import socket
+import aiohttp
 import backend.node.genvm.origin.base_host as genvmhost
 import collections.abc
 import functools
@@ -522,6 +523,11 @@ class Host(genvmhost.IHost):
 
 
 async def _copy_state_proxy(state_proxy) -> StateProxy:
+    # Snapshot-backed proxies fork a copy-on-write view instead of deep-copying
+    # the whole contract state.
+    fork = getattr(state_proxy, "fork", None)
+    if fork is not None:
+        return fork()
     # snapshot_factory cannot be pickled. Temporarily remove the factory to allow deepcopy
     factory = state_proxy.snapshot_factory
     shared_decoded_value_cache = getattr(
@@ -599,6 +605,7 @@ async def run_genvm_host(
     *,
     timeout: float,
     manager_uri: str = "http://127.0.0.1:3999",
+    http_session: aiohttp.ClientSession | None = None,
     logger: genvm_logger.Logger | None = None,
     is_sync: bool,
     capture_output: bool = True,
@@ -685,6 +692,7 @@ async def run_genvm_host(
                     res = await base_host.run_genvm(
                         host,
                         manager_uri=manager_uri,
+                        http_session=http_session,
                         message=message,
                         timeout=timeout,
                         capture_output=capture_output,
@@ -25,6 +25,9 @@ from . import public_abi
 ACCOUNT_ADDR_SIZE = 20
 SLOT_ID_SIZE = 32
 
+SOCKET_READ_BUFFER_SIZE = 65536
+SOCKET_DIRECT_WRITE_SIZE = 65536
+
 DEFAULT_GAS_DATA: dict[str, str] = {
     "storageUnitPrice": "1",
     "receiptGasPerByte": "1",
@@ -86,6 +89,21 @@ def _http_timeout(
     )
 
 
+def _manager_request(
+    http_session: aiohttp.ClientSession | None,
+    method: str,
+    url: str,
+    **kwargs,
+):
+    """
+    Issue a request to the GenVM manager through the caller's pooled session,
+    or as a one-shot request with its own connector when no session is given.
+    """
+    if http_session is None:
+        return aiohttp.request(method, url, **kwargs)
+    return http_session.request(method, url, **kwargs)
+
+
 class HostException(Exception):
     def __init__(self, error_code: host_fns.Errors, message: str = ""):
         if error_code == host_fns.Errors.OK:
@@ -231,56 +249,90 @@ async def host_loop(
     first_method_name: str | None = None
     first_method_received_s: float | None = None
 
+    # Responses are accumulated and flushed only before the loop blocks on
+    # the socket, so replies to pipelined requests go out in one write.
+    # Payloads too large to be worth copying are sent straight from the
+    # caller's buffer.
     socket_write_buffer = bytearray()
 
     async def send_all(data: bytes | memoryview):
-        socket_write_buffer.extend(data)
-        if len(socket_write_buffer) > 4096:
+        if len(data) >= SOCKET_DIRECT_WRITE_SIZE:
             await flush_socket_buffer()
+            await async_loop.sock_sendall(sock, data)
+        else:
+            socket_write_buffer.extend(data)
 
     async def flush_socket_buffer():
         if len(socket_write_buffer) > 0:
             await async_loop.sock_sendall(sock, socket_write_buffer)
             socket_write_buffer.clear()
 
-    socket_read_buf = bytearray(65536)
+    socket_read_buf = bytearray(SOCKET_READ_BUFFER_SIZE)
     socket_read_buf_view = memoryview(socket_read_buf)
     socket_read_start = 0
     socket_read_end = 0
 
+    async def fill_read_buffer(le: int):
+        """Receive until at least `le` (<= buffer size) bytes are buffered."""
+        nonlocal socket_read_start, socket_read_end
+        available = socket_read_end - socket_read_start
+        if available == 0:
+            socket_read_start = socket_read_end = 0
+        elif socket_read_start + le > SOCKET_READ_BUFFER_SIZE:
+            socket_read_buf[:available] = socket_read_buf[
+                socket_read_start:socket_read_end
+            ]
+            socket_read_start, socket_read_end = 0, available
+        await flush_socket_buffer()
+        while socket_read_end - socket_read_start < le:
+            received = await async_loop.sock_recv_into(
+                sock, socket_read_buf_view[socket_read_end:]
+            )
+            if received == 0:
+                raise ConnectionResetError()
+            socket_read_end += received
+
     async def read_exact(le: int) -> bytes:
         nonlocal socket_read_start, socket_read_end
+        if le <= SOCKET_READ_BUFFER_SIZE:
+            if socket_read_end - socket_read_start < le:
+                await fill_read_buffer(le)
+            out = bytes(
+                socket_read_buf_view[socket_read_start : socket_read_start + le]
+            )
+            socket_read_start += le
+            return out
+
+        # Larger payloads are received straight into their own buffer.
         out = bytearray(le)
-        idx = 0
+        out_view = memoryview(out)
+        idx = socket_read_end - socket_read_start
+        out_view[:idx] = socket_read_buf_view[socket_read_start:socket_read_end]
+        socket_read_start = socket_read_end = 0
+        await flush_socket_buffer()
         while idx < le:
-            available = socket_read_end - socket_read_start
-            if available == 0:
-                socket_read_start = 0
-                socket_read_end = await async_loop.sock_recv_into(
-                    sock, socket_read_buf_view
-                )
-                if socket_read_end == 0:
-                    raise ConnectionResetError()
-                available = socket_read_end
-            take = min(available, le - idx)
-            out[idx : idx + take] = socket_read_buf[
-                socket_read_start : socket_read_start + take
-            ]
-            idx += take
-            socket_read_start += take
+            received = await async_loop.sock_recv_into(sock, out_view[idx:])
+            if received == 0:
+                raise ConnectionResetError()
+            idx += received
+        out_view.release()
         return bytes(out)
 
     async def recv_int(bytes: int = 4) -> int:
-        return int.from_bytes(await read_exact(bytes), byteorder="little", signed=False)
+        nonlocal socket_read_start
+        if socket_read_end - socket_read_start < bytes:
+            await fill_read_buffer(bytes)
+        res = int.from_bytes(
+            socket_read_buf_view[socket_read_start : socket_read_start + bytes],
+            byteorder="little",
+            signed=False,
+        )
+        socket_read_start += bytes
+        return res
 
     async def send_int(i: int, bytes=4):
         await send_all(int.to_bytes(i, bytes, byteorder="little", signed=False))
 
-    async def read_slice() -> memoryview:
-        le = await recv_int()
-        data = await read_exact(le)
-        return memoryview(data)
-
     total_handling_time = 0.0
     time_per_method = {}
     call_counts = {}
@@ -295,8 +347,6 @@ async def host_loop(
                 time_per_method.get(meth_id.name, 0.0) + cur_delta
             )
 
-        await flush_socket_buffer()
-
         meth_id = host_fns.Methods(await recv_int(1))
         if first_method_name is None:
             first_method_name = meth_id.name
@@ -312,8 +362,7 @@ async def host_loop(
         handling_start = time.time()
         match meth_id:
             case host_fns.Methods.STORAGE_READ:
-                mode = await read_exact(1)
-                mode = public_abi.StorageType(mode[0])
+                mode = public_abi.StorageType(await recv_int(1))
                 account = await read_exact(ACCOUNT_ADDR_SIZE)
                 slot = await read_exact(SLOT_ID_SIZE)
                 index = await recv_int()
@@ -423,6 +472,7 @@ async def _send_timeout(
     manager_uri: str,
     genvm_id: str,
     ctx: Context,
+    http_session: aiohttp.ClientSession | None = None,
 ):
     try:
         graceful_shutdown_wait_time_ms = ctx.get_timeout(
@@ -432,7 +482,8 @@ async def _send_timeout(
             graceful_shutdown_wait_time_ms = 20
         else:
             graceful_shutdown_wait_time_ms = int(graceful_shutdown_wait_time_ms)
-        async with aiohttp.request(
+        async with _manager_request(
+            http_session,
             "DELETE",
             f"{manager_uri}/genvm/{genvm_id}?wait_timeout_ms={graceful_shutdown_wait_time_ms}",
             timeout=_http_timeout(ctx, TimeoutAction.GenVMDelete),
@@ -465,6 +516,7 @@ async def run_genvm(
     *,
     timeout: float | None = None,
     manager_uri: str = "http://127.0.0.1:3999",
+    http_session: aiohttp.ClientSession | None = None,
     ctx: Context,
     is_sync: bool,
     capture_output: bool = True,
@@ -502,7 +554,8 @@ async def run_genvm(
 
         timestamp = message.get("datetime", "2024-11-26T06:42:42.424242Z")
 
-        async with aiohttp.request(
+        async with _manager_request(
+            http_session,
             "POST",
             f"{manager_uri}/genvm/run",
             data=gvm_calldata.encode(
@@ -628,6 +681,7 @@ async def run_genvm(
             manager_uri,
             genvm_id,
             ctx=ctx,
+            http_session=http_session,
         )
 
     poll_status_mutex = asyncio.Lock()
@@ -638,7 +692,8 @@ async def run_genvm(
             if old_status is not None:
                 return old_status
             try:
-                async with aiohttp.request(
+                async with _manager_request(
+                    http_session,
                     "GET",
                     f"{manager_uri}/genvm/{genvm_id}",
                     timeout=_http_timeout(ctx, TimeoutAction.GenVMGet),
@@ -711,7 +766,9 @@ async def run_genvm(
 
         genvm_id = genvm_id_cell[0]
         if genvm_id is not None:
-            await _send_timeout(manager_uri, genvm_id, ctx=ctx)
+            await _send_timeout(
+                manager_uri, genvm_id, ctx=ctx, http_session=http_session
+            )
         raise
 
     # Log which tasks completed/failed for debugging
@@ -811,6 +868,7 @@ async def run_genvm(
             manager_uri,
             genvm_id,
             ctx=ctx,
+            http_session=http_session,
         )
 
         status = await poll_status(genvm_id)
@@ -856,7 +914,8 @@ async def run_genvm(
             result_data, str
         ):
             try:
-                async with aiohttp.request(
+                async with _manager_request(
+                    http_session,
                     "GET",
                     f"{manager_uri}/vm-error/describe",
                     params={"error": result_data},
@@ -29,6 +29,7 @@ from backend.protocol_rpc.message_handler.fastapi_handler import (
 )
 from backend.protocol_rpc.rpc_decorators import rpc
 from backend.protocol_rpc.rpc_endpoint_manager import RPCEndpointManager
+from backend.database_handler.db_offload import db_offload, event_loop_lag
 from backend.protocol_rpc.validators_init import initialize_validators
 from backend.protocol_rpc.websocket import create_emit_event_function
 from backend.protocol_rpc.broadcast import Broadcast
@@ -44,6 +45,8 @@ from backend.services.usage_metrics_service import UsageMetricsService
 import backend.validators as validators
 from backend.node.base import Manager as GenVMManager
 from backend.protocol_rpc.rate_limiter import RateLimiterService
+from backend.protocol_rpc.endpoints import genvm_admission, warm_contract_schema
+from backend.database_handler.contract_schema_cache import schema_cache_enabled
 import redis.asyncio as aioredis
 
 
@@ -333,6 +336,7 @@ async def rpc_app_lifespan(app, settings: RPCAppSettings) -> AsyncIterator[RPCAp
     # Start background health checker for fast /health endpoint responses
     logger.info("[STARTUP] Starting background health checker")
     start_background_health_checker(rpc_router, usage_metrics_service)
+    event_loop_lag.start()
 
     app_state = RPCAppState(
         db_manager=db_manager,
@@ -408,6 +412,29 @@ async def rpc_app_lifespan(app, settings: RPCAppSettings) -> AsyncIterator[RPCAp
             "validators_replaced", handle_validator_change
         )
 
+        schema_warm_tasks: set[asyncio.Task] = set()
+
+        async def handle_contract_deployed(event_data):
+            """Warm the schema cache for a new contract on one RPC pod."""
+            contract_address = (event_data.get("data") or {}).get("id")
+            if not contract_address or not schema_cache_enabled():
+                return
+            claimed = await redis_subscriber.redis_client.set(
+                f"contract_schema:warm:{contract_address}",
+                redis_subscriber.instance_id,
+                nx=True,
+                ex=300,
+            )
+            if not claimed:
+                return
+            task = asyncio.create_task(
+                warm_contract_schema(genvm_manager, msg_handler, contract_address)
+            )
+            schema_warm_tasks.add(task)
+            task.add_done_callback(schema_warm_tasks.discard)
+
+        redis_subscriber.register_handler("deployed_contract", handle_contract_deployed)
+
         logger.info(
             f"[STARTUP] Redis subscriber connected at {redis_url} for worker event broadcasting"
         )
@@ -427,6 +454,7 @@ async def rpc_app_lifespan(app, settings: RPCAppSettings) -> AsyncIterator[RPCAp
         get_session=lambda: db_manager.open_session(),
     )
     app_state.rate_limiter = rate_limiter
+    genvm_admission.attach_redis(rate_limit_redis)
     logger.info(f"[STARTUP] Rate limiter initialized (enabled={rate_limiter.enabled})")
 
     try:
@@ -449,6 +477,7 @@ async def rpc_app_lifespan(app, settings: RPCAppSettings) -> AsyncIterator[RPCAp
         # Stop background health checker
         stop_background_health_checker()
         logger.info("[SHUTDOWN] Background health checker stopped")
+        await event_loop_lag.stop()
 
         logger.info("[SHUTDOWN] Beginning graceful shutdown sequence")
         shutdown_start = time.time()
@@ -472,6 +501,7 @@ async def rpc_app_lifespan(app, settings: RPCAppSettings) -> AsyncIterator[RPCAp
         await resources.broadcast.disconnect()
 
         await genvm_manager.close()
+        db_offload.shutdown()
 
         # Log final monitoring status if available
         try:
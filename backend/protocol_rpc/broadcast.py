@@ -3,21 +3,130 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
+import logging
+import os
+import time
+from collections import defaultdict, deque
 from contextlib import AbstractAsyncContextManager
-from dataclasses import dataclass
-from typing import Dict, Iterable
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable
+
+logger = logging.getLogger(__name__)
+
+DROP_OLDEST = "drop_oldest"
+COALESCE = "coalesce"
+DISCONNECT = "disconnect"
+OVERFLOW_POLICIES = (DROP_OLDEST, COALESCE, DISCONNECT)
+
+DEFAULT_MAX_QUEUE_SIZE = 1000
+
+
+class SubscriberOverflowError(Exception):
+    """Raised to a subscriber that was cut off by the `disconnect` policy."""
 
 
 @dataclass(slots=True)
 class _BroadcastMessage:
     message: str
+    key: str | None = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass(slots=True)
+class BroadcastStats:
+    """Counters shared by all subscriber queues of one Broadcast."""
+
+    delivered: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    disconnected: int = 0
+    max_delivery_lag_seconds: float = 0.0
+
+
+class _SubscriberQueue:
+    """
+    Bounded per-subscriber queue.
+
+    A slow WebSocket client only ever holds `maxsize` pending messages. When
+    the queue is full, `policy` decides what gives way:
+    - drop_oldest: discard the oldest pending message
+    - coalesce: replace the pending message with the same key (transaction
+      hash), so the client still gets the latest event per transaction;
+      falls back to drop_oldest for unkeyed messages
+    - disconnect: end the subscription with SubscriberOverflowError
+    """
+
+    def __init__(self, maxsize: int, policy: str, stats: BroadcastStats):
+        self._items: deque[_BroadcastMessage] = deque()
+        self._maxsize = maxsize
+        self._policy = policy
+        self._stats = stats
+        self._ready = asyncio.Event()
+        self._closed = False
+        self.overflowed = False
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def oldest_enqueued_at(self) -> float | None:
+        return self._items[0].enqueued_at if self._items else None
+
+    def put_nowait(self, item: _BroadcastMessage) -> None:
+        if self._closed:
+            return
+        if self._maxsize > 0 and len(self._items) >= self._maxsize:
+            if not self._make_room(item):
+                return
+        self._items.append(item)
+        self._ready.set()
+
+    def close(self) -> None:
+        self._closed = True
+        self._ready.set()
+
+    async def get(self) -> _BroadcastMessage | None:
+        """Next message, or None once closed and drained."""
+        while not self._items:
+            if self._closed:
+                if self.overflowed:
+                    raise SubscriberOverflowError("Subscriber queue overflowed")
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+
+        item = self._items.popleft()
+        lag = time.monotonic() - item.enqueued_at
+        self._stats.delivered += 1
+        if lag > self._stats.max_delivery_lag_seconds:
+            self._stats.max_delivery_lag_seconds = lag
+        return item
+
+    def _make_room(self, item: _BroadcastMessage) -> bool:
+        """Apply the overflow policy; returns whether `item` should be queued."""
+        if self._policy == DISCONNECT:
+            self._items.clear()
+            self.overflowed = True
+            self._stats.disconnected += 1
+            self.close()
+            return False
+
+        if self._policy == COALESCE and item.key is not None:
+            for index in range(len(self._items) - 1, -1, -1):
+                if self._items[index].key == item.key:
+                    del self._items[index]
+                    self._stats.coalesced += 1
+                    return True
+
+        self._items.popleft()
+        self._stats.dropped += 1
+        return True
 
 
 class _BroadcastSubscriber:
     """Async iterator over messages emitted on a channel."""
 
-    def __init__(self, queue: asyncio.Queue):
+    def __init__(self, queue: _SubscriberQueue):
         self._queue = queue
 
     def __aiter__(self):
@@ -34,10 +143,10 @@ class _BroadcastSubscription(AbstractAsyncContextManager[_BroadcastSubscriber]):
     def __init__(self, manager: "Broadcast", channel: str):
         self._manager = manager
         self._channel = channel
-        self._queue: asyncio.Queue | None = None
+        self._queue: _SubscriberQueue | None = None
 
     async def __aenter__(self) -> _BroadcastSubscriber:
-        self._queue = asyncio.Queue()
+        self._queue = self._manager._new_queue()
         await self._manager._register(self._channel, self._queue)
         return _BroadcastSubscriber(self._queue)
 
@@ -47,14 +156,45 @@ class _BroadcastSubscription(AbstractAsyncContextManager[_BroadcastSubscriber]):
             self._queue = None
 
 
+def _max_queue_size_from_env() -> int:
+    try:
+        return int(
+            os.environ.get("WEBSOCKET_SUBSCRIBER_QUEUE_SIZE", DEFAULT_MAX_QUEUE_SIZE)
+        )
+    except ValueError:
+        return DEFAULT_MAX_QUEUE_SIZE
+
+
+def _overflow_policy_from_env() -> str:
+    policy = os.environ.get("WEBSOCKET_OVERFLOW_POLICY", DROP_OLDEST).lower()
+    if policy not in OVERFLOW_POLICIES:
+        logger.warning(
+            f"Unknown WEBSOCKET_OVERFLOW_POLICY={policy!r}, using {DROP_OLDEST}"
+        )
+        return DROP_OLDEST
+    return policy
+
+
 class Broadcast:
     """Lightweight broadcast hub; API-compatible subset of Starlette's Broadcast."""
 
-    def __init__(self, backend: str | None = None) -> None:
+    def __init__(
+        self,
+        backend: str | None = None,
+        max_queue_size: int | None = None,
+        overflow_policy: str | None = None,
+    ) -> None:
         self._backend = backend or "memory://"
-        self._channels: Dict[str, set[asyncio.Queue]] = defaultdict(set)
+        self._channels: Dict[str, set[_SubscriberQueue]] = defaultdict(set)
         self._lock = asyncio.Lock()
         self._closed = False
+        self.max_queue_size = (
+            max_queue_size if max_queue_size is not None else _max_queue_size_from_env()
+        )
+        self.overflow_policy = overflow_policy or _overflow_policy_from_env()
+        if self.overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {self.overflow_policy}")
+        self.stats = BroadcastStats()
 
     async def connect(self) -> None:
         self._closed = False
@@ -62,7 +202,7 @@ class Broadcast:
     async def disconnect(self) -> None:
         async with self._lock:
             self._closed = True
-            queues: Iterable[asyncio.Queue] = {
+            queues: Iterable[_SubscriberQueue] = {
                 queue
                 for subscribers in self._channels.values()
                 for queue in subscribers
@@ -70,29 +210,66 @@ class Broadcast:
             self._channels.clear()
 
         for queue in queues:
-            queue.put_nowait(None)
+            queue.close()
 
     def subscribe(self, channel: str) -> _BroadcastSubscription:
         return _BroadcastSubscription(self, channel)
 
-    async def publish(self, *, channel: str, message: str) -> None:
+    async def publish(
+        self, *, channel: str, message: str, key: str | None = None
+    ) -> None:
+        """
+        Fan `message` out to the channel's subscribers.
+
+        `key` (usually the transaction hash) lets the coalesce policy replace
+        an older pending event for the same transaction.
+        """
         async with self._lock:
             if self._closed:
                 return
             subscribers = list(self._channels.get(channel, []))
 
         for queue in subscribers:
-            queue.put_nowait(_BroadcastMessage(message))
+            queue.put_nowait(_BroadcastMessage(message, key))
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Queue depth, lag and overflow counters across all subscribers."""
+        queues = {
+            queue for subscribers in self._channels.values() for queue in subscribers
+        }
+        now = time.monotonic()
+        oldest = [
+            queue.oldest_enqueued_at
+            for queue in queues
+            if queue.oldest_enqueued_at is not None
+        ]
+        return {
+            "subscribers": len(queues),
+            "channels": len(self._channels),
+            "queued_messages": sum(len(queue) for queue in queues),
+            "max_queue_depth": max((len(queue) for queue in queues), default=0),
+            "max_queue_size": self.max_queue_size,
+            "overflow_policy": self.overflow_policy,
+            "oldest_pending_seconds": round(now - min(oldest), 3) if oldest else 0.0,
+            "delivered_total": self.stats.delivered,
+            "dropped_total": self.stats.dropped,
+            "coalesced_total": self.stats.coalesced,
+            "disconnected_total": self.stats.disconnected,
+            "max_delivery_lag_seconds": round(self.stats.max_delivery_lag_seconds, 3),
+        }
+
+    def _new_queue(self) -> _SubscriberQueue:
+        return _SubscriberQueue(self.max_queue_size, self.overflow_policy, self.stats)
 
-    async def _register(self, channel: str, queue: asyncio.Queue) -> None:
+    async def _register(self, channel: str, queue: _SubscriberQueue) -> None:
         async with self._lock:
             self._channels[channel].add(queue)
 
-    async def _unregister(self, channel: str, queue: asyncio.Queue) -> None:
+    async def _unregister(self, channel: str, queue: _SubscriberQueue) -> None:
         async with self._lock:
             subscribers = self._channels.get(channel)
             if subscribers and queue in subscribers:
                 subscribers.remove(queue)
                 if not subscribers:
                     self._channels.pop(channel, None)
-        queue.put_nowait(None)
+        queue.close()
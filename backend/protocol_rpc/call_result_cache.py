@@ -0,0 +1,160 @@
+"""
+Result cache for read-only contract calls (eth_call, gen_call type=read).
+
+Dashboards poll the same view methods with the same calldata over and over;
+each poll used to take a GenVM admission slot and run a full execution. A
+read only depends on the target contract's row in `current_state`, so
+results are keyed by the contract's state version (`updated_at`, which every
+ORM write to the row bumps, plus `balance`, which is also changed by raw SQL)
+together with the calldata and call flags. A new state version means a new
+key, so entries invalidate themselves on every pod without coordination.
+
+Results are not cached when the execution did not succeed (a VM error or
+timeout may be transient), ran a non-deterministic block (`eq_outputs`) or
+read another contract's state (that contract's version is not part of the
+key). Entries also expire after CALL_RESULT_CACHE_TTL_SECONDS to bound
+staleness of views that depend on the block time.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Hashable, Iterator
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.database_handler.models import CurrentState
+from backend.node.types import ExecutionResultStatus
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 10.0
+
+# Addresses of other contracts read during the current call.
+_foreign_reads: ContextVar[set[str] | None] = ContextVar(
+    "call_result_cache_foreign_reads", default=None
+)
+
+
+class CallResultCache:
+    """In-process LRU of read-call results with a TTL."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _cache_from_env() -> CallResultCache:
+    try:
+        max_entries = int(
+            os.environ.get("CALL_RESULT_CACHE_SIZE", str(DEFAULT_MAX_ENTRIES))
+        )
+        ttl = float(
+            os.environ.get("CALL_RESULT_CACHE_TTL_SECONDS", str(DEFAULT_TTL_SECONDS))
+        )
+    except ValueError:
+        max_entries, ttl = DEFAULT_MAX_ENTRIES, DEFAULT_TTL_SECONDS
+    return CallResultCache(max_entries, ttl)
+
+
+call_result_cache = _cache_from_env()
+
+
+def read_cache_key(
+    session: Session,
+    kind: str,
+    to_address: str,
+    calldata: str,
+    *flags: Hashable,
+) -> tuple | None:
+    """
+    Cache key for a read of `to_address`, or None when the cache is disabled
+    or the contract does not exist (the uncached path reports that error).
+    """
+    if not call_result_cache.enabled:
+        return None
+    row = session.execute(
+        select(CurrentState.updated_at, CurrentState.balance).where(
+            CurrentState.id == to_address
+        )
+    ).one_or_none()
+    if row is None or row.updated_at is None:
+        return None
+    return (
+        kind,
+        to_address.lower(),
+        row.updated_at.isoformat(),
+        int(row.balance or 0),
+        calldata.lower(),
+        *flags,
+    )
+
+
+def track_foreign_reads(
+    factory: Callable[[str], Any],
+) -> Callable[[str], Any]:
+    """Wrap a contract snapshot factory so cross-contract reads are recorded."""
+
+    def tracked(address: str):
+        reads = _foreign_reads.get()
+        if reads is not None:
+            reads.add(address.lower())
+        return factory(address)
+
+    return tracked
+
+
+@contextmanager
+def recording_foreign_reads() -> Iterator[set[str]]:
+    """Collect the addresses read through `track_foreign_reads` in this block."""
+    reads: set[str] = set()
+    token = _foreign_reads.set(reads)
+    try:
+        yield reads
+    finally:
+        _foreign_reads.reset(token)
+
+
+def is_cacheable_receipt(receipt: Any, foreign_reads: set[str]) -> bool:
+    """Successful, deterministic, self-contained executions only."""
+    return (
+        receipt.execution_result == ExecutionResultStatus.SUCCESS
+        and not receipt.eq_outputs
+        and not foreign_reads
+    )
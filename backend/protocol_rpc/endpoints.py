@@ -5,10 +5,10 @@ import json
 import time
 import eth_utils
 import logging
-from contextlib import asynccontextmanager
 from functools import partial, wraps
 from typing import Any
 from backend.protocol_rpc.exceptions import (
+    InvalidParams,
     JSONRPCError,
     NotFoundError,
     QueueDepthExceeded,
@@ -17,7 +17,10 @@ from sqlalchemy import Table, text
 from sqlalchemy.orm import Session
 import backend.validators as validators
 
-from backend.database_handler.contract_snapshot import ContractSnapshot
+from backend.database_handler.contract_snapshot import (
+    ContractSnapshot,
+    code_slot_b64,
+)
 from backend.database_handler.llm_providers import LLMProviderRegistry
 from backend.rollup.consensus_service import ConsensusService
 from backend.database_handler.models import Base, TransactionStatus
@@ -52,13 +55,23 @@ from backend.protocol_rpc.fees import (
     record_execution_fee_consumption,
     required_fee_deposit,
     studio_fee_config,
+    studio_fee_policy,
     validate_transaction_fee_deposit,
 )
 from backend.consensus.history import completed_consensus_round_index
 from backend.errors.errors import InvalidAddressError, InvalidTransactionError
 from backend.database_handler.errors import ContractNotFoundError
+from backend.database_handler.contract_schema_cache import (
+    ContractSchemaCache,
+    schema_cache_enabled,
+)
+from backend.database_handler.session_factory import get_database_manager
+from backend.database_handler.db_offload import run_sync
+from backend.protocol_rpc.genvm_admission import GenVMAdmission
 
 from backend.database_handler.transactions_processor import (
+    ADDRESS_HISTORY_DEFAULT_LIMIT,
+    ADDRESS_HISTORY_MAX_LIMIT,
     TransactionAddressFilter,
     TransactionsProcessor,
 )
@@ -70,6 +83,13 @@ from backend.node.base import Node, get_simulator_chain_id
 from backend.node.types import ExecutionMode, ExecutionResultStatus
 from backend.consensus.base import ConsensusAlgorithm
 from backend.protocol_rpc.call_interceptor import handle_consensus_data_call
+from backend.protocol_rpc.call_result_cache import (
+    call_result_cache,
+    is_cacheable_receipt,
+    read_cache_key,
+    recording_foreign_reads,
+    track_foreign_reads,
+)
 
 import base64
 import hashlib
@@ -88,9 +108,9 @@ import asyncio
 # Limit concurrent GenVM executions on the jsonrpc path to prevent uvloop fd
 # conflicts and DB pool exhaustion while calls hold request-scoped sessions.
 # Workers use asyncio.Semaphore(8) in consensus/base.py; keep the RPC path
-# bounded too.
-_GENVM_CONCURRENCY = int(os.environ.get("GENVM_MAX_CONCURRENT", "8"))
-_genvm_admission_semaphore = asyncio.Semaphore(_GENVM_CONCURRENCY)
+# bounded too. Calls over the limit wait briefly in a priority queue (see
+# genvm_admission) and can share a cluster-wide budget through Redis.
+genvm_admission = GenVMAdmission.from_environment()
 
 # ---------------------------------------------------------------------------
 # Per-address rate limiting for gen_call / sim_call
@@ -127,27 +147,9 @@ def _check_rate_limit(address: str) -> None:
     _address_request_log[address] = timestamps
 
 
-@asynccontextmanager
-async def _admit_genvm_call(method: str, to_address: str | None):
-    """Reject GenVM-backed RPC calls instead of queueing unlimited work."""
-    if _genvm_admission_semaphore.locked():
-        _rate_limit_logger.warning(
-            "GenVM at capacity (%s concurrent) - rejecting %s to %s",
-            _GENVM_CONCURRENCY,
-            method,
-            to_address,
-        )
-        raise JSONRPCError(
-            code=-32006,
-            message=f"Server busy: all {_GENVM_CONCURRENCY} execution slots occupied, retry later",
-            data={"retry_after_seconds": 2},
-        )
-
-    await _genvm_admission_semaphore.acquire()
-    try:
-        yield
-    finally:
-        _genvm_admission_semaphore.release()
+def _admit_genvm_call(method: str, to_address: str | None):
+    """Admit a GenVM-backed RPC call, waiting briefly for a slot if needed."""
+    return genvm_admission.admit(method, to_address)
 
 
 # ---------------------------------------------------------------------------
@@ -251,7 +253,7 @@ def _enforce_pending_queue_caps(
 
 
 def get_studio_fee_config() -> dict[str, Any]:
-    return studio_fee_config(StudioFeePolicy.from_env())
+    return studio_fee_config(studio_fee_policy.current())
 
 
 ####### ADMIN ACCESS CONTROL #######
@@ -988,14 +990,11 @@ def cancel_transaction(
 
 
 ####### GEN ENDPOINTS #######
-async def get_contract_schema(
-    session: Session,
-    genvm_manager: GenVMManager,
-    msg_handler: IMessageHandler,
-    contract_address: str,
-) -> dict:
+def _deployed_code(session: Session, contract_address: str) -> bytes:
     try:
-        contract_snapshot = ContractSnapshot(contract_address, session)
+        contract_snapshot = ContractSnapshot(
+            contract_address, session, slots=[code_slot_b64()]
+        )
     except ContractNotFoundError:
         raise NotFoundError(
             message=f"Contract {contract_address} not found",
@@ -1007,7 +1006,12 @@ async def get_contract_schema(
             contract_address,
             "Contract not deployed.",
         )
+    return base64.b64decode(code_b64)
+
 
+async def _run_schema_extraction(
+    genvm_manager: GenVMManager, msg_handler: IMessageHandler, code: bytes
+) -> dict:
     node = Node(  # Mock node just to get the data from the GenVM
         contract_snapshot=None,
         validator_mode=ExecutionMode.LEADER,
@@ -1027,32 +1031,44 @@ async def get_contract_schema(
         contract_snapshot_factory=None,
         manager=genvm_manager,
     )
-    schema = await node.get_contract_schema(base64.b64decode(code_b64))
+    schema = await node.get_contract_schema(code)
     return json.loads(schema)
 
 
+async def _contract_schema(
+    session: Session | None,
+    genvm_manager: GenVMManager,
+    msg_handler: IMessageHandler,
+    code: bytes,
+) -> dict:
+    """Schema for `code`, served from the code-hash cache when possible."""
+    if session is None or not schema_cache_enabled():
+        return await _run_schema_extraction(genvm_manager, msg_handler, code)
+
+    cache = ContractSchemaCache(session)
+    schema = cache.get(code)
+    if schema is None:
+        schema = await _run_schema_extraction(genvm_manager, msg_handler, code)
+        cache.put(code, schema)
+    return schema
+
+
+async def get_contract_schema(
+    session: Session,
+    genvm_manager: GenVMManager,
+    msg_handler: IMessageHandler,
+    contract_address: str,
+) -> dict:
+    code = _deployed_code(session, contract_address)
+    return await _contract_schema(session, genvm_manager, msg_handler, code)
+
+
 async def get_contract_schema_for_code(
-    genvm_manager: GenVMManager, msg_handler: IMessageHandler, contract_code_hex: str
+    genvm_manager: GenVMManager,
+    msg_handler: IMessageHandler,
+    contract_code_hex: str,
+    session: Session | None = None,
 ) -> dict:
-    node = Node(  # Mock node just to get the data from the GenVM
-        contract_snapshot=None,
-        validator_mode=ExecutionMode.LEADER,
-        validator=Validator(
-            address="",
-            stake=0,
-            llmprovider=LLMProvider(
-                provider="",
-                model="",
-                config={},
-                plugin="",
-                plugin_config={},
-            ),
-        ),
-        leader_receipt=None,
-        msg_handler=msg_handler.with_client_session(get_client_session_id()),
-        contract_snapshot_factory=None,
-        manager=genvm_manager,
-    )
     # Contract code is expected to be a hex string, but it can be a plain UTF-8 string
     # When hex decoding fails, fall back to UTF-8 encoding
     try:
@@ -1062,13 +1078,34 @@ async def get_contract_schema_for_code(
             "Contract code is not hex-encoded, treating as UTF-8 string",
         )
         contract_code = contract_code_hex.encode("utf-8")
-    schema = await node.get_contract_schema(contract_code)
-    return json.loads(schema)
+    return await _contract_schema(session, genvm_manager, msg_handler, contract_code)
+
+
+async def warm_contract_schema(
+    genvm_manager: GenVMManager,
+    msg_handler: IMessageHandler,
+    contract_address: str,
+) -> None:
+    """Extract and cache the schema of a freshly deployed contract."""
+    session = get_database_manager().open_session()
+    try:
+        await _contract_schema(
+            session,
+            genvm_manager,
+            msg_handler,
+            _deployed_code(session, contract_address),
+        )
+    except Exception as e:
+        logger.warning(f"Failed to warm schema cache for {contract_address}: {e}")
+    finally:
+        session.close()
 
 
 def get_contract_code(session: Session, contract_address: str) -> str:
     try:
-        contract_snapshot = ContractSnapshot(contract_address, session)
+        contract_snapshot = ContractSnapshot(
+            contract_address, session, slots=[code_slot_b64()]
+        )
     except ContractNotFoundError:
         raise NotFoundError(
             message=f"Contract {contract_address} not found",
@@ -1209,17 +1246,63 @@ async def gen_call(
     params: dict,
 ) -> str:
     to_address = params.get("to") if isinstance(params, dict) else None
-    async with _admit_genvm_call("gen_call", to_address):
-        receipt = await _execute_call_with_snapshot(
-            session,
-            accounts_manager,
-            msg_handler,
-            transactions_parser,
-            validators_manager,
-            genvm_manager,
-            params,
-        )
-    return eth_utils.hexadecimal.encode_hex(receipt.result[1:])[2:]
+    cache_key = await run_sync(_gen_call_cache_key, session, accounts_manager, params)
+    if cache_key is not None:
+        cached = call_result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    with recording_foreign_reads() as foreign_reads:
+        async with _admit_genvm_call("gen_call", to_address):
+            receipt = await _execute_call_with_snapshot(
+                session,
+                accounts_manager,
+                msg_handler,
+                transactions_parser,
+                validators_manager,
+                genvm_manager,
+                params,
+            )
+    result = eth_utils.hexadecimal.encode_hex(receipt.result[1:])[2:]
+    if cache_key is not None and is_cacheable_receipt(receipt, foreign_reads):
+        call_result_cache.put(cache_key, result)
+    return result
+
+
+def _gen_call_cache_key(
+    session: Session, accounts_manager: AccountsManager, params: Any
+) -> tuple | None:
+    """Result-cache key for plain gen_call reads; None when it must execute."""
+    if (
+        not isinstance(params, dict)
+        or params.get("type") != "read"
+        or params.get("sim_config")
+        or not isinstance(params.get("to"), str)
+        or not isinstance(params.get("data"), str)
+        or not accounts_manager.is_valid_address(params.get("from"))
+    ):
+        return None
+    try:
+        # The call value is credited to the contract balance for the
+        # simulated execution, so it changes what the read can observe.
+        call_value = int(params["value"], 16) if params.get("value") else 0
+    except (TypeError, ValueError):
+        return None
+    state_status = (
+        "finalized"
+        if params.get("transaction_hash_variant") == "latest-final"
+        else "accepted"
+    )
+    return read_cache_key(
+        session,
+        "gen_call",
+        params["to"],
+        params["data"],
+        state_status,
+        params["from"].lower(),
+        (params.get("origin_address") or "").lower(),
+        call_value,
+    )
 
 
 def sim_lint_contract(source_code: str, filename: str = "contract.py") -> dict:
@@ -1330,7 +1413,7 @@ def _with_default_simulation_fees(params: dict) -> dict:
         return params
 
     updated = dict(params)
-    updated["fees"] = studio_fee_config(StudioFeePolicy.from_env())["defaultFees"]
+    updated["fees"] = studio_fee_config(studio_fee_policy.current())["defaultFees"]
     return updated
 
 
@@ -1399,7 +1482,7 @@ async def _gen_call_with_validator(
 
     # Create validator node
     try:
-        contract_snapshot = ContractSnapshot(to_address, session)
+        contract_snapshot = await run_sync(ContractSnapshot, to_address, session)
     except ContractNotFoundError:
         raise NotFoundError(
             message=f"Contract {to_address} not found",
@@ -1409,7 +1492,9 @@ async def _gen_call_with_validator(
         _stage_simulated_call_value(contract_snapshot, call_value)
     node = Node(
         contract_snapshot=contract_snapshot,
-        contract_snapshot_factory=partial(ContractSnapshot, session=session),
+        contract_snapshot_factory=track_foreign_reads(
+            partial(ContractSnapshot, session=session)
+        ),
         validator_mode=ExecutionMode.LEADER,
         validator=validator,
         leader_receipt=None,
@@ -1605,8 +1690,8 @@ async def eth_call(
 
     # Check if this is a ConsensusData contract call that we should handle locally
     # This should happen before early return to allow interception even without 'from'
-    consensus_data_result = handle_consensus_data_call(
-        transactions_processor, to_address, data
+    consensus_data_result = await run_sync(
+        handle_consensus_data_call, transactions_processor, to_address, data
     )
     if consensus_data_result is not None:
         return consensus_data_result
@@ -1620,51 +1705,69 @@ async def eth_call(
     if not accounts_manager.is_valid_address(from_address):
         raise InvalidAddressError(from_address)
 
-    async with _admit_genvm_call("eth_call", to_address):
-        decoded_data = transactions_parser.decode_method_call_data(data)
+    # The sender is whichever validator is first in the snapshot, so it is not
+    # part of the key.
+    cache_key = await run_sync(read_cache_key, session, "eth_call", to_address, data)
+    if cache_key is not None:
+        cached = call_result_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        async with validators_manager.snapshot() as snapshot:
-            if len(snapshot.nodes) == 0:
-                raise JSONRPCError(
-                    code=-32000,
-                    message="No validators available to execute eth_call",
-                    data={"reason": "no_validators"},
-                )
-            as_validator = snapshot.nodes[0].validator
-            try:
-                target_contract_snapshot = ContractSnapshot(to_address, session)
-            except ContractNotFoundError:
-                raise NotFoundError(
-                    message=f"Contract {to_address} not found",
-                    data={"contract_address": to_address},
-                )
-            node = Node(  # Mock node just to get the data from the GenVM
-                contract_snapshot=target_contract_snapshot,
-                contract_snapshot_factory=partial(ContractSnapshot, session=session),
-                validator_mode=ExecutionMode.LEADER,
-                validator=as_validator,
-                leader_receipt=None,
-                msg_handler=msg_handler.with_client_session(get_client_session_id()),
-                validators_snapshot=snapshot,
-                manager=genvm_manager,
-            )
+    with recording_foreign_reads() as foreign_reads:
+        async with _admit_genvm_call("eth_call", to_address):
+            decoded_data = transactions_parser.decode_method_call_data(data)
 
-            try:
-                receipt = await node.get_contract_data(
-                    from_address=as_validator.address,
-                    calldata=decoded_data.calldata,
+            async with validators_manager.snapshot() as snapshot:
+                if len(snapshot.nodes) == 0:
+                    raise JSONRPCError(
+                        code=-32000,
+                        message="No validators available to execute eth_call",
+                        data={"reason": "no_validators"},
+                    )
+                as_validator = snapshot.nodes[0].validator
+                try:
+                    target_contract_snapshot = await run_sync(
+                        ContractSnapshot, to_address, session
+                    )
+                except ContractNotFoundError:
+                    raise NotFoundError(
+                        message=f"Contract {to_address} not found",
+                        data={"contract_address": to_address},
+                    )
+                node = Node(  # Mock node just to get the data from the GenVM
+                    contract_snapshot=target_contract_snapshot,
+                    contract_snapshot_factory=track_foreign_reads(
+                        partial(ContractSnapshot, session=session)
+                    ),
+                    validator_mode=ExecutionMode.LEADER,
+                    validator=as_validator,
+                    leader_receipt=None,
+                    msg_handler=msg_handler.with_client_session(
+                        get_client_session_id()
+                    ),
+                    validators_snapshot=snapshot,
+                    manager=genvm_manager,
                 )
-            except ContractNotFoundError as e:
-                raise NotFoundError(
-                    message=f"Contract {e.address} not found",
-                    data={"contract_address": e.address},
-                ) from e
+
+                try:
+                    receipt = await node.get_contract_data(
+                        from_address=as_validator.address,
+                        calldata=decoded_data.calldata,
+                    )
+                except ContractNotFoundError as e:
+                    raise NotFoundError(
+                        message=f"Contract {e.address} not found",
+                        data={"contract_address": e.address},
+                    ) from e
 
     if receipt.execution_result != ExecutionResultStatus.SUCCESS:
         raise JSONRPCError(
             code=-32000, message="execution failed", data={"receipt": receipt.to_dict()}
         )
-    return eth_utils.hexadecimal.encode_hex(receipt.result[1:])
+    result = eth_utils.hexadecimal.encode_hex(receipt.result[1:])
+    if cache_key is not None and is_cacheable_receipt(receipt, foreign_reads):
+        call_result_cache.put(cache_key, result)
+    return result
 
 
 def _fee_metadata(decoded_rollup_transaction: DecodedRollupTransaction) -> dict:
@@ -1696,7 +1799,7 @@ def _fee_metadata(decoded_rollup_transaction: DecodedRollupTransaction) -> dict:
         submitted_value=decoded_rollup_transaction.total_spend,
         user_value=int(args.user_value or 0),
         sender=decoded_rollup_transaction.from_address,
-        policy=StudioFeePolicy.from_env(),
+        policy=studio_fee_policy.current(),
     )
     return metadata
 
@@ -1724,7 +1827,7 @@ def _validate_fee_envelope(
             num_of_validators=args.num_of_initial_validators,
             submitted_value=decoded_rollup_transaction.total_spend,
             user_value=int(args.user_value or 0),
-            policy=StudioFeePolicy.from_env(),
+            policy=studio_fee_policy.current(),
         )
     except FeeValidationError as exc:
         raise InvalidTransactionError(str(exc)) from exc
@@ -1773,7 +1876,7 @@ def _handle_top_up_fees(
             amount=decoded_rollup_transaction.total_spend,
             sender=decoded_rollup_transaction.from_address,
             num_of_validators=int(tx.get("num_of_initial_validators") or 5),
-            policy=StudioFeePolicy.from_env(),
+            policy=studio_fee_policy.current(),
         )
     except FeeValidationError as exc:
         raise InvalidTransactionError(str(exc)) from exc
@@ -1881,7 +1984,7 @@ def _simulation_fee_accounting(
         _first_present(params, "num_of_initial_validators", "numOfInitialValidators"),
         5,
     )
-    policy = StudioFeePolicy.from_env()
+    policy = studio_fee_policy.current()
     fee_value = _int_param(raw_fee_value, None)
     if fee_value is None:
         fee_value = required_fee_deposit(
@@ -1917,7 +2020,7 @@ def _effective_simulation_fee_accounting_for_genvm(
     policy = (
         StudioFeePolicy.from_snapshot(snapshot)
         if isinstance(snapshot, dict)
-        else StudioFeePolicy.from_env()
+        else studio_fee_policy.current()
     )
     fees = normalize_fees_distribution(accounting.get("fees_distribution") or {})
     execution_budget_per_round = int(fees["executionBudgetPerRound"])
@@ -2084,7 +2187,7 @@ def send_raw_transaction(
                 transaction_data.update(fee_metadata)
 
         # Check for duplicate before debit+insert to avoid TOCTOU races
-        is_duplicate = transactions_processor.get_transaction_by_hash(transaction_hash)
+        is_duplicate = transactions_processor.get_transaction_summary(transaction_hash)
 
         # Queue-depth admission control: refuse new submissions when a
         # contract or a sender already has too many txs queued. Studio Prod
@@ -2172,13 +2275,40 @@ def get_transactions_for_address(
     accounts_manager: AccountsManager,
     address: str,
     filter: str = TransactionAddressFilter.ALL.value,
-) -> list[dict]:
+    full: bool = True,
+    limit: int | None = None,
+    cursor: str | None = None,
+    summary: bool = False,
+) -> list[dict] | dict:
+    """
+    Without `limit` or `cursor`, the newest transactions as a list (legacy
+    shape, capped at ADDRESS_HISTORY_MAX_LIMIT). With either, one page:
+    {"transactions": [...], "nextCursor": str | None}.
+    """
     if not accounts_manager.is_valid_address(address):
         raise InvalidAddressError(address)
 
-    return transactions_processor.get_transactions_for_address(
-        address, TransactionAddressFilter(filter)
-    )
+    address_filter = TransactionAddressFilter(filter)
+    if limit is None and cursor is None:
+        if summary:
+            return transactions_processor.get_transactions_for_address_page(
+                address, address_filter, limit=ADDRESS_HISTORY_MAX_LIMIT, summary=True
+            )["transactions"]
+        return transactions_processor.get_transactions_for_address(
+            address, address_filter, full=full
+        )
+
+    try:
+        return transactions_processor.get_transactions_for_address_page(
+            address,
+            address_filter,
+            limit=ADDRESS_HISTORY_DEFAULT_LIMIT if limit is None else limit,
+            cursor=cursor,
+            full=full,
+            summary=summary,
+        )
+    except ValueError as e:
+        raise InvalidParams(str(e)) from e
 
 
 @check_forbidden_method_in_hosted_studio
@@ -2279,7 +2409,7 @@ def get_transaction_receipt(
     transaction_hash: str,
 ) -> dict | None:
 
-    transaction = transactions_processor.get_transaction_by_hash(transaction_hash)
+    transaction = transactions_processor.get_transaction_summary(transaction_hash)
     if not transaction:
         return None
 
@@ -2346,7 +2476,10 @@ def get_block_by_hash(
     full_tx: bool = False,
 ) -> dict | None:
 
-    transaction = transactions_processor.get_transaction_by_hash(block_hash)
+    if full_tx:
+        transaction = transactions_processor.get_transaction_by_hash(block_hash)
+    else:
+        transaction = transactions_processor.get_transaction_summary(block_hash)
 
     if not transaction:
         return None
@@ -2406,16 +2539,48 @@ def get_contract(consensus_service: ConsensusService, contract_name: str) -> dic
     }
 
 
+def _snapshot_progress_reporter(msg_handler: IMessageHandler | None):
+    """Emit snapshot progress as log events, once per 10% of each phase."""
+    if msg_handler is None:
+        return None
+    reported: dict[str, int] = {}
+
+    def report(phase: str, done: int, total: int):
+        step = 10 if total == 0 else done * 10 // total
+        if reported.get(phase, -1) >= step:
+            return
+        reported[phase] = step
+        msg_handler.send_message(
+            log_event=LogEvent(
+                "snapshot_progress",
+                EventType.INFO,
+                EventScope.RPC,
+                f"Snapshot {phase}: {done}/{total} rows",
+                {"phase": phase, "done": done, "total": total},
+            )
+        )
+
+    return report
+
+
 @check_forbidden_method_in_hosted_studio
 def create_snapshot(
     snapshot_manager: SnapshotManager,
+    incremental: bool = False,
+    msg_handler: IMessageHandler | None = None,
 ) -> int:
     """Create a new snapshot of the current state and transactions.
 
+    Args:
+        incremental: Only store rows changed since the latest snapshot
+
     Returns:
         int: The snapshot ID
     """
-    snapshot = snapshot_manager.create_snapshot()
+    snapshot = snapshot_manager.create_snapshot(
+        incremental=incremental,
+        progress=_snapshot_progress_reporter(msg_handler),
+    )
     return snapshot.snapshot_id
 
 
@@ -2423,6 +2588,7 @@ def create_snapshot(
 def restore_snapshot(
     snapshot_manager: SnapshotManager,
     snapshot_id: int,
+    msg_handler: IMessageHandler | None = None,
 ) -> bool:
     """Restore the database state from a snapshot.
 
@@ -2432,7 +2598,9 @@ def restore_snapshot(
     Returns:
         bool: True if the snapshot was restored, False otherwise
     """
-    reverted = snapshot_manager.restore_snapshot(snapshot_id)
+    reverted = snapshot_manager.restore_snapshot(
+        snapshot_id, progress=_snapshot_progress_reporter(msg_handler)
+    )
     return reverted
 
 
@@ -2648,3 +2816,36 @@ async def admin_deactivate_api_key(
         await rate_limiter.invalidate_key_cache(api_key.key_hash)
 
     return {"key_prefix": key_prefix, "deactivated": True}
+
+
+@require_admin_access
+def admin_check_address_activity(
+    session: Session,
+    repair: bool = False,
+    limit: int = 100,
+    admin_key: str = None,
+) -> dict:
+    from backend.database_handler.address_activity import (
+        find_address_activity_drift,
+        repair_address_activity,
+    )
+
+    drift = find_address_activity_drift(session, limit=limit)
+    repaired = repair_address_activity(session) if repair and drift else 0
+    return {"drift": drift, "repaired": repaired}
+
+
+@require_admin_access
+def admin_reconcile_value_ledger(
+    session: Session,
+    repair: bool = False,
+    admin_key: str = None,
+) -> dict:
+    from backend.database_handler.invariants import reconcile_value_ledger
+
+    result = reconcile_value_ledger(session, repair=repair)
+    # Values are wei-scale; strings keep them exact in JSON.
+    for totals in (result["ledger"], result["actual"]):
+        for key, value in totals.items():
+            totals[key] = str(value)
+    return result
@@ -6,9 +6,13 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from eth_utils import to_checksum_address
-from sqlalchemy import asc, desc, func, or_, select, union
-from sqlalchemy.orm import Session, defer
+from sqlalchemy import asc, desc, func, or_, select, text, tuple_, union
+from sqlalchemy.orm import Session, defer, load_only, object_session
 
+from backend.database_handler.contract_storage import load_contract_data
+from backend.database_handler.transactions_processor import (
+    consensus_data_without_contract_state,
+)
 from backend.database_handler.models import (
     CurrentState,
     LLMProviderDBModel,
@@ -21,8 +25,14 @@ from backend.database_handler.models import (
 def _serialize_tx(
     tx: Transactions,
     triggered_count: int | None = None,
+    *,
+    consensus_data: dict | None,
 ) -> dict:
-    """Serialize a Transactions ORM object to a dict for the explorer API."""
+    """Serialize a Transactions ORM object to a dict for the explorer API.
+
+    `consensus_data` comes from _query_txs, which loads it without the leader
+    receipts' contract state.
+    """
     d = {
         "hash": tx.hash,
         "status": tx.status.value if tx.status else None,
@@ -30,7 +40,7 @@ def _serialize_tx(
         "to_address": tx.to_address,
         "input_data": tx.input_data,
         "data": tx.data,
-        "consensus_data": tx.consensus_data,
+        "consensus_data": consensus_data,
         "nonce": tx.nonce,
         "value": tx.value,
         "type": tx.type,
@@ -78,7 +88,7 @@ def _serialize_state(
         "updated_at": state.updated_at.isoformat() if state.updated_at else None,
     }
     if include_data:
-        d["data"] = state.data
+        d["data"] = load_contract_data(object_session(state), state)
     if tx_count is not None:
         d["tx_count"] = tx_count
     return d
@@ -112,9 +122,20 @@ def _serialize_provider(p: LLMProviderDBModel) -> dict:
     }
 
 
-# Columns to defer when loading transaction lists (large JSONB blobs that are
-# only needed in the detail view).
-_HEAVY_TX_COLUMNS = (defer(Transactions.contract_snapshot),)
+# Columns to defer when loading transactions (large JSONB blobs the explorer
+# never shows). consensus_data is selected by _query_txs instead, minus the
+# contract state carried in each leader receipt.
+_HEAVY_TX_COLUMNS = (
+    defer(Transactions.contract_snapshot),
+    defer(Transactions.consensus_data),
+)
+
+
+def _query_txs(session: Session):
+    """Query (transaction, consensus_data) rows for _serialize_tx."""
+    return session.query(
+        Transactions, consensus_data_without_contract_state().label("consensus_data")
+    ).options(*_HEAVY_TX_COLUMNS)
 
 
 # ---------------------------------------------------------------------------
@@ -187,11 +208,7 @@ def get_stats(session: Session) -> dict:
 
     # Recent transactions — skip the heavy contract_snapshot column.
     recent = (
-        session.query(Transactions)
-        .options(*_HEAVY_TX_COLUMNS)
-        .order_by(Transactions.created_at.desc())
-        .limit(10)
-        .all()
+        _query_txs(session).order_by(Transactions.created_at.desc()).limit(10).all()
     )
 
     # Finalized count from the status breakdown
@@ -247,8 +264,9 @@ def get_stats(session: Session) -> dict:
         "recentTransactions": [
             _serialize_tx(
                 tx,
+                consensus_data=consensus_data,
             )
-            for tx in recent
+            for tx, consensus_data in recent
         ],
     }
 
@@ -258,6 +276,58 @@ def get_stats(session: Session) -> dict:
 # ---------------------------------------------------------------------------
 
 
+# Filtered "approximate" counts stop counting after this many rows.
+APPROXIMATE_COUNT_CAP = 10_000
+
+
+def _encode_tx_cursor(tx: Transactions) -> str:
+    raw = f"{tx.created_at.isoformat()}|{tx.hash}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_tx_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        created_at, tx_hash = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        )
+        return datetime.fromisoformat(created_at), tx_hash
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
+def _count_transactions(
+    session: Session, filters: list, count_mode: str
+) -> tuple[Optional[int], bool]:
+    """Return (total, is_approximate) for the transaction list."""
+    if count_mode == "none":
+        return None, False
+
+    if count_mode == "approximate":
+        if not filters:
+            # Planner statistics: O(1), refreshed by (auto)analyze
+            estimate = session.execute(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class "
+                    "WHERE oid = 'transactions'::regclass"
+                )
+            ).scalar()
+            if estimate is not None and estimate > 0:
+                return int(estimate), True
+        capped = (
+            session.query(Transactions.hash)
+            .filter(*filters)
+            .limit(APPROXIMATE_COUNT_CAP + 1)
+            .subquery()
+        )
+        total = session.query(func.count()).select_from(capped).scalar() or 0
+        return min(total, APPROXIMATE_COUNT_CAP), total > APPROXIMATE_COUNT_CAP
+
+    count_q = session.query(func.count()).select_from(Transactions)
+    if filters:
+        count_q = count_q.filter(*filters)
+    return count_q.scalar() or 0, False
+
+
 def get_all_transactions_paginated(
     session: Session,
     page: int = 1,
@@ -267,7 +337,17 @@ def get_all_transactions_paginated(
     from_date: Optional[str] = None,
     to_date: Optional[str] = None,
     address: Optional[str] = None,
+    cursor: Optional[str] = None,
+    count_mode: str = "exact",
 ) -> dict:
+    """List transactions newest first.
+
+    Pages either by `page` (OFFSET) or, when `cursor` is given, by seeking
+    past the (created_at, hash) key returned as `nextCursor` on the previous
+    page, which costs the same at any depth. `count_mode` is "exact",
+    "approximate" (planner estimate, or a count capped at
+    APPROXIMATE_COUNT_CAP when filtering) or "none".
+    """
     if address:
         try:
             address = to_checksum_address(address)
@@ -299,9 +379,12 @@ def get_all_transactions_paginated(
                     "limit": limit,
                     "total": 0,
                     "totalPages": 0,
+                    "nextCursor": None,
+                    "totalIsApproximate": False,
                 },
             }
     if search:
+        # Served by the pg_trgm GIN indexes on hash/from_address/to_address
         like = f"%{search}%"
         filters.append(
             or_(
@@ -323,46 +406,56 @@ def get_all_transactions_paginated(
         except ValueError:
             pass
 
-    count_q = session.query(func.count()).select_from(Transactions)
-    if filters:
-        count_q = count_q.filter(*filters)
-    total = count_q.scalar() or 0
+    total, total_is_approximate = _count_transactions(session, filters, count_mode)
 
-    offset = (page - 1) * limit
-    q = (
-        session.query(Transactions)
-        .options(*_HEAVY_TX_COLUMNS)
-        .order_by(Transactions.created_at.desc())
+    q = _query_txs(session).order_by(
+        Transactions.created_at.desc(), Transactions.hash.desc()
     )
     if filters:
         q = q.filter(*filters)
-    txs = q.offset(offset).limit(limit).all()
+    if cursor:
+        cursor_created_at, cursor_hash = _decode_tx_cursor(cursor)
+        q = q.filter(
+            tuple_(Transactions.created_at, Transactions.hash)
+            < tuple_(cursor_created_at, cursor_hash)
+        )
+    else:
+        q = q.offset((page - 1) * limit)
+    rows = q.limit(limit).all()
+    txs = [tx for tx, _ in rows]
 
     # Batch-fetch triggered counts for this page
     hashes = [tx.hash for tx in txs]
     triggered_counts: dict[str, int] = {}
     if hashes:
-        rows = (
+        triggered_rows = (
             session.query(Transactions.triggered_by_hash, func.count())
             .filter(Transactions.triggered_by_hash.in_(hashes))
             .group_by(Transactions.triggered_by_hash)
             .all()
         )
-        triggered_counts = {row[0]: row[1] for row in rows}
+        triggered_counts = {row[0]: row[1] for row in triggered_rows}
 
     return {
         "transactions": [
             _serialize_tx(
                 tx,
                 triggered_counts.get(tx.hash, 0),
+                consensus_data=consensus_data,
             )
-            for tx in txs
+            for tx, consensus_data in rows
         ],
         "pagination": {
             "page": page,
             "limit": limit,
             "total": total,
-            "totalPages": math.ceil(total / limit) if limit > 0 else 0,
+            "totalPages": (
+                None if total is None else math.ceil(total / limit) if limit > 0 else 0
+            ),
+            "nextCursor": (
+                _encode_tx_cursor(txs[-1]) if txs and len(txs) == limit else None
+            ),
+            "totalIsApproximate": total_is_approximate,
         },
     }
 
@@ -373,17 +466,12 @@ def get_all_transactions_paginated(
 
 
 def get_transaction_with_relations(session: Session, tx_hash: str) -> Optional[dict]:
-    tx = (
-        session.query(Transactions)
-        .options(*_HEAVY_TX_COLUMNS)
-        .filter(Transactions.hash == tx_hash)
-        .first()
-    )
-    if not tx:
+    row = _query_txs(session).filter(Transactions.hash == tx_hash).first()
+    if not row:
         return None
+    tx, consensus_data = row
     triggered = (
-        session.query(Transactions)
-        .options(*_HEAVY_TX_COLUMNS)
+        _query_txs(session)
         .filter(Transactions.triggered_by_hash == tx_hash)
         .order_by(Transactions.created_at)
         .all()
@@ -392,23 +480,24 @@ def get_transaction_with_relations(session: Session, tx_hash: str) -> Optional[d
     parent = None
     if tx.triggered_by_hash:
         parent = (
-            session.query(Transactions)
-            .options(*_HEAVY_TX_COLUMNS)
+            _query_txs(session)
             .filter(Transactions.hash == tx.triggered_by_hash)
             .first()
         )
 
     return {
-        "transaction": _serialize_tx(tx),
+        "transaction": _serialize_tx(tx, consensus_data=consensus_data),
         "triggeredTransactions": [
             _serialize_tx(
                 t,
+                consensus_data=t_consensus_data,
             )
-            for t in triggered
+            for t, t_consensus_data in triggered
         ],
         "parentTransaction": (
             _serialize_tx(
-                parent,
+                parent[0],
+                consensus_data=parent[1],
             )
             if parent
             else None
@@ -651,8 +740,7 @@ def get_state_with_transactions(session: Session, state_id: str) -> Optional[dic
     )
 
     txs = (
-        session.query(Transactions)
-        .options(*_HEAVY_TX_COLUMNS)
+        _query_txs(session)
         .filter(addr_filter)
         .order_by(Transactions.created_at.desc())
         .limit(50)
@@ -665,6 +753,13 @@ def get_state_with_transactions(session: Session, state_id: str) -> Optional[dic
     creator_info = None
     deploy_tx = (
         session.query(Transactions)
+        .options(
+            load_only(
+                Transactions.hash,
+                Transactions.from_address,
+                Transactions.created_at,
+            )
+        )
         .filter(
             Transactions.to_address == state_id,
             Transactions.type == 1,
@@ -684,7 +779,10 @@ def get_state_with_transactions(session: Session, state_id: str) -> Optional[dic
     return {
         "state": _serialize_state(state, include_data=False),
         "tx_count": tx_count,
-        "transactions": [_serialize_tx(tx) for tx in txs],
+        "transactions": [
+            _serialize_tx(tx, consensus_data=consensus_data)
+            for tx, consensus_data in txs
+        ],
         "contract_code": contract_code,
         "creator_info": creator_info,
     }
@@ -759,8 +857,7 @@ def get_address_info(session: Session, address: str) -> Optional[dict]:
         )
 
         recent_txs = (
-            session.query(Transactions)
-            .options(*_HEAVY_TX_COLUMNS)
+            _query_txs(session)
             .filter(addr_filter)
             .order_by(Transactions.created_at.desc())
             .limit(50)
@@ -788,8 +885,9 @@ def get_address_info(session: Session, address: str) -> Optional[dict]:
             "transactions": [
                 _serialize_tx(
                     tx,
+                    consensus_data=consensus_data,
                 )
-                for tx in recent_txs
+                for tx, consensus_data in recent_txs
             ],
         }
 
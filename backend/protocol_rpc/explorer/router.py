@@ -42,10 +42,24 @@ def get_transactions(
     from_date: Optional[str] = None,
     to_date: Optional[str] = None,
     address: Optional[str] = None,
+    cursor: Optional[str] = None,
+    count: Literal["exact", "approximate", "none"] = "exact",
 ):
-    return queries.get_all_transactions_paginated(
-        session, page, limit, status, search, from_date, to_date, address
-    )
+    try:
+        return queries.get_all_transactions_paginated(
+            session,
+            page,
+            limit,
+            status,
+            search,
+            from_date,
+            to_date,
+            address,
+            cursor=cursor,
+            count_mode=count,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @explorer_router.get("/transactions/{tx_hash}")
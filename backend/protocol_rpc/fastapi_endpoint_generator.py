@@ -84,6 +84,25 @@ def _serialize(obj):
         return str(obj)
 
 
+_SESSION_PARAMETER_NAMES = frozenset({"session", "request_session"})
+
+# Parameters of partially applied handlers injected from the app state.
+_PARTIAL_INJECTED_PARAMETER_NAMES = _SESSION_PARAMETER_NAMES | {
+    "msg_handler",
+    "accounts_manager",
+    "transactions_processor",
+    "validators_registry",
+    "modifiable_validators_registry",
+    "validators_manager",
+    "llm_provider_registry",
+    "consensus",
+    "consensus_service",
+    "snapshot_manager",
+    "transactions_parser",
+    "sqlalchemy_db",
+}
+
+
 class FastAPIEndpointRegistry:
     """Registry for FastAPI RPC endpoints."""
 
@@ -118,11 +137,36 @@ class FastAPIEndpointRegistry:
             filled_kwargs = {}
             underlying_func = partial_function
 
+        # Work out once which parameters are injected per call, so
+        # handle_method does not inspect the signature on every request.
+        param_list = list(inspect.signature(underlying_func).parameters)
+        is_partial = isinstance(partial_function, partial)
+        if is_partial:
+            session_arg_positions = tuple(
+                i
+                for i, arg in enumerate(filled_args)
+                if i < len(param_list)
+                and param_list[i] in _SESSION_PARAMETER_NAMES
+                and arg is None
+            )
+            injected_params = tuple(
+                param_name
+                for param_name in param_list[len(filled_args) :]
+                if param_name not in filled_kwargs
+                and param_name in _PARTIAL_INJECTED_PARAMETER_NAMES
+            )
+        else:
+            session_arg_positions = ()
+            injected_params = tuple(param_list)
+
         self.method_metadata[json_rpc_method_name] = {
             "filled_args": filled_args,
             "filled_kwargs": filled_kwargs,
             "underlying_func": underlying_func,
-            "is_partial": isinstance(partial_function, partial),
+            "is_partial": is_partial,
+            "is_coroutine": inspect.iscoroutinefunction(underlying_func),
+            "session_arg_positions": session_arg_positions,
+            "injected_params": injected_params,
         }
 
         return json_rpc_method_name
@@ -167,83 +211,26 @@ class FastAPIEndpointRegistry:
         handler = self.methods[method_name]
         metadata = self.method_metadata[method_name]
 
-        # Get the signature of the underlying function
-        underlying_func = metadata["underlying_func"]
-        sig = inspect.signature(underlying_func)
+        # Replace None sessions filled in by the partial with the request session
+        if metadata["session_arg_positions"] and db is not None:
+            modified_args = list(metadata["filled_args"])
+            for i in metadata["session_arg_positions"]:
+                modified_args[i] = db
+            handler = partial(
+                metadata["underlying_func"],
+                *modified_args,
+                **metadata["filled_kwargs"],
+            )
 
         # Build kwargs for dependencies that haven't been filled by partial
         kwargs = {}
-
-        if metadata["is_partial"]:
-            # For partial functions, skip parameters that are already filled
-            filled_args_count = len(metadata["filled_args"])
-            filled_kwargs = metadata["filled_kwargs"]
-
-            param_list = list(sig.parameters.items())
-
-            # Check if we need to replace None session in filled_args
-            modified_args = list(metadata["filled_args"])
-            for i, arg in enumerate(modified_args):
-                if i < len(param_list):
-                    param_name = param_list[i][0]
-                    if (
-                        param_name == "session" or param_name == "request_session"
-                    ) and arg is None:
-                        modified_args[i] = db
-
-            # Create a new partial with the modified args if needed
-            if modified_args != list(metadata["filled_args"]):
-                handler = partial(
-                    metadata["underlying_func"],
-                    *modified_args,
-                    **metadata["filled_kwargs"],
-                )
-
-            # Skip filled positional arguments and add unfilled dependencies
-            for i, (param_name, param) in enumerate(param_list):
-                # Skip if it's a positional arg that was filled
-                if i < filled_args_count:
-                    continue
-                # Skip if it's a keyword arg that was filled
-                if param_name in filled_kwargs:
-                    continue
-
-                # Add dependency injection for unfilled parameters
-                if param_name == "session" or param_name == "request_session":
-                    kwargs[param_name] = db
-                elif param_name == "msg_handler":
-                    kwargs[param_name] = app_state.get("msg_handler")
-                elif param_name == "accounts_manager":
-                    kwargs[param_name] = app_state.get("accounts_manager")
-                elif param_name == "transactions_processor":
-                    kwargs[param_name] = app_state.get("transactions_processor")
-                elif param_name == "validators_registry":
-                    kwargs[param_name] = app_state.get("validators_registry")
-                elif param_name == "modifiable_validators_registry":
-                    kwargs[param_name] = app_state.get("modifiable_validators_registry")
-                elif param_name == "validators_manager":
-                    kwargs[param_name] = app_state.get("validators_manager")
-                elif param_name == "llm_provider_registry":
-                    kwargs[param_name] = app_state.get("llm_provider_registry")
-                elif param_name == "consensus":
-                    kwargs[param_name] = app_state.get("consensus")
-                elif param_name == "consensus_service":
-                    kwargs[param_name] = app_state.get("consensus_service")
-                elif param_name == "snapshot_manager":
-                    kwargs[param_name] = app_state.get("snapshot_manager")
-                elif param_name == "transactions_parser":
-                    kwargs[param_name] = app_state.get("transactions_parser")
-                elif param_name == "sqlalchemy_db":
-                    kwargs[param_name] = app_state.get("sqlalchemy_db")
-        else:
-            # For non-partial functions, inject all dependencies
-            for param_name in sig.parameters:
-                if param_name == "session" or param_name == "request_session":
-                    kwargs[param_name] = db
-                elif param_name == "msg_handler":
-                    kwargs[param_name] = app_state.get("msg_handler")
-                elif param_name in app_state:
-                    kwargs[param_name] = app_state.get(param_name)
+        for param_name in metadata["injected_params"]:
+            if param_name in _SESSION_PARAMETER_NAMES:
+                kwargs[param_name] = db
+            elif param_name == "msg_handler" or metadata["is_partial"]:
+                kwargs[param_name] = app_state.get(param_name)
+            elif param_name in app_state:
+                kwargs[param_name] = app_state.get(param_name)
 
         # Call the handler with params
         try:
@@ -262,7 +249,7 @@ class FastAPIEndpointRegistry:
                 result = handler(params, **kwargs)
 
             # Handle async functions
-            if inspect.iscoroutinefunction(underlying_func):
+            if metadata["is_coroutine"]:
                 result = await result
             elif hasattr(result, "__await__"):
                 result = await result
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import os
 from typing import Any, Dict, List
 
 from fastapi import Request, Response
@@ -25,15 +27,103 @@ from backend.protocol_rpc.rpc_endpoint_manager import (
 
 MAX_BATCH_SIZE = 100
 
+# Read-only methods that may run concurrently with their neighbours in a
+# batch. Anything else (transactions, admin/sim mutations) is a barrier: it
+# runs alone, after every earlier entry has finished, so batches that send a
+# transaction and then read its effects keep their meaning.
+CONCURRENT_BATCH_METHODS = frozenset(
+    {
+        "ping",
+        "eth_call",
+        "gen_call",
+        "sim_call",
+        "eth_chainId",
+        "net_version",
+        "eth_blockNumber",
+        "eth_gasPrice",
+        "eth_estimateGas",
+        "eth_feeHistory",
+        "eth_maxPriorityFeePerGas",
+        "eth_syncing",
+        "eth_getBalance",
+        "eth_getCode",
+        "eth_getLogs",
+        "eth_getTransactionCount",
+        "eth_getTransactionByHash",
+        "eth_getTransactionReceipt",
+        "eth_getBlockByNumber",
+        "eth_getBlockByHash",
+        "gen_getContractSchema",
+        "gen_getContractSchemaForCode",
+        "gen_getContractCode",
+        "gen_getContractNonce",
+        "gen_getTransactionStatus",
+        "gen_getStudioTransactionByHash",
+        "sim_getTransactionsForAddress",
+        "sim_getFinalityWindowTime",
+        "sim_getFeeConfig",
+        "sim_getConsensusContract",
+        "sim_getAllValidators",
+        "sim_getValidator",
+        "sim_countValidators",
+        "sim_getProvidersAndModels",
+        "sim_estimateTransactionFees",
+        "sim_lintContract",
+    }
+)
+
+DEFAULT_BATCH_CONCURRENCY = 4
+
 
 logger = logging.getLogger(__name__)
 
 
+def get_batch_concurrency() -> int:
+    """
+    Per-batch parallelism (RPC_BATCH_CONCURRENCY).
+
+    Capped at GENVM_MAX_CONCURRENT: gen_call/eth_call/sim_call only wait
+    briefly for a GenVM slot before being rejected, so one batch must not be
+    able to claim more slots than exist.
+    """
+    try:
+        configured = int(
+            os.environ.get("RPC_BATCH_CONCURRENCY", DEFAULT_BATCH_CONCURRENCY)
+        )
+        genvm_slots = int(os.environ.get("GENVM_MAX_CONCURRENT", "8"))
+    except ValueError:
+        return DEFAULT_BATCH_CONCURRENCY
+    return max(1, min(configured, genvm_slots))
+
+
+def _is_concurrent_entry(entry: Any) -> bool:
+    return isinstance(entry, dict) and entry.get("method") in CONCURRENT_BATCH_METHODS
+
+
+def _isolated_request(request: Request) -> Request:
+    """
+    Request sharing headers/app/state but with its own scope dict.
+
+    RPCEndpointManager stores the per-call dependency exit stack in
+    request.scope; concurrent entries must not overwrite each other's.
+    """
+    return Request(dict(request.scope), request.receive)
+
+
 class FastAPIRPCRouter:
     """Bridges FastAPI requests with the RPC endpoint manager."""
 
-    def __init__(self, endpoint_manager: RPCEndpointManager) -> None:
+    def __init__(
+        self,
+        endpoint_manager: RPCEndpointManager,
+        batch_concurrency: int | None = None,
+    ) -> None:
         self._endpoint_manager = endpoint_manager
+        self._batch_concurrency = (
+            batch_concurrency
+            if batch_concurrency is not None
+            else get_batch_concurrency()
+        )
 
     async def handle_http_request(self, request: Request) -> Response:
         try:
@@ -71,11 +161,11 @@ class FastAPIRPCRouter:
                     content={"jsonrpc": "2.0", "error": invalid, "id": None},
                 )
 
-            responses: List[Dict[str, Any]] = []
-            for entry in payload:
-                response = await self._dispatch_entry(entry, request=request)
-                if isinstance(response, dict) and response.get("id") is not None:
-                    responses.append(response)
+            responses: List[Dict[str, Any]] = [
+                response
+                for response in await self._dispatch_batch(payload, request=request)
+                if isinstance(response, dict) and response.get("id") is not None
+            ]
             if not responses:
                 return Response(status_code=204)
             return JSONResponse(content=responses)
@@ -92,6 +182,45 @@ class FastAPIRPCRouter:
             content={"jsonrpc": "2.0", "error": invalid, "id": None},
         )
 
+    async def _dispatch_batch(
+        self,
+        entries: List[Any],
+        *,
+        request: Request,
+    ) -> List[Dict[str, Any]]:
+        """
+        Dispatch batch entries, running runs of read-only entries concurrently
+        (bounded by the batch concurrency) and returning responses in request
+        order.
+        """
+        if self._batch_concurrency <= 1:
+            return [
+                await self._dispatch_entry(entry, request=request) for entry in entries
+            ]
+
+        results: List[Dict[str, Any]] = [{} for _ in entries]
+        semaphore = asyncio.Semaphore(self._batch_concurrency)
+        in_flight: List[asyncio.Task] = []
+
+        async def run(index: int, entry: Any) -> None:
+            async with semaphore:
+                results[index] = await self._dispatch_entry(
+                    entry, request=_isolated_request(request)
+                )
+
+        for index, entry in enumerate(entries):
+            if _is_concurrent_entry(entry):
+                in_flight.append(asyncio.create_task(run(index, entry)))
+                continue
+            if in_flight:
+                await asyncio.gather(*in_flight)
+                in_flight = []
+            results[index] = await self._dispatch_entry(entry, request=request)
+
+        if in_flight:
+            await asyncio.gather(*in_flight)
+        return results
+
     async def _dispatch_entry(
         self,
         payload: Any,
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import base64
 import copy
+import functools
 import os
+import threading
 from dataclasses import dataclass, fields
 from typing import Any, Callable
 
@@ -76,6 +78,8 @@ WEI_PER_GEN = 10**18
 DEFAULT_GEN_PER_TIME_UNIT = WEI_PER_GEN // 1_000
 DEFAULT_STORAGE_UNIT_PRICE = 1
 DEFAULT_RECEIPT_GAS_PRICE = 1
+# Distinct (policy, fee distribution, validator count) deposits kept memoised.
+FEE_PRESET_CACHE_SIZE = 1024
 DEFAULT_TRANSACTION_EXECUTION_BUDGET_PER_ROUND = 500_000
 DEFAULT_LEADER_TIMEUNITS_ALLOCATION = 100
 DEFAULT_VALIDATOR_TIMEUNITS_ALLOCATION = 200
@@ -194,6 +198,40 @@ class TooManyMessages(FeeValidationError):
     pass
 
 
+# (policy field, environment variable, default) read by StudioFeePolicy.from_env.
+STUDIO_FEE_POLICY_ENV: tuple[tuple[str, str, int], ...] = (
+    (
+        "gen_per_time_unit",
+        "GENLAYER_STUDIO_GEN_PER_TIME_UNIT",
+        DEFAULT_GEN_PER_TIME_UNIT,
+    ),
+    (
+        "storage_unit_price",
+        "GENLAYER_STUDIO_STORAGE_UNIT_PRICE",
+        DEFAULT_STORAGE_UNIT_PRICE,
+    ),
+    (
+        "receipt_gas_price",
+        "GENLAYER_STUDIO_RECEIPT_GAS_PRICE",
+        DEFAULT_RECEIPT_GAS_PRICE,
+    ),
+    ("intrinsic_gas", "GENLAYER_STUDIO_INTRINSIC_GAS", 21_000),
+    ("bootloader_overhead", "GENLAYER_STUDIO_BOOTLOADER_OVERHEAD", 60_000),
+    ("gas_per_changed_slot", "GENLAYER_STUDIO_GAS_PER_CHANGED_SLOT", 1_000),
+    ("calldata_gas_per_byte", "GENLAYER_STUDIO_CALLDATA_GAS_PER_BYTE", 16),
+    (
+        "fixed_propose_receipt_gas",
+        "GENLAYER_STUDIO_FIXED_PROPOSE_RECEIPT_GAS",
+        210_000,
+    ),
+    ("fixed_message_reveal_gas", "GENLAYER_STUDIO_FIXED_MESSAGE_REVEAL_GAS", 100_000),
+    ("receipt_wrapper_bytes", "GENLAYER_STUDIO_RECEIPT_WRAPPER_BYTES", 1_024),
+    ("extra_exec_gas", "GENLAYER_STUDIO_EXTRA_EXEC_GAS", 210_000),
+    ("max_allocation_tree_depth", "GENLAYER_STUDIO_MAX_ALLOCATION_TREE_DEPTH", 5),
+    ("max_messages_per_tx", "GENLAYER_STUDIO_MAX_MESSAGES_PER_TX", 0),
+)
+
+
 @dataclass(frozen=True)
 class StudioFeePolicy:
     gen_per_time_unit: int = 0
@@ -213,35 +251,10 @@ class StudioFeePolicy:
     @classmethod
     def from_env(cls) -> "StudioFeePolicy":
         return cls(
-            gen_per_time_unit=_env_int(
-                "GENLAYER_STUDIO_GEN_PER_TIME_UNIT", DEFAULT_GEN_PER_TIME_UNIT
-            ),
-            storage_unit_price=_env_int(
-                "GENLAYER_STUDIO_STORAGE_UNIT_PRICE", DEFAULT_STORAGE_UNIT_PRICE
-            ),
-            receipt_gas_price=_env_int(
-                "GENLAYER_STUDIO_RECEIPT_GAS_PRICE", DEFAULT_RECEIPT_GAS_PRICE
-            ),
-            intrinsic_gas=_env_int("GENLAYER_STUDIO_INTRINSIC_GAS", 21_000),
-            bootloader_overhead=_env_int("GENLAYER_STUDIO_BOOTLOADER_OVERHEAD", 60_000),
-            gas_per_changed_slot=_env_int(
-                "GENLAYER_STUDIO_GAS_PER_CHANGED_SLOT", 1_000
-            ),
-            calldata_gas_per_byte=_env_int("GENLAYER_STUDIO_CALLDATA_GAS_PER_BYTE", 16),
-            fixed_propose_receipt_gas=_env_int(
-                "GENLAYER_STUDIO_FIXED_PROPOSE_RECEIPT_GAS", 210_000
-            ),
-            fixed_message_reveal_gas=_env_int(
-                "GENLAYER_STUDIO_FIXED_MESSAGE_REVEAL_GAS", 100_000
-            ),
-            receipt_wrapper_bytes=_env_int(
-                "GENLAYER_STUDIO_RECEIPT_WRAPPER_BYTES", 1_024
-            ),
-            extra_exec_gas=_env_int("GENLAYER_STUDIO_EXTRA_EXEC_GAS", 210_000),
-            max_allocation_tree_depth=_env_int(
-                "GENLAYER_STUDIO_MAX_ALLOCATION_TREE_DEPTH", 5
-            ),
-            max_messages_per_tx=_env_int("GENLAYER_STUDIO_MAX_MESSAGES_PER_TX", 0),
+            **{
+                field: _env_int(name, default)
+                for field, name, default in STUDIO_FEE_POLICY_ENV
+            }
         )
 
     def estimate_propose_receipt_bytes(self, eq_outputs_length: int) -> int:
@@ -338,6 +351,49 @@ class StudioFeePolicy:
         return cls(**{field.name: int(snapshot[field.name]) for field in fields(cls)})
 
 
+class StudioFeePolicyCache:
+    """Process-wide StudioFeePolicy, built from the environment once.
+
+    The GENLAYER_STUDIO_* variables are read on first use and again only on
+    ``reload()``, so per-request callers get the cached policy without
+    touching the environment. ``version`` increases every time the policy is
+    rebuilt.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # (policy, version), swapped as a whole on rebuild.
+        self._state: tuple[StudioFeePolicy, int] | None = None
+
+    def current(self) -> StudioFeePolicy:
+        return self.current_with_version()[0]
+
+    def current_with_version(self) -> tuple[StudioFeePolicy, int]:
+        state = self._state
+        if state is None:
+            with self._lock:
+                state = self._state
+                if state is None:
+                    state = self._rebuild()
+        return state
+
+    def reload(self) -> StudioFeePolicy:
+        """Re-read the environment and publish the result as a new version."""
+        with self._lock:
+            return self._rebuild()[0]
+
+    @property
+    def version(self) -> int:
+        return self._state[1] if self._state is not None else 0
+
+    def _rebuild(self) -> tuple[StudioFeePolicy, int]:
+        self._state = (StudioFeePolicy.from_env(), self.version + 1)
+        return self._state
+
+
+studio_fee_policy = StudioFeePolicyCache()
+
+
 def _accounting_policy(
     accounting: dict[str, Any] | None,
     override: StudioFeePolicy | None = None,
@@ -515,6 +571,31 @@ def required_fee_deposit(
     policy: StudioFeePolicy | None = None,
 ) -> int:
     fees = normalize_fees_distribution(fees_distribution)
+    return _required_fee_deposit_for_shape(
+        _fees_distribution_shape(fees),
+        int(num_of_validators),
+        policy or StudioFeePolicy(),
+    )
+
+
+def _fees_distribution_shape(
+    fees: dict[str, int | list[int]],
+) -> tuple[tuple[str, int | tuple[int, ...]], ...]:
+    return tuple(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in fees.items()
+    )
+
+
+@functools.lru_cache(maxsize=FEE_PRESET_CACHE_SIZE)
+def _required_fee_deposit_for_shape(
+    shape: tuple[tuple[str, int | tuple[int, ...]], ...],
+    num_of_validators: int,
+    policy: StudioFeePolicy,
+) -> int:
+    fees = {
+        key: list(value) if isinstance(value, tuple) else value for key, value in shape
+    }
     return calculate_round_fees(fees, num_of_validators, 0, policy) + int(
         fees["totalMessageFees"]
     )
@@ -563,7 +644,11 @@ def default_transaction_fees_for_policy(
 
 
 def studio_fee_config(policy: StudioFeePolicy | None = None) -> dict[str, Any]:
-    policy = policy or StudioFeePolicy.from_env()
+    return copy.deepcopy(_studio_fee_config(policy or studio_fee_policy.current()))
+
+
+@functools.lru_cache(maxsize=32)
+def _studio_fee_config(policy: StudioFeePolicy) -> dict[str, Any]:
     distribution, fee_value = default_transaction_fees_for_policy(policy)
     return {
         "enabled": policy.fee_accounting_enabled(),
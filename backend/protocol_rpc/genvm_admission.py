@@ -0,0 +1,306 @@
+"""
+Admission control for GenVM-backed RPC calls (gen_call, sim_call, eth_call).
+
+Each RPC pod runs at most GENVM_MAX_CONCURRENT executions. Calls arriving
+while every slot is busy wait in a short priority queue instead of failing
+at once: callers on higher-priority API tiers are admitted first, and a call
+is only queued if the expected wait (from the average slot hold time) fits
+in GENVM_ADMISSION_MAX_WAIT_SECONDS. Calls that cannot be admitted in time
+get the usual "server busy" error.
+
+With GENVM_GLOBAL_MAX_CONCURRENT set, admitted calls also take a lease from
+a budget shared by all RPC replicas through Redis, so the cluster as a whole
+does not oversubscribe GenVM. Leases expire on their own if a pod dies;
+Redis errors let calls through on the local limit alone.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import socket
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+from backend.protocol_rpc.exceptions import JSONRPCError
+from backend.protocol_rpc.rate_limiter import current_api_tier
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENT = 8
+DEFAULT_QUEUE_SIZE = 32
+DEFAULT_MAX_WAIT_SECONDS = 2.0
+DEFAULT_LEASE_SECONDS = 300.0
+RETRY_AFTER_SECONDS = 2
+# Priority of tiers missing from GENVM_ADMISSION_TIER_PRIORITY (lower runs first).
+UNRANKED_PRIORITY = 100
+
+GLOBAL_LEASES_KEY = "genvm:admission:leases"
+
+# Drop expired leases, then take one if the budget has room.
+# KEYS: [leases_key]  ARGV: [member, limit, lease_ms]
+_ACQUIRE_LEASE_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], now + tonumber(ARGV[3]), ARGV[1])
+redis.call('PEXPIRE', KEYS[1], tonumber(ARGV[3]))
+return 1
+"""
+
+# Backoff between global lease attempts while a call waits for budget.
+_GLOBAL_RETRY_MIN_SECONDS = 0.02
+_GLOBAL_RETRY_MAX_SECONDS = 0.25
+# Weight of the latest call in the average slot hold time.
+_HOLD_TIME_ALPHA = 0.2
+
+
+def parse_tier_priorities(raw: str) -> dict[str, int]:
+    """Parse "enterprise=0,pro=1" into {"enterprise": 0, "pro": 1}."""
+    priorities = {}
+    for entry in raw.split(","):
+        name, sep, value = entry.partition("=")
+        if not sep or not name.strip():
+            continue
+        try:
+            priorities[name.strip()] = int(value)
+        except ValueError:
+            logger.warning(f"Ignoring invalid GENVM_ADMISSION_TIER_PRIORITY: {entry}")
+    return priorities
+
+
+class GenVMAdmission:
+    """Bounded, priority-ordered admission to a fixed number of GenVM slots."""
+
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
+        tier_priorities: Optional[dict[str, int]] = None,
+        global_max_concurrent: int = 0,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    ):
+        """
+        Initialize admission control.
+
+        Args:
+            max_concurrent: GenVM executions this pod runs at once
+            queue_size: Calls allowed to wait for a slot; 0 rejects when full
+            max_wait_seconds: Longest a call waits for a local or global slot
+            tier_priorities: API tier name -> priority, lower admitted first
+            global_max_concurrent: Cluster-wide budget; 0 disables it
+            lease_seconds: Lifetime of a global lease held by a running call
+        """
+        self.max_concurrent = max(0, max_concurrent)
+        self.queue_size = max(0, queue_size)
+        self.max_wait_seconds = max(0.0, max_wait_seconds)
+        self.tier_priorities = tier_priorities or {}
+        self.global_max_concurrent = max(0, global_max_concurrent)
+        self.lease_ms = int(lease_seconds * 1000)
+        self.pod_id = f"{socket.gethostname()}-{uuid.uuid4().hex[:8]}"
+        self.redis_client: Optional[aioredis.Redis] = None
+
+        self._active = 0
+        self._queued = 0
+        # (priority, seq, future); entries of abandoned waiters stay in the
+        # heap with a cancelled future and are skipped when popped.
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self.avg_hold_seconds = 0.0
+
+        self.admitted_total = 0
+        self.waited_total = 0
+        self.rejected_total: dict[str, int] = {}
+        self.global_errors_total = 0
+
+    @classmethod
+    def from_environment(cls) -> "GenVMAdmission":
+        return cls(
+            max_concurrent=int(
+                os.environ.get("GENVM_MAX_CONCURRENT", DEFAULT_MAX_CONCURRENT)
+            ),
+            queue_size=int(
+                os.environ.get("GENVM_ADMISSION_QUEUE_SIZE", DEFAULT_QUEUE_SIZE)
+            ),
+            max_wait_seconds=float(
+                os.environ.get(
+                    "GENVM_ADMISSION_MAX_WAIT_SECONDS", DEFAULT_MAX_WAIT_SECONDS
+                )
+            ),
+            tier_priorities=parse_tier_priorities(
+                os.environ.get("GENVM_ADMISSION_TIER_PRIORITY", "")
+            ),
+            global_max_concurrent=int(
+                os.environ.get("GENVM_GLOBAL_MAX_CONCURRENT", "0")
+            ),
+            lease_seconds=float(
+                os.environ.get("GENVM_GLOBAL_LEASE_SECONDS", DEFAULT_LEASE_SECONDS)
+            ),
+        )
+
+    def attach_redis(self, redis_client: Optional[aioredis.Redis]) -> None:
+        """Use `redis_client` for the cluster-wide budget, if one is configured."""
+        self.redis_client = redis_client if self.global_max_concurrent else None
+
+    def priority_for(self, tier: Optional[str]) -> int:
+        if tier is None:
+            return UNRANKED_PRIORITY
+        return self.tier_priorities.get(tier, UNRANKED_PRIORITY)
+
+    @asynccontextmanager
+    async def admit(self, method: str, to_address: Optional[str]):
+        """Hold a GenVM slot (and global lease) for the duration of the block."""
+        deadline = time.monotonic() + self.max_wait_seconds
+        await self._acquire_local(method, to_address, deadline)
+        try:
+            lease = await self._acquire_global(method, to_address, deadline)
+        except BaseException:
+            self._release_local()
+            raise
+
+        self.admitted_total += 1
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            held = time.monotonic() - started
+            self.avg_hold_seconds += _HOLD_TIME_ALPHA * (held - self.avg_hold_seconds)
+            self._release_local()
+            if lease is not None:
+                await self._release_global(lease)
+
+    async def _acquire_local(
+        self, method: str, to_address: Optional[str], deadline: float
+    ) -> None:
+        if self._active < self.max_concurrent and not self._queued:
+            self._active += 1
+            return
+
+        priority = self.priority_for(current_api_tier.get())
+        if self._queued >= self.queue_size:
+            self._reject("queue_full", method, to_address)
+        ahead = sum(
+            1 for p, _, waiter in self._waiters if p <= priority and not waiter.done()
+        )
+        if self.max_concurrent == 0 or (
+            self.avg_hold_seconds * (ahead + 1) / self.max_concurrent
+            > deadline - time.monotonic()
+        ):
+            self._reject("deadline", method, to_address)
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), waiter))
+        self._queued += 1
+        try:
+            await asyncio.wait({waiter}, timeout=max(0.0, deadline - time.monotonic()))
+        except asyncio.CancelledError:
+            if not waiter.cancel():
+                # The slot was handed over just as we were cancelled.
+                self._release_local()
+            raise
+        finally:
+            self._queued -= 1
+
+        if not waiter.done():
+            waiter.cancel()
+            self._reject("deadline", method, to_address)
+        self.waited_total += 1
+
+    def _release_local(self) -> None:
+        """Hand the slot to the best live waiter, or free it."""
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    async def _acquire_global(
+        self, method: str, to_address: Optional[str], deadline: float
+    ) -> Optional[str]:
+        if self.redis_client is None:
+            return None
+
+        member = f"{self.pod_id}:{uuid.uuid4().hex}"
+        backoff = _GLOBAL_RETRY_MIN_SECONDS
+        while True:
+            try:
+                acquired = await self.redis_client.eval(
+                    _ACQUIRE_LEASE_LUA,
+                    1,
+                    GLOBAL_LEASES_KEY,
+                    member,
+                    self.global_max_concurrent,
+                    self.lease_ms,
+                )
+            except Exception as e:
+                self.global_errors_total += 1
+                logger.warning(
+                    f"GenVM global budget unavailable, using local only: {e}"
+                )
+                return None
+            if acquired:
+                return member
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._reject("global_budget", method, to_address)
+            await asyncio.sleep(min(backoff, remaining))
+            backoff = min(backoff * 2, _GLOBAL_RETRY_MAX_SECONDS)
+
+    async def _release_global(self, member: str) -> None:
+        try:
+            await self.redis_client.zrem(GLOBAL_LEASES_KEY, member)
+        except Exception as e:
+            self.global_errors_total += 1
+            logger.warning(f"Failed to release GenVM global lease: {e}")
+
+    def _reject(self, reason: str, method: str, to_address: Optional[str]) -> None:
+        self.rejected_total[reason] = self.rejected_total.get(reason, 0) + 1
+        logger.warning(
+            "GenVM admission rejected %s to %s (%s, %s active, %s queued)",
+            method,
+            to_address,
+            reason,
+            self._active,
+            self._queued,
+        )
+        if reason == "global_budget":
+            message = (
+                f"Server busy: all {self.global_max_concurrent} cluster execution "
+                "slots occupied, retry later"
+            )
+        else:
+            message = (
+                f"Server busy: all {self.max_concurrent} execution slots occupied, "
+                "retry later"
+            )
+        raise JSONRPCError(
+            code=-32006,
+            message=message,
+            data={"retry_after_seconds": RETRY_AFTER_SECONDS, "reason": reason},
+        )
+
+    def get_metrics(self) -> dict:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "active": self._active,
+            "queued": self._queued,
+            "queue_size": self.queue_size,
+            "avg_hold_seconds": round(self.avg_hold_seconds, 4),
+            "admitted_total": self.admitted_total,
+            "waited_total": self.waited_total,
+            "rejected_total": dict(self.rejected_total),
+            "global_max_concurrent": self.global_max_concurrent,
+            "global_enabled": self.redis_client is not None,
+            "global_errors_total": self.global_errors_total,
+        }
@@ -13,7 +13,12 @@ from fastapi import APIRouter, FastAPI, Depends
 from fastapi.responses import JSONResponse
 from backend.database_handler.session_factory import get_database_manager
 from backend.protocol_rpc.fastapi_rpc_router import FastAPIRPCRouter
-from backend.protocol_rpc.dependencies import get_rpc_router_optional
+from backend.protocol_rpc.broadcast import Broadcast
+from backend.protocol_rpc.dependencies import (
+    get_broadcast_optional,
+    get_rpc_router_optional,
+)
+from backend.protocol_rpc.health_aggregator import ClusterHealthAggregator
 
 logger = logging.getLogger(__name__)
 
@@ -108,6 +113,7 @@ _health_cache = HealthCache()
 _background_task: Optional[asyncio.Task] = None
 _rpc_router_ref: Optional[FastAPIRPCRouter] = None
 _usage_metrics_service_ref: Optional[Any] = None
+_cluster_aggregator: Optional[ClusterHealthAggregator] = None
 _metrics_send_counter: int = 0
 
 # =============================================================================
@@ -215,6 +221,8 @@ def _evaluate_permit_readiness(
 # Send system health metrics every 6 health checks (6 × 10s = 60s = 1 minute)
 METRICS_SEND_INTERVAL = 6
 _no_progress_scan_suppressed_until: float = 0.0
+_value_ledger_reconciled_at: float = 0.0
+_value_ledger_reconcile: Optional[Dict[str, Any]] = None
 
 # Statuses where the consensus state machine is actively working.
 # The "head of queue stuck" check uses ONLY these: ACCEPTED-class
@@ -247,6 +255,11 @@ def get_no_progress_scan_error_cooldown_seconds() -> float:
     return float(os.getenv("HEALTH_NO_PROGRESS_SCAN_ERROR_COOLDOWN_SECONDS", "300"))
 
 
+def get_value_ledger_reconcile_interval_seconds() -> float:
+    """How often the value ledger is checked against a full recount (0 = never)."""
+    return float(os.getenv("VALUE_LEDGER_RECONCILE_INTERVAL_SECONDS", "3600"))
+
+
 def _update_genvm_health_cache(
     services: Dict[str, Any],
     genvm_ok: bool,
@@ -290,6 +303,124 @@ def _update_genvm_health_cache(
         _health_cache.genvm_active_executions = None
 
 
+async def _compute_cluster_health() -> Dict[str, Any]:
+    """
+    Run the checks whose result is the same for every RPC pod (consensus,
+    LLM providers, aggregate counts, pending contracts).
+
+    These are the expensive DB scans; with the health aggregator enabled only
+    the elected pod runs them and the others serve its published snapshot.
+    Consensus and LLM issues can only degrade the overall status.
+    """
+    degraded = False
+    issues = []
+    services = {}
+
+    # Consensus health
+    consensus_health = await _check_consensus_health()
+    consensus_status = consensus_health.get("status", "unknown")
+    services["consensus"] = {
+        "processing_transactions": consensus_health.get(
+            "total_processing_transactions", 0
+        ),
+        "orphaned_transactions": consensus_health.get("total_orphaned_transactions", 0),
+        "stuck_head_transactions": consensus_health.get("stuck_head_transactions", []),
+        "stuck_finalization_count": consensus_health.get("stuck_finalization_count", 0),
+        "recovery_storm_count": consensus_health.get("recovery_storm_count", 0),
+        "max_recovery_count": consensus_health.get("max_recovery_count", 0),
+        "max_recovery_exhausted_count": consensus_health.get(
+            "max_recovery_exhausted_count", 0
+        ),
+        "max_recovery_exhausted_transactions": consensus_health.get(
+            "max_recovery_exhausted_transactions", []
+        ),
+        "no_consensus_progress": consensus_health.get("no_consensus_progress", False),
+        "no_progress_backlog_count": consensus_health.get(
+            "no_progress_backlog_count", 0
+        ),
+        "seconds_since_consensus_progress": consensus_health.get(
+            "seconds_since_consensus_progress"
+        ),
+        "no_progress_check_error": consensus_health.get(
+            "no_progress_check_error", False
+        ),
+        "no_progress_scan_suppressed": consensus_health.get(
+            "no_progress_scan_suppressed", False
+        ),
+        "active_workers": consensus_health.get("active_workers", 0),
+        "status": consensus_status,
+    }
+    if consensus_status in ["unhealthy", "error"]:
+        degraded = True
+        issues.append("consensus_issue")
+    else:
+        if consensus_health.get("total_orphaned_transactions", 0) >= 3:
+            degraded = True
+            issues.append("orphaned_transactions")
+        if consensus_health.get("stuck_finalization_count", 0) >= 3:
+            degraded = True
+            issues.append("stuck_finalizations")
+        if consensus_health.get("recovery_storm_count", 0) > 0:
+            degraded = True
+            issues.append("transaction_recovery_storm")
+        if consensus_health.get("max_recovery_exhausted_count", 0) > 0:
+            degraded = True
+            issues.append("max_recovery_cycles_exhausted")
+        if consensus_health.get("no_consensus_progress", False):
+            degraded = True
+            issues.append("no_consensus_progress")
+
+    # LLM provider health (per-provider failure-rate detection)
+    # Catches cases like a provider returning HTTP 402 / "tier required"
+    # for every call from a specific (provider, model) entry — the
+    # actual cause behind a recent stuck-shard incident that the
+    # generic "orphaned_transactions" tag couldn't articulate.
+    llm_health = await _check_llm_provider_health()
+    llm_status = llm_health.get("status", "unknown")
+    services["llm_providers"] = {
+        "status": llm_status,
+        "alert_providers": llm_health.get("alert_providers", []),
+        "window_minutes": llm_health.get("window_minutes"),
+        "total_samples": llm_health.get("total_samples"),
+    }
+    if llm_status == "error":
+        issues.append("llm_provider_check_error")
+    elif llm_status == "degraded" and llm_health.get("alert_providers"):
+        degraded = True
+        issues.append("llm_provider_failure")
+
+    # Value conservation, from the trigger-maintained ledger
+    conservation = await _check_value_conservation()
+    services["value_conservation"] = conservation
+    if conservation["status"] == "violated":
+        degraded = True
+        issues.append("value_conservation_violated")
+    elif conservation["status"] == "error":
+        issues.append("value_conservation_check_error")
+    if conservation.get("ledger_drifted"):
+        degraded = True
+        issues.append("value_ledger_drift")
+
+    decisions_count, users_count, pending_count = await _get_aggregate_counts()
+
+    return {
+        "services": services,
+        "issues": issues,
+        "degraded": degraded,
+        "total_decisions": decisions_count,
+        "total_users": users_count,
+        "pending_transactions": pending_count,
+        "pending_contracts": await _get_pending_contracts(),
+    }
+
+
+async def _get_cluster_health() -> Dict[str, Any]:
+    """Cluster health snapshot, shared through the aggregator when enabled."""
+    if _cluster_aggregator is None:
+        return await _compute_cluster_health()
+    return await _cluster_aggregator.get_snapshot(_compute_cluster_health)
+
+
 async def _run_health_checks() -> None:
     """Run all expensive health checks and update cache."""
     global _health_cache
@@ -321,93 +452,18 @@ async def _run_health_checks() -> None:
             if overall_status == "healthy":
                 overall_status = "degraded"
 
-        # 3. Consensus health
-        consensus_health = await _check_consensus_health()
-        consensus_status = consensus_health.get("status", "unknown")
-        services["consensus"] = {
-            "processing_transactions": consensus_health.get(
-                "total_processing_transactions", 0
-            ),
-            "orphaned_transactions": consensus_health.get(
-                "total_orphaned_transactions", 0
-            ),
-            "stuck_head_transactions": consensus_health.get(
-                "stuck_head_transactions", []
-            ),
-            "stuck_finalization_count": consensus_health.get(
-                "stuck_finalization_count", 0
-            ),
-            "recovery_storm_count": consensus_health.get("recovery_storm_count", 0),
-            "max_recovery_count": consensus_health.get("max_recovery_count", 0),
-            "max_recovery_exhausted_count": consensus_health.get(
-                "max_recovery_exhausted_count", 0
-            ),
-            "max_recovery_exhausted_transactions": consensus_health.get(
-                "max_recovery_exhausted_transactions", []
-            ),
-            "no_consensus_progress": consensus_health.get(
-                "no_consensus_progress", False
-            ),
-            "no_progress_backlog_count": consensus_health.get(
-                "no_progress_backlog_count", 0
-            ),
-            "seconds_since_consensus_progress": consensus_health.get(
-                "seconds_since_consensus_progress"
-            ),
-            "no_progress_check_error": consensus_health.get(
-                "no_progress_check_error", False
-            ),
-            "no_progress_scan_suppressed": consensus_health.get(
-                "no_progress_scan_suppressed", False
-            ),
-            "active_workers": consensus_health.get("active_workers", 0),
-            "status": consensus_status,
-        }
-        if consensus_status in ["unhealthy", "error"]:
-            if overall_status == "healthy":
-                overall_status = "degraded"
-            issues.append("consensus_issue")
-        else:
-            if consensus_health.get("total_orphaned_transactions", 0) >= 3:
-                if overall_status == "healthy":
-                    overall_status = "degraded"
-                issues.append("orphaned_transactions")
-            if consensus_health.get("stuck_finalization_count", 0) >= 3:
-                if overall_status == "healthy":
-                    overall_status = "degraded"
-                issues.append("stuck_finalizations")
-            if consensus_health.get("recovery_storm_count", 0) > 0:
-                if overall_status == "healthy":
-                    overall_status = "degraded"
-                issues.append("transaction_recovery_storm")
-            if consensus_health.get("max_recovery_exhausted_count", 0) > 0:
-                if overall_status == "healthy":
-                    overall_status = "degraded"
-                issues.append("max_recovery_cycles_exhausted")
-            if consensus_health.get("no_consensus_progress", False):
-                if overall_status == "healthy":
-                    overall_status = "degraded"
-                issues.append("no_consensus_progress")
-
-        # 4. LLM provider health (per-provider failure-rate detection)
-        # Catches cases like a provider returning HTTP 402 / "tier required"
-        # for every call from a specific (provider, model) entry — the
-        # actual cause behind a recent stuck-shard incident that the
-        # generic "orphaned_transactions" tag couldn't articulate.
-        llm_health = await _check_llm_provider_health()
-        llm_status = llm_health.get("status", "unknown")
-        services["llm_providers"] = {
-            "status": llm_status,
-            "alert_providers": llm_health.get("alert_providers", []),
-            "window_minutes": llm_health.get("window_minutes"),
-            "total_samples": llm_health.get("total_samples"),
-        }
-        if llm_status == "error":
-            issues.append("llm_provider_check_error")
-        elif llm_status == "degraded" and llm_health.get("alert_providers"):
-            if overall_status == "healthy":
-                overall_status = "degraded"
-            issues.append("llm_provider_failure")
+        # 3-4. Cluster-wide checks (consensus, LLM providers, counts),
+        # computed by the elected aggregator pod when enabled.
+        cluster = await _get_cluster_health()
+        services.update(cluster["services"])
+        issues.extend(cluster["issues"])
+        if cluster["degraded"] and overall_status == "healthy":
+            overall_status = "degraded"
+        if "aggregator" in cluster:
+            services["health_aggregator"] = {
+                **cluster["aggregator"],
+                "leader": _cluster_aggregator.is_leader,
+            }
 
         # 5. Memory health
         memory_health = await _check_memory_health()
@@ -432,14 +488,13 @@ async def _run_health_checks() -> None:
             issues.append("redis_unreachable")
 
         # 7. Aggregate counts for metrics
-        decisions_count, users_count, pending_count = await _get_aggregate_counts()
-        _health_cache.total_decisions = decisions_count
-        _health_cache.total_users = users_count
-        _health_cache.pending_transactions = pending_count
+        _health_cache.total_decisions = cluster["total_decisions"]
+        _health_cache.total_users = cluster["total_users"]
+        _health_cache.pending_transactions = cluster["pending_transactions"]
         _health_cache.uptime_percent = 100.0  # 100% while running
 
-        # 8. Get pending contracts breakdown for dashboard
-        _health_cache.pending_contracts = await _get_pending_contracts()
+        # 8. Pending contracts breakdown for dashboard
+        _health_cache.pending_contracts = cluster["pending_contracts"]
 
         # Update cache
         _health_cache.last_check = time.time()
@@ -464,29 +519,38 @@ async def _background_health_loop() -> None:
     interval = get_health_check_interval()
     logger.info(f"Starting background health checker (interval={interval}s)")
 
-    while True:
-        try:
-            await _run_health_checks()
+    # Captured so the lease is released even after stop() drops the global.
+    aggregator = _cluster_aggregator
+    try:
+        while True:
+            try:
+                await _run_health_checks()
 
-            # Send system health metrics every 1 minute (every 6th iteration)
-            _metrics_send_counter += 1
-            if _metrics_send_counter >= METRICS_SEND_INTERVAL:
-                _metrics_send_counter = 0
-                if _usage_metrics_service_ref and _usage_metrics_service_ref.enabled:
-                    try:
-                        await _usage_metrics_service_ref.send_system_health_metrics(
-                            _health_cache
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to send system health metrics: {e}")
+                # Send system health metrics every 1 minute (every 6th iteration)
+                _metrics_send_counter += 1
+                if _metrics_send_counter >= METRICS_SEND_INTERVAL:
+                    _metrics_send_counter = 0
+                    if (
+                        _usage_metrics_service_ref
+                        and _usage_metrics_service_ref.enabled
+                    ):
+                        try:
+                            await _usage_metrics_service_ref.send_system_health_metrics(
+                                _health_cache
+                            )
+                        except Exception as e:
+                            logger.warning(f"Failed to send system health metrics: {e}")
 
-        except asyncio.CancelledError:
-            logger.info("Background health checker cancelled")
-            raise
-        except Exception as e:
-            logger.exception(f"Background health check error: {e}")
+            except asyncio.CancelledError:
+                logger.info("Background health checker cancelled")
+                raise
+            except Exception as e:
+                logger.exception(f"Background health check error: {e}")
 
-        await asyncio.sleep(interval)
+            await asyncio.sleep(interval)
+    finally:
+        if aggregator is not None:
+            await aggregator.close()
 
 
 def start_background_health_checker(
@@ -495,6 +559,7 @@ def start_background_health_checker(
 ) -> None:
     """Start the background health checker task. Call from app startup."""
     global _background_task, _rpc_router_ref, _usage_metrics_service_ref
+    global _cluster_aggregator
 
     _rpc_router_ref = rpc_router
     _usage_metrics_service_ref = usage_metrics_service
@@ -503,6 +568,14 @@ def start_background_health_checker(
         logger.warning("Background health checker already running")
         return
 
+    _cluster_aggregator = ClusterHealthAggregator.from_environment(
+        get_health_check_interval()
+    )
+    if _cluster_aggregator is not None:
+        logger.info(
+            f"Cluster health aggregation enabled (pod_id={_cluster_aggregator.pod_id})"
+        )
+
     loop = asyncio.get_event_loop()
     _background_task = loop.create_task(_background_health_loop())
     logger.info("Background health checker started")
@@ -510,11 +583,12 @@ def start_background_health_checker(
 
 def stop_background_health_checker() -> None:
     """Stop the background health checker task. Call from app shutdown."""
-    global _background_task
+    global _background_task, _cluster_aggregator
 
     if _background_task is not None:
         _background_task.cancel()
         _background_task = None
+        _cluster_aggregator = None
         logger.info("Background health checker stopped")
 
 
@@ -1374,6 +1448,61 @@ async def _check_memory_health() -> Dict[str, Any]:
         return {"status": "error", "error": str(e)}
 
 
+async def _check_value_conservation() -> Dict[str, Any]:
+    """
+    Balances plus in-transit value must equal everything ever minted.
+
+    Checked every cycle from the value_ledger totals (a few rows). Every
+    VALUE_LEDGER_RECONCILE_INTERVAL_SECONDS the ledger itself is compared
+    with a full recount of current_state and transactions; drift there
+    means value moved outside the triggers and is repaired with
+    admin_reconcileValueLedger.
+    """
+    global _value_ledger_reconciled_at, _value_ledger_reconcile
+    from sqlalchemy.orm import Session
+
+    from backend.database_handler.invariants import (
+        reconcile_value_ledger,
+        verify_conservation_from_ledger,
+    )
+
+    interval = get_value_ledger_reconcile_interval_seconds()
+    reconcile_due = (
+        interval > 0 and time.time() - _value_ledger_reconciled_at >= interval
+    )
+
+    def _query():
+        db_manager = get_database_manager()
+        with Session(db_manager.engine) as session:
+            is_valid, totals = verify_conservation_from_ledger(session)
+            reconcile = reconcile_value_ledger(session) if reconcile_due else None
+            return is_valid, totals, reconcile
+
+    try:
+        is_valid, totals, reconcile = await asyncio.to_thread(_query)
+    except Exception as e:
+        logger.warning(f"Failed to check value conservation: {e}")
+        return {"status": "error", "error": str(e)}
+
+    if reconcile is not None:
+        _value_ledger_reconciled_at = time.time()
+        _value_ledger_reconcile = reconcile
+        if reconcile["drifted"]:
+            logger.error(
+                f"Value ledger drifted from recount: ledger={reconcile['ledger']} "
+                f"actual={reconcile['actual']}"
+            )
+    # Values are wei-scale; strings keep them exact in JSON.
+    return {
+        "status": "healthy" if is_valid else "violated",
+        **{key: str(value) for key, value in totals.items()},
+        "ledger_drifted": bool(
+            _value_ledger_reconcile and _value_ledger_reconcile["drifted"]
+        ),
+        "last_reconciled_at": _value_ledger_reconciled_at or None,
+    }
+
+
 async def _get_aggregate_counts() -> tuple[int, int, int]:
     """Query total decisions, unique users, and pending transactions from database."""
     from sqlalchemy import text
@@ -1732,8 +1861,7 @@ async def health_ratelimit() -> Dict[str, Any]:
         _address_request_log,
         _RATE_LIMIT_WINDOW,
         _RATE_LIMIT_MAX,
-        _genvm_semaphore,
-        _GENVM_CONCURRENCY,
+        genvm_admission,
     )
     import time as _time
 
@@ -1751,8 +1879,7 @@ async def health_ratelimit() -> Dict[str, Any]:
     return {
         "window_seconds": _RATE_LIMIT_WINDOW,
         "max_per_window": _RATE_LIMIT_MAX,
-        "genvm_concurrency_limit": _GENVM_CONCURRENCY,
-        "genvm_semaphore_available": _genvm_semaphore._value,  # noqa: SLF001
+        "genvm_admission": genvm_admission.get_metrics(),
         "active_addresses": len(addresses),
         "addresses": addresses,
     }
@@ -2038,12 +2165,100 @@ async def health_consensus(
         return {"status": "error", "error": str(e)}
 
 
+def _add_websocket_metrics(registry, broadcast: Broadcast, Gauge, Counter) -> None:
+    """WebSocket fan-out queue depth, lag and overflow counters."""
+    stats = broadcast.get_metrics()
+    gauges = {
+        "subscribers": "Active WebSocket channel subscriptions",
+        "queued_messages": "Events waiting in WebSocket subscriber queues",
+        "max_queue_depth": "Deepest WebSocket subscriber queue",
+        "oldest_pending_seconds": "Age of the oldest undelivered WebSocket event",
+        "max_delivery_lag_seconds": "Largest publish-to-send delay seen",
+    }
+    for name, description in gauges.items():
+        Gauge(f"genlayer_websocket_{name}", description, registry=registry).set(
+            stats[name]
+        )
+    counters = {
+        "dropped_total": (
+            "genlayer_websocket_dropped_messages",
+            "Events dropped from full WebSocket subscriber queues",
+        ),
+        "coalesced_total": (
+            "genlayer_websocket_coalesced_messages",
+            "Events replaced by a newer event for the same transaction",
+        ),
+        "disconnected_total": (
+            "genlayer_websocket_disconnected_subscribers",
+            "Subscribers cut off for falling too far behind",
+        ),
+    }
+    for key, (name, description) in counters.items():
+        Counter(name, description, registry=registry).inc(stats[key])
+
+
+def _add_event_loop_metrics(registry, Gauge) -> None:
+    """Event loop lag and database offload pool pressure."""
+    from backend.database_handler.db_offload import db_offload, event_loop_lag
+
+    lag = event_loop_lag.get_metrics()
+    gauges = {
+        "lag_seconds": "Latest event loop wake-up delay",
+        "lag_p99_seconds": "p99 event loop wake-up delay over the recent window",
+        "lag_max_seconds": "Largest event loop wake-up delay over the recent window",
+    }
+    for name, description in gauges.items():
+        Gauge(f"genlayer_event_loop_{name}", description, registry=registry).set(
+            lag[name]
+        )
+    offload = db_offload.get_metrics()
+    gauges = {
+        "in_flight": "Database calls submitted to the offload pool",
+        "queued": "Database calls waiting for an offload thread",
+        "max_wait_seconds": "Longest wait for an offload thread",
+    }
+    for name, description in gauges.items():
+        Gauge(f"genlayer_db_offload_{name}", description, registry=registry).set(
+            offload[name]
+        )
+
+
+def _add_genvm_admission_metrics(registry, Gauge, Counter) -> None:
+    """GenVM slot usage, admission queue depth and rejections on this pod."""
+    from backend.protocol_rpc.endpoints import genvm_admission
+
+    stats = genvm_admission.get_metrics()
+    gauges = {
+        "active": "GenVM-backed RPC calls running on this pod",
+        "queued": "GenVM-backed RPC calls waiting for a slot",
+        "avg_hold_seconds": "Average time a GenVM slot is held",
+    }
+    for name, description in gauges.items():
+        Gauge(f"genlayer_genvm_admission_{name}", description, registry=registry).set(
+            stats[name]
+        )
+    Counter(
+        "genlayer_genvm_admission_waited",
+        "GenVM-backed RPC calls admitted after queueing",
+        registry=registry,
+    ).inc(stats["waited_total"])
+    rejected = Counter(
+        "genlayer_genvm_admission_rejected",
+        "GenVM-backed RPC calls rejected by admission control",
+        ["reason"],
+        registry=registry,
+    )
+    for reason, count in stats["rejected_total"].items():
+        rejected.labels(reason=reason).inc(count)
+
+
 @health_router.get("/metrics")
-async def metrics():
+async def metrics(broadcast: Optional[Broadcast] = Depends(get_broadcast_optional)):
     """Return worker metrics for autoscaling in Prometheus format."""
     from fastapi.responses import Response
     from prometheus_client import (
         CollectorRegistry,
+        Counter,
         Gauge,
         generate_latest,
         CONTENT_TYPE_LATEST,
@@ -2108,6 +2323,11 @@ async def metrics():
         runnable_contracts.set(runnable_count)
         needed_workers.set(needed_workers_count)
 
+        if broadcast is not None:
+            _add_websocket_metrics(registry, broadcast, Gauge, Counter)
+        _add_event_loop_metrics(registry, Gauge)
+        _add_genvm_admission_metrics(registry, Gauge, Counter)
+
         return Response(
             content=generate_latest(registry),
             media_type=CONTENT_TYPE_LATEST,
@@ -0,0 +1,158 @@
+"""
+Cluster-wide health aggregation for RPC pods.
+
+The background health checker on every RPC pod used to run the cluster-level
+queries (consensus health scans, LLM provider failure rates, aggregate counts,
+pending contracts) itself, so their DB load grew with the replica count. Those
+results are the same for every pod, so one pod holding a short Redis lease
+computes them and publishes the snapshot; the others serve the published copy.
+Pod-local checks (GenVM manager, DB pool, memory) still run on every pod.
+"""
+
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import redis.asyncio as aioredis
+
+logger = logging.getLogger(__name__)
+
+LEADER_KEY = "health:aggregator:leader"
+SNAPSHOT_KEY = "health:aggregator:snapshot"
+
+# Take the lease if it is free, or extend it if we already hold it.
+_ACQUIRE_OR_RENEW_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    return 1
+end
+if redis.call('SET', KEYS[1], ARGV[1], 'NX', 'PX', ARGV[2]) then
+    return 1
+end
+return 0
+"""
+
+_RELEASE_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class ClusterHealthAggregator:
+    """
+    Elects one pod (Redis lease) to compute the cluster health snapshot and
+    shares the result with all pods through Redis.
+    """
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        pod_id: str,
+        lease_ttl_seconds: float,
+        snapshot_ttl_seconds: float,
+    ):
+        """
+        Initialize the aggregator.
+
+        Args:
+            redis_client: Redis client (decode_responses=True)
+            pod_id: Unique id of this pod, stored as the lease holder
+            lease_ttl_seconds: Lease lifetime; a dead leader is replaced after it
+            snapshot_ttl_seconds: Lifetime of a published snapshot
+        """
+        self.redis_client = redis_client
+        self.pod_id = pod_id
+        self.lease_ttl_ms = int(lease_ttl_seconds * 1000)
+        self.snapshot_ttl_ms = int(snapshot_ttl_seconds * 1000)
+        self.is_leader = False
+
+    @classmethod
+    def from_environment(
+        cls, check_interval_seconds: float
+    ) -> Optional["ClusterHealthAggregator"]:
+        """Build an aggregator from REDIS_URL, or None when disabled/unconfigured."""
+        redis_url = os.getenv("REDIS_URL")
+        enabled = os.getenv("HEALTH_AGGREGATOR_ENABLED", "true").lower() == "true"
+        if not redis_url or not enabled:
+            return None
+
+        ttl = max(check_interval_seconds * 3, 5.0)
+        return cls(
+            redis_client=aioredis.from_url(redis_url, decode_responses=True),
+            pod_id=f"{socket.gethostname()}-{uuid.uuid4().hex[:8]}",
+            lease_ttl_seconds=ttl,
+            snapshot_ttl_seconds=ttl,
+        )
+
+    async def get_snapshot(
+        self, compute: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Return the cluster health snapshot.
+
+        The lease holder runs `compute` and publishes the result; other pods
+        read the published snapshot. Pods fall back to computing locally when
+        Redis is unavailable or no snapshot has been published yet.
+        """
+        try:
+            self.is_leader = bool(
+                await self.redis_client.eval(
+                    _ACQUIRE_OR_RENEW_LUA,
+                    1,
+                    LEADER_KEY,
+                    self.pod_id,
+                    self.lease_ttl_ms,
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Health aggregator lease check failed: {e}")
+            self.is_leader = False
+            return await self._compute(compute, "local")
+
+        if self.is_leader:
+            snapshot = await self._compute(compute, "leader")
+            try:
+                await self.redis_client.set(
+                    SNAPSHOT_KEY,
+                    json.dumps(snapshot, default=str),
+                    px=self.snapshot_ttl_ms,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to publish cluster health snapshot: {e}")
+            return snapshot
+
+        try:
+            raw = await self.redis_client.get(SNAPSHOT_KEY)
+            if raw:
+                return json.loads(raw)
+        except Exception as e:
+            logger.warning(f"Failed to read cluster health snapshot: {e}")
+        return await self._compute(compute, "local")
+
+    async def close(self):
+        """Give up the lease (if held) and close the Redis client."""
+        try:
+            if self.is_leader:
+                await self.redis_client.eval(_RELEASE_LUA, 1, LEADER_KEY, self.pod_id)
+        except Exception as e:
+            logger.debug(f"Failed to release health aggregator lease: {e}")
+        finally:
+            self.is_leader = False
+            await self.redis_client.aclose()
+
+    async def _compute(
+        self, compute: Callable[[], Awaitable[Dict[str, Any]]], source: str
+    ) -> Dict[str, Any]:
+        snapshot = await compute()
+        snapshot["aggregator"] = {
+            "computed_by": self.pod_id,
+            "computed_at": time.time(),
+            "source": source,
+        }
+        return snapshot
@@ -9,6 +9,7 @@ from typing import Any
 
 from loguru import logger
 
+from backend.database_handler.db_offload import calling_event_loop
 from backend.protocol_rpc.configuration import GlobalConfiguration
 from backend.protocol_rpc.message_handler.types import (
     EventScope,
@@ -68,7 +69,9 @@ class MessageHandler(IMessageHandler):
 
             return sync_wrapper
 
-    def _publish(self, channel: str, payload: dict[str, Any]) -> None:
+    def _publish(
+        self, channel: str, payload: dict[str, Any], key: str | None = None
+    ) -> None:
         """Queue a broadcast publish for the given channel."""
 
         if self.broadcast is None:
@@ -78,12 +81,22 @@ class MessageHandler(IMessageHandler):
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
+            # Sync handlers run on the DB offload pool; publish on their loop.
+            loop = calling_event_loop()
+            if loop is None or loop.is_closed():
+                return
+            asyncio.run_coroutine_threadsafe(
+                self.broadcast.publish(channel=channel, message=message, key=key),
+                loop,
+            )
             return
 
         if not loop.is_running():
             return
 
-        loop.create_task(self.broadcast.publish(channel=channel, message=message))
+        loop.create_task(
+            self.broadcast.publish(channel=channel, message=message, key=key)
+        )
 
     def _socket_emit(self, log_event: LogEvent) -> None:
         """Emit a log event via broadcast channels.
@@ -98,7 +111,9 @@ class MessageHandler(IMessageHandler):
         payload = {"event": log_event.name, "data": log_event.to_dict()}
 
         if log_event.transaction_hash:
-            self._publish(log_event.transaction_hash, payload)
+            self._publish(
+                log_event.transaction_hash, payload, key=log_event.transaction_hash
+            )
             return
 
         if getattr(log_event, "account_address", None):
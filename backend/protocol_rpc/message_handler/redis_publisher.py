@@ -0,0 +1,216 @@
+"""
+Batched Redis pub/sub publishing for consensus workers.
+
+Workers emit many small events per transaction. Publishing each one with its
+own task and round-trip costs far more than the events themselves, so events
+go into a bounded in-memory queue and a single flusher task sends them in
+pipelined batches, once `batch_size` events are waiting or `flush_interval`
+has passed since the oldest one was queued. Events keep their order. When
+Redis cannot keep up and the queue is full, the oldest events are dropped
+and counted.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import redis.asyncio as aioredis
+from loguru import logger
+
+DEFAULT_MAX_QUEUE_SIZE = 10000
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL = 0.005
+
+
+@dataclass(slots=True)
+class _PendingEvent:
+    channel: str
+    message: str
+    waiter: Optional[asyncio.Future] = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class RedisBatchPublisher:
+    """Queues pub/sub messages and publishes them in pipelined batches."""
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        """
+        Initialize the publisher.
+
+        Args:
+            redis_client: Client used to run the publish pipelines
+            max_queue_size: Events held while Redis is slow; oldest dropped beyond it
+            batch_size: Events sent per pipeline; a full batch flushes immediately
+            flush_interval: Longest an event waits for its batch to fill (seconds)
+        """
+        self.redis_client = redis_client
+        self.max_queue_size = max(1, max_queue_size)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.0, flush_interval)
+
+        self._queue: deque[_PendingEvent] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+        self.published = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+        self.max_batch_size = 0
+        self.max_latency_seconds = 0.0
+        self.total_latency_seconds = 0.0
+
+    @classmethod
+    def from_environment(cls, redis_client: aioredis.Redis) -> RedisBatchPublisher:
+        return cls(
+            redis_client,
+            max_queue_size=int(
+                os.environ.get("WORKER_EVENT_QUEUE_SIZE", DEFAULT_MAX_QUEUE_SIZE)
+            ),
+            batch_size=int(
+                os.environ.get("WORKER_EVENT_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+            ),
+            flush_interval=float(os.environ.get("WORKER_EVENT_FLUSH_INTERVAL_MS", "5"))
+            / 1000,
+        )
+
+    def start(self) -> None:
+        """Start the flusher on the running loop (idempotent)."""
+        if self._task is not None and not self._task.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._closing = False
+        self._task = self._loop.create_task(self._run())
+
+    def publish_nowait(self, channel: str, message: str) -> None:
+        """Queue a message; safe to call from threads other than the loop's."""
+        loop = self._loop
+        if loop is None:
+            raise RuntimeError("RedisBatchPublisher has not been started")
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._enqueue(_PendingEvent(channel, message))
+        elif not loop.is_closed():
+            loop.call_soon_threadsafe(self._enqueue, _PendingEvent(channel, message))
+
+    async def publish(self, channel: str, message: str) -> None:
+        """Queue a message and wait until its batch has been sent."""
+        if self._task is None or self._task.done():
+            self.start()
+        waiter = asyncio.get_running_loop().create_future()
+        self._enqueue(_PendingEvent(channel, message, waiter))
+        await waiter
+
+    def _enqueue(self, event: _PendingEvent) -> None:
+        if len(self._queue) >= self.max_queue_size:
+            dropped = self._queue.popleft()
+            self.dropped += 1
+            if dropped.waiter is not None and not dropped.waiter.done():
+                dropped.waiter.set_exception(
+                    RuntimeError("Redis event queue overflow, event dropped")
+                )
+        self._queue.append(event)
+        if len(self._queue) == 1 or len(self._queue) >= self.batch_size:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            # Give the batch until `flush_interval` after its oldest event.
+            if self._queue and not self._closing and len(self._queue) < self.batch_size:
+                remaining = self._queue[0].enqueued_at + self.flush_interval
+                delay = remaining - time.monotonic()
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    self._wakeup.clear()
+            await self.flush()
+            if self._closing:
+                return
+
+    async def flush(self) -> None:
+        """Send everything queued so far, batch by batch."""
+        while self._queue:
+            batch = [
+                self._queue.popleft()
+                for _ in range(min(self.batch_size, len(self._queue)))
+            ]
+            await self._send(batch)
+
+    async def _send(self, batch: list[_PendingEvent]) -> None:
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for event in batch:
+                    pipe.publish(event.channel, event.message)
+                await pipe.execute()
+        except Exception as e:
+            self.failed += len(batch)
+            logger.error(f"Failed to publish {len(batch)} events to Redis: {e}")
+            for event in batch:
+                if event.waiter is not None and not event.waiter.done():
+                    event.waiter.set_exception(e)
+            return
+
+        now = time.monotonic()
+        self.published += len(batch)
+        self.batches += 1
+        self.max_batch_size = max(self.max_batch_size, len(batch))
+        for event in batch:
+            latency = now - event.enqueued_at
+            self.total_latency_seconds += latency
+            self.max_latency_seconds = max(self.max_latency_seconds, latency)
+            if event.waiter is not None and not event.waiter.done():
+                event.waiter.set_result(None)
+
+    async def close(self) -> None:
+        """Stop the flusher after sending whatever is still queued."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            self._closing = True
+            self._wakeup.set()
+            try:
+                await asyncio.wait_for(task, timeout=5)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                logger.warning(
+                    f"Dropping {len(self._queue)} unpublished events on shutdown"
+                )
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "queued": len(self._queue),
+            "max_queue_size": self.max_queue_size,
+            "published_total": self.published,
+            "dropped_total": self.dropped,
+            "failed_total": self.failed,
+            "batches_total": self.batches,
+            "avg_batch_size": (
+                round(self.published / self.batches, 2) if self.batches else 0.0
+            ),
+            "max_batch_size": self.max_batch_size,
+            "avg_latency_seconds": (
+                round(self.total_latency_seconds / self.published, 6)
+                if self.published
+                else 0.0
+            ),
+            "max_latency_seconds": round(self.max_latency_seconds, 6),
+        }
@@ -11,6 +11,7 @@ import redis.asyncio as aioredis
 from loguru import logger
 
 from backend.protocol_rpc.message_handler.base import MessageHandler
+from backend.protocol_rpc.message_handler.redis_publisher import RedisBatchPublisher
 from backend.protocol_rpc.message_handler.types import LogEvent
 from backend.protocol_rpc.configuration import GlobalConfiguration
 
@@ -52,6 +53,7 @@ class RedisWorkerMessageHandler(MessageHandler):
             "REDIS_URL", "redis://redis:6379/0"
         )
         self.redis_client: Optional[aioredis.Redis] = None
+        self.publisher: Optional[RedisBatchPublisher] = None
         self._listener_task: Optional[asyncio.Task] = None
 
         logger.info(f"Worker {self.worker_id} initialized with Redis pub/sub")
@@ -65,6 +67,8 @@ class RedisWorkerMessageHandler(MessageHandler):
                 )
                 # Test connection
                 await self.redis_client.ping()
+                self.publisher = RedisBatchPublisher.from_environment(self.redis_client)
+                self.publisher.start()
                 logger.info(
                     f"Worker {self.worker_id} connected to Redis at {self.redis_url}"
                 )
@@ -134,9 +138,22 @@ class RedisWorkerMessageHandler(MessageHandler):
         else:
             return self.GENERAL_CHANNEL
 
+    def _serialize_event(self, log_event: LogEvent) -> tuple[str, str]:
+        """Return the Redis channel and JSON payload for an event."""
+        channel = self._get_channel_for_event(log_event)
+        message = json.dumps(
+            {
+                "worker_id": self.worker_id,
+                "event": log_event.name,
+                "data": log_event.to_dict(),
+                "transaction_hash": log_event.transaction_hash,
+            }
+        )
+        return channel, message
+
     async def _publish_to_redis(self, log_event: LogEvent):
         """
-        Publish event to Redis pub/sub channel.
+        Publish event to Redis pub/sub channel and wait until it is sent.
 
         Args:
             log_event: The event to publish
@@ -145,52 +162,34 @@ class RedisWorkerMessageHandler(MessageHandler):
             await self.initialize()
 
         try:
-            # Determine channel
-            channel = self._get_channel_for_event(log_event)
-
-            # Prepare message
-            message = json.dumps(
-                {
-                    "worker_id": self.worker_id,
-                    "event": log_event.name,
-                    "data": log_event.to_dict(),
-                    "transaction_hash": log_event.transaction_hash,
-                }
-            )
-
-            # Publish to Redis channel
-            subscribers = await self.redis_client.publish(channel, message)
-
-            logger.debug(
-                f"Worker {self.worker_id} published {log_event.name} "
-                f"to {subscribers} subscribers on {channel}"
-            )
-
+            channel, message = self._serialize_event(log_event)
+            await self.publisher.publish(channel, message)
         except Exception as e:
             logger.error(f"Failed to publish to Redis: {e}")
             raise
 
     def _socket_emit(self, log_event: LogEvent):
         """
-        Override socket emit to publish events to Redis.
+        Override socket emit to queue events for batched Redis publishing.
 
         Args:
             log_event: The event to emit
         """
-        # Try to get the current event loop
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # Schedule the async send operation
-                asyncio.create_task(self._publish_to_redis(log_event))
-            else:
-                # If no loop is running, run it synchronously
+        if self.publisher is None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # No loop and no publisher yet: publish synchronously
                 asyncio.run(self._publish_to_redis(log_event))
-        except RuntimeError:
-            # No event loop available
+                return
+            asyncio.create_task(self._publish_to_redis(log_event))
+            return
+
+        try:
+            self.publisher.publish_nowait(*self._serialize_event(log_event))
+        except Exception as e:
             logger.error(
-                f"No event loop available for worker {self.worker_id}, "
-                f"cannot publish event: {log_event.name}"
+                f"Worker {self.worker_id} cannot publish event {log_event.name}: {e}"
             )
 
     def send_message(self, log_event: LogEvent, log_to_terminal: bool = True):
@@ -243,6 +242,10 @@ class RedisWorkerMessageHandler(MessageHandler):
                 pass
             self._listener_task = None
 
+        if self.publisher is not None:
+            await self.publisher.close()
+            self.publisher = None
+
         if self.redis_client:
             await self.redis_client.close()
             self.redis_client = None
@@ -273,4 +276,13 @@ class RedisWorkerMessageHandler(MessageHandler):
             except Exception as e:
                 health["redis_error"] = str(e)
 
+        if self.publisher is not None:
+            health["publisher"] = self.publisher.get_metrics()
+
         return health
+
+    def get_publish_metrics(self) -> dict:
+        """Queue depth, batching, drop and latency counters of the publisher."""
+        if self.publisher is None:
+            return {}
+        return self.publisher.get_metrics()
@@ -7,6 +7,7 @@ import logging
 import os
 import time
 import uuid
+from contextvars import ContextVar
 from dataclasses import dataclass
 from typing import Callable, Optional
 
@@ -24,6 +25,10 @@ DEFAULT_ANON_PER_MINUTE = 30
 DEFAULT_ANON_PER_HOUR = 500
 DEFAULT_ANON_PER_DAY = 5000
 
+# Tier of the API key (or "anonymous") the current request was checked
+# against; used to prioritise queued GenVM calls.
+current_api_tier: ContextVar[Optional[str]] = ContextVar("api_tier", default=None)
+
 # Lua script that atomically prunes, checks, and records in one round-trip.
 # This eliminates the TOCTOU race where concurrent requests could all read the
 # same stale count before any of them recorded, bypassing the limit.
@@ -132,6 +137,7 @@ class RateLimiterService:
             limits = self._anon_limits
 
         await self._check_windows(identity, limits)
+        current_api_tier.set(limits.name)
 
     async def _resolve_api_key(
         self, raw_key: str
@@ -216,7 +216,9 @@ class RedisEventSubscriber:
             # Determine broadcast channel based on transaction hash or Redis channel
             if transaction_hash:
                 # Send to transaction-specific channel
-                await self.broadcast.publish(channel=transaction_hash, message=message)
+                await self.broadcast.publish(
+                    channel=transaction_hash, message=message, key=transaction_hash
+                )
                 logger.debug(
                     f"Published {event} to broadcast channel: {transaction_hash}"
                 )
@@ -4,15 +4,16 @@ from __future__ import annotations
 
 import inspect
 import traceback
-from contextlib import AsyncExitStack
+from contextlib import AsyncExitStack, ExitStack, contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
 
 from fastapi import params
 from fastapi.dependencies.utils import get_dependant, solve_dependencies
 from fastapi.requests import Request
 from pydantic import BaseModel, ConfigDict
 
+from backend.database_handler.db_offload import run_sync
 from backend.protocol_rpc.exceptions import (
     InternalError,
     InvalidParams,
@@ -101,11 +102,104 @@ class JSONRPCResponse(BaseModel):
     id: Any | None = None
 
 
+@dataclass(slots=True)
+class PlannedDependency:
+    """One node of a handler's dependency graph, resolved without FastAPI.
+
+    Only plain sync functions and sync generators whose parameters are other
+    dependencies or the request are planned, e.g. the app-state accessors
+    and the DB session in backend.protocol_rpc.dependencies.
+    """
+
+    name: Optional[str]
+    call: Callable[..., Any]
+    cache_key: Any
+    use_cache: bool
+    request_param_name: Optional[str]
+    # contextmanager(call) for generator dependencies, None otherwise.
+    enter: Optional[Callable[..., Any]]
+    dependencies: List["PlannedDependency"]
+
+
 @dataclass(slots=True)
 class RegisteredEndpoint:
     definition: RPCEndpointDefinition
     dependant: Any
     user_parameters: List[inspect.Parameter]
+    # Sync handler with dependencies (sessions, processors, ...): call it on
+    # the DB offload pool so its queries do not block the event loop.
+    offload: bool = False
+    user_parameter_names: FrozenSet[str] = frozenset()
+    required_parameter_names: tuple[str, ...] = ()
+    # Dependencies resolved directly instead of through solve_dependencies;
+    # None when the graph uses something only FastAPI can resolve.
+    dependency_plan: Optional[List[PlannedDependency]] = None
+
+
+def _plan_dependencies(dependant: Any) -> Optional[List[PlannedDependency]]:
+    planned: List[PlannedDependency] = []
+    for sub_dependant in dependant.dependencies:
+        if (
+            sub_dependant.path_params
+            or sub_dependant.query_params
+            or sub_dependant.header_params
+            or sub_dependant.cookie_params
+            or sub_dependant.body_params
+            or sub_dependant.websocket_param_name
+            or sub_dependant.http_connection_param_name
+            or sub_dependant.response_param_name
+            or sub_dependant.background_tasks_param_name
+            or sub_dependant.security_scopes_param_name
+            or sub_dependant.oauth_scopes
+            or sub_dependant.is_async_gen_callable
+            or sub_dependant.is_coroutine_callable
+        ):
+            return None
+        sub_plan = _plan_dependencies(sub_dependant)
+        if sub_plan is None:
+            return None
+        planned.append(
+            PlannedDependency(
+                name=sub_dependant.name,
+                call=sub_dependant.call,
+                cache_key=sub_dependant.cache_key,
+                use_cache=sub_dependant.use_cache,
+                request_param_name=sub_dependant.request_param_name,
+                enter=(
+                    contextmanager(sub_dependant.call)
+                    if sub_dependant.is_gen_callable
+                    else None
+                ),
+                dependencies=sub_plan,
+            )
+        )
+    return planned
+
+
+def _resolve_planned_dependencies(
+    plan: List[PlannedDependency],
+    request: Request,
+    stack: ExitStack,
+    cache: Dict[Any, Any],
+) -> Dict[str, Any]:
+    values: Dict[str, Any] = {}
+    for dependency in plan:
+        if dependency.use_cache and dependency.cache_key in cache:
+            solved = cache[dependency.cache_key]
+        else:
+            kwargs = _resolve_planned_dependencies(
+                dependency.dependencies, request, stack, cache
+            )
+            if dependency.request_param_name:
+                kwargs[dependency.request_param_name] = request
+            if dependency.enter is not None:
+                solved = stack.enter_context(dependency.enter(**kwargs))
+            else:
+                solved = dependency.call(**kwargs)
+            cache.setdefault(dependency.cache_key, solved)
+        if dependency.name is not None:
+            values[dependency.name] = solved
+    return values
 
 
 class RPCEndpointManager:
@@ -140,6 +234,15 @@ class RPCEndpointManager:
             definition=definition,
             dependant=dependant,
             user_parameters=user_parameters,
+            offload=bool(dependant.dependencies)
+            and not inspect.iscoroutinefunction(definition.handler),
+            user_parameter_names=frozenset(param.name for param in user_parameters),
+            required_parameter_names=tuple(
+                param.name
+                for param in user_parameters
+                if param.default is inspect._empty
+            ),
+            dependency_plan=_plan_dependencies(dependant),
         )
 
     def has_method(self, name: str) -> bool:
@@ -310,6 +413,13 @@ class RPCEndpointManager:
                 result = await result
             return result
 
+        if registered.dependency_plan is not None and not getattr(
+            self._dependency_overrides_provider, "dependency_overrides", None
+        ):
+            return await self._call_planned(
+                registered, bound_arguments, fastapi_request, session_logger
+            )
+
         synthetic_body = bound_arguments or {}
 
         async with AsyncExitStack() as async_exit_stack:
@@ -326,7 +436,7 @@ class RPCEndpointManager:
             values, errors = solved.values, solved.errors
 
             if errors:
-                user_param_names = {param.name for param in registered.user_parameters}
+                user_param_names = registered.user_parameter_names
                 filtered_errors = []
                 for error in errors:
                     loc = error.get("loc") if isinstance(error, dict) else None
@@ -366,18 +476,65 @@ class RPCEndpointManager:
             if "msg_handler" in call_kwargs:
                 call_kwargs["msg_handler"] = session_logger
 
-            result = registered.dependant.call(**call_kwargs)
+            if registered.offload:
+                result = await run_sync(registered.dependant.call, **call_kwargs)
+            else:
+                result = registered.dependant.call(**call_kwargs)
             if inspect.isawaitable(result):
                 result = await result
             return result
 
+    async def _call_planned(
+        self,
+        registered: RegisteredEndpoint,
+        bound_arguments: Dict[str, Any],
+        fastapi_request: Request,
+        session_logger: MessageHandler,
+    ) -> Any:
+        """Resolve dependencies from the registration-time plan and call.
+
+        Sync handlers resolve, run and tear down their dependencies in one
+        trip to the DB offload pool. Async handlers resolve them inline (the
+        planned accessors only read app state or open a session) and close
+        them on the pool, since closing commits the session.
+        """
+
+        def build_kwargs(stack: ExitStack) -> Dict[str, Any]:
+            call_kwargs = _resolve_planned_dependencies(
+                registered.dependency_plan, fastapi_request, stack, {}
+            )
+            call_kwargs.update(bound_arguments)
+            if "msg_handler" in call_kwargs:
+                call_kwargs["msg_handler"] = session_logger
+            return call_kwargs
+
+        if registered.offload:
+
+            def run_handler() -> Any:
+                with ExitStack() as stack:
+                    return registered.dependant.call(**build_kwargs(stack))
+
+            return await run_sync(run_handler)
+
+        stack = ExitStack()
+        try:
+            result = registered.dependant.call(**build_kwargs(stack))
+            if inspect.isawaitable(result):
+                result = await result
+        except BaseException as exc:
+            if not await run_sync(stack.__exit__, type(exc), exc, exc.__traceback__):
+                raise
+            return None
+        await run_sync(stack.close)
+        return result
+
     def _bind_rpc_arguments(
         self,
         registered: RegisteredEndpoint,
         params: Any,
     ) -> Dict[str, Any]:
         user_parameters = registered.user_parameters
-        user_param_names = [param.name for param in user_parameters]
+        user_param_names = registered.user_parameter_names
 
         if params is None:
             provided: Dict[str, Any] = {}
@@ -408,11 +565,9 @@ class RPCEndpointManager:
                 )
             provided = {user_parameters[0].name: params}
 
-        for parameter in user_parameters:
-            if parameter.name not in provided and parameter.default is inspect._empty:
-                raise InvalidParams(
-                    message=f"Missing required parameter: {parameter.name}"
-                )
+        for name in registered.required_parameter_names:
+            if name not in provided:
+                raise InvalidParams(message=f"Missing required parameter: {name}")
 
         return provided
 
@@ -268,13 +268,21 @@ def cancel_transaction(
 @rpc.method("sim_getTransactionsForAddress", log_policy=LogPolicy.debug())
 def get_transactions_for_address(
     address: str,
+    full: bool = True,
+    limit: int | None = None,
+    cursor: str | None = None,
+    summary: bool = False,
     transactions_processor: TransactionsProcessor = Depends(get_transactions_processor),
     accounts_manager: AccountsManager = Depends(get_accounts_manager),
-) -> list[dict]:
+) -> list[dict] | dict:
     return impl.get_transactions_for_address(
         transactions_processor=transactions_processor,
         accounts_manager=accounts_manager,
         address=address,
+        full=full,
+        limit=limit,
+        cursor=cursor,
+        summary=summary,
     )
 
 
@@ -309,18 +317,27 @@ def get_consensus_contract(
 
 @rpc.method("sim_createSnapshot")
 def create_snapshot(
+    incremental: bool = False,
     snapshot_manager=Depends(get_snapshot_manager),
+    msg_handler=Depends(get_message_handler),
 ) -> int:
-    return impl.create_snapshot(snapshot_manager=snapshot_manager)
+    return impl.create_snapshot(
+        snapshot_manager=snapshot_manager,
+        incremental=incremental,
+        msg_handler=msg_handler,
+    )
 
 
 @rpc.method("sim_restoreSnapshot")
 def restore_snapshot(
     snapshot_id: int,
     snapshot_manager=Depends(get_snapshot_manager),
+    msg_handler=Depends(get_message_handler),
 ) -> bool:
     return impl.restore_snapshot(
-        snapshot_manager=snapshot_manager, snapshot_id=snapshot_id
+        snapshot_manager=snapshot_manager,
+        snapshot_id=snapshot_id,
+        msg_handler=msg_handler,
     )
 
 
@@ -362,6 +379,7 @@ async def get_contract_schema(
 @rpc.method("gen_getContractSchemaForCode", log_policy=LogPolicy.debug())
 async def get_contract_schema_for_code(
     contract_code_hex: str,
+    session: Session = Depends(get_db_session),
     msg_handler=Depends(get_message_handler),
     genvm_manager=Depends(get_genvm_manager),
 ) -> dict:
@@ -369,6 +387,7 @@ async def get_contract_schema_for_code(
         genvm_manager=genvm_manager,
         msg_handler=msg_handler,
         contract_code_hex=contract_code_hex,
+        session=session,
     )
 
 
@@ -753,3 +772,31 @@ async def rpc_admin_deactivate_api_key(
         rate_limiter=rate_limiter,
         admin_key=admin_key,
     )
+
+
+@rpc.method("admin_checkAddressActivity")
+def rpc_admin_check_address_activity(
+    repair: bool = False,
+    limit: int = 100,
+    admin_key: str = None,
+    session: Session = Depends(get_db_session),
+) -> dict:
+    return impl.admin_check_address_activity(
+        session=session,
+        repair=repair,
+        limit=limit,
+        admin_key=admin_key,
+    )
+
+
+@rpc.method("admin_reconcileValueLedger")
+def rpc_admin_reconcile_value_ledger(
+    repair: bool = False,
+    admin_key: str = None,
+    session: Session = Depends(get_db_session),
+) -> dict:
+    return impl.admin_reconcile_value_ledger(
+        session=session,
+        repair=repair,
+        admin_key=admin_key,
+    )
@@ -10,10 +10,13 @@ from typing import Any, Awaitable, Callable, Dict
 from fastapi import WebSocket
 from fastapi.websockets import WebSocketDisconnect
 
-from backend.protocol_rpc.broadcast import Broadcast
+from backend.protocol_rpc.broadcast import Broadcast, SubscriberOverflowError
 
 GLOBAL_CHANNEL = "__broadcast__"
 
+# "Try Again Later": sent when a client falls too far behind its event stream.
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
 
 async def _forward_messages(websocket: WebSocket, subscriber: Any) -> None:
     """Forward broadcast messages to the websocket client."""
@@ -22,6 +25,13 @@ async def _forward_messages(websocket: WebSocket, subscriber: Any) -> None:
             await websocket.send_text(event.message)
     except asyncio.CancelledError:  # Expected during shutdown/unsubscribe
         raise
+    except SubscriberOverflowError:
+        # The client can't keep up and the overflow policy is `disconnect`;
+        # closing makes the receive loop exit and clean up all subscriptions.
+        with suppress(Exception):
+            await websocket.close(
+                code=SLOW_CONSUMER_CLOSE_CODE, reason="Subscriber too slow"
+            )
     except Exception:
         # Ignore send failures caused by client disconnection.
         # This covers WebSocketDisconnect, RuntimeError, ClientDisconnected (uvicorn),
@@ -1,9 +1,12 @@
 __all__ = ("Manager", "with_lock", "select_random_different_validator")
 
 import asyncio
+import collections
 import typing
 import contextlib
 import dataclasses
+import hashlib
+import json
 import os
 import random
 
@@ -151,6 +154,40 @@ class Snapshot:
 
 from backend.node.base import LLMConfig, Manager as GenVMManager
 
+# Simulation (sim_config) validators are registered in the LLM module under an
+# id derived from their provider config, so repeated simulations with the same
+# providers reuse the running module instead of restarting it.
+SIM_LLM_ID_PREFIX = "sim-"
+DEFAULT_SIM_POOL_SIZE = 16
+
+
+def _llm_backend(validator: domain.Validator) -> LLMConfig:
+    """LLM module backend entry serving `validator`'s provider and model."""
+    key_env = validator.llmprovider.plugin_config["api_key_env_var"]
+    use_max_completion_tokens = validator.llmprovider.config.get(
+        "use_max_completion_tokens", False
+    )
+    return {
+        "models": {
+            validator.llmprovider.model: {
+                "supports_json": True,
+                "meta": {
+                    "config": validator.llmprovider.config,
+                },
+                "use_max_completion_tokens": use_max_completion_tokens,
+            }
+        },
+        "enabled": True,
+        "host": validator.llmprovider.plugin_config["api_url"],
+        "provider": validator.llmprovider.plugin,
+        "key": f"${{ENV[{key_env}]}}",
+    }
+
+
+def _sim_llm_id(validator: domain.Validator) -> str:
+    encoded = json.dumps(_llm_backend(validator), sort_keys=True, default=str)
+    return SIM_LLM_ID_PREFIX + hashlib.sha256(encoded.encode()).hexdigest()[:16]
+
 
 class Manager:
     registry: vr.ModifiableValidatorsRegistry
@@ -167,6 +204,17 @@ class Manager:
         )
         self._restart_llm_lock = asyncio.Lock()
 
+        # Backends currently loaded in the LLM module: the registry validators
+        # plus a bounded, least-recently-used pool of simulation backends.
+        self._registry_backends: dict[str, LLMConfig] = {}
+        self._sim_backends: collections.OrderedDict[str, LLMConfig] = (
+            collections.OrderedDict()
+        )
+        self._sim_backends_in_use: collections.Counter[str] = collections.Counter()
+        self.sim_pool_size = int(
+            os.getenv("LLM_SIM_POOL_SIZE", str(DEFAULT_SIM_POOL_SIZE))
+        )
+
     async def restart(self):
         # Fetches the validators from the database
         # creates the general Snapshot with:
@@ -189,7 +237,7 @@ class Manager:
         return snapshot
 
     async def _get_snap_from_validators(
-        self, validators: list[domain.Validator]
+        self, validators: list[domain.Validator], sim: bool = False
     ) -> Snapshot:
         current_validators: list[SingleValidatorSnapshot] = []
         has_multiple_validators = len(validators) > 1
@@ -232,13 +280,26 @@ class Manager:
                 val.llmprovider.plugin = (
                     "openai-compatible"  # so genvm thinks it is an implemented plugin
                 )
-            if has_multiple_validators:
-                fallback_validator = select_random_different_validator(val, validators)
-                if fallback_validator:
-                    host_data["fallback_llm_id"] = f"node-{fallback_validator.address}"
-                    val.fallback_validator = fallback_validator.address
+            if sim:
+                host_data["studio_llm_id"] = _sim_llm_id(val)
 
             current_validators.append(SingleValidatorSnapshot(val, host_data))
+
+        if has_multiple_validators:
+            llm_ids = {
+                node.validator.address: node.genvm_host_data["studio_llm_id"]
+                for node in current_validators
+            }
+            for node in current_validators:
+                fallback_validator = select_random_different_validator(
+                    node.validator, validators
+                )
+                if fallback_validator:
+                    node.genvm_host_data["fallback_llm_id"] = llm_ids[
+                        fallback_validator.address
+                    ]
+                    node.validator.fallback_validator = fallback_validator.address
+
         return Snapshot(
             nodes=current_validators,
         )
@@ -257,18 +318,73 @@ class Manager:
 
     @contextlib.asynccontextmanager
     async def temporal_snapshot(self, validators: list[domain.Validator]):
-        # Capture original snapshot while holding lock to avoid race condition
-        async with self._restart_llm_lock:
-            original_snapshot = deepcopy(self._cached_snapshot)
+        """
+        Snapshot of ad-hoc validators (sim_config) for a single execution.
+
+        Their backends are added to the running LLM module next to the
+        registry validators and kept warm for later calls with the same
+        provider configs, so the module only restarts for configs it has not
+        seen recently and concurrent executions keep their own backends.
+        """
+        temp_snapshot = await self._get_snap_from_validators(validators, sim=True)
+        backends = {
+            node.genvm_host_data["studio_llm_id"]: _llm_backend(node.validator)
+            for node in temp_snapshot.nodes
+        }
 
-        temp_snapshot = await self._get_snap_from_validators(validators)
-        await self._change_providers_from_snapshot(temp_snapshot)
+        async with self._restart_llm_lock:
+            self._sim_backends_in_use.update(backends.keys())
+            try:
+                await self._load_sim_backends_locked(backends)
+            except BaseException:
+                self._release_sim_backends(backends)
+                raise
 
         try:
             yield deepcopy(temp_snapshot)
         finally:
-            if original_snapshot is not None:
-                await self._change_providers_from_snapshot(original_snapshot)
+            self._release_sim_backends(backends)
+
+    def _release_sim_backends(self, llm_ids: typing.Iterable[str]):
+        for llm_id in llm_ids:
+            self._sim_backends_in_use[llm_id] -= 1
+            if self._sim_backends_in_use[llm_id] <= 0:
+                del self._sim_backends_in_use[llm_id]
+
+    async def _load_sim_backends_locked(self, backends: dict[str, LLMConfig]):
+        missing = [llm_id for llm_id in backends if llm_id not in self._sim_backends]
+        for llm_id, backend in backends.items():
+            self._sim_backends[llm_id] = backend
+            self._sim_backends.move_to_end(llm_id)
+        if not missing:
+            return
+
+        idle = [
+            llm_id
+            for llm_id in self._sim_backends
+            if not self._sim_backends_in_use[llm_id]
+        ]
+        for llm_id in idle[: max(0, len(self._sim_backends) - self.sim_pool_size)]:
+            del self._sim_backends[llm_id]
+
+        logger.info(
+            f"Loading {len(missing)} simulation LLM backend(s), "
+            f"{len(self._sim_backends)} kept warm"
+        )
+        try:
+            await self._restart_llm_module_locked()
+        except Exception:
+            for llm_id in missing:
+                self._sim_backends.pop(llm_id, None)
+            raise
+
+    async def _restart_llm_module_locked(self):
+        await self.genvm_manager.stop_module("llm")
+        new_llm_config = deepcopy(self.genvm_manager.llm_config_base)
+        new_llm_config["backends"] = {**self._registry_backends, **self._sim_backends}
+        await self.genvm_manager.start_module(
+            "llm", new_llm_config, {"allow_empty_backends": True}
+        )
 
     async def _change_providers_from_snapshot(self, snap: Snapshot):
         async with self._restart_llm_lock:
@@ -278,47 +394,24 @@ class Manager:
         new_providers: dict[str, LLMConfig] = {}
 
         for i in snap.nodes:
-            key_env = i.validator.llmprovider.plugin_config["api_key_env_var"]
-
             logger.info(
                 f"Configuring validator {i.validator.llmprovider} with LLM provider:"
             )
-
-            use_max_completion_tokens = i.validator.llmprovider.config.get(
-                "use_max_completion_tokens", False
-            )
-
-            new_providers[f"node-{i.validator.address}"] = {
-                "models": {
-                    i.validator.llmprovider.model: {
-                        "supports_json": True,
-                        "meta": {
-                            "config": i.validator.llmprovider.config,
-                        },
-                        "use_max_completion_tokens": use_max_completion_tokens,
-                    }
-                },
-                "enabled": True,
-                "host": i.validator.llmprovider.plugin_config["api_url"],
-                "provider": i.validator.llmprovider.plugin,
-                "key": f"${{ENV[{key_env}]}}",
-            }
+            new_providers[f"node-{i.validator.address}"] = _llm_backend(i.validator)
 
         # Invalidate snapshot only after building config, not before.
         # If start_module fails, we preserve the previous snapshot so the
         # worker can keep processing transactions instead of going idle.
         previous_snapshot = self._cached_snapshot
+        previous_providers = self._registry_backends
         self._cached_snapshot = None
+        self._registry_backends = new_providers
         try:
-            await self.genvm_manager.stop_module("llm")
-            new_llm_config = deepcopy(self.genvm_manager.llm_config_base)
-            new_llm_config["backends"] = new_providers
-            await self.genvm_manager.start_module(
-                "llm", new_llm_config, {"allow_empty_backends": True}
-            )
+            await self._restart_llm_module_locked()
         except Exception:
             # Restore previous snapshot so the worker isn't permanently broken
             self._cached_snapshot = previous_snapshot
+            self._registry_backends = previous_providers
             logger.exception(
                 "Failed to restart LLM module — restoring previous snapshot"
             )
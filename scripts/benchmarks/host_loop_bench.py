@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import json
+import socket
+import threading
+import time
+from statistics import mean
+
+
+class NoopLogger:
+    def trace(self, *args, **kwargs):
+        pass
+
+    def debug(self, *args, **kwargs):
+        pass
+
+
+class BenchCtx:
+    logger = NoopLogger()
+
+    def __init__(self):
+        self.stats = {}
+
+    def add_stat(self, key, value):
+        self.stats[key] = value
+
+
+class ZeroValues(dict):
+    def __missing__(self, le):
+        self[le] = bytes(le)
+        return self[le]
+
+
+def make_handler(base_host, sock: socket.socket):
+    values = ZeroValues()
+
+    class Handler(base_host.IHost):
+        async def loop_enter(self, cancellation):
+            return sock
+
+        async def storage_read(self, mode, account, slot, index, le):
+            return values[le]
+
+        async def consume_gas(self, gas):
+            pass
+
+        async def eth_call(self, account, calldata):
+            return calldata
+
+        async def get_balance(self, account):
+            return 0
+
+        async def remaining_fuel_as_gen(self):
+            return 0
+
+        async def notify_nondet_disagreement(self, call_no):
+            pass
+
+    return Handler()
+
+
+def recv_exact(sock: socket.socket, le: int) -> None:
+    remaining = le
+    while remaining:
+        chunk = sock.recv(min(remaining, 1 << 20))
+        if not chunk:
+            raise ConnectionResetError()
+        remaining -= len(chunk)
+
+
+def fake_genvm(
+    base_host, host_fns, public_abi, sock, reads: int, read_len: int, batch: int
+):
+    """Issue storage reads like GenVM does: `batch` requests, then their replies."""
+    request = (
+        bytes([host_fns.Methods.STORAGE_READ, public_abi.StorageType.DEFAULT])
+        + b"\x01" * base_host.ACCOUNT_ADDR_SIZE
+        + b"\x02" * base_host.SLOT_ID_SIZE
+        + (0).to_bytes(4, "little")
+        + read_len.to_bytes(4, "little")
+    )
+    done = 0
+    while done < reads:
+        n = min(batch, reads - done)
+        sock.sendall(request * n)
+        recv_exact(sock, n * (1 + read_len))
+        done += n
+    sock.sendall(bytes([host_fns.Methods.NOTIFY_FINISHED]))
+    recv_exact(sock, 1)
+
+
+async def run_once(reads: int, read_len: int, batch: int) -> dict:
+    from backend.node.genvm.origin import base_host, host_fns, public_abi
+
+    host_sock, peer_sock = socket.socketpair()
+    host_sock.setblocking(False)
+    peer = threading.Thread(
+        target=fake_genvm,
+        args=(base_host, host_fns, public_abi, peer_sock, reads, read_len, batch),
+    )
+    ctx = BenchCtx()
+    try:
+        started = time.perf_counter()
+        peer.start()
+        await base_host.host_loop(
+            make_handler(base_host, host_sock), asyncio.Event(), ctx=ctx
+        )
+        elapsed = time.perf_counter() - started
+        peer.join()
+    finally:
+        host_sock.close()
+        peer_sock.close()
+    return {
+        "elapsed_s": elapsed,
+        "handling_ms": ctx.stats.get("host_total_handling_time_ms", 0),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--executions", type=int, default=5)
+    parser.add_argument("--reads", type=int, default=50_000)
+    args = parser.parse_args()
+
+    scenarios = [
+        {"name": "small_slots_request_response", "read_len": 32, "batch": 1},
+        {"name": "small_slots_pipelined", "read_len": 32, "batch": 64},
+        {"name": "medium_values_pipelined", "read_len": 512, "batch": 64},
+        {"name": "large_values_request_response", "read_len": 131072, "batch": 1},
+    ]
+
+    results = []
+    for scenario in scenarios:
+        reads = args.reads
+        if scenario["read_len"] > 4096:
+            reads = max(1, reads // 100)
+        runs = [
+            asyncio.run(run_once(reads, scenario["read_len"], scenario["batch"]))
+            for _ in range(args.executions)
+        ]
+        elapsed = [r["elapsed_s"] for r in runs]
+        results.append(
+            {
+                "scenario": scenario["name"],
+                "reads": reads,
+                "read_len": scenario["read_len"],
+                "mean_s": round(mean(elapsed), 4),
+                "best_s": round(min(elapsed), 4),
+                "us_per_read": round(min(elapsed) / reads * 1e6, 2),
+                "mean_handling_ms": round(mean(r["handling_ms"] for r in runs), 1),
+            }
+        )
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
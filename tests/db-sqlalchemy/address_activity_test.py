@@ -0,0 +1,109 @@
+from sqlalchemy import text
+
+from backend.database_handler.address_activity import (
+    find_address_activity_drift,
+    repair_address_activity,
+)
+from backend.database_handler.transactions_processor import (
+    TransactionStatus,
+    TransactionsProcessor,
+)
+
+SENDER = "0x9F0e84243496AcFB3Cd99D02eA59673c05901501"
+CONTRACT = "0xAcec3A6d871C25F591aBd4fC24054e524BBbF794"
+OTHER_CONTRACT = "0x5B38Da6a701c568545dCfcB03FcB875f56beddC4"
+
+_tx_counter = 0
+
+
+def _insert(tp: TransactionsProcessor, **overrides) -> str:
+    global _tx_counter
+    _tx_counter += 1
+    kwargs = dict(
+        from_address=SENDER,
+        to_address=CONTRACT,
+        data={"key": "value"},
+        value=0,
+        type=2,
+        nonce=0,
+        leader_only=True,
+        config_rotation_rounds=3,
+        triggered_by_hash=None,
+        transaction_hash=f"0x{_tx_counter:064x}",
+    )
+    kwargs.update(overrides)
+    tx_hash = tp.insert_transaction(**kwargs)
+    tp.session.commit()
+    return tx_hash
+
+
+def test_insert_increments_counters(tp: TransactionsProcessor):
+    _insert(tp)
+    _insert(tp)
+    _insert(tp, to_address=OTHER_CONTRACT)
+
+    assert tp.get_transaction_count(SENDER) == 3
+    assert tp.get_transaction_count(SENDER.lower()) == 3
+    assert tp.get_pending_transaction_count_for_address(CONTRACT) == 2
+    assert tp.get_pending_transaction_count_for_address(OTHER_CONTRACT) == 1
+    assert tp.get_transaction_count(CONTRACT) == 0
+    assert find_address_activity_drift(tp.session) == []
+
+
+def test_status_change_updates_pending_count(tp: TransactionsProcessor):
+    first = _insert(tp)
+    _insert(tp)
+
+    tp.update_transaction_status(first, TransactionStatus.ACTIVATED)
+    tp.session.commit()
+    assert tp.get_pending_transaction_count_for_address(CONTRACT) == 1
+
+    # Raw SQL status writes (as used by the consensus worker) are covered too.
+    tp.session.execute(
+        text("UPDATE transactions SET status = 'PENDING' WHERE hash = :hash"),
+        {"hash": first},
+    )
+    tp.session.commit()
+    assert tp.get_pending_transaction_count_for_address(CONTRACT) == 2
+    # Status changes never move the nonce.
+    assert tp.get_transaction_count(SENDER) == 2
+
+
+def test_delete_decrements_counters(tp: TransactionsProcessor):
+    tx_hash = _insert(tp)
+    _insert(tp)
+
+    tp.session.execute(
+        text("DELETE FROM transactions WHERE hash = :hash"), {"hash": tx_hash}
+    )
+    tp.session.commit()
+
+    assert tp.get_transaction_count(SENDER) == 1
+    assert tp.get_pending_transaction_count_for_address(CONTRACT) == 1
+    assert find_address_activity_drift(tp.session) == []
+
+
+def test_drift_is_detected_and_repaired(tp: TransactionsProcessor):
+    _insert(tp)
+    _insert(tp)
+    tp.session.execute(
+        text("UPDATE address_activity SET sent_count = 7 WHERE address = :address"),
+        {"address": SENDER},
+    )
+    tp.session.commit()
+
+    drift = find_address_activity_drift(tp.session)
+    assert drift == [
+        {
+            "address": SENDER,
+            "stored_sent_count": 7,
+            "actual_sent_count": 2,
+            "stored_pending_count": 0,
+            "actual_pending_count": 0,
+        }
+    ]
+
+    assert repair_address_activity(tp.session) == 1
+    tp.session.commit()
+    assert find_address_activity_drift(tp.session) == []
+    assert tp.get_transaction_count(SENDER) == 2
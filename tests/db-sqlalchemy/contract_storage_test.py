@@ -0,0 +1,133 @@
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.database_handler.contract_processor import ContractProcessor
+from backend.database_handler.contract_snapshot import ContractSnapshot
+from backend.database_handler.contract_storage import ContractStorage, is_slot_backed
+from backend.database_handler.models import ContractStorageSlot, CurrentState
+
+CONTRACT_ADDRESS = "0xslot_storage_contract"
+
+
+@pytest.fixture
+def slot_storage(monkeypatch):
+    monkeypatch.setenv("CONTRACT_STORAGE_BACKEND", "slots")
+
+
+def _add_contract(session: Session, states: dict):
+    session.add(CurrentState(id=CONTRACT_ADDRESS, data={"state": states}))
+    session.commit()
+
+
+def _slot_rows(session: Session) -> dict[tuple[str, str], tuple[str, int]]:
+    rows = session.execute(
+        select(ContractStorageSlot).where(
+            ContractStorageSlot.contract_address == CONTRACT_ADDRESS
+        )
+    ).scalars()
+    return {(row.state, row.slot): (row.value, row.version) for row in rows}
+
+
+def test_first_write_moves_blob_to_slot_rows(session: Session, slot_storage):
+    _add_contract(session, {"accepted": {"a": "1", "b": "2"}, "finalized": {"a": "1"}})
+
+    ContractProcessor(session).update_contract_state(
+        CONTRACT_ADDRESS, accepted_state={"a": "1", "b": "3"}
+    )
+
+    contract = session.query(CurrentState).filter_by(id=CONTRACT_ADDRESS).one()
+    assert is_slot_backed(contract.data)
+    assert _slot_rows(session) == {
+        ("accepted", "a"): ("1", 1),
+        ("accepted", "b"): ("3", 1),
+        ("finalized", "a"): ("1", 1),
+    }
+    assert ContractSnapshot(CONTRACT_ADDRESS, session).states == {
+        "accepted": {"a": "1", "b": "3"},
+        "finalized": {"a": "1"},
+    }
+
+
+def test_only_changed_slots_are_rewritten(session: Session, slot_storage):
+    _add_contract(session, {"accepted": {"a": "1", "b": "2"}, "finalized": {}})
+    processor = ContractProcessor(session)
+    processor.update_contract_state(
+        CONTRACT_ADDRESS, accepted_state={"a": "1", "b": "2"}
+    )
+
+    processor.update_contract_state(
+        CONTRACT_ADDRESS, accepted_state={"a": "1", "c": "4"}
+    )
+
+    # "a" is untouched (still version 1), "b" is deleted, "c" is new
+    assert _slot_rows(session) == {
+        ("accepted", "a"): ("1", 1),
+        ("accepted", "c"): ("4", 2),
+    }
+
+
+def test_write_based_on_current_snapshot_sends_only_changed_slots(
+    session: Session, slot_storage
+):
+    _add_contract(session, {"accepted": {"a": "1", "b": "2"}, "finalized": {}})
+    processor = ContractProcessor(session)
+    processor.update_contract_state(
+        CONTRACT_ADDRESS, accepted_state={"a": "1", "b": "2"}
+    )
+    snapshot = ContractSnapshot(CONTRACT_ADDRESS, session)
+    assert snapshot.storage_version == 1
+
+    with patch.object(ContractStorage, "replace_state") as replace_state:
+        processor.update_contract_state(
+            CONTRACT_ADDRESS, accepted_state={"a": "1", "c": "4"}, based_on=snapshot
+        )
+    replace_state.assert_not_called()
+    assert _slot_rows(session) == {
+        ("accepted", "a"): ("1", 1),
+        ("accepted", "c"): ("4", 2),
+    }
+
+    # The snapshot is now a version behind, so it is not used as a base.
+    processor.update_contract_state(
+        CONTRACT_ADDRESS, accepted_state={"d": "5"}, based_on=snapshot
+    )
+    assert _slot_rows(session) == {("accepted", "d"): ("5", 3)}
+
+
+def test_point_read_loads_only_requested_slots(session: Session, slot_storage):
+    _add_contract(session, {"accepted": {"a": "1", "b": "2"}, "finalized": {}})
+    ContractProcessor(session).update_contract_state(
+        CONTRACT_ADDRESS, finalized_state={"a": "1"}
+    )
+
+    snapshot = ContractSnapshot(CONTRACT_ADDRESS, session, slots=["a"])
+
+    assert snapshot.states == {"accepted": {"a": "1"}, "finalized": {"a": "1"}}
+
+
+def test_jsonb_write_moves_contract_back_to_blob(
+    session: Session, slot_storage, monkeypatch
+):
+    _add_contract(session, {"accepted": {"a": "1"}, "finalized": {"a": "0"}})
+    processor = ContractProcessor(session)
+    processor.update_contract_state(CONTRACT_ADDRESS, accepted_state={"a": "2"})
+
+    monkeypatch.setenv("CONTRACT_STORAGE_BACKEND", "jsonb")
+    processor.update_contract_state(CONTRACT_ADDRESS, finalized_state={"a": "2"})
+
+    contract = session.query(CurrentState).filter_by(id=CONTRACT_ADDRESS).one()
+    assert contract.data == {"state": {"accepted": {"a": "2"}, "finalized": {"a": "2"}}}
+    assert _slot_rows(session) == {}
+
+
+def test_reset_contract_clears_slot_rows(session: Session, slot_storage):
+    _add_contract(session, {"accepted": {"a": "1"}, "finalized": {}})
+    processor = ContractProcessor(session)
+    processor.update_contract_state(CONTRACT_ADDRESS, accepted_state={"a": "2"})
+
+    assert processor.reset_contract(CONTRACT_ADDRESS)
+
+    assert _slot_rows(session) == {}
@@ -7,6 +7,7 @@ the explorer endpoints won't break.
 
 import base64
 
+import pytest
 from sqlalchemy.orm import Session
 
 from backend.database_handler.models import (
@@ -282,6 +283,49 @@ class TestGetAllTransactionsPaginated:
         )
         assert parent_row["triggered_count"] == 2
 
+    def test_cursor_walks_all_rows_once(self, session: Session):
+        # Same transaction -> same created_at, so hash breaks the tie
+        created = {_make_tx(session).hash for _ in range(5)}
+        session.commit()
+
+        seen = []
+        cursor = None
+        while True:
+            result = queries.get_all_transactions_paginated(
+                session, limit=2, cursor=cursor
+            )
+            seen.extend(tx["hash"] for tx in result["transactions"])
+            cursor = result["pagination"]["nextCursor"]
+            if cursor is None:
+                break
+
+        assert len(seen) == 5
+        assert set(seen) == created
+
+    def test_invalid_cursor_raises(self, session: Session):
+        with pytest.raises(ValueError):
+            queries.get_all_transactions_paginated(session, cursor="not-a-cursor")
+
+    def test_approximate_count_with_filter(self, session: Session):
+        _make_tx(session, status=TransactionStatus.PENDING)
+        _make_tx(session, status=TransactionStatus.FINALIZED)
+        session.commit()
+
+        result = queries.get_all_transactions_paginated(
+            session, status="PENDING", count_mode="approximate"
+        )
+        assert result["pagination"]["total"] == 1
+        assert result["pagination"]["totalIsApproximate"] is False
+
+    def test_count_none_skips_total(self, session: Session):
+        _make_tx(session)
+        session.commit()
+
+        result = queries.get_all_transactions_paginated(session, count_mode="none")
+        assert result["pagination"]["total"] is None
+        assert result["pagination"]["totalPages"] is None
+        assert len(result["transactions"]) == 1
+
 
 # ---------------------------------------------------------------------------
 # Single transaction with relations
@@ -314,6 +358,21 @@ class TestGetTransactionWithRelations:
         assert len(result["triggeredTransactions"]) == 1
         assert result["triggeredTransactions"][0]["hash"] == grandchild.hash
 
+    def test_leader_receipt_contract_state_is_not_returned(self, session: Session):
+        receipt = {"result": "AA==", "contract_state": {"slot": "x" * 64}}
+        tx = _make_tx(
+            session,
+            consensus_data={"leader_receipt": [receipt], "votes": {"0x1": "agree"}},
+        )
+        session.commit()
+
+        result = queries.get_transaction_with_relations(session, tx.hash)
+
+        assert result["transaction"]["consensus_data"] == {
+            "leader_receipt": [{"result": "AA=="}],
+            "votes": {"0x1": "agree"},
+        }
+
 
 # ---------------------------------------------------------------------------
 # Contracts (state)
@@ -3,7 +3,13 @@ import pytest
 from sqlalchemy.orm import Session
 
 from backend.database_handler.snapshot_manager import SnapshotManager
-from backend.database_handler.models import Snapshot
+from backend.database_handler.models import (
+    CurrentState,
+    Snapshot,
+    SnapshotChunk,
+    Transactions,
+    TransactionStatus,
+)
 
 
 @pytest.fixture
@@ -15,8 +21,9 @@ def test_create_snapshot(snapshot_manager: SnapshotManager):
     snapshot = snapshot_manager.create_snapshot()
     assert isinstance(snapshot, Snapshot)
     assert snapshot.snapshot_id == 1
-    assert snapshot.state_data is not None
-    assert snapshot.transaction_data is not None
+    assert snapshot.base_snapshot_id is None
+    assert snapshot.state_count == 0
+    assert snapshot.transaction_count == 0
     assert isinstance(snapshot.created_at, datetime)
 
 
@@ -111,3 +118,158 @@ def test_snapshot_sequence_after_deletion(
     snapshots = session.query(Snapshot).order_by(Snapshot.snapshot_id).all()
     assert len(snapshots) == 3  # Should have 3 snapshots (1, 3, 4)
     assert [s.snapshot_id for s in snapshots] == [1, 3, 4]  # Verify IDs are correct
+
+
+def _add_transaction(session: Session, tx_hash: str, **overrides) -> Transactions:
+    fields = dict(
+        status=TransactionStatus.PENDING,
+        hash=tx_hash,
+        from_address="0x123",
+        to_address="0x456",
+        data={},
+        consensus_data={},
+        value=10,
+        type=0,
+        gaslimit=0,
+        input_data={},
+        nonce=0,
+        r=0,
+        s=0,
+        v=0,
+        leader_only=False,
+        appeal_failed=0,
+        consensus_history={},
+        timestamp_appeal=0,
+        appeal_processing_time=0,
+        contract_snapshot={},
+        config_rotation_rounds=0,
+        appealed=False,
+        appeal_undetermined=False,
+        timestamp_awaiting_finalization=0,
+        num_of_initial_validators=5,
+        last_vote_timestamp=0,
+        rotation_count=0,
+        appeal_leader_timeout=False,
+        leader_timeout_validators=None,
+        appeal_validators_timeout=False,
+    )
+    fields.update(overrides)
+    tx = Transactions(**fields)
+    session.add(tx)
+    return tx
+
+
+def _seed(session: Session, count: int):
+    for i in range(count):
+        session.add(
+            CurrentState(id=f"0x{i:040x}", data={"state": {"accepted": {}}}, balance=i)
+        )
+        _add_transaction(session, f"0x{i:064x}", nonce=i)
+    session.commit()
+
+
+def test_snapshot_is_written_in_chunks(session: Session):
+    _seed(session, 5)
+    progress = []
+    manager = SnapshotManager(session, chunk_rows=2)
+
+    snapshot = manager.create_snapshot(progress=lambda *args: progress.append(args))
+
+    assert snapshot.state_count == 5
+    assert snapshot.transaction_count == 5
+    chunks = (
+        session.query(SnapshotChunk)
+        .filter_by(kind="transaction")
+        .order_by(SnapshotChunk.seq)
+        .all()
+    )
+    assert [chunk.row_count for chunk in chunks] == [2, 2, 1]
+    assert progress[-1] == ("create.transaction", 5, 5)
+
+
+def test_restore_round_trips_rows_and_links(session: Session):
+    _seed(session, 3)
+    child = _add_transaction(
+        session, "0x" + "c" * 64, status=TransactionStatus.ACCEPTED
+    )
+    child.triggered_by = session.get(Transactions, f"0x{0:064x}")
+    session.commit()
+    session.expire_all()
+    assert session.get(Transactions, "0x" + "c" * 64).triggered_by_hash == f"0x{0:064x}"
+    manager = SnapshotManager(session, chunk_rows=2)
+    snapshot = manager.create_snapshot()
+
+    session.query(Transactions).filter_by(hash="0x" + "c" * 64).delete()
+    session.query(CurrentState).filter_by(id=f"0x{1:040x}").update({"balance": 99})
+    _add_transaction(session, "0x" + "d" * 64)
+    session.commit()
+
+    assert manager.restore_snapshot(snapshot.snapshot_id) is True
+    session.expire_all()
+
+    assert session.query(Transactions).count() == 4
+    assert session.query(Transactions).filter_by(hash="0x" + "d" * 64).count() == 0
+    restored = session.query(Transactions).filter_by(hash="0x" + "c" * 64).one()
+    assert restored.status == TransactionStatus.ACCEPTED
+    assert restored.triggered_by_hash == f"0x{0:064x}"
+    assert restored.created_at is not None
+    assert session.get(CurrentState, f"0x{1:040x}").balance == 1
+
+
+def test_incremental_snapshot_stores_only_changed_rows(session: Session):
+    _seed(session, 4)
+    manager = SnapshotManager(session, chunk_rows=10)
+    full = manager.create_snapshot()
+
+    session.query(Transactions).filter_by(hash=f"0x{0:064x}").update(
+        {"status": TransactionStatus.FINALIZED}
+    )
+    session.query(Transactions).filter_by(hash=f"0x{3:064x}").delete()
+    _add_transaction(session, "0x" + "e" * 64)
+    session.commit()
+
+    delta = manager.create_snapshot(incremental=True)
+
+    assert delta.base_snapshot_id == full.snapshot_id
+    assert delta.transaction_count == 4
+    delta_chunks = (
+        session.query(SnapshotChunk)
+        .filter_by(snapshot_id=delta.snapshot_id, kind="transaction")
+        .all()
+    )
+    assert sum(chunk.row_count for chunk in delta_chunks) == 2
+
+    # Drift away from both snapshots, then restore the delta.
+    session.query(Transactions).delete()
+    _add_transaction(session, "0x" + "f" * 64)
+    session.commit()
+
+    assert manager.restore_snapshot(delta.snapshot_id) is True
+    session.expire_all()
+
+    hashes = {tx.hash for tx in session.query(Transactions).all()}
+    assert hashes == {
+        f"0x{0:064x}",
+        f"0x{1:064x}",
+        f"0x{2:064x}",
+        "0x" + "e" * 64,
+    }
+    assert (
+        session.get(Transactions, f"0x{0:064x}").status == TransactionStatus.FINALIZED
+    )
+    assert session.query(CurrentState).count() == 4
+
+
+def test_restore_legacy_blob_snapshot(session: Session):
+    manager = SnapshotManager(session)
+    legacy = Snapshot(
+        state_data=manager._compress_data(
+            {"0xabc": {"data": {}, "balance": 7, "updated_at": None}}
+        ),
+        transaction_data=manager._compress_data({}),
+    )
+    session.add(legacy)
+    session.commit()
+
+    assert manager.restore_snapshot(legacy.snapshot_id) is True
+    assert session.get(CurrentState, "0xabc").balance == 7
@@ -1,8 +1,10 @@
-from sqlalchemy import text
+from sqlalchemy import event, text
 import pytest
 from unittest.mock import patch, MagicMock
 import os
+import re
 import math
+import json
 from datetime import datetime
 from web3 import Web3
 from web3.providers import BaseProvider
@@ -11,10 +13,10 @@ from backend.database_handler.transactions_processor import (
     TransactionStatus,
     TransactionsProcessor,
     TransactionAddressFilter,
+    HEAVY_TRANSACTION_COLUMNS,
 )
 from backend.consensus.types import ConsensusRound
 
-
 _tx_counter = 0
 
 
@@ -646,6 +648,197 @@ class TestGetTransactions:
         for t in txs:
             assert t["to_address"] == addr_a
 
+    def test_get_transactions_for_address_page_walks_history(self, tp):
+        sender = "0x9F0e84243496AcFB3Cd99D02eA59673c05901501"
+        other = "0x1111111111111111111111111111111111111111"
+        sent = [_make_tx(tp, from_address=sender, to_address=other) for _ in range(3)]
+        received = [
+            _make_tx(tp, from_address=other, to_address=sender) for _ in range(2)
+        ]
+        self_sent = _make_tx(tp, from_address=sender, to_address=sender)
+        _make_tx(tp, from_address=other, to_address=other)
+
+        seen, cursor = [], None
+        while True:
+            page = tp.get_transactions_for_address_page(
+                sender, TransactionAddressFilter.ALL, limit=2, cursor=cursor
+            )
+            assert len(page["transactions"]) <= 2
+            seen.extend(t["hash"] for t in page["transactions"])
+            cursor = page["nextCursor"]
+            if cursor is None:
+                break
+
+        assert sorted(seen) == sorted(sent + received + [self_sent])
+        assert len(seen) == len(set(seen))
+        assert seen == [
+            t["hash"]
+            for t in tp.get_transactions_for_address(
+                sender, TransactionAddressFilter.ALL
+            )
+        ]
+
+        page = tp.get_transactions_for_address_page(
+            sender, TransactionAddressFilter.FROM, limit=10
+        )
+        assert page["nextCursor"] is None
+        assert {t["hash"] for t in page["transactions"]} == set(sent + [self_sent])
+
+    def test_get_transactions_for_address_page_summary(self, tp):
+        address = "0xAcec3A6d871C25F591aBd4fC24054e524BBbF794"
+        tx_hash = _make_tx(tp, to_address=address, value=5)
+
+        page = tp.get_transactions_for_address_page(
+            address, TransactionAddressFilter.TO, summary=True
+        )
+
+        assert page["transactions"] == [tp.get_transaction_summary(tx_hash)]
+        assert page["nextCursor"] is None
+
+    def test_get_transactions_for_address_page_rejects_bad_cursor(self, tp):
+        with pytest.raises(ValueError):
+            tp.get_transactions_for_address_page(
+                "0xAcec3A6d871C25F591aBd4fC24054e524BBbF794",
+                TransactionAddressFilter.ALL,
+                cursor="not-a-cursor",
+            )
+
+
+class TestLeanReads:
+    @staticmethod
+    def _set_consensus_data(tp, tx_hash, consensus_data):
+        tp.session.execute(
+            text(
+                "UPDATE transactions SET consensus_data = CAST(:cd AS jsonb) "
+                "WHERE hash = :h"
+            ),
+            {"h": tx_hash, "cd": json.dumps(consensus_data)},
+        )
+        tp.session.commit()
+
+    def test_get_transaction_by_hash_strips_contract_state(self, tp):
+        tx_hash = _make_tx(tp)
+        node_config = {"address": "0xaAaAaAaaAaAaAaaAaAAAAAAAAaaaAaAaAaaAaaAa"}
+        self._set_consensus_data(
+            tp,
+            tx_hash,
+            {
+                "leader_receipt": [
+                    {
+                        "execution_result": "SUCCESS",
+                        "contract_state": {"a": "b"},
+                        "vote": "agree",
+                        "node_config": node_config,
+                    },
+                    {
+                        "execution_result": "ERROR",
+                        "contract_state": {"c": "d"},
+                        "vote": "agree",
+                        "node_config": node_config,
+                    },
+                ]
+            },
+        )
+
+        tx = tp.get_transaction_by_hash(tx_hash)
+        assert tx["consensus_data"]["leader_receipt"] == [
+            {
+                "execution_result": "SUCCESS",
+                "vote": "agree",
+                "node_config": node_config,
+            },
+            {"execution_result": "ERROR", "vote": "agree", "node_config": node_config},
+        ]
+        assert tx["txExecutionResultName"] == "FINISHED_WITH_RETURN"
+        assert tx["last_leader"] == node_config["address"]
+
+        tx = tp.get_transaction_by_hash(
+            tx_hash, sim_config={"include_contract_state": True}
+        )
+        assert tx["consensus_data"]["leader_receipt"][1]["contract_state"] == {"c": "d"}
+
+    def test_get_transaction_summary(self, tp):
+        tx_hash = _make_tx(tp, value=7)
+        summary = tp.get_transaction_summary(tx_hash)
+        assert summary["hash"] == tx_hash
+        assert summary["status"] == TransactionStatus.PENDING.value
+        assert summary["value"] == 7
+        assert "data" not in summary
+        assert tp.get_transaction_summary("0x" + "ee" * 32) is None
+
+    def test_lean_reads_match_full_derived_fields(self, tp):
+        tx_hash = _make_tx(
+            tp, data={"calldata": "AA==", "fee_accounting": {"policy_snapshot": {}}}
+        )
+        self._set_consensus_data(
+            tp,
+            tx_hash,
+            {
+                "leader_receipt": {
+                    "execution_result": "SUCCESS",
+                    "result": {"raw": "AAE="},
+                    "contract_state": {"a": "b"},
+                }
+            },
+        )
+        address = "0xAcec3A6d871C25F591aBd4fC24054e524BBbF794"
+        full = next(
+            t
+            for t in tp.get_transactions_for_address(
+                address, TransactionAddressFilter.TO
+            )
+            if t["hash"] == tx_hash
+        )
+        lean = next(
+            t
+            for t in tp.get_transactions_for_address(
+                address, TransactionAddressFilter.TO, full=False
+            )
+            if t["hash"] == tx_hash
+        )
+
+        for key in HEAVY_TRANSACTION_COLUMNS:
+            assert key not in lean
+            full.pop(key)
+        assert lean == full
+
+        studio = tp.get_studio_transaction_by_hash(tx_hash, full=False)
+        assert studio["tx_id"] == tx_hash
+        assert studio["fees"] == full["fees"]
+        assert studio["result"] == full["result"]
+        assert "consensus_data" not in studio
+
+    def test_lean_reads_load_only_triggered_hashes(self, tp):
+        parent_hash = _make_tx(tp)
+        child_hash = _make_tx(tp, triggered_by_hash=parent_hash)
+        tp.session.expunge_all()
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = tp.session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            studio = tp.get_studio_transaction_by_hash(parent_hash, full=False)
+            page = tp.get_transactions_for_address_page(
+                "0xAcec3A6d871C25F591aBd4fC24054e524BBbF794",
+                TransactionAddressFilter.TO,
+                full=False,
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert studio["triggered_transactions"] == [child_hash]
+        lean_parent = next(t for t in page["transactions"] if t["hash"] == parent_hash)
+        assert lean_parent["triggered_transactions"] == [child_hash]
+        # Derived fields may read the heavy columns in SQL, but no loader
+        # may select them as entity columns.
+        for statement in statements:
+            for column in HEAVY_TRANSACTION_COLUMNS:
+                assert not re.search(rf"AS transactions(_\d+)?_{column}\b", statement)
+
 
 class TestContractSnapshot:
     def test_set_transaction_contract_snapshot(self, tp):
@@ -25,6 +25,7 @@ def _make_snapshot(states=None):
 def _make_transaction(*, tx_type=TransactionType.RUN_CONTRACT, contract_snapshot=None):
     """Build a minimal Transaction for context creation."""
     tx = Mock(spec=Transaction)
+    tx.hash = "0xtx"
     tx.type = tx_type
     tx.to_address = "0xcontract"
     tx.contract_snapshot = contract_snapshot
@@ -243,6 +243,23 @@ class TestContractEffects:
             "0xcontract", finalized_state={"key": "val"}
         )
 
+    async def test_update_contract_state_passes_transaction_snapshot(self):
+        ctx = _make_context()
+        ctx.contract_snapshot = MagicMock(name="contract_snapshot")
+        executor = EffectExecutor(ctx)
+        await executor.execute(
+            [
+                UpdateContractStateEffect(
+                    address="0xcontract", accepted_state={"key": "val"}
+                )
+            ]
+        )
+        ctx.contract_processor.update_contract_state.assert_called_once_with(
+            "0xcontract",
+            accepted_state={"key": "val"},
+            based_on=ctx.contract_snapshot,
+        )
+
 
 @pytest.mark.asyncio
 class TestAppealEffects:
@@ -417,6 +417,25 @@ class TransactionsProcessorMock:
 
         self.commit(transaction)
 
+    def add_state_timestamps(self, transaction_hash: str, markers: dict[str, float]):
+        """
+        Add several state timestamps at once.
+
+        Args:
+            transaction_hash (str): Hash of the transaction.
+            markers (dict[str, float]): State name -> epoch seconds.
+        """
+        transaction = self.get_transaction_by_hash(transaction_hash)
+
+        if not transaction.get("consensus_history"):
+            transaction["consensus_history"] = {}
+
+        transaction["consensus_history"].setdefault("current_monitoring", {}).update(
+            markers
+        )
+
+        self.commit(transaction)
+
 
 class SnapshotMock:
     def __init__(self, transactions_processor: TransactionsProcessorMock):
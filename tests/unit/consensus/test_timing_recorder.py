@@ -0,0 +1,143 @@
+"""
+Tests for buffered consensus timing markers.
+
+State handlers record `current_monitoring` markers on the context's
+ConsensusTimingRecorder; they are written in one statement at the next effect
+batch, after a flush interval, or when the state exits.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.consensus import timing
+from backend.consensus.base import _handle_state
+from backend.consensus.effect_executor import EffectExecutor
+from backend.consensus.effects import StatusUpdateEffect
+from backend.consensus.timing import ConsensusTimingRecorder
+from backend.database_handler.transactions_processor import TransactionsProcessor
+
+
+class TestConsensusTimingRecorder:
+    def test_markers_are_buffered_until_flush(self):
+        tp = MagicMock()
+        recorder = ConsensusTimingRecorder(tp, "0x1", flush_interval=60)
+
+        recorder.record("COMMITTING.VALIDATOR_0_START.attempt_0")
+        recorder.record("COMMITTING.VALIDATOR_0_END.attempt_0")
+        tp.add_state_timestamps.assert_not_called()
+
+        recorder.flush()
+
+        tp.add_state_timestamps.assert_called_once()
+        tx_hash, markers = tp.add_state_timestamps.call_args.args
+        assert tx_hash == "0x1"
+        assert list(markers) == [
+            "COMMITTING.VALIDATOR_0_START.attempt_0",
+            "COMMITTING.VALIDATOR_0_END.attempt_0",
+        ]
+        assert recorder.pending == {}
+
+        recorder.flush()
+        tp.add_state_timestamps.assert_called_once()
+
+    def test_flushes_when_oldest_marker_exceeds_interval(self):
+        tp = MagicMock()
+        recorder = ConsensusTimingRecorder(tp, "0x1", flush_interval=5)
+
+        with patch.object(timing.time, "time", side_effect=[100.0, 103.0, 105.0]):
+            recorder.record("A")
+            recorder.record("B")
+            tp.add_state_timestamps.assert_not_called()
+            recorder.record("C")
+
+        tp.add_state_timestamps.assert_called_once_with(
+            "0x1", {"A": 100.0, "B": 103.0, "C": 105.0}
+        )
+
+    def test_zero_interval_writes_immediately(self):
+        tp = MagicMock()
+        recorder = ConsensusTimingRecorder(tp, "0x1", flush_interval=0)
+
+        recorder.record("A")
+
+        tp.add_state_timestamps.assert_called_once()
+
+    def test_interval_from_env(self):
+        with patch.dict(
+            "os.environ", {"CONSENSUS_TIMING_FLUSH_INTERVAL_SECONDS": "2.5"}
+        ):
+            assert ConsensusTimingRecorder(MagicMock(), "0x1").flush_interval == 2.5
+
+    def test_close_swallows_write_errors(self):
+        tp = MagicMock()
+        tp.add_state_timestamps.side_effect = RuntimeError("db down")
+        recorder = ConsensusTimingRecorder(tp, "0x1", flush_interval=60)
+        recorder.record("A")
+
+        recorder.close()
+
+
+class TestFlushPoints:
+    @pytest.mark.asyncio
+    async def test_state_exit_flushes_even_on_error(self):
+        tp = MagicMock()
+        context = SimpleNamespace(timing=ConsensusTimingRecorder(tp, "0x1", 60))
+
+        async def handle(ctx):
+            ctx.timing.record("PROPOSING.LEADER.EXEC_START")
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await _handle_state(SimpleNamespace(handle=handle), context)
+
+        tp.add_state_timestamps.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_effect_batch_flushes_before_writes(self):
+        tp = MagicMock()
+        call_order = []
+        tp.add_state_timestamps.side_effect = lambda *a: call_order.append("timing")
+        tp.update_transaction_status.side_effect = lambda *a: call_order.append(
+            "status"
+        )
+        msg_handler = MagicMock()
+        msg_handler.send_message_async = AsyncMock()
+        context = SimpleNamespace(
+            transactions_processor=tp,
+            msg_handler=msg_handler,
+            consensus_service=MagicMock(),
+            contract_processor=MagicMock(),
+            timing=ConsensusTimingRecorder(tp, "0x1", 60),
+        )
+        context.timing.record("COMMITTING.VALIDATORS_EXECUTION_END")
+
+        await EffectExecutor(context).execute(
+            [StatusUpdateEffect(tx_hash="0x1", new_status="REVEALING")]
+        )
+
+        assert call_order == ["timing", "status"]
+
+
+class TestAddStateTimestamps:
+    def test_single_statement_for_all_markers(self):
+        processor = TransactionsProcessor(MagicMock())
+        processor.session = MagicMock()
+        processor.session.execute.return_value.rowcount = 1
+
+        processor.add_state_timestamps("0x1", {"A": 1.0, "B": 2.0})
+
+        processor.session.execute.assert_called_once()
+        params = processor.session.execute.call_args.args[1]
+        assert params["hash"] == "0x1"
+        assert params["markers"] == '{"A": 1.0, "B": 2.0}'
+        processor.session.commit.assert_called_once()
+
+    def test_no_markers_is_a_no_op(self):
+        processor = TransactionsProcessor(MagicMock())
+        processor.session = MagicMock()
+
+        processor.add_state_timestamps("0x1", {})
+
+        processor.session.execute.assert_not_called()
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from backend.consensus.base import CommittingState
+from backend.consensus.timing import ConsensusTimingRecorder
 from backend.database_handler.types import ConsensusData
 from backend.node.genvm.error_codes import GenVMInternalError, GenVMErrorCode
 from backend.node.genvm.origin.public_abi import ResultCode
@@ -100,6 +101,7 @@ async def test_committing_times_out_hung_validator_without_blocking(monkeypatch)
         ],
         consensus_data=ConsensusData(votes={}, leader_receipt=None, validators=[]),
         validation_results=[],
+        timing=ConsensusTimingRecorder(tx_processor, "tx-hash"),
     )
 
     start = asyncio.get_running_loop().time()
@@ -125,10 +127,12 @@ async def test_committing_times_out_hung_validator_without_blocking(monkeypatch)
     ]
     assert timeout_receipt.genvm_result["raw_error"]["fatal"] is False
 
+    context.timing.flush()
     timeout_timestamps = [
-        call.args[1]
-        for call in tx_processor.add_state_timestamp.call_args_list
-        if "_TIMEOUT" in call.args[1]
+        state_name
+        for call in tx_processor.add_state_timestamps.call_args_list
+        for state_name in call.args[1]
+        if "_TIMEOUT" in state_name
     ]
     assert timeout_timestamps
 
@@ -166,6 +170,7 @@ def _make_context(
         remaining_validators=[{"address": address} for address in validators],
         consensus_data=ConsensusData(votes={}, leader_receipt=None, validators=[]),
         validation_results=[],
+        timing=ConsensusTimingRecorder(tx_processor, "tx-hash"),
     )
 
 
@@ -0,0 +1,140 @@
+"""
+Tests for bounded WebSocket subscriber queues.
+
+Each subscriber holds at most `max_queue_size` pending events; the overflow
+policy decides whether the oldest event is dropped, an older event for the
+same transaction is replaced, or the subscriber is cut off.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.protocol_rpc.broadcast import (
+    COALESCE,
+    DISCONNECT,
+    DROP_OLDEST,
+    Broadcast,
+    SubscriberOverflowError,
+)
+from backend.protocol_rpc.websocket import SLOW_CONSUMER_CLOSE_CODE, _forward_messages
+
+
+async def _drain(subscriber, count):
+    return [(await subscriber.__anext__()).message for _ in range(count)]
+
+
+class TestBoundedQueues:
+    @pytest.mark.asyncio
+    async def test_drop_oldest_keeps_latest_messages(self):
+        broadcast = Broadcast(max_queue_size=3, overflow_policy=DROP_OLDEST)
+        async with broadcast.subscribe("room") as subscriber:
+            for i in range(5):
+                await broadcast.publish(channel="room", message=str(i))
+
+            assert broadcast.get_metrics()["queued_messages"] == 3
+            assert await _drain(subscriber, 3) == ["2", "3", "4"]
+
+        assert broadcast.stats.dropped == 2
+        assert broadcast.stats.delivered == 3
+
+    @pytest.mark.asyncio
+    async def test_coalesce_replaces_pending_event_for_same_transaction(self):
+        broadcast = Broadcast(max_queue_size=2, overflow_policy=COALESCE)
+        async with broadcast.subscribe("transactions") as subscriber:
+            await broadcast.publish(channel="transactions", message="a1", key="0xa")
+            await broadcast.publish(channel="transactions", message="b1", key="0xb")
+            await broadcast.publish(channel="transactions", message="a2", key="0xa")
+
+            assert await _drain(subscriber, 2) == ["b1", "a2"]
+
+        assert broadcast.stats.coalesced == 1
+        assert broadcast.stats.dropped == 0
+
+    @pytest.mark.asyncio
+    async def test_coalesce_drops_oldest_without_matching_key(self):
+        broadcast = Broadcast(max_queue_size=2, overflow_policy=COALESCE)
+        async with broadcast.subscribe("room") as subscriber:
+            await broadcast.publish(channel="room", message="a", key="0xa")
+            await broadcast.publish(channel="room", message="b", key="0xb")
+            await broadcast.publish(channel="room", message="c")
+
+            assert await _drain(subscriber, 2) == ["b", "c"]
+
+        assert broadcast.stats.dropped == 1
+
+    @pytest.mark.asyncio
+    async def test_disconnect_ends_slow_subscriber(self):
+        broadcast = Broadcast(max_queue_size=1, overflow_policy=DISCONNECT)
+        async with broadcast.subscribe("room") as slow:
+            async with broadcast.subscribe("room") as fast:
+                await broadcast.publish(channel="room", message="1")
+                assert await _drain(fast, 1) == ["1"]
+                await broadcast.publish(channel="room", message="2")
+
+                with pytest.raises(SubscriberOverflowError):
+                    await slow.__anext__()
+                assert await _drain(fast, 1) == ["2"]
+
+        assert broadcast.stats.disconnected == 1
+
+    @pytest.mark.asyncio
+    async def test_healthy_subscriber_receives_every_message(self):
+        broadcast = Broadcast(max_queue_size=2, overflow_policy=DROP_OLDEST)
+        async with broadcast.subscribe("room") as subscriber:
+            received = []
+
+            async def consume():
+                async for event in subscriber:
+                    received.append(event.message)
+                    if len(received) == 10:
+                        return
+
+            consumer = asyncio.create_task(consume())
+            for i in range(10):
+                await broadcast.publish(channel="room", message=str(i))
+                await asyncio.sleep(0)
+            await asyncio.wait_for(consumer, timeout=1)
+
+        assert received == [str(i) for i in range(10)]
+        assert broadcast.stats.dropped == 0
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_drains_then_stops(self):
+        broadcast = Broadcast(max_queue_size=10)
+        subscription = broadcast.subscribe("room")
+        subscriber = await subscription.__aenter__()
+        await broadcast.publish(channel="room", message="last")
+        await subscription.__aexit__(None, None, None)
+
+        assert [event.message async for event in subscriber] == ["last"]
+
+    def test_policy_and_size_from_env(self, monkeypatch):
+        monkeypatch.setenv("WEBSOCKET_SUBSCRIBER_QUEUE_SIZE", "50")
+        monkeypatch.setenv("WEBSOCKET_OVERFLOW_POLICY", "coalesce")
+        broadcast = Broadcast()
+
+        assert broadcast.max_queue_size == 50
+        assert broadcast.overflow_policy == COALESCE
+
+    def test_unknown_policy_rejected(self):
+        with pytest.raises(ValueError):
+            Broadcast(overflow_policy="block")
+
+
+class TestSlowConsumerWebSocket:
+    @pytest.mark.asyncio
+    async def test_overflowed_subscriber_closes_websocket(self):
+        broadcast = Broadcast(max_queue_size=1, overflow_policy=DISCONNECT)
+        websocket = AsyncMock()
+        async with broadcast.subscribe("room") as subscriber:
+            await broadcast.publish(channel="room", message=json.dumps({"n": 1}))
+            await broadcast.publish(channel="room", message=json.dumps({"n": 2}))
+
+            await _forward_messages(websocket, subscriber)
+
+        websocket.send_text.assert_not_awaited()
+        websocket.close.assert_awaited_once()
+        assert websocket.close.call_args.kwargs["code"] == SLOW_CONSUMER_CLOSE_CODE
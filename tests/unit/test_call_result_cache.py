@@ -0,0 +1,228 @@
+"""
+Tests for the eth_call/gen_call read-result cache.
+
+Results are keyed by the target contract's state version, so a state write
+produces a new key; non-deterministic or cross-contract reads are not cached.
+"""
+
+import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.node.types import ExecutionResultStatus
+from backend.protocol_rpc import call_result_cache as cache_module
+from backend.protocol_rpc import endpoints
+from backend.protocol_rpc.call_result_cache import CallResultCache
+
+TO = "0x" + "ab" * 20
+FROM = "0x" + "cd" * 20
+OTHER = "0x" + "ef" * 20
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    fresh = CallResultCache(max_entries=16, ttl_seconds=60)
+    monkeypatch.setattr(cache_module, "call_result_cache", fresh)
+    monkeypatch.setattr(endpoints, "call_result_cache", fresh)
+    monkeypatch.setattr(
+        endpoints, "handle_consensus_data_call", lambda *args, **kwargs: None
+    )
+    return fresh
+
+
+def _session(version: int, balance: int = 0) -> MagicMock:
+    session = MagicMock()
+    session.execute.return_value.one_or_none.return_value = SimpleNamespace(
+        updated_at=datetime.datetime(2026, 1, 1, second=version),
+        balance=balance,
+    )
+    return session
+
+
+def _validators_manager():
+    snapshot_cm = AsyncMock()
+    snapshot_cm.__aenter__.return_value = SimpleNamespace(
+        nodes=[SimpleNamespace(validator=SimpleNamespace(address=FROM))]
+    )
+    manager = MagicMock()
+    manager.snapshot.return_value = snapshot_cm
+    return manager
+
+
+def _receipt(
+    result: bytes,
+    eq_outputs=None,
+    execution_result: ExecutionResultStatus = ExecutionResultStatus.SUCCESS,
+):
+    return SimpleNamespace(
+        execution_result=execution_result,
+        result=b"\x00" + result,
+        eq_outputs=eq_outputs,
+    )
+
+
+async def _eth_call(session, node_cls):
+    accounts_manager = MagicMock()
+    accounts_manager.is_valid_address.return_value = True
+    with patch.object(endpoints, "Node", node_cls), patch.object(
+        endpoints, "ContractSnapshot"
+    ), patch.object(endpoints, "get_client_session_id", return_value=None):
+        return await endpoints.eth_call(
+            session=session,
+            accounts_manager=accounts_manager,
+            msg_handler=MagicMock(),
+            transactions_parser=MagicMock(),
+            validators_manager=_validators_manager(),
+            genvm_manager=MagicMock(),
+            transactions_processor=MagicMock(),
+            params={"to": TO, "from": FROM, "data": "0x1234"},
+        )
+
+
+def _node_cls(*receipts, read_foreign: bool = False):
+    node_cls = MagicMock()
+
+    def build(**kwargs):
+        async def get_contract_data(**_):
+            if read_foreign:
+                kwargs["contract_snapshot_factory"](OTHER)
+            return receipts[node_cls.call_count - 1]
+
+        return SimpleNamespace(get_contract_data=get_contract_data)
+
+    node_cls.side_effect = build
+    return node_cls
+
+
+class TestCallResultCache:
+    def test_lru_eviction(self):
+        cache = CallResultCache(max_entries=2, ttl_seconds=60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_entries_expire(self):
+        cache = CallResultCache(max_entries=2, ttl_seconds=5)
+        with patch.object(cache_module.time, "monotonic", return_value=100.0):
+            cache.put("a", 1)
+        with patch.object(cache_module.time, "monotonic", return_value=106.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_zero_size_disables(self):
+        cache = CallResultCache(max_entries=0, ttl_seconds=5)
+        cache.put("a", 1)
+        assert not cache.enabled
+        assert cache.get("a") is None
+
+
+class TestEthCallCaching:
+    @pytest.mark.asyncio
+    async def test_repeated_read_skips_genvm(self, cache):
+        node_cls = _node_cls(_receipt(b"\x01"))
+
+        first = await _eth_call(_session(1), node_cls)
+        second = await _eth_call(_session(1), node_cls)
+
+        assert first == second == "0x01"
+        assert node_cls.call_count == 1
+        assert cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_state_change_invalidates(self, cache):
+        node_cls = _node_cls(_receipt(b"\x01"), _receipt(b"\x02"))
+
+        assert await _eth_call(_session(1), node_cls) == "0x01"
+        assert await _eth_call(_session(2), node_cls) == "0x02"
+        assert node_cls.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_balance_change_invalidates(self, cache):
+        node_cls = _node_cls(_receipt(b"\x01"), _receipt(b"\x02"))
+
+        await _eth_call(_session(1, balance=0), node_cls)
+        await _eth_call(_session(1, balance=5), node_cls)
+        assert node_cls.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_nondeterministic_result_not_cached(self, cache):
+        node_cls = _node_cls(
+            _receipt(b"\x01", eq_outputs={0: "AA=="}), _receipt(b"\x01")
+        )
+
+        await _eth_call(_session(1), node_cls)
+        await _eth_call(_session(1), node_cls)
+        assert node_cls.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cross_contract_read_not_cached(self, cache):
+        node_cls = _node_cls(_receipt(b"\x01"), _receipt(b"\x01"), read_foreign=True)
+
+        await _eth_call(_session(1), node_cls)
+        await _eth_call(_session(1), node_cls)
+        assert node_cls.call_count == 2
+        assert len(cache) == 0
+
+
+class TestIsCacheableReceipt:
+    def test_failed_execution_not_cacheable(self):
+        receipt = _receipt(b"\x01", execution_result=ExecutionResultStatus.ERROR)
+        assert not cache_module.is_cacheable_receipt(receipt, set())
+
+    def test_successful_execution_cacheable(self):
+        assert cache_module.is_cacheable_receipt(_receipt(b"\x01"), set())
+
+
+class TestGenCallCacheKey:
+    def _accounts(self):
+        accounts_manager = MagicMock()
+        accounts_manager.is_valid_address.return_value = True
+        return accounts_manager
+
+    def test_read_is_keyed_by_state_status_and_sender(self, cache):
+        params = {"type": "read", "to": TO, "from": FROM, "data": "0x12"}
+        accepted = endpoints._gen_call_cache_key(_session(1), self._accounts(), params)
+        finalized = endpoints._gen_call_cache_key(
+            _session(1),
+            self._accounts(),
+            {**params, "transaction_hash_variant": "latest-final"},
+        )
+
+        assert accepted is not None and finalized is not None
+        assert accepted != finalized
+
+    @pytest.mark.parametrize(
+        "extra",
+        [{"type": "write"}, {"sim_config": {"genvm_datetime": "2024-01-01"}}],
+    )
+    def test_writes_and_sim_config_bypass(self, cache, extra):
+        params = {"type": "read", "to": TO, "from": FROM, "data": "0x12", **extra}
+        assert (
+            endpoints._gen_call_cache_key(_session(1), self._accounts(), params) is None
+        )
+
+    def test_missing_contract_bypasses(self, cache):
+        session = MagicMock()
+        session.execute.return_value.one_or_none.return_value = None
+        params = {"type": "read", "to": TO, "from": FROM, "data": "0x12"}
+
+        assert endpoints._gen_call_cache_key(session, self._accounts(), params) is None
+
+    def test_call_value_is_part_of_key(self, cache):
+        params = {"type": "read", "to": TO, "from": FROM, "data": "0x12"}
+        without_value = endpoints._gen_call_cache_key(
+            _session(1), self._accounts(), params
+        )
+        with_value = endpoints._gen_call_cache_key(
+            _session(1), self._accounts(), {**params, "value": "0x5"}
+        )
+
+        assert without_value is not None and with_value is not None
+        assert without_value != with_value
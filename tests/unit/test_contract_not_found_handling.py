@@ -257,12 +257,7 @@ class TestGenCallContractNotFoundHandling:
                 mock_node_cls.return_value = mock_node
 
                 with patch("backend.protocol_rpc.endpoints._check_rate_limit"):
-                    with patch(
-                        "backend.protocol_rpc.endpoints._genvm_admission_semaphore"
-                    ) as mock_sem:
-                        mock_sem.locked.return_value = False
-                        mock_sem.__aenter__ = AsyncMock()
-                        mock_sem.__aexit__ = AsyncMock(return_value=False)
+                    with patch("backend.protocol_rpc.endpoints.genvm_admission"):
 
                         with patch(
                             "backend.protocol_rpc.endpoints.get_client_session_id",
@@ -0,0 +1,118 @@
+"""
+Tests for the content-addressed contract schema cache.
+
+Schemas are stored by sha256 of the contract code, so repeated schema
+requests for the same code skip GenVM.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.database_handler import contract_schema_cache
+from backend.database_handler.contract_schema_cache import (
+    ContractSchemaCache,
+    code_hash,
+)
+from backend.protocol_rpc import endpoints
+
+SCHEMA = {"ctor": {"params": []}, "methods": {}}
+
+
+@pytest.fixture(autouse=True)
+def clear_memo():
+    contract_schema_cache.clear_memo()
+    yield
+    contract_schema_cache.clear_memo()
+
+
+def _session(stored=None) -> MagicMock:
+    session = MagicMock()
+    session.execute.return_value.scalar_one_or_none.return_value = stored
+    return session
+
+
+class TestContractSchemaCache:
+    def test_miss_then_put_is_memoised(self):
+        session = _session()
+        cache = ContractSchemaCache(session)
+
+        assert cache.get(b"code") is None
+        cache.put(b"code", SCHEMA)
+        session.execute.reset_mock()
+
+        assert cache.get(b"code") == SCHEMA
+        session.execute.assert_not_called()
+
+    def test_db_hit_is_memoised(self):
+        session = _session(stored=SCHEMA)
+
+        assert ContractSchemaCache(session).get(b"code") == SCHEMA
+        assert ContractSchemaCache(_session()).get(b"code") == SCHEMA
+        session.execute.assert_called_once()
+
+    def test_key_includes_genvm_release(self, monkeypatch):
+        monkeypatch.setenv("GENVM_TAG", "v1")
+        ContractSchemaCache(_session()).put(b"code", SCHEMA)
+
+        monkeypatch.setenv("GENVM_TAG", "v2")
+        assert ContractSchemaCache(_session()).get(b"code") is None
+
+    def test_code_hash_is_sha256(self):
+        assert code_hash(b"") == (
+            "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+        )
+
+
+class TestSchemaEndpoints:
+    @pytest.mark.asyncio
+    async def test_schema_for_code_runs_genvm_once(self):
+        extraction = AsyncMock(return_value=SCHEMA)
+        session = _session()
+
+        with patch.object(endpoints, "_run_schema_extraction", extraction):
+            for _ in range(3):
+                schema = await endpoints.get_contract_schema_for_code(
+                    MagicMock(), MagicMock(), "0x1234", session=session
+                )
+
+        assert schema == SCHEMA
+        extraction.assert_awaited_once()
+        session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_contracts_with_same_code_share_schema(self):
+        extraction = AsyncMock(return_value=SCHEMA)
+
+        with patch.object(
+            endpoints, "_run_schema_extraction", extraction
+        ), patch.object(endpoints, "_deployed_code", return_value=b"same code"):
+            for address in ("0x" + "aa" * 20, "0x" + "bb" * 20):
+                await endpoints.get_contract_schema(
+                    _session(), MagicMock(), MagicMock(), address
+                )
+
+        extraction.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_can_be_disabled(self, monkeypatch):
+        monkeypatch.setenv("CONTRACT_SCHEMA_CACHE", "false")
+        extraction = AsyncMock(return_value=SCHEMA)
+
+        with patch.object(endpoints, "_run_schema_extraction", extraction):
+            for _ in range(2):
+                await endpoints.get_contract_schema_for_code(
+                    MagicMock(), MagicMock(), "0x1234", session=_session()
+                )
+
+        assert extraction.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_warm_contract_schema_swallows_errors(self):
+        db_manager = MagicMock()
+        with patch.object(
+            endpoints, "get_database_manager", return_value=db_manager
+        ), patch.object(endpoints, "_deployed_code", side_effect=RuntimeError("gone")):
+            await endpoints.warm_contract_schema(MagicMock(), MagicMock(), "0xabc")
+
+        db_manager.open_session.return_value.close.assert_called_once()
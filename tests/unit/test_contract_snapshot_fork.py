@@ -0,0 +1,86 @@
+import base64
+
+import pytest
+
+from backend.database_handler.contract_snapshot import ContractSnapshot
+from backend.node.base import _SnapshotView
+from backend.node.genvm.base import _copy_state_proxy
+from backend.node.types import Address
+
+CONTRACT = "0x" + "ab" * 20
+SLOT = b"\x01" * 32
+SLOT_KEY = base64.b64encode(SLOT).decode("ascii")
+
+
+def _b64(value: bytes) -> str:
+    return base64.b64encode(value).decode("ascii")
+
+
+def _snapshot() -> ContractSnapshot:
+    return ContractSnapshot.from_dict(
+        {
+            "contract_address": CONTRACT,
+            "states": {"accepted": {SLOT_KEY: _b64(b"base")}, "finalized": {}},
+            "balance": 7,
+        }
+    )
+
+
+def _view(snapshot: ContractSnapshot) -> _SnapshotView:
+    return _SnapshotView(
+        snapshot, lambda _addr: snapshot, readonly=False, collect_metrics=True
+    )
+
+
+def test_fork_writes_do_not_touch_parent_or_siblings():
+    base = _snapshot()
+    first, second = base.fork(), base.fork()
+
+    _view(first).storage_write(SLOT, 0, b"LEAD")
+
+    assert first.states["accepted"][SLOT_KEY] == _b64(b"LEAD")
+    assert second.states["accepted"][SLOT_KEY] == _b64(b"base")
+    assert base.states["accepted"] == {SLOT_KEY: _b64(b"base")}
+    assert first.balance == 7 and first.contract_address == CONTRACT
+
+
+def test_forks_share_decoded_parent_state():
+    base = _snapshot()
+    view1, view2 = _view(base.fork()), _view(base.fork())
+
+    assert view1.storage_read(Address(CONTRACT), SLOT, 0, 4) == b"base"
+    assert view2.storage_read(Address(CONTRACT), SLOT, 0, 4) == b"base"
+
+    assert view1.get_metrics()["decoded_slots_total"] == 1
+    assert view2.get_metrics()["decoded_slots_total"] == 0
+
+
+def test_writes_are_visible_to_reads_in_same_execution():
+    view = _view(_snapshot().fork())
+
+    view.storage_write(SLOT, 4, b"!!")
+
+    assert view.storage_read(Address(CONTRACT), SLOT, 0, 6) == b"base!!"
+
+
+def test_fork_to_dict_is_plain():
+    fork = _snapshot().fork()
+    _view(fork).storage_write(SLOT, 0, b"next")
+
+    states = fork.to_dict()["states"]
+
+    assert type(states["accepted"]) is dict
+    assert states["accepted"] == {SLOT_KEY: _b64(b"next")}
+
+
+@pytest.mark.asyncio
+async def test_retry_copy_starts_from_pre_execution_state():
+    base = _snapshot()
+    view = _view(base.fork())
+    view.storage_write(SLOT, 0, b"half")
+
+    retry = await _copy_state_proxy(view)
+
+    assert retry is not view
+    assert retry.snapshot.parent is base
+    assert retry.storage_read(Address(CONTRACT), SLOT, 0, 4) == b"base"
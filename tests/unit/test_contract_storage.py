@@ -0,0 +1,180 @@
+"""
+Tests for slot-backed contract storage.
+
+With CONTRACT_STORAGE_BACKEND=slots, ContractProcessor writes contract state
+to per-slot rows (only the states being updated) and leaves a small marker in
+`current_state.data`; ContractSnapshot reads the rows back.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.database_handler import contract_processor, contract_snapshot
+from backend.database_handler.contract_processor import ContractProcessor
+from backend.database_handler.contract_snapshot import ContractSnapshot
+from backend.database_handler.contract_storage import (
+    is_slot_backed,
+    slot_backed_data,
+    slot_storage_enabled,
+    state_write_set,
+)
+from backend.database_handler.models import CurrentState
+
+
+def _processor_with_contract(data):
+    contract = CurrentState(id="0xc", data=data)
+    session = MagicMock()
+    session.query.return_value.filter_by.return_value.with_for_update.return_value.populate_existing.return_value.one_or_none.return_value = (
+        contract
+    )
+    return ContractProcessor(session), contract
+
+
+class TestBackendSelection:
+    @pytest.mark.parametrize(
+        "value,expected", [("slots", True), (" SLOTS ", True), ("jsonb", False)]
+    )
+    def test_env_value(self, value, expected):
+        with patch.dict("os.environ", {"CONTRACT_STORAGE_BACKEND": value}):
+            assert slot_storage_enabled() is expected
+
+    def test_default_is_jsonb(self):
+        with patch.dict("os.environ", {}, clear=True):
+            assert slot_storage_enabled() is False
+
+    def test_marker_is_recognised(self):
+        assert is_slot_backed(slot_backed_data(3))
+        assert not is_slot_backed({"state": {"accepted": {}, "finalized": {}}})
+        assert not is_slot_backed({})
+
+
+class TestSlotWrites:
+    def test_only_updated_state_is_written(self):
+        processor, contract = _processor_with_contract(slot_backed_data(4))
+
+        with patch.dict(
+            "os.environ", {"CONTRACT_STORAGE_BACKEND": "slots"}
+        ), patch.object(contract_processor, "ContractStorage") as storage_cls:
+            processor.update_contract_state("0xc", accepted_state={"a": "1"})
+
+        storage = storage_cls.return_value
+        storage.replace_state.assert_called_once_with("0xc", "accepted", {"a": "1"}, 5)
+        storage.clear.assert_not_called()
+        assert contract.data == slot_backed_data(5)
+
+    def test_blob_contract_is_moved_on_first_write(self):
+        processor, contract = _processor_with_contract(
+            {"state": {"accepted": {"a": "0"}, "finalized": {"f": "1"}}}
+        )
+
+        with patch.dict(
+            "os.environ", {"CONTRACT_STORAGE_BACKEND": "slots"}
+        ), patch.object(contract_processor, "ContractStorage") as storage_cls:
+            processor.update_contract_state("0xc", accepted_state={"a": "1"})
+
+        storage = storage_cls.return_value
+        storage.clear.assert_called_once_with("0xc")
+        assert storage.replace_state.call_args_list == [
+            (("0xc", "finalized", {"f": "1"}, 1),),
+            (("0xc", "accepted", {"a": "1"}, 1),),
+        ]
+        assert contract.data == slot_backed_data(1)
+
+    def test_write_based_on_current_snapshot_sends_write_set(self):
+        processor, contract = _processor_with_contract(slot_backed_data(4))
+        snapshot = ContractSnapshot.from_dict(
+            {
+                "contract_address": "0xc",
+                "states": {"accepted": {"a": "0", "b": "1"}, "finalized": {}},
+            }
+        )
+        snapshot.storage_version = 4
+
+        with patch.dict(
+            "os.environ", {"CONTRACT_STORAGE_BACKEND": "slots"}
+        ), patch.object(contract_processor, "ContractStorage") as storage_cls:
+            processor.update_contract_state(
+                "0xc", accepted_state={"a": "1", "b": "1", "c": "2"}, based_on=snapshot
+            )
+
+        storage = storage_cls.return_value
+        storage.apply_write_set.assert_called_once_with(
+            "0xc", "accepted", {"a": "1", "c": "2"}, 5
+        )
+        storage.replace_state.assert_not_called()
+
+    def test_stale_snapshot_falls_back_to_full_state(self):
+        processor, contract = _processor_with_contract(slot_backed_data(4))
+        snapshot = ContractSnapshot.from_dict(
+            {"contract_address": "0xc", "states": {"accepted": {"a": "0"}}}
+        )
+        snapshot.storage_version = 3
+
+        with patch.dict(
+            "os.environ", {"CONTRACT_STORAGE_BACKEND": "slots"}
+        ), patch.object(contract_processor, "ContractStorage") as storage_cls:
+            processor.update_contract_state(
+                "0xc", accepted_state={"a": "1"}, based_on=snapshot
+            )
+
+        storage = storage_cls.return_value
+        storage.replace_state.assert_called_once_with("0xc", "accepted", {"a": "1"}, 5)
+        storage.apply_write_set.assert_not_called()
+
+    def test_write_set_marks_deleted_slots(self):
+        assert state_write_set({"a": "0", "b": "1"}, {"a": "1"}) == {
+            "a": "1",
+            "b": None,
+        }
+
+    def test_jsonb_mode_keeps_blob_writes(self):
+        processor, contract = _processor_with_contract(
+            {"state": {"accepted": {"a": "0"}, "finalized": {"f": "1"}}}
+        )
+
+        with patch.dict(
+            "os.environ", {"CONTRACT_STORAGE_BACKEND": "jsonb"}
+        ), patch.object(contract_processor, "ContractStorage") as storage_cls:
+            processor.update_contract_state("0xc", accepted_state={"a": "1"})
+
+        storage_cls.assert_not_called()
+        assert contract.data == {
+            "state": {"accepted": {"a": "1"}, "finalized": {"f": "1"}}
+        }
+
+
+class TestSlotReads:
+    def _session_with(self, data):
+        session = MagicMock()
+        session.query.return_value.filter.return_value.populate_existing.return_value.one_or_none.return_value = CurrentState(
+            id="0xc", data=data, balance=7
+        )
+        return session
+
+    def test_snapshot_point_read(self):
+        session = self._session_with(slot_backed_data(2))
+
+        with patch.object(contract_snapshot, "ContractStorage") as storage_cls:
+            storage_cls.return_value.read_slots.return_value = {
+                "accepted": {"code": "x"},
+                "finalized": {},
+            }
+            snapshot = ContractSnapshot("0xc", session, slots=["code"])
+
+        storage_cls.return_value.read_slots.assert_called_once_with("0xc", ["code"])
+        storage_cls.return_value.read_state.assert_not_called()
+        assert snapshot.states == {"accepted": {"code": "x"}, "finalized": {}}
+        # A partial read cannot serve as the base of a write-set
+        assert snapshot.storage_version is None
+        assert snapshot.balance == 7
+
+    def test_blob_snapshot_ignores_slot_table(self):
+        states = {"accepted": {"a": "1"}, "finalized": {}}
+        session = self._session_with({"state": states})
+
+        with patch.object(contract_snapshot, "ContractStorage") as storage_cls:
+            snapshot = ContractSnapshot("0xc", session, slots=["a"])
+
+        storage_cls.assert_not_called()
+        assert snapshot.states == states
@@ -0,0 +1,183 @@
+"""
+Tests for running synchronous database work off the event loop.
+"""
+
+import asyncio
+import contextvars
+import threading
+
+import pytest
+
+from backend.database_handler.db_offload import (
+    DBOffloadExecutor,
+    EventLoopLagMonitor,
+    calling_event_loop,
+)
+from backend.protocol_rpc.message_handler.fastapi_handler import MessageHandler
+
+_request_id: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "test_request_id", default=None
+)
+
+
+@pytest.mark.asyncio
+async def test_run_executes_on_offload_thread_with_caller_context():
+    executor = DBOffloadExecutor(max_workers=2)
+    _request_id.set("req-1")
+    loop = asyncio.get_running_loop()
+
+    def work(x, *, y):
+        return (
+            threading.current_thread().name,
+            _request_id.get(),
+            calling_event_loop(),
+            x + y,
+        )
+
+    try:
+        thread_name, request_id, calling_loop, total = await executor.run(work, 1, y=2)
+    finally:
+        executor.shutdown()
+
+    assert thread_name.startswith("db-offload")
+    assert request_id == "req-1"
+    assert calling_loop is loop
+    assert total == 3
+    assert calling_event_loop() is None
+
+
+@pytest.mark.asyncio
+async def test_run_keeps_loop_responsive_and_bounds_concurrency():
+    executor = DBOffloadExecutor(max_workers=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocking():
+        started.set()
+        release.wait(5)
+        return "done"
+
+    try:
+        first = asyncio.create_task(executor.run(blocking))
+        second = asyncio.create_task(executor.run(lambda: "second"))
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+
+        metrics = executor.get_metrics()
+        assert metrics["in_flight"] == 2
+        assert metrics["running"] == 1
+        assert metrics["queued"] == 1
+
+        release.set()
+        assert await first == "done"
+        assert await second == "second"
+    finally:
+        release.set()
+        executor.shutdown()
+
+    metrics = executor.get_metrics()
+    assert metrics["in_flight"] == 0
+    assert metrics["completed_total"] == 2
+    assert metrics["max_wait_seconds"] > 0
+
+
+@pytest.mark.asyncio
+async def test_cancellation_waits_for_running_call():
+    executor = DBOffloadExecutor(max_workers=1)
+    started = threading.Event()
+    finished = threading.Event()
+
+    def slow():
+        started.set()
+        threading.Event().wait(0.2)
+        finished.set()
+
+    try:
+        task = asyncio.create_task(executor.run(slow))
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert finished.is_set()
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_caller():
+    executor = DBOffloadExecutor(max_workers=1)
+
+    def fail():
+        raise ValueError("boom")
+
+    try:
+        with pytest.raises(ValueError, match="boom"):
+            await executor.run(fail)
+    finally:
+        executor.shutdown()
+    assert executor.get_metrics()["in_flight"] == 0
+
+
+def test_lag_monitor_reports_latest_p99_and_max():
+    monitor = EventLoopLagMonitor(window=100)
+    assert monitor.get_metrics()["lag_p99_seconds"] == 0.0
+
+    for _ in range(98):
+        monitor.record(0.001)
+    monitor.record(0.5)
+    monitor.record(-0.01)
+
+    metrics = monitor.get_metrics()
+    assert metrics["lag_seconds"] == 0.0
+    assert metrics["lag_p99_seconds"] == 0.5
+    assert metrics["lag_max_seconds"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_lag_monitor_samples_blocked_loop():
+    monitor = EventLoopLagMonitor(interval=0.01)
+    monitor.start()
+    await asyncio.sleep(0.02)
+    threading.Event().wait(0.1)  # block the loop
+    await asyncio.sleep(0.03)
+    await monitor.stop()
+
+    assert monitor.samples_total > 0
+    assert monitor.get_metrics()["lag_max_seconds"] >= 0.05
+
+
+def test_disabled_lag_monitor_does_not_start():
+    monitor = EventLoopLagMonitor(interval=0)
+
+    async def start():
+        monitor.start()
+        return monitor._task
+
+    assert asyncio.run(start()) is None
+
+
+class _RecordingBroadcast:
+    def __init__(self):
+        self.published = []
+
+    async def publish(self, channel, message, key=None):
+        self.published.append((channel, threading.current_thread().name))
+
+
+@pytest.mark.asyncio
+async def test_publish_from_offload_thread_runs_on_calling_loop():
+    broadcast = _RecordingBroadcast()
+    handler = MessageHandler(broadcast, config=None)
+    executor = DBOffloadExecutor(max_workers=1)
+
+    try:
+        await executor.run(handler._publish, "tx-1", {"event": "x"})
+    finally:
+        executor.shutdown()
+    for _ in range(10):
+        if broadcast.published:
+            break
+        await asyncio.sleep(0.01)
+
+    assert broadcast.published == [("tx-1", threading.current_thread().name)]
@@ -0,0 +1,169 @@
+"""
+Tests for the worker-wide AIMD GenVM execution scheduler.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.consensus.execution_scheduler import ExecutionScheduler
+
+
+async def _hold(scheduler: ExecutionScheduler, key: str, order: list, release):
+    async with scheduler.slot(key):
+        order.append(key)
+        await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_limit_bounds_in_flight_executions():
+    scheduler = ExecutionScheduler(initial_limit=2, max_limit=2)
+    release = asyncio.Event()
+    order: list[str] = []
+
+    tasks = [
+        asyncio.create_task(_hold(scheduler, "tx", order, release)) for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+
+    assert scheduler.in_flight == 2
+    assert scheduler.waiting == 3
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert scheduler.in_flight == 0
+    assert len(order) == 5
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_granted_round_robin_across_transactions():
+    scheduler = ExecutionScheduler(initial_limit=1, max_limit=1)
+    blocker = await scheduler.acquire("busy")
+    order: list[str] = []
+    release = asyncio.Event()
+    release.set()
+
+    tasks = [
+        asyncio.create_task(_hold(scheduler, key, order, release))
+        for key in ["a", "a", "a", "b", "c"]
+    ]
+    await asyncio.sleep(0)
+    scheduler.release(blocker)
+    await asyncio.gather(*tasks)
+
+    assert order == ["a", "b", "c", "a", "a"]
+
+
+@pytest.mark.asyncio
+async def test_fast_successes_increase_limit_additively():
+    scheduler = ExecutionScheduler(initial_limit=2, max_limit=4)
+
+    # 2 -> 2.5 -> 2.9 -> 3.24: about one slot per limit's worth of successes.
+    for _ in range(3):
+        async with scheduler.slot("tx", budget_seconds=60):
+            pass
+    assert scheduler.limit == 3
+
+    for _ in range(10):
+        async with scheduler.slot("tx", budget_seconds=60):
+            pass
+    assert scheduler.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_slow_successes_hold_the_limit():
+    scheduler = ExecutionScheduler(initial_limit=2, latency_threshold=0.5)
+
+    for _ in range(4):
+        async with scheduler.slot("tx", budget_seconds=0.01):
+            await asyncio.sleep(0.01)
+
+    assert scheduler.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_overload_backs_off_once_per_round():
+    scheduler = ExecutionScheduler(initial_limit=10, decrease_factor=0.5)
+    slots = [await scheduler.acquire("tx") for _ in range(3)]
+
+    for slot in slots:
+        slot.overloaded()
+        scheduler.release(slot)
+
+    assert scheduler.limit == 5
+    assert scheduler.decreases == 1
+
+    slot = await scheduler.acquire("tx")
+    slot.overloaded()
+    scheduler.release(slot)
+    assert scheduler.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_limit_never_drops_below_minimum():
+    scheduler = ExecutionScheduler(initial_limit=2, min_limit=1, decrease_factor=0.1)
+
+    for _ in range(3):
+        slot = await scheduler.acquire("tx")
+        slot.overloaded()
+        scheduler.release(slot)
+
+    assert scheduler.limit == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_executions_do_not_change_limit():
+    scheduler = ExecutionScheduler(initial_limit=2)
+
+    with pytest.raises(RuntimeError):
+        async with scheduler.slot("tx", budget_seconds=60):
+            raise RuntimeError("cancelled after quorum")
+
+    assert scheduler.limit == 2
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue():
+    scheduler = ExecutionScheduler(initial_limit=1, max_limit=1)
+    blocker = await scheduler.acquire("busy")
+
+    waiter = asyncio.create_task(scheduler.acquire("tx"))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert scheduler.waiting == 0
+    scheduler.release(blocker)
+    assert scheduler.in_flight == 0
+
+
+def test_from_environment(monkeypatch):
+    monkeypatch.setenv("CONSENSUS_EXEC_CONCURRENCY_INITIAL", "4")
+    monkeypatch.setenv("CONSENSUS_EXEC_CONCURRENCY_MAX", "3")
+    monkeypatch.setenv("CONSENSUS_EXEC_DECREASE_FACTOR", "bogus")
+
+    scheduler = ExecutionScheduler.from_environment()
+
+    assert scheduler.limit == 3
+    assert scheduler.decrease_factor == 0.7
+
+
+@pytest.mark.asyncio
+async def test_manager_capacity_caps_limit():
+    scheduler = ExecutionScheduler(initial_limit=8, max_limit=16)
+
+    scheduler.set_capacity(4)
+    assert scheduler.limit == 4
+    slot = await scheduler.acquire("tx")
+    scheduler.release(slot)
+    assert scheduler.limit == 4
+    assert scheduler.get_metrics()["max_limit"] == 4
+
+    scheduler.set_capacity(64)
+    assert scheduler.max_limit == 16
+
+    scheduler.set_capacity(None)
+    assert scheduler.max_limit == 16
+    assert scheduler.limit == 8
@@ -62,6 +62,8 @@ class TestValidatorsManagerHostData:
                 self.genvm_manager = MockGenVMManager()
                 self._cached_snapshot = None
                 self._restart_llm_lock = asyncio.Lock()
+                self._registry_backends = {}
+                self._sim_backends = {}
 
                 # Bind both methods from the actual Manager class
                 self._change_providers_from_snapshot = types.MethodType(
@@ -70,6 +72,9 @@ class TestValidatorsManagerHostData:
                 self._change_providers_from_snapshot_locked = types.MethodType(
                     Manager._change_providers_from_snapshot_locked, self
                 )
+                self._restart_llm_module_locked = types.MethodType(
+                    Manager._restart_llm_module_locked, self
+                )
 
         mock_manager = MockManager()
         return mock_manager
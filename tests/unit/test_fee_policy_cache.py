@@ -0,0 +1,74 @@
+from backend.protocol_rpc import fees
+from backend.protocol_rpc.fees import (
+    DEFAULT_GEN_PER_TIME_UNIT,
+    STUDIO_FEE_POLICY_ENV,
+    StudioFeePolicy,
+    StudioFeePolicyCache,
+    default_transaction_fees_for_policy,
+    required_fee_deposit,
+    studio_fee_config,
+)
+
+
+def _clear_policy_env(monkeypatch):
+    for _, name, _ in STUDIO_FEE_POLICY_ENV:
+        monkeypatch.delenv(name, raising=False)
+
+
+def test_cached_policy_is_reused_until_reload(monkeypatch):
+    _clear_policy_env(monkeypatch)
+    cache = StudioFeePolicyCache()
+
+    policy, version = cache.current_with_version()
+    assert policy == StudioFeePolicy.from_env()
+    assert policy.gen_per_time_unit == DEFAULT_GEN_PER_TIME_UNIT
+    assert cache.current() is policy
+    assert cache.version == version
+
+    monkeypatch.setenv("GENLAYER_STUDIO_GEN_PER_TIME_UNIT", "7")
+    assert cache.current_with_version() == (policy, version)
+
+    updated = cache.reload()
+    assert updated.gen_per_time_unit == 7
+    assert cache.current_with_version() == (updated, version + 1)
+    assert cache.current() is updated
+
+
+def test_reload_rebuilds_and_bumps_version(monkeypatch):
+    _clear_policy_env(monkeypatch)
+    cache = StudioFeePolicyCache()
+    policy = cache.current()
+    version = cache.version
+
+    reloaded = cache.reload()
+
+    assert reloaded == policy
+    assert reloaded is not policy
+    assert cache.version == version + 1
+
+
+def test_required_fee_deposit_is_memoised_per_shape():
+    policy = StudioFeePolicy(gen_per_time_unit=3)
+    distribution, _ = default_transaction_fees_for_policy(policy)
+    fees._required_fee_deposit_for_shape.cache_clear()
+
+    first = required_fee_deposit(distribution, 5, policy)
+    second = required_fee_deposit(dict(distribution), 5, policy)
+    info = fees._required_fee_deposit_for_shape.cache_info()
+
+    assert first == second
+    assert (info.hits, info.misses) == (1, 1)
+    assert required_fee_deposit(distribution, 5, policy) == first
+    assert required_fee_deposit(distribution, 5, StudioFeePolicy()) != first
+    assert fees._required_fee_deposit_for_shape.cache_info().misses == 2
+
+
+def test_studio_fee_config_returns_independent_copies():
+    policy = StudioFeePolicy(gen_per_time_unit=3)
+
+    config = studio_fee_config(policy)
+    config["defaultFees"]["distribution"]["rotations"].append("9")
+
+    assert studio_fee_config(policy)["defaultFees"]["distribution"]["rotations"] == [
+        "0"
+    ]
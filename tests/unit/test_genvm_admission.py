@@ -0,0 +1,202 @@
+"""
+Tests for GenVM admission control on the RPC path.
+
+Calls over the local slot limit wait in a short priority queue; an optional
+Redis lease set bounds executions across all RPC replicas.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.protocol_rpc.exceptions import JSONRPCError
+from backend.protocol_rpc.genvm_admission import (
+    GLOBAL_LEASES_KEY,
+    GenVMAdmission,
+    parse_tier_priorities,
+)
+from backend.protocol_rpc.rate_limiter import current_api_tier
+
+
+async def _hold(admission, release: asyncio.Event, admitted: list, name: str):
+    async with admission.admit("gen_call", "0xabc"):
+        admitted.append(name)
+        await release.wait()
+
+
+async def _wait_queued(admission, count: int):
+    for _ in range(100):
+        if admission.get_metrics()["queued"] == count:
+            return
+        await asyncio.sleep(0.001)
+    raise AssertionError(f"expected {count} queued calls")
+
+
+@pytest.mark.asyncio
+async def test_call_waits_for_slot_instead_of_failing():
+    admission = GenVMAdmission(max_concurrent=1, queue_size=4, max_wait_seconds=1)
+    release = asyncio.Event()
+    admitted = []
+
+    holder = asyncio.create_task(_hold(admission, release, admitted, "first"))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(_hold(admission, asyncio.Event(), admitted, "second"))
+    await _wait_queued(admission, 1)
+    assert admitted == ["first"]
+
+    release.set()
+    await holder
+    await asyncio.sleep(0)
+    assert admitted == ["first", "second"]
+    assert admission.get_metrics()["waited_total"] == 1
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert admission.get_metrics()["active"] == 0
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_queue_full():
+    admission = GenVMAdmission(max_concurrent=1, queue_size=0)
+    release = asyncio.Event()
+    holder = asyncio.create_task(_hold(admission, release, [], "first"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(JSONRPCError) as exc_info:
+        async with admission.admit("gen_call", "0xabc"):
+            pass
+
+    assert exc_info.value.code == -32006
+    assert exc_info.value.data == {"retry_after_seconds": 2, "reason": "queue_full"}
+    release.set()
+    await holder
+
+
+@pytest.mark.asyncio
+async def test_rejects_after_waiting_past_deadline():
+    admission = GenVMAdmission(max_concurrent=1, queue_size=4, max_wait_seconds=0.02)
+    release = asyncio.Event()
+    holder = asyncio.create_task(_hold(admission, release, [], "first"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(JSONRPCError) as exc_info:
+        async with admission.admit("gen_call", "0xabc"):
+            pass
+
+    assert exc_info.value.data["reason"] == "deadline"
+    release.set()
+    await holder
+    metrics = admission.get_metrics()
+    assert metrics["active"] == 0
+    assert metrics["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_rejects_immediately_when_expected_wait_exceeds_deadline():
+    admission = GenVMAdmission(max_concurrent=1, queue_size=4, max_wait_seconds=1)
+    admission.avg_hold_seconds = 5.0
+    release = asyncio.Event()
+    holder = asyncio.create_task(_hold(admission, release, [], "first"))
+    await asyncio.sleep(0)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    with pytest.raises(JSONRPCError) as exc_info:
+        async with admission.admit("gen_call", "0xabc"):
+            pass
+
+    assert exc_info.value.data["reason"] == "deadline"
+    assert loop.time() - started < 0.5
+    release.set()
+    await holder
+
+
+@pytest.mark.asyncio
+async def test_higher_priority_tier_is_admitted_first():
+    admission = GenVMAdmission(
+        max_concurrent=1,
+        queue_size=4,
+        max_wait_seconds=1,
+        tier_priorities={"enterprise": 0},
+    )
+    release = asyncio.Event()
+    admitted = []
+    done = asyncio.Event()
+    done.set()
+
+    async def as_tier(tier, name):
+        current_api_tier.set(tier)
+        await _hold(admission, done, admitted, name)
+
+    holder = asyncio.create_task(_hold(admission, release, admitted, "holder"))
+    await asyncio.sleep(0)
+    anonymous = asyncio.create_task(as_tier("anonymous", "anonymous"))
+    await _wait_queued(admission, 1)
+    enterprise = asyncio.create_task(as_tier("enterprise", "enterprise"))
+    await _wait_queued(admission, 2)
+
+    release.set()
+    await asyncio.gather(holder, anonymous, enterprise)
+    assert admitted == ["holder", "enterprise", "anonymous"]
+
+
+@pytest.mark.asyncio
+async def test_global_budget_takes_and_releases_lease():
+    admission = GenVMAdmission(max_concurrent=2, global_max_concurrent=4)
+    client = AsyncMock()
+    client.eval.return_value = 1
+    admission.attach_redis(client)
+
+    async with admission.admit("eth_call", "0xabc"):
+        member = client.eval.await_args.args[3]
+
+    assert client.eval.await_args.args[2] == GLOBAL_LEASES_KEY
+    assert client.eval.await_args.args[4] == 4
+    client.zrem.assert_awaited_once_with(GLOBAL_LEASES_KEY, member)
+
+
+@pytest.mark.asyncio
+async def test_global_budget_exhausted_rejects_and_frees_local_slot():
+    admission = GenVMAdmission(
+        max_concurrent=2, max_wait_seconds=0.05, global_max_concurrent=4
+    )
+    client = AsyncMock()
+    client.eval.return_value = 0
+    admission.attach_redis(client)
+
+    with pytest.raises(JSONRPCError) as exc_info:
+        async with admission.admit("eth_call", "0xabc"):
+            pass
+
+    assert exc_info.value.data["reason"] == "global_budget"
+    assert client.eval.await_count > 1
+    assert admission.get_metrics()["active"] == 0
+
+
+@pytest.mark.asyncio
+async def test_global_budget_fails_open_when_redis_unavailable():
+    admission = GenVMAdmission(max_concurrent=1, global_max_concurrent=4)
+    client = AsyncMock()
+    client.eval.side_effect = ConnectionError("redis down")
+    admission.attach_redis(client)
+
+    async with admission.admit("eth_call", "0xabc"):
+        pass
+
+    assert admission.get_metrics()["global_errors_total"] == 1
+    client.zrem.assert_not_called()
+
+
+def test_attach_redis_ignored_without_global_budget():
+    admission = GenVMAdmission(global_max_concurrent=0)
+    admission.attach_redis(AsyncMock())
+    assert admission.get_metrics()["global_enabled"] is False
+
+
+def test_parse_tier_priorities_skips_invalid_entries():
+    assert parse_tier_priorities("enterprise=0, pro=1,bad,x=y,") == {
+        "enterprise": 0,
+        "pro": 1,
+    }
@@ -0,0 +1,154 @@
+"""
+Tests for socket framing in the GenVM host protocol loop.
+"""
+
+import asyncio
+import socket
+
+import pytest
+
+from backend.node.genvm.origin import base_host, host_fns, public_abi
+
+
+class _NoopLogger:
+    def trace(self, *args, **kwargs):
+        pass
+
+    def debug(self, *args, **kwargs):
+        pass
+
+
+class _Ctx:
+    logger = _NoopLogger()
+
+    def __init__(self):
+        self.stats = {}
+
+    def add_stat(self, key, value):
+        self.stats[key] = value
+
+
+class _Handler(base_host.IHost):
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.storage_reads = []
+        self.eth_calls = []
+
+    async def loop_enter(self, cancellation):
+        return self.sock
+
+    async def storage_read(self, mode, account, slot, index, le):
+        self.storage_reads.append((mode, account, slot, index, le))
+        return bytes([index % 256]) * le
+
+    async def consume_gas(self, gas):
+        pass
+
+    async def eth_call(self, account, calldata):
+        self.eth_calls.append((account, calldata))
+        return calldata[::-1]
+
+    async def get_balance(self, account):
+        return 0
+
+    async def remaining_fuel_as_gen(self):
+        return 0
+
+    async def notify_nondet_disagreement(self, call_no):
+        pass
+
+
+def _u32(i: int) -> bytes:
+    return i.to_bytes(4, byteorder="little")
+
+
+def _storage_read_request(index: int, le: int) -> bytes:
+    return (
+        bytes([host_fns.Methods.STORAGE_READ, public_abi.StorageType.DEFAULT])
+        + b"\x01" * base_host.ACCOUNT_ADDR_SIZE
+        + index.to_bytes(base_host.SLOT_ID_SIZE, byteorder="little")
+        + _u32(index)
+        + _u32(le)
+    )
+
+
+def _eth_call_request(calldata: bytes) -> bytes:
+    return (
+        bytes([host_fns.Methods.ETH_CALL])
+        + b"\x02" * base_host.ACCOUNT_ADDR_SIZE
+        + _u32(len(calldata))
+        + calldata
+    )
+
+
+def _recv_exact(sock: socket.socket, le: int) -> bytes:
+    out = bytearray()
+    while len(out) < le:
+        chunk = sock.recv(le - len(out))
+        assert chunk, "host closed the socket"
+        out.extend(chunk)
+    return bytes(out)
+
+
+async def _run(requests: list[bytes], peer, chunk_size: int | None = None):
+    host_sock, peer_sock = socket.socketpair()
+    host_sock.setblocking(False)
+    handler = _Handler(host_sock)
+
+    def genvm():
+        payload = b"".join(requests) + bytes([host_fns.Methods.NOTIFY_FINISHED])
+        step = chunk_size or len(payload)
+        for i in range(0, len(payload), step):
+            peer_sock.sendall(payload[i : i + step])
+        result = peer(peer_sock)
+        assert _recv_exact(peer_sock, 1) == b"\x00"
+        return result
+
+    try:
+        peer_task = asyncio.to_thread(genvm)
+        _, result = await asyncio.gather(
+            base_host.host_loop(handler, asyncio.Event(), ctx=_Ctx()),
+            peer_task,
+        )
+    finally:
+        host_sock.close()
+        peer_sock.close()
+    return handler, result
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [None, 1, 7])
+async def test_storage_reads_survive_arbitrary_chunking(chunk_size):
+    requests = [_storage_read_request(i, 32) for i in range(50)]
+
+    def peer(sock):
+        return [_recv_exact(sock, 33) for _ in range(50)]
+
+    handler, responses = await _run(requests, peer, chunk_size)
+
+    assert len(handler.storage_reads) == 50
+    mode, account, slot, index, le = handler.storage_reads[7]
+    assert mode == public_abi.StorageType.DEFAULT
+    assert account == b"\x01" * base_host.ACCOUNT_ADDR_SIZE
+    assert slot == (7).to_bytes(base_host.SLOT_ID_SIZE, byteorder="little")
+    assert (index, le) == (7, 32)
+    assert responses[7] == bytes([host_fns.Errors.OK]) + b"\x07" * 32
+
+
+@pytest.mark.asyncio
+async def test_payloads_larger_than_read_buffer_round_trip():
+    calldata = bytes(range(256)) * (base_host.SOCKET_READ_BUFFER_SIZE // 128)
+    requests = [_storage_read_request(1, 4), _eth_call_request(calldata)]
+
+    def peer(sock):
+        storage = _recv_exact(sock, 5)
+        header = _recv_exact(sock, 5)
+        body = _recv_exact(sock, int.from_bytes(header[1:], byteorder="little"))
+        return storage, header[0], body
+
+    handler, (storage, status, body) = await _run(requests, peer, chunk_size=4096)
+
+    assert storage == bytes([host_fns.Errors.OK]) + b"\x01" * 4
+    assert handler.eth_calls[0][1] == calldata
+    assert status == host_fns.Errors.OK
+    assert body == calldata[::-1]
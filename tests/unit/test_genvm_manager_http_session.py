@@ -0,0 +1,66 @@
+"""
+Tests for the pooled GenVM manager HTTP session.
+
+Manager calls (module start/stop, llm checks, /genvm/run, status polls,
+deletes) go through one keep-alive aiohttp session owned by the Manager
+instead of a fresh `aiohttp.request` connector per call.
+"""
+
+import aiohttp
+import pytest
+from unittest.mock import MagicMock, patch
+
+from backend.node import base as node_base
+from backend.node.genvm.origin import base_host
+
+
+def _make_manager():
+    manager = node_base.Manager()
+    manager.url = "http://127.0.0.1:3999"
+    manager.proc = None
+    manager.logger = MagicMock()
+    return manager
+
+
+class TestManagerHttpSession:
+    @pytest.mark.asyncio
+    async def test_session_is_reused_until_closed(self):
+        manager = _make_manager()
+
+        session = manager.http_session()
+        assert manager.http_session() is session
+        assert isinstance(session.connector, aiohttp.TCPConnector)
+
+        await manager.close()
+        assert session.closed
+
+        reopened = manager.http_session()
+        assert reopened is not session
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_unix_socket_connector(self, tmp_path):
+        manager = _make_manager()
+
+        with patch.dict(
+            "os.environ", {"GENVM_MANAGER_SOCKET": str(tmp_path / "manager.sock")}
+        ):
+            session = manager.http_session()
+
+        assert isinstance(session.connector, aiohttp.UnixConnector)
+        await manager.close()
+
+
+class TestManagerRequest:
+    def test_uses_pooled_session_when_given(self):
+        session = MagicMock()
+
+        base_host._manager_request(session, "GET", "http://m/genvm/1", timeout=None)
+
+        session.request.assert_called_once_with("GET", "http://m/genvm/1", timeout=None)
+
+    def test_falls_back_to_one_shot_request(self):
+        with patch.object(base_host.aiohttp, "request") as one_shot:
+            base_host._manager_request(None, "DELETE", "http://m/genvm/1")
+
+        one_shot.assert_called_once_with("DELETE", "http://m/genvm/1")
@@ -0,0 +1,72 @@
+import pytest
+from unittest.mock import Mock
+
+from backend.protocol_rpc.exceptions import JSONRPCError
+from backend.protocol_rpc.endpoints import get_transactions_for_address
+from backend.database_handler.transactions_processor import (
+    ADDRESS_HISTORY_DEFAULT_LIMIT,
+    ADDRESS_HISTORY_MAX_LIMIT,
+    TransactionAddressFilter,
+    TransactionsProcessor,
+)
+
+ADDRESS = "0x9F0e84243496AcFB3Cd99D02eA59673c05901501"
+
+
+class TestGetTransactionsForAddressEndpoint:
+    """Test cases for the sim_getTransactionsForAddress RPC endpoint."""
+
+    def setup_method(self):
+        self.transactions_processor = Mock(spec=TransactionsProcessor)
+        self.accounts_manager = Mock()
+        self.accounts_manager.is_valid_address.return_value = True
+        self.page = {"transactions": [{"hash": "0x1"}], "nextCursor": "abc"}
+        self.transactions_processor.get_transactions_for_address_page.return_value = (
+            self.page
+        )
+
+    def _call(self, **kwargs):
+        return get_transactions_for_address(
+            self.transactions_processor, self.accounts_manager, ADDRESS, **kwargs
+        )
+
+    def test_without_paging_params_returns_legacy_list(self):
+        self.transactions_processor.get_transactions_for_address.return_value = [
+            {"hash": "0x1"}
+        ]
+
+        assert self._call(full=False) == [{"hash": "0x1"}]
+        self.transactions_processor.get_transactions_for_address.assert_called_once_with(
+            ADDRESS, TransactionAddressFilter.ALL, full=False
+        )
+
+    def test_summary_without_paging_params_returns_capped_list(self):
+        assert self._call(summary=True) == [{"hash": "0x1"}]
+        self.transactions_processor.get_transactions_for_address_page.assert_called_once_with(
+            ADDRESS,
+            TransactionAddressFilter.ALL,
+            limit=ADDRESS_HISTORY_MAX_LIMIT,
+            summary=True,
+        )
+
+    def test_cursor_returns_page_with_default_limit(self):
+        assert self._call(cursor="abc", filter="to") == self.page
+        self.transactions_processor.get_transactions_for_address_page.assert_called_once_with(
+            ADDRESS,
+            TransactionAddressFilter.TO,
+            limit=ADDRESS_HISTORY_DEFAULT_LIMIT,
+            cursor="abc",
+            full=True,
+            summary=False,
+        )
+
+    def test_invalid_cursor_is_invalid_params(self):
+        self.transactions_processor.get_transactions_for_address_page.side_effect = (
+            ValueError("Invalid cursor")
+        )
+
+        with pytest.raises(JSONRPCError) as exc_info:
+            self._call(limit=10, cursor="not-a-cursor")
+
+        assert exc_info.value.code == -32602
+        assert exc_info.value.message == "Invalid cursor"
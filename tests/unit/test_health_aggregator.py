@@ -0,0 +1,173 @@
+"""
+Tests for the cluster health aggregator.
+
+One RPC pod holds a Redis lease and computes the cluster-wide health checks;
+the other pods serve the snapshot it publishes.
+"""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+import backend.protocol_rpc.health as health_module
+from backend.protocol_rpc.health_aggregator import (
+    LEADER_KEY,
+    SNAPSHOT_KEY,
+    ClusterHealthAggregator,
+)
+
+
+def _make_redis(lease_granted: bool, published=None):
+    client = AsyncMock()
+    client.eval.return_value = 1 if lease_granted else 0
+    client.get.return_value = published
+    return client
+
+
+def _make_aggregator(client, pod_id="pod-a"):
+    return ClusterHealthAggregator(
+        client, pod_id, lease_ttl_seconds=30, snapshot_ttl_seconds=30
+    )
+
+
+class TestClusterHealthAggregator:
+    @pytest.mark.asyncio
+    async def test_leader_computes_and_publishes(self):
+        client = _make_redis(lease_granted=True)
+        aggregator = _make_aggregator(client)
+        compute = AsyncMock(return_value={"issues": ["orphaned_transactions"]})
+
+        snapshot = await aggregator.get_snapshot(compute)
+
+        compute.assert_awaited_once()
+        assert aggregator.is_leader is True
+        assert snapshot["aggregator"]["computed_by"] == "pod-a"
+        assert snapshot["aggregator"]["source"] == "leader"
+        assert client.eval.call_args.args[2:] == (LEADER_KEY, "pod-a", 30000)
+        key, payload = client.set.call_args.args
+        assert key == SNAPSHOT_KEY
+        assert json.loads(payload)["issues"] == ["orphaned_transactions"]
+        assert client.set.call_args.kwargs == {"px": 30000}
+
+    @pytest.mark.asyncio
+    async def test_follower_serves_published_snapshot(self):
+        published = json.dumps(
+            {"issues": [], "aggregator": {"computed_by": "pod-a", "source": "leader"}}
+        )
+        client = _make_redis(lease_granted=False, published=published)
+        aggregator = _make_aggregator(client, pod_id="pod-b")
+        compute = AsyncMock()
+
+        snapshot = await aggregator.get_snapshot(compute)
+
+        compute.assert_not_awaited()
+        client.set.assert_not_awaited()
+        assert aggregator.is_leader is False
+        assert snapshot["aggregator"]["computed_by"] == "pod-a"
+
+    @pytest.mark.asyncio
+    async def test_follower_computes_locally_without_snapshot(self):
+        client = _make_redis(lease_granted=False, published=None)
+        aggregator = _make_aggregator(client, pod_id="pod-b")
+        compute = AsyncMock(return_value={"issues": []})
+
+        snapshot = await aggregator.get_snapshot(compute)
+
+        compute.assert_awaited_once()
+        client.set.assert_not_awaited()
+        assert snapshot["aggregator"]["source"] == "local"
+
+    @pytest.mark.asyncio
+    async def test_redis_error_falls_back_to_local_compute(self):
+        client = AsyncMock()
+        client.eval.side_effect = ConnectionError("redis down")
+        aggregator = _make_aggregator(client)
+        compute = AsyncMock(return_value={"issues": []})
+
+        snapshot = await aggregator.get_snapshot(compute)
+
+        compute.assert_awaited_once()
+        assert aggregator.is_leader is False
+        assert snapshot["aggregator"]["source"] == "local"
+
+    @pytest.mark.asyncio
+    async def test_close_releases_held_lease(self):
+        client = _make_redis(lease_granted=True)
+        aggregator = _make_aggregator(client)
+        await aggregator.get_snapshot(AsyncMock(return_value={}))
+        client.eval.reset_mock()
+
+        await aggregator.close()
+
+        assert client.eval.call_args.args[2:] == (LEADER_KEY, "pod-a")
+        client.aclose.assert_awaited_once()
+        assert aggregator.is_leader is False
+
+    def test_from_environment_requires_redis(self):
+        with patch.dict("os.environ", {}, clear=True):
+            assert ClusterHealthAggregator.from_environment(10) is None
+        with patch.dict(
+            "os.environ",
+            {"REDIS_URL": "redis://localhost:6379", "HEALTH_AGGREGATOR_ENABLED": "0"},
+        ):
+            assert ClusterHealthAggregator.from_environment(10) is None
+
+    def test_from_environment_lease_outlives_interval(self):
+        with patch.dict("os.environ", {"REDIS_URL": "redis://localhost:6379"}):
+            aggregator = ClusterHealthAggregator.from_environment(10)
+
+        assert aggregator is not None
+        assert aggregator.lease_ttl_ms == 30000
+
+
+class TestRunHealthChecksWithAggregator:
+    @pytest.mark.asyncio
+    async def test_follower_skips_cluster_queries(self, monkeypatch):
+        published = {
+            "services": {"consensus": {"status": "degraded"}},
+            "issues": ["no_consensus_progress"],
+            "degraded": True,
+            "total_decisions": 7,
+            "total_users": 2,
+            "pending_transactions": 1,
+            "pending_contracts": [],
+            "aggregator": {"computed_by": "pod-a", "source": "leader"},
+        }
+        client = _make_redis(lease_granted=False, published=json.dumps(published))
+        monkeypatch.setattr(
+            health_module, "_cluster_aggregator", _make_aggregator(client, "pod-b")
+        )
+        monkeypatch.setattr(
+            health_module,
+            "_check_genvm_health",
+            AsyncMock(return_value=(True, None, {})),
+        )
+        monkeypatch.setattr(
+            health_module,
+            "_check_database_health",
+            AsyncMock(return_value={"status": "healthy"}),
+        )
+        monkeypatch.setattr(
+            health_module,
+            "_check_memory_health",
+            AsyncMock(return_value={"status": "healthy"}),
+        )
+        monkeypatch.setattr(
+            health_module, "_check_redis_health", AsyncMock(return_value="healthy")
+        )
+        consensus_check = AsyncMock()
+        counts = AsyncMock()
+        monkeypatch.setattr(health_module, "_check_consensus_health", consensus_check)
+        monkeypatch.setattr(health_module, "_get_aggregate_counts", counts)
+
+        await health_module._run_health_checks()
+
+        consensus_check.assert_not_awaited()
+        counts.assert_not_awaited()
+        cache = health_module._health_cache
+        assert cache.status == "degraded"
+        assert cache.issues == ["no_consensus_progress"]
+        assert cache.total_decisions == 7
+        assert cache.services["health_aggregator"]["computed_by"] == "pod-a"
+        assert cache.services["health_aggregator"]["leader"] is False
@@ -0,0 +1,174 @@
+"""
+Tests for batched Redis event publishing from consensus workers.
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from backend.protocol_rpc.message_handler.redis_publisher import RedisBatchPublisher
+from backend.protocol_rpc.message_handler.redis_worker_handler import (
+    RedisWorkerMessageHandler,
+)
+from backend.protocol_rpc.message_handler.types import EventScope, EventType, LogEvent
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def publish(self, channel, message):
+        self.commands.append((channel, message))
+
+    async def execute(self):
+        if self.client.fail:
+            raise ConnectionError("redis down")
+        await asyncio.sleep(0)
+        self.client.batches.append(list(self.commands))
+        return [1] * len(self.commands)
+
+
+class _FakeRedis:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.batches = []
+
+    def pipeline(self, transaction=True):
+        assert transaction is False
+        return _FakePipeline(self)
+
+    @property
+    def messages(self):
+        return [m for batch in self.batches for m in batch]
+
+
+async def _drain(publisher):
+    for _ in range(200):
+        if not publisher.get_metrics()["queued"]:
+            await asyncio.sleep(0)
+            return
+        await asyncio.sleep(0.001)
+
+
+@pytest.mark.asyncio
+async def test_events_are_coalesced_into_ordered_batches():
+    redis = _FakeRedis()
+    publisher = RedisBatchPublisher(redis, batch_size=50, flush_interval=0.01)
+    publisher.start()
+
+    for i in range(120):
+        publisher.publish_nowait("transaction:events", str(i))
+    await publisher.close()
+
+    assert [m for _, m in redis.messages] == [str(i) for i in range(120)]
+    assert [len(b) for b in redis.batches] == [50, 50, 20]
+    metrics = publisher.get_metrics()
+    assert metrics["published_total"] == 120
+    assert metrics["batches_total"] == 3
+    assert metrics["max_batch_size"] == 50
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_flushes_after_interval():
+    redis = _FakeRedis()
+    publisher = RedisBatchPublisher(redis, batch_size=100, flush_interval=0.01)
+    publisher.start()
+
+    publisher.publish_nowait("consensus:events", "a")
+    publisher.publish_nowait("consensus:events", "b")
+    await asyncio.sleep(0)
+    assert redis.batches == []
+
+    await asyncio.sleep(0.05)
+    assert redis.batches == [[("consensus:events", "a"), ("consensus:events", "b")]]
+    assert publisher.get_metrics()["max_latency_seconds"] >= 0.005
+    await publisher.close()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest_events():
+    redis = _FakeRedis()
+    publisher = RedisBatchPublisher(
+        redis, max_queue_size=3, batch_size=10, flush_interval=1
+    )
+    publisher.start()
+
+    for i in range(5):
+        publisher.publish_nowait("c", str(i))
+    await publisher.close()
+
+    assert [m for _, m in redis.messages] == ["2", "3", "4"]
+    assert publisher.get_metrics()["dropped_total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_publish_waits_for_send_and_surfaces_errors():
+    redis = _FakeRedis()
+    publisher = RedisBatchPublisher(redis, batch_size=10, flush_interval=0.001)
+    publisher.start()
+
+    await publisher.publish("c", "sent")
+    assert redis.messages == [("c", "sent")]
+
+    redis.fail = True
+    with pytest.raises(ConnectionError):
+        await publisher.publish("c", "lost")
+    assert publisher.get_metrics()["failed_total"] == 1
+    await publisher.close()
+
+
+@pytest.mark.asyncio
+async def test_publish_nowait_from_another_thread():
+    redis = _FakeRedis()
+    publisher = RedisBatchPublisher(redis, batch_size=10, flush_interval=0.001)
+    publisher.start()
+
+    thread = threading.Thread(target=publisher.publish_nowait, args=("c", "x"))
+    thread.start()
+    thread.join()
+    await asyncio.sleep(0.02)
+    await _drain(publisher)
+
+    assert redis.messages == [("c", "x")]
+    await publisher.close()
+
+
+@pytest.mark.asyncio
+async def test_worker_handler_queues_events_without_creating_tasks():
+    redis = _FakeRedis()
+    handler = RedisWorkerMessageHandler(worker_id="worker-1", redis_url="redis://x")
+    handler.publisher = RedisBatchPublisher(redis, batch_size=10, flush_interval=0.001)
+    handler.publisher.start()
+    tasks_before = len(asyncio.all_tasks())
+
+    for i in range(5):
+        handler.send_message(
+            LogEvent(
+                name="transaction_status_updated",
+                type=EventType.INFO,
+                scope=EventScope.TRANSACTION,
+                message="status",
+                data={"i": i},
+                transaction_hash="0xabc",
+            ),
+            log_to_terminal=False,
+        )
+    assert len(asyncio.all_tasks()) == tasks_before
+    await handler.publisher.close()
+
+    assert len(redis.batches) == 1
+    channel, message = redis.messages[0]
+    payload = json.loads(message)
+    assert channel == RedisWorkerMessageHandler.TRANSACTION_CHANNEL
+    assert payload["worker_id"] == "worker-1"
+    assert payload["transaction_hash"] == "0xabc"
+    assert handler.get_publish_metrics()["published_total"] == 5
@@ -0,0 +1,162 @@
+"""
+Tests for concurrent JSON-RPC batch dispatch.
+
+Runs of read-only entries execute concurrently (bounded per batch); other
+methods act as barriers; responses keep request order.
+"""
+
+import asyncio
+import json
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from starlette.requests import Request
+
+from backend.protocol_rpc.fastapi_rpc_router import (
+    FastAPIRPCRouter,
+    _isolated_request,
+    get_batch_concurrency,
+)
+from backend.protocol_rpc.rpc_endpoint_manager import (
+    RPCEndpointDefinition,
+    RPCEndpointManager,
+)
+
+
+def make_request(app: FastAPI, payload: Any) -> Request:
+    body = json.dumps(payload).encode()
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/api",
+        "headers": [(b"content-type", b"application/json")],
+        "app": app,
+        "query_string": b"",
+        "root_path": "",
+        "scheme": "http",
+        "server": ("localhost", 4000),
+    }
+    return Request(scope, receive)
+
+
+class StubMessageHandler:
+    def send_message(self, event: object) -> None:
+        pass
+
+
+class Tracker:
+    def __init__(self) -> None:
+        self.active = 0
+        self.max_active = 0
+        self.events: list[str] = []
+
+    def handler(self, name: str, delay: float):
+        async def handle(value: int) -> int:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.events.append(f"{name}:start")
+            await asyncio.sleep(delay)
+            self.events.append(f"{name}:end")
+            self.active -= 1
+            return value
+
+        return handle
+
+
+def _setup(batch_concurrency: int):
+    app = FastAPI()
+    manager = RPCEndpointManager(
+        logger=StubMessageHandler(), dependency_overrides_provider=app
+    )
+    tracker = Tracker()
+    manager.register(
+        RPCEndpointDefinition(name="eth_call", handler=tracker.handler("read", 0.05))
+    )
+    manager.register(
+        RPCEndpointDefinition(
+            name="eth_sendRawTransaction", handler=tracker.handler("write", 0.01)
+        )
+    )
+    router = FastAPIRPCRouter(manager, batch_concurrency=batch_concurrency)
+    return router, app, tracker
+
+
+def _batch(*methods: str) -> list[dict]:
+    return [
+        {"jsonrpc": "2.0", "method": method, "params": [i], "id": i}
+        for i, method in enumerate(methods)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_read_entries_run_concurrently_in_order():
+    router, app, tracker = _setup(batch_concurrency=4)
+
+    response = await router.handle_http_request(
+        make_request(app, _batch(*["eth_call"] * 8))
+    )
+
+    data = json.loads(response.body)
+    assert [item["id"] for item in data] == list(range(8))
+    assert [item["result"] for item in data] == list(range(8))
+    assert tracker.max_active == 4
+
+
+@pytest.mark.asyncio
+async def test_state_changing_entry_is_a_barrier():
+    router, app, tracker = _setup(batch_concurrency=4)
+
+    response = await router.handle_http_request(
+        make_request(app, _batch("eth_call", "eth_call", "eth_sendRawTransaction"))
+    )
+
+    assert [item["id"] for item in json.loads(response.body)] == [0, 1, 2]
+    write_start = tracker.events.index("write:start")
+    assert tracker.events[:write_start].count("read:end") == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrency_of_one_is_sequential():
+    router, app, tracker = _setup(batch_concurrency=1)
+
+    await router.handle_http_request(make_request(app, _batch(*["eth_call"] * 3)))
+
+    assert tracker.max_active == 1
+
+
+@pytest.mark.asyncio
+async def test_invalid_entries_keep_their_position():
+    router, app, _ = _setup(batch_concurrency=4)
+    payload = _batch("eth_call", "eth_call")
+    payload.insert(1, {"jsonrpc": "2.0", "method": "eth_call", "id": None})
+    payload.insert(1, {"jsonrpc": "2.0", "method": "unknown", "id": 7})
+
+    response = await router.handle_http_request(make_request(app, payload))
+
+    data = json.loads(response.body)
+    assert [item["id"] for item in data] == [0, 7, 1]
+    assert data[1]["error"]["code"] == -32601
+
+
+def test_isolated_request_has_own_scope():
+    request = make_request(FastAPI(), {})
+    isolated = _isolated_request(request)
+
+    isolated.scope["fastapi_inner_astack"] = object()
+
+    assert "fastapi_inner_astack" not in request.scope
+    assert isolated.headers == request.headers
+
+
+def test_batch_concurrency_capped_by_genvm_slots(monkeypatch):
+    monkeypatch.setenv("RPC_BATCH_CONCURRENCY", "16")
+    monkeypatch.setenv("GENVM_MAX_CONCURRENT", "6")
+    assert get_batch_concurrency() == 6
+
+    monkeypatch.setenv("RPC_BATCH_CONCURRENCY", "0")
+    assert get_batch_concurrency() == 1
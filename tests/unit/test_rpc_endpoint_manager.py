@@ -147,3 +147,148 @@ async def test_manager_returns_invalid_params_when_arguments_missing():
 
     assert response.error["code"] == -32602
     assert "missing" in response.error["message"].lower()
+
+
+@pytest.mark.asyncio
+async def test_sync_endpoints_with_dependencies_run_off_the_event_loop():
+    import threading
+
+    threads = {}
+    app = FastAPI()
+
+    def provide_session() -> str:
+        return "db-session"
+
+    def with_session(session: str = Depends(provide_session)):
+        threads["with_session"] = threading.current_thread().name
+        return session
+
+    def plain():
+        threads["plain"] = threading.current_thread().name
+        return "ok"
+
+    manager = RPCEndpointManager(
+        StubMessageHandler(), dependency_overrides_provider=app
+    )
+    manager.register(RPCEndpointDefinition(name="with_session", handler=with_session))
+    manager.register(RPCEndpointDefinition(name="plain", handler=plain))
+    request = Request(
+        {
+            "type": "http",
+            "method": "POST",
+            "headers": [],
+            "app": app,
+            "query_string": b"",
+            "path": "/api",
+            "root_path": "",
+            "scheme": "http",
+            "server": ("localhost", 4000),
+        }
+    )
+
+    first = await manager.invoke(
+        JSONRPCRequest(method="with_session", params=[], id=1), request
+    )
+    second = await manager.invoke(
+        JSONRPCRequest(method="plain", params=[], id=2), request
+    )
+
+    assert first.result == "db-session"
+    assert second.result == "ok"
+    assert threads["with_session"].startswith("db-offload")
+    assert threads["plain"] == threading.current_thread().name
+
+
+def _request_for(app: FastAPI) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "POST",
+            "headers": [],
+            "app": app,
+            "query_string": b"",
+            "path": "/api",
+            "root_path": "",
+            "scheme": "http",
+            "server": ("localhost", 4000),
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_planned_dependencies_skip_solve_dependencies(monkeypatch):
+    import backend.protocol_rpc.rpc_endpoint_manager as manager_module
+
+    async def unexpected_solve(**kwargs):
+        raise AssertionError("solve_dependencies should not run")
+
+    monkeypatch.setattr(manager_module, "solve_dependencies", unexpected_solve)
+    events = []
+    app = FastAPI()
+    app.state.prefix = "db"
+
+    def get_prefix(request: Request) -> str:
+        return request.app.state.prefix
+
+    def get_session(prefix: str = Depends(get_prefix)):
+        events.append("open")
+        try:
+            yield f"{prefix}-session"
+            events.append("commit")
+        except Exception:
+            events.append("rollback")
+            raise
+
+    def get_processor(session: str = Depends(get_session)) -> str:
+        return f"processor({session})"
+
+    def count(
+        address: str,
+        session: str = Depends(get_session),
+        processor: str = Depends(get_processor),
+    ) -> str:
+        if address == "bad":
+            raise ValueError("bad address")
+        return f"{address}:{session}:{processor}"
+
+    manager = RPCEndpointManager(
+        StubMessageHandler(), dependency_overrides_provider=app
+    )
+    manager.register(RPCEndpointDefinition(name="count", handler=count))
+    assert manager._endpoints["count"].dependency_plan is not None
+
+    ok = await manager.invoke(
+        JSONRPCRequest(method="count", params=["0xabc"], id=1), _request_for(app)
+    )
+    assert ok.result == "0xabc:db-session:processor(db-session)"
+    # The shared session dependency is opened once and closed after the call.
+    assert events == ["open", "commit"]
+
+    failed = await manager.invoke(
+        JSONRPCRequest(method="count", params=["bad"], id=2), _request_for(app)
+    )
+    assert failed.error["code"] == -32603
+    assert events[2:] == ["open", "rollback"]
+
+
+@pytest.mark.asyncio
+async def test_dependency_overrides_use_fastapi_resolution():
+    app = FastAPI()
+
+    def provide_session() -> str:
+        return "db-session"
+
+    async def endpoint(session: str = Depends(provide_session)):
+        return session
+
+    app.dependency_overrides[provide_session] = lambda: "override-session"
+    manager = RPCEndpointManager(
+        StubMessageHandler(), dependency_overrides_provider=app
+    )
+    manager.register(RPCEndpointDefinition(name="session", handler=endpoint))
+
+    response = await manager.invoke(
+        JSONRPCRequest(method="session", params=[], id=1), _request_for(app)
+    )
+
+    assert response.result == "override-session"
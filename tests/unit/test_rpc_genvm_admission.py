@@ -1,10 +1,10 @@
-import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from backend.node.types import ExecutionResultStatus
 from backend.protocol_rpc import endpoints
+from backend.protocol_rpc.genvm_admission import GenVMAdmission
 from backend.protocol_rpc.exceptions import JSONRPCError
 
 
@@ -21,8 +21,9 @@ class _AsyncSnapshot:
 
 @pytest.mark.asyncio
 async def test_genvm_admission_rejects_when_slots_full(monkeypatch):
-    monkeypatch.setattr(endpoints, "_GENVM_CONCURRENCY", 1)
-    monkeypatch.setattr(endpoints, "_genvm_admission_semaphore", asyncio.Semaphore(0))
+    monkeypatch.setattr(
+        endpoints, "genvm_admission", GenVMAdmission(max_concurrent=0, queue_size=0)
+    )
 
     with pytest.raises(JSONRPCError) as exc_info:
         async with endpoints._admit_genvm_call("eth_call", "0xabc"):
@@ -34,20 +35,21 @@ async def test_genvm_admission_rejects_when_slots_full(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_genvm_admission_releases_slot_after_error(monkeypatch):
-    semaphore = asyncio.Semaphore(1)
-    monkeypatch.setattr(endpoints, "_genvm_admission_semaphore", semaphore)
+    admission = GenVMAdmission(max_concurrent=1)
+    monkeypatch.setattr(endpoints, "genvm_admission", admission)
 
     with pytest.raises(RuntimeError):
         async with endpoints._admit_genvm_call("eth_call", "0xabc"):
             raise RuntimeError("boom")
 
-    assert semaphore._value == 1
+    assert admission.get_metrics()["active"] == 0
 
 
 @pytest.mark.asyncio
 async def test_eth_call_rejects_before_db_snapshot_when_genvm_full(monkeypatch):
-    monkeypatch.setattr(endpoints, "_GENVM_CONCURRENCY", 1)
-    monkeypatch.setattr(endpoints, "_genvm_admission_semaphore", asyncio.Semaphore(0))
+    monkeypatch.setattr(
+        endpoints, "genvm_admission", GenVMAdmission(max_concurrent=0, queue_size=0)
+    )
     monkeypatch.setattr(
         endpoints, "handle_consensus_data_call", lambda *args, **kwargs: None
     )
@@ -80,8 +82,9 @@ async def test_eth_call_rejects_before_db_snapshot_when_genvm_full(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_gen_call_rejects_before_validator_snapshot_when_genvm_full(monkeypatch):
-    monkeypatch.setattr(endpoints, "_GENVM_CONCURRENCY", 1)
-    monkeypatch.setattr(endpoints, "_genvm_admission_semaphore", asyncio.Semaphore(0))
+    monkeypatch.setattr(
+        endpoints, "genvm_admission", GenVMAdmission(max_concurrent=0, queue_size=0)
+    )
 
     validators_manager = MagicMock()
 
@@ -102,8 +105,9 @@ async def test_gen_call_rejects_before_validator_snapshot_when_genvm_full(monkey
 
 @pytest.mark.asyncio
 async def test_sim_call_rejects_before_validator_snapshot_when_genvm_full(monkeypatch):
-    monkeypatch.setattr(endpoints, "_GENVM_CONCURRENCY", 1)
-    monkeypatch.setattr(endpoints, "_genvm_admission_semaphore", asyncio.Semaphore(0))
+    monkeypatch.setattr(
+        endpoints, "genvm_admission", GenVMAdmission(max_concurrent=0, queue_size=0)
+    )
 
     validators_manager = MagicMock()
 
@@ -124,8 +128,8 @@ async def test_sim_call_rejects_before_validator_snapshot_when_genvm_full(monkey
 
 @pytest.mark.asyncio
 async def test_eth_call_releases_admission_slot_after_success(monkeypatch):
-    semaphore = asyncio.Semaphore(1)
-    monkeypatch.setattr(endpoints, "_genvm_admission_semaphore", semaphore)
+    admission = GenVMAdmission(max_concurrent=1)
+    monkeypatch.setattr(endpoints, "genvm_admission", admission)
     monkeypatch.setattr(
         endpoints, "handle_consensus_data_call", lambda *args, **kwargs: None
     )
@@ -172,7 +176,7 @@ async def test_eth_call_releases_admission_slot_after_success(monkeypatch):
             )
 
     assert result == "0x1234"
-    assert semaphore._value == 1
+    assert admission.get_metrics()["active"] == 0
     node.get_contract_data.assert_awaited_once_with(
         from_address=validator.address,
         calldata=decoded_data.calldata,
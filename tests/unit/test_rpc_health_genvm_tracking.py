@@ -350,6 +350,11 @@ class TestBackgroundHealthGenVMOrdering:
         monkeypatch.setattr(
             health_module, "_get_pending_contracts", AsyncMock(return_value=[])
         )
+        monkeypatch.setattr(
+            health_module,
+            "_check_value_conservation",
+            AsyncMock(return_value={"status": "healthy"}),
+        )
 
         await health_module._run_health_checks()
 
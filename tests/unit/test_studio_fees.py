@@ -15,7 +15,10 @@ from backend.consensus.base import (
 from backend.domain.types import TransactionType
 from backend.errors.errors import InvalidTransactionError
 from backend.database_handler.accounts_manager import _infer_final_round
-from backend.database_handler.transactions_processor import TransactionsProcessor
+from backend.database_handler.transactions_processor import (
+    HEAVY_TRANSACTION_COLUMNS,
+    TransactionsProcessor,
+)
 from backend.protocol_rpc.exceptions import JSONRPCError
 from backend.protocol_rpc.endpoints import (
     _current_fee_round,
@@ -91,6 +94,7 @@ from backend.protocol_rpc.fees import (
     required_fee_deposit,
     settle_fee_accounting,
     studio_fee_config,
+    studio_fee_policy,
     unwind_reveal_message_fees,
     validate_message_allocations,
     validate_transaction_fee_deposit,
@@ -110,6 +114,18 @@ from backend.protocol_rpc.types import (
 )
 
 
+@pytest.fixture
+def reload_fee_policy(monkeypatch):
+    """Rebuild the process-wide fee policy from the patched environment."""
+
+    def reload():
+        # Registering the current state restores it after the test.
+        monkeypatch.setattr(studio_fee_policy, "_state", studio_fee_policy._state)
+        studio_fee_policy.reload()
+
+    return reload
+
+
 def _fees_distribution(
     *,
     leader_timeunits=100,
@@ -5562,11 +5578,12 @@ def test_message_value_withdrawal_drops_unbacked_external_value():
 
 
 def test_message_dispatch_creates_mode1_child_fee_accounting_from_pending_metadata(
-    monkeypatch,
+    monkeypatch, reload_fee_policy
 ):
     monkeypatch.setenv("GENLAYER_STUDIO_GEN_PER_TIME_UNIT", "1")
     monkeypatch.setenv("GENLAYER_STUDIO_STORAGE_UNIT_PRICE", "0")
     monkeypatch.setenv("GENLAYER_STUDIO_RECEIPT_GAS_PRICE", "0")
+    reload_fee_policy()
     policy = StudioFeePolicy.from_env()
     fee_params = _encode_internal_fee_params()
     fees_distribution = _fees_distribution(total_message_fees=55)
@@ -5625,11 +5642,12 @@ def test_message_dispatch_creates_mode1_child_fee_accounting_from_pending_metada
 
 
 def test_message_dispatch_fills_mode2_child_fee_accounting_from_allocation_subtree(
-    monkeypatch,
+    monkeypatch, reload_fee_policy
 ):
     monkeypatch.setenv("GENLAYER_STUDIO_GEN_PER_TIME_UNIT", "1")
     monkeypatch.setenv("GENLAYER_STUDIO_STORAGE_UNIT_PRICE", "0")
     monkeypatch.setenv("GENLAYER_STUDIO_RECEIPT_GAS_PRICE", "0")
+    reload_fee_policy()
     policy = StudioFeePolicy.from_env()
     root_fee_params = _encode_internal_fee_params(leader_timeunits=6)
     child_fee_params = _encode_internal_fee_params(leader_timeunits=7)
@@ -5700,11 +5718,12 @@ def test_message_dispatch_fills_mode2_child_fee_accounting_from_allocation_subtr
 
 
 def test_message_dispatch_records_revealed_external_message_execution_fees(
-    monkeypatch,
+    monkeypatch, reload_fee_policy
 ):
     monkeypatch.setenv("GENLAYER_STUDIO_GEN_PER_TIME_UNIT", "1")
     monkeypatch.setenv("GENLAYER_STUDIO_STORAGE_UNIT_PRICE", "0")
     monkeypatch.setenv("GENLAYER_STUDIO_RECEIPT_GAS_PRICE", "7")
+    reload_fee_policy()
     policy = StudioFeePolicy.from_env()
     recipient = "0x4444444444444444444444444444444444444444"
     calldata = b"\xaa\xbb\xcc\xdd\x01\x02"
@@ -6389,6 +6408,35 @@ def test_transaction_payload_includes_canonical_fee_object_with_decimal_strings(
     }
 
 
+def test_lean_transaction_payload_derives_fields_without_heavy_columns():
+    accounting = create_fee_accounting(
+        fees_distribution=_fees_distribution(),
+        num_of_validators=5,
+        submitted_value=10_000,
+        user_value=0,
+        policy=StudioFeePolicy(storage_unit_price=1, receipt_gas_price=1),
+        allow_low_execution_budget=True,
+    )
+    transaction = _processor_transaction(
+        accounting=accounting, execution_result="SUCCESS"
+    )
+    full = TransactionsProcessor._parse_transaction_data(transaction)
+
+    lean = TransactionsProcessor._parse_transaction_data(
+        transaction,
+        {
+            "fee_accounting": accounting,
+            "receipt_summary": transaction.consensus_data,
+        },
+    )
+
+    for key in HEAVY_TRANSACTION_COLUMNS:
+        assert key not in lean
+        full.pop(key)
+    assert lean == full
+    assert lean["txExecutionResultName"] == "FINISHED_WITH_RETURN"
+
+
 def test_transaction_payload_fees_null_when_fee_accounting_disabled():
     parsed = TransactionsProcessor._parse_transaction_data(_processor_transaction())
 
@@ -2,7 +2,6 @@
 
 from unittest.mock import Mock, patch
 from backend.database_handler.transactions_processor import TransactionsProcessor
-from backend.database_handler.models import Transactions
 from sqlalchemy.orm import Session
 
 
@@ -12,36 +11,42 @@ class TestGetTransactionCount:
     def setup_method(self, method):
         """Set up test fixtures"""
         self.mock_session = Mock(spec=Session)
-        self.mock_web3 = Mock()
+        self.checksum_patcher = patch(
+            "backend.database_handler.transactions_processor.to_checksum_address"
+        )
+        self.mock_to_checksum_address = self.checksum_patcher.start()
         self.processor = TransactionsProcessor(Mock())
-        self.processor.web3 = self.mock_web3
         self.processor.session = self.mock_session
 
+    def teardown_method(self, method):
+        self.checksum_patcher.stop()
+
+    def _mock_count(self, value):
+        self.mock_session.execute.return_value.scalar.return_value = value
+
+    def _queried_statement(self):
+        self.mock_session.execute.assert_called_once()
+        return self.mock_session.execute.call_args[0][0]
+
     def test_get_transaction_count_with_checksum_address(self):
         """Test get_transaction_count with address normalization"""
         # Setup
         test_address = "0xabcdef1234567890abcdef1234567890abcdef12"
         checksum_address = "0xABcdEF1234567890aBcDef1234567890AbCdEf12"
 
-        self.mock_web3.to_checksum_address.return_value = checksum_address
-
-        # Mock database query
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.count.return_value = 5
-        self.mock_session.query.return_value = mock_query
+        self.mock_to_checksum_address.return_value = checksum_address
+        self._mock_count(5)
 
         # Execute
         result = self.processor.get_transaction_count(test_address)
 
-        # Verify
-        self.mock_web3.to_checksum_address.assert_called_once_with(test_address)
-        self.mock_session.query.assert_called_once_with(Transactions)
-        mock_query.filter.assert_called_once()
-        # Verify the filter checks from_address with checksum address
-        filter_call = mock_query.filter.call_args[0][0]
-        assert str(filter_call.left) == "transactions.from_address"
-        assert str(filter_call.right.value) == checksum_address
+        # Verify the counter row is looked up by checksum address
+        self.mock_to_checksum_address.assert_called_once_with(test_address)
+        statement = self._queried_statement()
+        assert str(statement.selected_columns[0]) == "address_activity.sent_count"
+        where = statement.whereclause
+        assert str(where.left) == "address_activity.address"
+        assert where.right.value == checksum_address
         assert result == 5
 
     def test_get_transaction_count_with_invalid_address(self):
@@ -49,93 +54,76 @@ class TestGetTransactionCount:
         # Setup
         test_address = "invalid_address"
 
-        self.mock_web3.to_checksum_address.side_effect = Exception("Invalid address")
-
-        # Mock database query with original address
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.count.return_value = 3
-        self.mock_session.query.return_value = mock_query
+        self.mock_to_checksum_address.side_effect = Exception("Invalid address")
+        self._mock_count(3)
 
         # Execute
         result = self.processor.get_transaction_count(test_address)
 
         # Verify - should use original address after checksum fails
-        self.mock_web3.to_checksum_address.assert_called_once_with(test_address)
-        self.mock_session.query.assert_called_once_with(Transactions)
-        mock_query.filter.assert_called_once()
-        # Verify the filter uses the original address since checksum failed
-        filter_call = mock_query.filter.call_args[0][0]
-        assert str(filter_call.left) == "transactions.from_address"
-        assert str(filter_call.right.value) == test_address
+        self.mock_to_checksum_address.assert_called_once_with(test_address)
+        assert self._queried_statement().whereclause.right.value == test_address
         assert result == 3
 
     def test_get_transaction_count_returns_zero_when_no_transactions(self):
-        """Test get_transaction_count returns 0 when no transactions exist"""
+        """Test get_transaction_count returns 0 for an address with no counter row"""
         # Setup
         test_address = "0xABcdEF1234567890aBcDef1234567890AbCdEf12"
 
-        self.mock_web3.to_checksum_address.return_value = test_address
-
-        # Mock database query returning 0
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.count.return_value = 0
-        self.mock_session.query.return_value = mock_query
+        self.mock_to_checksum_address.return_value = test_address
+        self._mock_count(None)
 
         # Execute
         result = self.processor.get_transaction_count(test_address)
 
         # Verify
         assert result == 0
-        self.mock_session.query.assert_called_once_with(Transactions)
-        mock_query.filter.assert_called_once()
-        mock_query.count.assert_called_once()
+        self._queried_statement()
 
-    def test_get_transaction_count_with_multiple_transactions(self):
-        """Test get_transaction_count correctly counts multiple transactions"""
+    def test_get_transaction_count_does_not_scan_transactions(self):
+        """Test get_transaction_count reads the maintained counter"""
         # Setup
         test_address = "0xABcdEF1234567890aBcDef1234567890AbCdEf12"
 
-        self.mock_web3.to_checksum_address.return_value = test_address
+        self.mock_to_checksum_address.return_value = test_address
+        self._mock_count(8)
+
+        # Execute
+        result = self.processor.get_transaction_count(test_address)
+
+        # Verify no query against transactions is issued
+        self.mock_session.query.assert_not_called()
+        assert "transactions" not in str(self._queried_statement())
+        assert result == 8
 
-        # Mock database query returning count of 7
+    def test_get_transaction_count_for_mints_counts_sender_less_rows(self):
+        """Test get_transaction_count(None) numbers mint transactions"""
         mock_query = Mock()
         mock_query.filter.return_value = mock_query
-        mock_query.count.return_value = 7
+        mock_query.count.return_value = 4
         self.mock_session.query.return_value = mock_query
 
-        # Execute
-        result = self.processor.get_transaction_count(test_address)
-
-        # Verify database is queried and correct count returned
-        assert result == 7
-        self.mock_session.query.assert_called_once_with(Transactions)
-        mock_query.filter.assert_called_once()
-        mock_query.count.assert_called_once()
+        assert self.processor.get_transaction_count(None) == 4
+        filter_call = mock_query.filter.call_args[0][0]
+        assert str(filter_call) == "transactions.from_address IS NULL"
+        self.mock_session.execute.assert_not_called()
 
-    def test_get_transaction_count_database_query_structure(self):
-        """Test that get_transaction_count queries database with correct structure"""
+    def test_pending_count_reads_pending_counter(self):
+        """Test get_pending_transaction_count_for_address reads pending_count"""
         # Setup
         test_address = "0xABcdEF1234567890aBcDef1234567890AbCdEf12"
 
-        self.mock_web3.to_checksum_address.return_value = test_address
-
-        # Mock database query
-        mock_query = Mock()
-        mock_filter = Mock()
-        mock_query.filter.return_value = mock_filter
-        mock_filter.count.return_value = 8
-        self.mock_session.query.return_value = mock_query
+        self.mock_to_checksum_address.return_value = test_address
+        self._mock_count(2)
 
         # Execute
-        result = self.processor.get_transaction_count(test_address)
+        result = self.processor.get_pending_transaction_count_for_address(test_address)
 
-        # Verify correct database query structure
-        self.mock_session.query.assert_called_once_with(Transactions)
-        mock_query.filter.assert_called_once()
-        mock_filter.count.assert_called_once()
-        assert result == 8
+        # Verify
+        statement = self._queried_statement()
+        assert str(statement.selected_columns[0]) == "address_activity.pending_count"
+        assert statement.whereclause.right.value == test_address
+        assert result == 2
 
 
 class TestSetTransactionAppealProcessingTime:
@@ -0,0 +1,155 @@
+"""
+Tests for simulation (sim_config) validator snapshots.
+
+Simulation backends are keyed by provider config and kept warm in the LLM
+module, so repeated simulations do not restart it and registry validators
+stay loaded while simulations run.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+import backend.domain.types as domain
+from backend.validators import SIM_LLM_ID_PREFIX, Manager
+
+
+def _validator(address: str, provider: str = "openai", model: str = "gpt-4o"):
+    return domain.Validator(
+        address=address,
+        stake=0,
+        llmprovider=domain.LLMProvider(
+            provider=provider,
+            model=model,
+            config={"temperature": 0.75},
+            plugin=provider,
+            plugin_config={
+                "api_key_env_var": f"{provider.upper()}_API_KEY",
+                "api_url": f"{provider}_url",
+            },
+        ),
+    )
+
+
+def _make_manager(pool_size: int = 16) -> Manager:
+    genvm_manager = Mock()
+    genvm_manager.stop_module = AsyncMock()
+    genvm_manager.start_module = AsyncMock()
+    genvm_manager.llm_config_base = {}
+    manager = Manager(Mock(), genvm_manager)
+    manager.sim_pool_size = pool_size
+    return manager
+
+
+def _loaded_backends(manager: Manager) -> dict:
+    return manager.genvm_manager.start_module.await_args[0][1]["backends"]
+
+
+@pytest.mark.asyncio
+async def test_same_provider_config_reuses_running_module():
+    manager = _make_manager()
+
+    async with manager.temporal_snapshot([_validator("0x1")]) as first:
+        first_id = first.nodes[0].genvm_host_data["studio_llm_id"]
+    async with manager.temporal_snapshot([_validator("0x2")]) as second:
+        second_id = second.nodes[0].genvm_host_data["studio_llm_id"]
+
+    assert first_id == second_id
+    assert first_id.startswith(SIM_LLM_ID_PREFIX)
+    assert manager.genvm_manager.start_module.await_count == 1
+    assert manager.genvm_manager.stop_module.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_registry_backends_stay_loaded_during_simulation():
+    manager = _make_manager()
+    await manager._change_providers_from_snapshot(
+        await manager._get_snap_from_validators([_validator("0xreg")])
+    )
+
+    async with manager.temporal_snapshot([_validator("0xsim", "anthropic", "c")]):
+        backends = _loaded_backends(manager)
+
+    assert "node-0xreg" in backends
+    assert any(llm_id.startswith(SIM_LLM_ID_PREFIX) for llm_id in backends)
+    # The registry snapshot is untouched and no restore restart is needed.
+    async with manager.snapshot() as snap:
+        assert [n.validator.address for n in snap.nodes] == ["0xreg"]
+    assert manager.genvm_manager.start_module.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_registry_reload_keeps_warm_sim_backends():
+    manager = _make_manager()
+    async with manager.temporal_snapshot([_validator("0xsim")]) as snap:
+        sim_id = snap.nodes[0].genvm_host_data["studio_llm_id"]
+
+    await manager._change_providers_from_snapshot(
+        await manager._get_snap_from_validators([_validator("0xreg")])
+    )
+
+    assert set(_loaded_backends(manager)) == {"node-0xreg", sim_id}
+
+
+@pytest.mark.asyncio
+async def test_fallback_points_at_sim_backend():
+    manager = _make_manager()
+    validators = [_validator("0x1", "openai", "a"), _validator("0x2", "anthropic", "b")]
+
+    async with manager.temporal_snapshot(validators) as snap:
+        ids = [n.genvm_host_data["studio_llm_id"] for n in snap.nodes]
+        fallbacks = [n.genvm_host_data["fallback_llm_id"] for n in snap.nodes]
+
+    assert fallbacks == [ids[1], ids[0]]
+    assert set(ids) <= set(_loaded_backends(manager))
+
+
+@pytest.mark.asyncio
+async def test_pool_evicts_idle_backends_but_not_in_use_ones():
+    manager = _make_manager(pool_size=1)
+
+    async with manager.temporal_snapshot([_validator("0x1", model="a")]) as held:
+        held_id = held.nodes[0].genvm_host_data["studio_llm_id"]
+        async with manager.temporal_snapshot([_validator("0x2", model="b")]) as snap:
+            other_id = snap.nodes[0].genvm_host_data["studio_llm_id"]
+            assert set(_loaded_backends(manager)) == {held_id, other_id}
+
+    async with manager.temporal_snapshot([_validator("0x3", model="c")]) as snap:
+        newest_id = snap.nodes[0].genvm_host_data["studio_llm_id"]
+
+    assert set(_loaded_backends(manager)) == {newest_id}
+    assert not manager._sim_backends_in_use
+
+
+@pytest.mark.asyncio
+async def test_concurrent_simulations_share_one_restart():
+    manager = _make_manager()
+    started = asyncio.Event()
+
+    async def slow_start(*args, **kwargs):
+        started.set()
+        await asyncio.sleep(0.01)
+
+    manager.genvm_manager.start_module.side_effect = slow_start
+
+    async def simulate(address):
+        async with manager.temporal_snapshot([_validator(address)]):
+            pass
+
+    await asyncio.gather(*(simulate(f"0x{i}") for i in range(5)))
+
+    assert manager.genvm_manager.start_module.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_load_is_not_kept_warm():
+    manager = _make_manager()
+    manager.genvm_manager.start_module.side_effect = RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        async with manager.temporal_snapshot([_validator("0x1")]):
+            pass
+
+    assert not manager._sim_backends
+    assert not manager._sim_backends_in_use
@@ -0,0 +1,114 @@
+"""
+Tests for batch claiming in the consensus worker.
+
+`_try_claim_work` fills all free processing slots with one claim query per
+work kind (appeals > finalizations > transactions) instead of claiming one
+row per round-trip.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+def _make_worker(max_parallel_txs="4", batch_size=None):
+    from backend.consensus.worker import ConsensusWorker
+
+    env = {"MAX_PARALLEL_TXS_PER_WORKER": max_parallel_txs}
+    if batch_size is not None:
+        env["WORKER_CLAIM_BATCH_SIZE"] = batch_size
+
+    with patch.dict("os.environ", env):
+        worker = ConsensusWorker(
+            get_session=MagicMock(),
+            msg_handler=MagicMock(),
+            consensus_service=MagicMock(),
+            validators_manager=MagicMock(),
+            genvm_manager=MagicMock(),
+            worker_id="test-worker",
+        )
+    worker._process_appeal_task = AsyncMock()
+    worker._process_finalization_task = AsyncMock()
+    worker._process_transaction_task = AsyncMock()
+    worker.release_transaction = MagicMock()
+    return worker
+
+
+def _items(*hashes):
+    return [{"hash": h} for h in hashes]
+
+
+class TestClaimBatchSize:
+    def test_defaults_to_max_parallel_txs(self):
+        assert _make_worker("4").claim_batch_size == 4
+
+    def test_clamped_to_max_parallel_txs(self):
+        assert _make_worker("4", "10").claim_batch_size == 4
+
+    def test_invalid_value_uses_default(self):
+        assert _make_worker("3", "abc").claim_batch_size == 3
+
+    def test_minimum_is_one(self):
+        assert _make_worker("3", "0").claim_batch_size == 1
+
+
+class TestTryClaimWork:
+    @pytest.mark.asyncio
+    async def test_fills_free_slots_by_priority(self):
+        worker = _make_worker("4")
+        worker.claim_next_appeals = AsyncMock(return_value=_items("0xa"))
+        worker.claim_next_finalizations = AsyncMock(return_value=_items("0xf"))
+        worker.claim_next_transactions = AsyncMock(return_value=_items("0x1", "0x2"))
+
+        assert await worker._try_claim_work(MagicMock()) is True
+
+        worker.claim_next_appeals.assert_awaited_once()
+        assert worker.claim_next_appeals.await_args.args[1] == 4
+        assert worker.claim_next_finalizations.await_args.args[1] == 3
+        assert worker.claim_next_transactions.await_args.args[1] == 2
+        assert len(worker._active_tasks) == 4
+
+    @pytest.mark.asyncio
+    async def test_skips_lower_priority_when_slots_full(self):
+        worker = _make_worker("2")
+        worker.claim_next_appeals = AsyncMock(return_value=_items("0xa", "0xb"))
+        worker.claim_next_finalizations = AsyncMock(return_value=[])
+        worker.claim_next_transactions = AsyncMock(return_value=[])
+
+        assert await worker._try_claim_work(MagicMock()) is True
+
+        worker.claim_next_finalizations.assert_not_awaited()
+        worker.claim_next_transactions.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_no_free_slots_claims_nothing(self):
+        worker = _make_worker("1")
+        worker._active_tasks.add(MagicMock())
+        worker.claim_next_appeals = AsyncMock(return_value=[])
+
+        assert await worker._try_claim_work(MagicMock()) is False
+        worker.claim_next_appeals.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_backoff_transactions_are_released(self):
+        worker = _make_worker("2")
+        worker.claim_next_appeals = AsyncMock(return_value=[])
+        worker.claim_next_finalizations = AsyncMock(return_value=[])
+        worker.claim_next_transactions = AsyncMock(return_value=_items("0x1", "0x2"))
+        worker._is_in_backoff = lambda tx: tx["hash"] == "0x1"
+        session = MagicMock()
+
+        assert await worker._try_claim_work(session) is True
+
+        worker.release_transaction.assert_called_once_with(session, "0x1")
+        assert len(worker._active_tasks) == 1
+
+    @pytest.mark.asyncio
+    async def test_single_claim_wrappers_use_limit_one(self):
+        worker = _make_worker("4")
+        worker.claim_next_transactions = AsyncMock(return_value=_items("0x1"))
+
+        assert await worker.claim_next_transaction(MagicMock()) == {"hash": "0x1"}
+        assert worker.claim_next_transactions.await_args.kwargs == {"limit": 1}
+
+        worker.claim_next_transactions = AsyncMock(return_value=[])
+        assert await worker.claim_next_transaction(MagicMock()) is None
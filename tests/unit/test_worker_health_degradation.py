@@ -6,6 +6,7 @@ from unittest.mock import patch, MagicMock
 
 # Import the module-level functions and variables
 import backend.consensus.worker_service as worker_service
+from backend.consensus.execution_scheduler import ExecutionScheduler
 
 
 class TestGenVMFailureTracking:
@@ -168,3 +169,50 @@ class TestEnvVarThresholdConfig:
 
             threshold = int(os.environ.get("GENVM_FAILURE_UNHEALTHY_THRESHOLD", "3"))
             assert threshold == 3
+
+
+class TestExecutionSchedulerHealth:
+    """Test execution scheduler capacity and metrics in /health"""
+
+    def setup_method(self):
+        worker_service._genvm_consecutive_failures = 0
+        worker_service._genvm_health_last_check = 0.0
+        worker_service._genvm_health_last_ok = True
+        worker_service._genvm_health_last_error = None
+        worker_service.worker_task = None
+        worker_service.worker_permanently_failed = False
+
+        mock_worker = MagicMock()
+        mock_worker.worker_id = "test-worker-123"
+        mock_worker.running = True
+        mock_worker.current_transactions = {}
+        mock_worker._active_tasks = set()
+        mock_worker.max_parallel_txs = 1
+        worker_service.worker = mock_worker
+
+    def test_genvm_manager_slots(self):
+        """Slot count is read from the manager's permits"""
+        assert worker_service.genvm_manager_slots(b'{"permits": 6}') == 6
+        assert worker_service.genvm_manager_slots(b'{"permits": {"max": 6}}') == 6
+        assert worker_service.genvm_manager_slots(b'{"status": "ok"}') is None
+        assert worker_service.genvm_manager_slots(b'{"permits": 0}') is None
+        assert worker_service.genvm_manager_slots(b"not json") is None
+
+    def test_health_caps_scheduler_by_manager_slots(self):
+        """Health probe caps the scheduler and reports its metrics"""
+        scheduler = ExecutionScheduler(initial_limit=8, max_limit=32)
+
+        with patch("urllib.request.urlopen") as mock_urlopen, patch.object(
+            worker_service, "execution_scheduler", scheduler
+        ):
+            mock_resp = MagicMock()
+            mock_resp.status = 200
+            mock_resp.read.return_value = b'{"permits": {"max": 4}}'
+            mock_urlopen.return_value = mock_resp
+
+            worker_service.health_check()
+            response = worker_service.health_check()
+
+        assert scheduler.max_limit == 4
+        assert response["execution_scheduler"]["limit"] == 4
+        assert response["execution_scheduler"]["max_limit"] == 4
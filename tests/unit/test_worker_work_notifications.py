@@ -0,0 +1,150 @@
+"""
+Tests for LISTEN/NOTIFY-driven worker wakeup.
+
+TransactionsProcessor queues a pg_notify on the consensus work channel when a
+transaction becomes claimable, and the worker loop sleeps on the notifier's
+event (with a slow safety-net poll) instead of polling every poll_interval.
+"""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import MagicMock
+
+from backend.consensus.work_notifier import WorkNotificationListener
+from backend.database_handler.models import TransactionStatus
+from backend.database_handler.transactions_processor import (
+    CONSENSUS_WORK_CHANNEL,
+    TransactionsProcessor,
+)
+
+
+def _make_worker(work_notifier=None, **kwargs):
+    from backend.consensus.worker import ConsensusWorker
+
+    return ConsensusWorker(
+        get_session=MagicMock(),
+        msg_handler=MagicMock(),
+        consensus_service=MagicMock(),
+        validators_manager=MagicMock(),
+        genvm_manager=MagicMock(),
+        worker_id="test-worker",
+        work_notifier=work_notifier,
+        **kwargs,
+    )
+
+
+def _notify_calls(session):
+    calls = []
+    for call in session.execute.call_args_list:
+        statement, params = call.args[0], call.args[1]
+        if "pg_notify" in str(statement):
+            calls.append(params)
+    return calls
+
+
+class TestNotifyEmission:
+    def setup_method(self):
+        self.processor = TransactionsProcessor(MagicMock())
+        self.processor.session = MagicMock()
+        self.processor.session.execute.return_value.rowcount = 1
+
+    @pytest.mark.parametrize(
+        "status",
+        [
+            TransactionStatus.PENDING,
+            TransactionStatus.ACCEPTED,
+            TransactionStatus.UNDETERMINED,
+            TransactionStatus.LEADER_TIMEOUT,
+            TransactionStatus.VALIDATORS_TIMEOUT,
+        ],
+    )
+    def test_claimable_status_notifies(self, status):
+        self.processor.update_transaction_status("0xabc", status)
+
+        calls = _notify_calls(self.processor.session)
+        assert len(calls) == 1
+        assert calls[0]["channel"] == CONSENSUS_WORK_CHANNEL
+        assert json.loads(calls[0]["payload"]) == {
+            "hash": "0xabc",
+            "reason": status.value,
+        }
+
+    @pytest.mark.parametrize(
+        "status",
+        [
+            TransactionStatus.ACTIVATED,
+            TransactionStatus.PROPOSING,
+            TransactionStatus.COMMITTING,
+            TransactionStatus.FINALIZED,
+        ],
+    )
+    def test_in_flight_status_does_not_notify(self, status):
+        self.processor.update_transaction_status("0xabc", status)
+
+        assert _notify_calls(self.processor.session) == []
+
+    def test_missing_transaction_does_not_notify(self):
+        self.processor.session.execute.return_value.rowcount = 0
+
+        self.processor.update_transaction_status("0xabc", TransactionStatus.ACCEPTED)
+
+        assert _notify_calls(self.processor.session) == []
+
+    def test_appeal_notifies_only_when_applied(self):
+        self.processor.set_transaction_appeal("0xabc", True)
+        assert len(_notify_calls(self.processor.session)) == 1
+
+        self.processor.session.reset_mock()
+        self.processor.session.execute.return_value.rowcount = 0
+        self.processor.set_transaction_appeal("0xabc", True)
+        assert _notify_calls(self.processor.session) == []
+
+
+class TestWorkerWakeup:
+    @pytest.mark.asyncio
+    async def test_notification_wakes_idle_worker(self):
+        notifier = WorkNotificationListener("postgresql://unused")
+        worker = _make_worker(notifier, poll_interval=5, safety_poll_interval=30)
+
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.01, notifier.wake)
+        started = loop.time()
+        await worker._wait_for_work()
+
+        assert loop.time() - started < 1
+        assert not notifier.work_available.is_set()
+
+    @pytest.mark.asyncio
+    async def test_polls_at_poll_interval_without_notifier(self):
+        worker = _make_worker(poll_interval=0, safety_poll_interval=30)
+
+        await asyncio.wait_for(worker._wait_for_work(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_accepted_notification_schedules_finalization_wakeup(self):
+        notifier = WorkNotificationListener("postgresql://unused")
+        worker = _make_worker(notifier)
+        worker.consensus_algorithm.finality_window_time = 60
+
+        worker._on_work_notification({"hash": "0x1", "reason": "ACCEPTED"})
+        worker._on_work_notification({"hash": "0x2", "reason": "ACCEPTED"})
+        worker._on_work_notification({"hash": "0x3", "reason": "inserted"})
+
+        # Coalesced into a single timer for the same second
+        assert len(worker._finalization_wakeups) == 1
+
+        worker.stop()
+        assert worker._finalization_wakeups == {}
+        assert notifier.work_available.is_set()
+
+    @pytest.mark.asyncio
+    async def test_zero_finality_window_schedules_nothing(self):
+        notifier = WorkNotificationListener("postgresql://unused")
+        worker = _make_worker(notifier)
+        worker.consensus_algorithm.finality_window_time = 0
+
+        worker._on_work_notification({"hash": "0x1", "reason": "ACCEPTED"})
+
+        assert worker._finalization_wakeups == {}